@@ -36,7 +36,7 @@ result = client.invoke_vector(
 
 print(f"Result: {result}")`,
     async: `import asyncio
-from awareness_network_async import AsyncAwarenessClient
+from awareness_network_sdk import AsyncAwarenessClient
 
 async def main():
     client = AsyncAwarenessClient(
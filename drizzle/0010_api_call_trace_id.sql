@@ -0,0 +1,2 @@
+ALTER TABLE `api_call_logs` ADD `trace_id` varchar(32);--> statement-breakpoint
+CREATE INDEX `trace_idx` ON `api_call_logs` (`trace_id`);
\ No newline at end of file
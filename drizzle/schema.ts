@@ -157,11 +157,13 @@ export const apiCallLogs = mysqlTable("api_call_logs", {
   responseTime: int("response_time"), // milliseconds
   success: boolean("success").default(true).notNull(),
   errorMessage: text("error_message"),
+  traceId: varchar("trace_id", { length: 32 }), // W3C trace id of the request
   createdAt: timestamp("createdAt").defaultNow().notNull(),
 }, (table) => ({
   userIdx: index("user_idx").on(table.userId),
   vectorIdx: index("vector_idx").on(table.vectorId),
   createdAtIdx: index("created_at_idx").on(table.createdAt),
+  traceIdx: index("trace_idx").on(table.traceId),
 }));
 
 /**
@@ -0,0 +1,99 @@
+"""
+Awareness Network Python SDK for AI Agents
+
+This SDK enables AI agents to autonomously discover, purchase, and use
+latent space vectors from the Awareness Network marketplace.
+
+Importing the package is cheap: every public name is resolved on first
+access, so ``requests`` loads with the sync client, ``aiohttp`` with the
+async client, and NumPy only with the local engines (search, recommend,
+catalog, alignment, shared memory) that need it.
+
+Usage:
+    from awareness_network_sdk import AwarenessNetworkClient
+
+    client = AwarenessNetworkClient(api_key="your_api_key")
+    vectors = client.search_vectors(category="nlp", min_rating=4.0)
+"""
+
+import importlib
+from typing import Any, Dict, List
+
+__version__ = "1.0.0"
+
+# Public name -> submodule defining it
+_EXPORTS: Dict[str, str] = {
+    # Sync client
+    "AwarenessNetworkClient": "client",
+    "AlignmentMethod": "client",
+    "TransformMethod": "client",
+    "LatentVector": "client",
+    "PurchaseAccess": "client",
+    "Memory": "client",
+    "quick_start": "client",
+    # Async client
+    "AsyncAwarenessClient": "async_client",
+    "VectorsAsyncClient": "async_client",
+    "LatentMASAsyncClient": "async_client",
+    "MemoryAsyncClient": "async_client",
+    "Vector": "async_client",
+    "Purchase": "async_client",
+    "InvocationResult": "async_client",
+    "quick_invoke": "async_client",
+    # Models, decoding and pagination
+    "ResultSet": "models",
+    "ResponseValidationError": "models",
+    "decode_models": "codec",
+    "get_json_backend": "codec",
+    "set_json_backend": "codec",
+    "CursorPaginator": "pagination",
+    "AsyncCursorPaginator": "pagination",
+    "TTLCache": "cache",
+    "VectorPayloadCache": "payload_cache",
+    "QuotaTracker": "quota",
+    "QuotaSnapshot": "quota",
+    "QuotaExceededError": "quota",
+    "RateLimiter": "ratelimit",
+    "TokenBucket": "ratelimit",
+    "shared_rate_limiter": "ratelimit",
+    "Instrumentation": "instrumentation",
+    "HistogramExporter": "instrumentation",
+    "RequestEvent": "instrumentation",
+    "Tracer": "tracing",
+    "Span": "tracing",
+    "JsonLinesSpanExporter": "tracing",
+    "current_span": "tracing",
+    "McpSession": "mcp_session",
+    "AsyncMcpSession": "mcp_session",
+    "McpCallError": "mcp_session",
+    "McpSessionClosed": "mcp_session",
+    # Local engines
+    "WriteBehindMemoryClient": "memory",
+    "AsyncWriteBehindMemoryClient": "memory",
+    "CatalogMirror": "catalog",
+    "MemorySearchIndex": "search",
+    "HybridMemorySearchIndex": "search",
+    "HashingEncoder": "search",
+    "InteractionMatrix": "recommend",
+    "CollaborativeFilter": "recommend",
+    "ImplicitALS": "als",
+    "AlignmentScheduler": "alignment",
+    "WMatrix": "alignment",
+    "SharedTensorStore": "shm",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
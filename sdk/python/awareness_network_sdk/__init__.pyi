@@ -0,0 +1,508 @@
+"""
+Type stubs for Awareness Network SDK
+Provides type hints for better IDE support and type checking
+"""
+
+from typing import List, Dict, Any, Optional, AsyncIterator, Iterator, Generic, Sequence, TypeVar, Union, overload
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from .alignment import AlignmentScheduler as AlignmentScheduler, WMatrix as WMatrix
+from .als import ImplicitALS as ImplicitALS
+from .cache import TTLCache as TTLCache
+from .catalog import CatalogMirror as CatalogMirror
+from .codec import (
+    decode_models as decode_models,
+    get_json_backend as get_json_backend,
+    set_json_backend as set_json_backend,
+)
+from .instrumentation import (
+    HistogramExporter as HistogramExporter,
+    Instrumentation as Instrumentation,
+    RequestEvent as RequestEvent,
+)
+from .memory import (
+    AsyncWriteBehindMemoryClient as AsyncWriteBehindMemoryClient,
+    WriteBehindMemoryClient as WriteBehindMemoryClient,
+)
+from .mcp_session import (
+    AsyncMcpSession as AsyncMcpSession,
+    McpCallError as McpCallError,
+    McpSession as McpSession,
+    McpSessionClosed as McpSessionClosed,
+)
+from .models import ResponseValidationError as ResponseValidationError
+from .pagination import AsyncCursorPaginator as AsyncCursorPaginator, CursorPaginator as CursorPaginator
+from .payload_cache import VectorPayloadCache as VectorPayloadCache
+from .quota import (
+    QuotaExceededError as QuotaExceededError,
+    QuotaSnapshot as QuotaSnapshot,
+    QuotaTracker as QuotaTracker,
+)
+from .ratelimit import (
+    RateLimiter as RateLimiter,
+    TokenBucket as TokenBucket,
+    shared_rate_limiter as shared_rate_limiter,
+)
+from .recommend import CollaborativeFilter as CollaborativeFilter, InteractionMatrix as InteractionMatrix
+from .search import (
+    HashingEncoder as HashingEncoder,
+    HybridMemorySearchIndex as HybridMemorySearchIndex,
+    MemorySearchIndex as MemorySearchIndex,
+)
+from .shm import SharedTensorStore as SharedTensorStore
+from .tracing import (
+    JsonLinesSpanExporter as JsonLinesSpanExporter,
+    Span as Span,
+    Tracer as Tracer,
+    current_span as current_span,
+)
+
+__version__: str
+
+class AlignmentMethod(Enum):
+    LINEAR: str
+    NONLINEAR: str
+    LEARNED: str
+
+class TransformMethod(Enum):
+    PCA: str
+    AUTOENCODER: str
+    INTERPOLATION: str
+
+_T = TypeVar("_T")
+
+class ResultSet(Generic[_T], Sequence[_T]):
+    model: type
+    
+    def __init__(self, model_cls: type, columns: Optional[Dict[str, Sequence[Any]]] = ...) -> None: ...
+    
+    @classmethod
+    def from_responses(cls, model_cls: type, responses: Any, strict: bool = ...) -> ResultSet[_T]: ...
+    
+    def extend(self, responses: Any, strict: bool = ...) -> None: ...
+    
+    def column(self, name: str) -> Sequence[Any]: ...
+    
+    def to_numpy(self, name: str) -> Any: ...
+    
+    def __len__(self) -> int: ...
+    
+    @overload
+    def __getitem__(self, index: int) -> _T: ...
+    
+    @overload
+    def __getitem__(self, index: slice) -> ResultSet[_T]: ...
+
+@dataclass(frozen=True)
+class LatentVector:
+    id: int
+    name: str
+    description: str
+    category: str
+    price: float
+    dimension: int
+    model_architecture: str
+    rating: float
+    total_calls: int
+    creator_id: int
+    
+    @classmethod
+    def from_response(cls, response: Dict[str, Any]) -> LatentVector: ...
+
+@dataclass(frozen=True)
+class PurchaseAccess:
+    access_token: str
+    vector_id: int
+    expires_at: str
+    call_limit: Optional[int]
+    remaining_calls: Optional[int]
+    
+    @classmethod
+    def from_response(cls, response: Dict[str, Any]) -> PurchaseAccess: ...
+
+@dataclass(frozen=True)
+class Memory:
+    key: str
+    value: Any
+    created_at: str
+    updated_at: str
+    version: Optional[int] = ...
+    expires_at: Optional[str] = ...
+    
+    @classmethod
+    def from_response(cls, response: Dict[str, Any]) -> Memory: ...
+
+@dataclass(frozen=True)
+class Vector:
+    id: int
+    name: str
+    description: str
+    category: str
+    dimension: int
+    pricing_per_call: float
+    pricing_subscription: Optional[float]
+    creator_id: int
+    performance_metrics: Dict[str, Any]
+    created_at: datetime
+    
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> Vector: ...
+
+@dataclass(frozen=True)
+class Purchase:
+    id: int
+    vector_id: int
+    buyer_id: int
+    pricing_tier: str
+    access_token: str
+    expires_at: Optional[datetime]
+    call_limit: Optional[int]
+    calls_used: int
+    calls_remaining: Optional[int] = ...
+    
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> Purchase: ...
+
+@dataclass(frozen=True)
+class InvocationResult:
+    success: bool
+    result: Any
+    latency_ms: float
+    calls_remaining: Optional[int]
+    
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> InvocationResult: ...
+
+class AwarenessNetworkClient:
+    base_url: str
+    api_key: Optional[str]
+    session: Any
+    memory_cache: Any
+    catalog_sync_interval: float
+    numpy_vectors: bool
+    quota: QuotaTracker
+    rate_limiter: Optional[RateLimiter]
+    request_encoding: Optional[str]
+    compression_threshold: int
+    instrumentation: Optional[Instrumentation]
+    tracer: Optional[Tracer]
+    
+    def __init__(
+        self,
+        base_url: str = ...,
+        api_key: Optional[str] = ...,
+        memory_cache_size: int = ...,
+        catalog_sync_interval: float = ...,
+        numpy_vectors: bool = ...,
+        quota_reroute: bool = ...,
+        rate_limiter: Union[RateLimiter, bool] = ...,
+        compress_requests: Union[bool, str] = ...,
+        compression_threshold: int = ...,
+        instrumentation: Optional[Instrumentation] = ...,
+        tracer: Optional[Tracer] = ...
+    ) -> None: ...
+    
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = ...,
+        params: Optional[Dict] = ...,
+        headers: Optional[Dict[str, str]] = ...
+    ) -> Dict[str, Any]: ...
+    
+    def register_agent(
+        self,
+        agent_name: str,
+        agent_type: str = ...,
+        email: Optional[str] = ...,
+        metadata: Optional[Dict] = ...
+    ) -> Dict[str, Any]: ...
+    
+    def create_api_key(
+        self,
+        name: str,
+        permissions: Optional[List[str]] = ...,
+        expires_in_days: Optional[int] = ...
+    ) -> Dict[str, Any]: ...
+    
+    def list_api_keys(self) -> List[Dict[str, Any]]: ...
+    
+    def iter_api_keys(self, page_size: int = ..., prefetch: bool = ...) -> Iterator[Dict[str, Any]]: ...
+    
+    def revoke_api_key(self, key_id: int) -> Dict[str, Any]: ...
+    
+    def store_memory(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int] = ...
+    ) -> Memory: ...
+    
+    def retrieve_memory(self, key: str) -> Optional[Memory]: ...
+    
+    def delete_memory(self, key: str) -> Dict[str, Any]: ...
+    
+    def store_memory_batch(
+        self,
+        writes: List[Dict[str, Any]],
+        deletes: Optional[List[str]] = None
+    ) -> Dict[str, Any]: ...
+    
+    def retrieve_memories(self, keys: List[str]) -> Dict[str, Memory]: ...
+    
+    def iter_memories(self, page_size: int = ..., prefetch: bool = ...) -> Iterator[Memory]: ...
+    
+    def list_memories(self) -> List[Memory]: ...
+    
+    def search_vectors(
+        self,
+        category: Optional[str] = ...,
+        min_price: Optional[float] = ...,
+        max_price: Optional[float] = ...,
+        min_rating: Optional[float] = ...,
+        sort_by: str = ...,
+        limit: int = ...,
+        offset: int = ...
+    ) -> List[LatentVector]: ...
+    
+    def iter_vectors(
+        self,
+        category: Optional[str] = ...,
+        page_size: int = ...,
+        prefetch: bool = ...
+    ) -> Iterator[LatentVector]: ...
+    
+    def list_vectors(self, category: Optional[str] = ..., page_size: int = ...) -> ResultSet[LatentVector]: ...
+    
+    def iter_purchases(self, page_size: int = ..., prefetch: bool = ...) -> Iterator[PurchaseAccess]: ...
+    
+    def sync_quotas(self) -> List[QuotaSnapshot]: ...
+    
+    @property
+    def catalog(self) -> Any: ...
+    
+    def get_recommendations(self, limit: int = ...) -> List[Dict[str, Any]]: ...
+    
+    def get_vector_details(self, vector_id: int) -> LatentVector: ...
+    
+    def purchase_vector(
+        self,
+        vector_id: int,
+        call_limit: Optional[int] = ...,
+        duration_days: Optional[int] = ...
+    ) -> PurchaseAccess: ...
+    
+    def invoke_vector(
+        self,
+        access_token: str,
+        input_data: Any,
+        parameters: Optional[Dict] = ...
+    ) -> Dict[str, Any]: ...
+    
+    def align_vector(
+        self,
+        source_vector: List[float],
+        source_model: str,
+        target_model: str,
+        method: AlignmentMethod = ...
+    ) -> Dict[str, Any]: ...
+    
+    def transform_dimension(
+        self,
+        vector: List[float],
+        target_dimension: int,
+        method: TransformMethod = ...
+    ) -> Dict[str, Any]: ...
+    
+    def validate_vector(
+        self,
+        vector: List[float],
+        expected_dimension: Optional[int] = ...
+    ) -> Dict[str, Any]: ...
+    
+    def get_supported_models(self) -> Dict[str, Any]: ...
+    
+    def mcp_discover(
+        self,
+        category: Optional[str] = ...
+    ) -> Dict[str, Any]: ...
+    
+    def sync_rate_limits(self) -> Dict[str, Dict[str, float]]: ...
+    
+    def mcp_invoke(
+        self,
+        vector_id: int,
+        input_data: Any,
+        access_token: str
+    ) -> Dict[str, Any]: ...
+    
+    def mcp_session(self, timeout: float = ...) -> McpSession: ...
+
+class AsyncAwarenessClient:
+    api_key: str
+    base_url: str
+    timeout: Any
+    max_retries: int
+    _session: Optional[Any]
+    vectors: VectorsAsyncClient
+    latentmas: LatentMASAsyncClient
+    memory: MemoryAsyncClient
+    memory_cache: Any
+    numpy_vectors: bool
+    quota: QuotaTracker
+    rate_limiter: Optional[RateLimiter]
+    request_encoding: Optional[str]
+    compression_threshold: int
+    instrumentation: Optional[Instrumentation]
+    tracer: Optional[Tracer]
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = ...,
+        timeout: int = ...,
+        max_retries: int = ...,
+        memory_cache_size: int = ...,
+        numpy_vectors: bool = ...,
+        quota_reroute: bool = ...,
+        rate_limiter: Union[RateLimiter, bool] = ...,
+        compress_requests: Union[bool, str] = ...,
+        compression_threshold: int = ...,
+        instrumentation: Optional[Instrumentation] = ...,
+        tracer: Optional[Tracer] = ...
+    ) -> None: ...
+    
+    async def __aenter__(self) -> AsyncAwarenessClient: ...
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None: ...
+    
+    async def sync_rate_limits(self) -> Dict[str, Dict[str, float]]: ...
+    
+    def mcp_session(self) -> AsyncMcpSession: ...
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = ...,
+        params: Optional[Dict] = ...,
+        stream: bool = ...
+    ) -> Any: ...
+
+class VectorsAsyncClient:
+    client: AsyncAwarenessClient
+    
+    def __init__(self, client: AsyncAwarenessClient) -> None: ...
+    
+    async def list(
+        self,
+        category: Optional[str] = ...,
+        limit: int = ...,
+        offset: int = ...
+    ) -> List[Vector]: ...
+    
+    async def get(self, vector_id: int) -> Vector: ...
+    
+    async def purchase(
+        self,
+        vector_id: int,
+        pricing_tier: str = ...,
+        call_limit: Optional[int] = ...
+    ) -> Purchase: ...
+    
+    async def invoke(
+        self,
+        vector_id: int,
+        input_data: Dict[str, Any],
+        access_token: Optional[str] = ...
+    ) -> InvocationResult: ...
+    
+    async def invoke_stream(
+        self,
+        vector_id: int,
+        input_data: Dict[str, Any],
+        access_token: Optional[str] = ...
+    ) -> AsyncIterator[Dict[str, Any]]: ...
+    
+    async def batch_invoke(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> ResultSet[InvocationResult]: ...
+    
+    def aiter_vectors(
+        self,
+        category: Optional[str] = ...,
+        page_size: int = ...,
+        prefetch: bool = ...
+    ) -> AsyncIterator[Vector]: ...
+    
+    async def list_all(self, category: Optional[str] = ..., page_size: int = ...) -> ResultSet[Vector]: ...
+    
+    async def my_purchases(self) -> List[Purchase]: ...
+    
+    def aiter_purchases(self, page_size: int = ..., prefetch: bool = ...) -> AsyncIterator[Purchase]: ...
+    
+    async def sync_quotas(self) -> List[QuotaSnapshot]: ...
+
+class LatentMASAsyncClient:
+    client: AsyncAwarenessClient
+    
+    def __init__(self, client: AsyncAwarenessClient) -> None: ...
+    
+    async def align(
+        self,
+        source_vector: List[float],
+        source_model: str,
+        target_model: str
+    ) -> Dict[str, Any]: ...
+    
+    async def transform(
+        self,
+        vector: List[float],
+        target_dimension: int,
+        method: str = ...
+    ) -> Dict[str, Any]: ...
+    
+    async def validate(
+        self,
+        original_vector: List[float],
+        aligned_vector: List[float]
+    ) -> Dict[str, Any]: ...
+
+class MemoryAsyncClient:
+    client: AsyncAwarenessClient
+    
+    def __init__(self, client: AsyncAwarenessClient) -> None: ...
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]: ...
+    
+    async def set(self, key: str, value: Dict[str, Any]) -> bool: ...
+    
+    async def delete(self, key: str) -> bool: ...
+    
+    async def set_many(
+        self,
+        writes: List[Dict[str, Any]],
+        deletes: Optional[List[str]] = None
+    ) -> Dict[str, Any]: ...
+    
+    async def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]: ...
+    
+    def iter_memories(self, page_size: int = ..., prefetch: bool = ...) -> AsyncIterator[Dict[str, Any]]: ...
+    
+    async def list_keys(self) -> List[str]: ...
+
+def quick_start(
+    agent_name: str,
+    agent_type: str = ...
+) -> AwarenessNetworkClient: ...
+
+async def quick_invoke(
+    api_key: str,
+    vector_id: int,
+    input_data: Dict[str, Any],
+    base_url: str = ...
+) -> InvocationResult: ...
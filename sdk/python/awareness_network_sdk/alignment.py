@@ -0,0 +1,311 @@
+"""
+Awareness Network SDK - Bulk KV-Cache Alignment
+Ahead-of-time alignment of a purchased KV-cache to many target models
+
+The server's ``purchaseMemory`` aligns a cache to a single ``targetModel`` at
+purchase time. This module mirrors ``WMatrixService.alignKVCache`` locally so
+a cache can be pre-warmed for a whole model family in one pass. Targets are
+aligned in parallel in a process pool; the source tensors are published once
+through ``awareness_network_sdk.shm`` and every worker attaches to them by
+descriptor instead of receiving a pickled copy.
+
+Usage:
+    from awareness_network_sdk.alignment import AlignmentScheduler, WMatrix
+
+    scheduler = AlignmentScheduler(max_workers=8)
+    aligned = scheduler.align_all(
+        kv_cache,
+        {"llama-3-8b": WMatrix.orthogonal(llama_matrix, target_dimension=128),
+         "mistral-7b": WMatrix.orthogonal(mistral_matrix, target_dimension=128)},
+    )
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+from .shm import SharedTensorStore, TensorDescriptor, attach, detach
+
+
+@dataclass
+class WMatrix:
+    """
+    Transformation rules for one source -> target model pair
+
+    Mirrors ``WMatrixStandard.transformationRules`` on the server. ``method``
+    is one of "orthogonal", "learned", "hybrid" or "identity".
+    """
+    method: str
+    target_dimension: int
+    orthogonal_matrix: Optional[np.ndarray] = None
+    shared_parameters: Optional[np.ndarray] = None
+    version: str = "1.0.0"
+
+    @classmethod
+    def orthogonal(cls, matrix: Any, target_dimension: int, version: str = "1.0.0") -> "WMatrix":
+        """Build an orthogonal W-Matrix from a square matrix"""
+        return cls(
+            "orthogonal", target_dimension, np.asarray(matrix, dtype=np.float32), None, version
+        )
+
+    @classmethod
+    def identity(cls, target_dimension: int, version: str = "1.0.0") -> "WMatrix":
+        """W-Matrix for compatible models (same key dimension)"""
+        return cls("identity", target_dimension, None, None, version)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], target_dimension: Optional[int] = None) -> "WMatrix":
+        """Build from a server ``WMatrixStandard`` payload"""
+        rules = data.get("transformationRules", {})
+        if target_dimension is None:
+            target_dimension = data["kvCacheCompatibility"]["keyDimension"]
+        orthogonal = rules.get("orthogonalMatrix")
+        shared = rules.get("sharedParameters")
+        return cls(
+            method=data.get("method", "orthogonal"),
+            target_dimension=target_dimension,
+            orthogonal_matrix=(
+                None if orthogonal is None else np.asarray(orthogonal, dtype=np.float32)
+            ),
+            shared_parameters=None if shared is None else np.asarray(shared, dtype=np.float32),
+            version=data.get("version", "1.0.0"),
+        )
+
+
+def _adjust_dimension(tensor: np.ndarray, target_dim: int) -> np.ndarray:
+    """Truncate or zero-pad the last axis to ``target_dim``"""
+    dim = tensor.shape[-1]
+    if dim == target_dim:
+        return tensor
+    if dim > target_dim:
+        return tensor[..., :target_dim]
+    pad = [(0, 0)] * (tensor.ndim - 1) + [(0, target_dim - dim)]
+    return np.pad(tensor, pad)
+
+
+def _interpolate_dimension(tensor: np.ndarray, target_dim: int) -> np.ndarray:
+    """Linear interpolation along the last axis (server fallback path)"""
+    source_dim = tensor.shape[-1]
+    if source_dim == target_dim:
+        return tensor
+    positions = np.arange(target_dim) * (source_dim / target_dim)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(np.ceil(positions).astype(np.intp), source_dim - 1)
+    weight = (positions - lower).astype(tensor.dtype)
+    interpolated: np.ndarray = tensor[..., lower] * (1 - weight) + tensor[..., upper] * weight
+    return interpolated
+
+
+def transform_tensor(tensor: np.ndarray, w_matrix: WMatrix) -> np.ndarray:
+    """
+    Apply a W-Matrix to a [layers, heads, sequence, dim] tensor
+
+    Vectorized equivalent of ``WMatrixService.transformTensor``: every
+    sequence position is transformed in a single matmul.
+    """
+    target_dim = w_matrix.target_dimension
+    result = tensor
+
+    if w_matrix.method == "identity":
+        return _adjust_dimension(result, target_dim)
+
+    applied = False
+    if w_matrix.method in ("orthogonal", "hybrid") and w_matrix.orthogonal_matrix is not None:
+        matrix = w_matrix.orthogonal_matrix
+        result = _adjust_dimension(result, matrix.shape[1]) @ matrix.T
+        result = _adjust_dimension(result, target_dim)
+        applied = True
+    if w_matrix.method in ("learned", "hybrid") and w_matrix.shared_parameters is not None:
+        params = w_matrix.shared_parameters
+        dim = result.shape[-1]
+        # Parameter index is clamped to the last entry, as on the server
+        scale = params[np.minimum(np.arange(dim), len(params) - 1)]
+        result = _adjust_dimension(result * scale, target_dim)
+        applied = True
+
+    if not applied:
+        if w_matrix.method == "hybrid":
+            # A hybrid matrix without rules leaves the tensor unchanged, as on the server
+            return result
+        return _interpolate_dimension(result, target_dim)
+    return result
+
+
+def output_dimension(w_matrix: WMatrix, source_dim: int) -> int:
+    """Last-axis size of ``transform_tensor``'s result for a ``source_dim`` input"""
+    if (w_matrix.method == "hybrid" and w_matrix.orthogonal_matrix is None
+            and w_matrix.shared_parameters is None):
+        return source_dim
+    return w_matrix.target_dimension
+
+
+def _tensor_to_array(tensor: Any) -> np.ndarray:
+    return np.ascontiguousarray(np.asarray(tensor, dtype=np.float32))
+
+
+def _information_retention(source: np.ndarray, aligned: np.ndarray) -> float:
+    source_energy = float(np.square(source, dtype=np.float64).sum())
+    if source_energy == 0.0:
+        return 1.0
+    return min(float(np.square(aligned, dtype=np.float64).sum()) / source_energy, 1.0)
+
+
+def _align_worker(
+    keys_desc: TensorDescriptor,
+    values_desc: TensorDescriptor,
+    w_matrix: WMatrix,
+    out_keys_desc: TensorDescriptor,
+    out_values_desc: TensorDescriptor,
+) -> Dict[str, Any]:
+    """Align keys and values held in shared memory into the output segments"""
+    keys = attach(keys_desc)
+    values = attach(values_desc)
+    aligned_keys = transform_tensor(keys, w_matrix)
+    attach(out_keys_desc, writable=True)[...] = aligned_keys
+    attach(out_values_desc, writable=True)[...] = transform_tensor(values, w_matrix)
+    quality = {"informationRetention": _information_retention(keys, aligned_keys)}
+
+    # The source segment stays mapped for the next target handled by this
+    # worker; outputs are written once and can be unmapped immediately
+    del aligned_keys
+    detach(out_keys_desc)
+    detach(out_values_desc)
+    return quality
+
+
+class AlignmentScheduler:
+    """
+    Aligns one KV-cache to many target models in parallel
+
+    Example:
+        scheduler = AlignmentScheduler()
+        results = scheduler.align_all(kv_cache, w_matrices)
+        results["llama-3-8b"]["keys"]  # numpy array [layers, heads, seq, dim]
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        w_matrix_provider: Optional[Callable[[str, str], WMatrix]] = None,
+    ):
+        """
+        Args:
+            max_workers: Size of the process pool (defaults to CPU count)
+            w_matrix_provider: Callable ``(source_model, target_model) -> WMatrix``
+                used when ``align_all`` is given a list of model names
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.w_matrix_provider = w_matrix_provider
+
+    def align_all(
+        self,
+        kv_cache: Dict[str, Any],
+        targets: Union[Mapping[str, WMatrix], Iterable[str]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Align ``kv_cache`` to every target model
+
+        Args:
+            kv_cache: KV-cache dict as stored by the marketplace (``sourceModel``,
+                ``keys``, ``values``, ``metadata``, ...)
+            targets: Mapping of target model name to its W-Matrix, or a list of
+                target model names (e.g. one family from ``getModelsByFamily``)
+                resolved through ``w_matrix_provider``
+
+        Returns:
+            Mapping of target model name to an aligned KV-cache dict
+        """
+        w_matrices = self._resolve(kv_cache, targets)
+        keys = _tensor_to_array(kv_cache["keys"])
+        values = _tensor_to_array(kv_cache["values"])
+        if not w_matrices:
+            return {}
+
+        workers = min(self.max_workers, len(w_matrices))
+        with SharedTensorStore() as store:
+            source = store.publish_many({"keys": keys, "values": values})
+            outputs = {
+                target: (
+                    store.allocate(keys.shape[:-1] + (output_dimension(w_matrix, keys.shape[-1]),)),
+                    store.allocate(
+                        values.shape[:-1] + (output_dimension(w_matrix, values.shape[-1]),)
+                    ),
+                )
+                for target, w_matrix in w_matrices.items()
+            }
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    target: pool.submit(
+                        _align_worker,
+                        source["keys"],
+                        source["values"],
+                        w_matrix,
+                        *outputs[target],
+                    )
+                    for target, w_matrix in w_matrices.items()
+                }
+                results = {}
+                for target, future in futures.items():
+                    quality = future.result()
+                    results[target] = self._result(
+                        kv_cache,
+                        target,
+                        w_matrices[target],
+                        store.read(outputs[target][0]),
+                        store.read(outputs[target][1]),
+                        quality,
+                    )
+                return results
+
+    def _resolve(
+        self,
+        kv_cache: Dict[str, Any],
+        targets: Union[Mapping[str, WMatrix], Iterable[str]],
+    ) -> Dict[str, WMatrix]:
+        if isinstance(targets, Mapping):
+            return dict(targets)
+        if self.w_matrix_provider is None:
+            raise ValueError("A w_matrix_provider is required to align to model names")
+        source_model = kv_cache["sourceModel"]
+        return {target: self.w_matrix_provider(source_model, target) for target in targets}
+
+    def align(
+        self, kv_cache: Dict[str, Any], target_model: str, w_matrix: WMatrix
+    ) -> Dict[str, Any]:
+        """Align to a single target in-process (no pool, no shared memory)"""
+        keys = _tensor_to_array(kv_cache["keys"])
+        values = _tensor_to_array(kv_cache["values"])
+        aligned_keys = transform_tensor(keys, w_matrix)
+        aligned_values = transform_tensor(values, w_matrix)
+        return self._result(
+            kv_cache,
+            target_model,
+            w_matrix,
+            aligned_keys,
+            aligned_values,
+            {"informationRetention": _information_retention(keys, aligned_keys)},
+        )
+
+    @staticmethod
+    def _result(
+        kv_cache: Dict[str, Any],
+        target_model: str,
+        w_matrix: WMatrix,
+        keys: np.ndarray,
+        values: np.ndarray,
+        quality: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        return {
+            "sourceModel": target_model,
+            "targetModel": target_model,
+            "keys": keys,
+            "values": values,
+            "attentionMask": kv_cache.get("attentionMask"),
+            "positionEncodings": kv_cache.get("positionEncodings"),
+            "metadata": kv_cache.get("metadata"),
+            "wMatrixVersion": w_matrix.version,
+            "alignmentQuality": quality,
+        }
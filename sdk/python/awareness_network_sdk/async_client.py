@@ -0,0 +1,810 @@
+"""
+Awareness Network SDK - Async Version
+Async/await support for high-performance applications
+"""
+
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, AsyncIterator, ClassVar, Union, cast
+from datetime import datetime
+
+from .cache import TTLCache, seconds_until
+from .codec import loads, vectors_to_numpy
+from .compression import (
+    ACCEPT_ENCODING,
+    DEFAULT_THRESHOLD,
+    aiter_compressed,
+    encode_json_body,
+    resolve_encoding,
+)
+from .instrumentation import (
+    Instrumentation,
+    StreamedResponse,
+    acount_sent,
+    server_seconds,
+    server_timing,
+    trace_config,
+)
+from .models import Getter, ResponseModel, ResultSet, field_from, model, timestamp_from
+from .pagination import AsyncCursorPaginator
+from .quota import QuotaSnapshot, QuotaTracker
+from .ratelimit import RateLimiter, retry_after, shared_rate_limiter
+from .tracing import Tracer, traced
+
+if TYPE_CHECKING:
+    from .mcp_session import AsyncMcpSession
+
+
+def _subscription_price(data: Dict[str, Any]) -> Optional[float]:
+    if 'pricing_subscription' in data:
+        price: Optional[float] = data['pricing_subscription']
+        return price
+    if data.get('pricingModel') == 'subscription':
+        return float(data.get('basePrice') or 0)
+    return None
+
+
+def _performance_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
+    if 'performance_metrics' in data:
+        metrics: Dict[str, Any] = data['performance_metrics']
+        return metrics
+    return {
+        'averageRating': float(data.get('averageRating') or 0),
+        'totalCalls': data.get('totalCalls') or 0,
+        'reviewCount': data.get('reviewCount') or 0,
+    }
+
+
+def _latency_ms(data: Dict[str, Any]) -> float:
+    # Batch results nest latency in the result; single invokes report
+    # processingTime in the output
+    if data.get('latency_ms') is not None:
+        return float(data['latency_ms'])
+    for nested in (data.get('result'), data.get('output')):
+        if isinstance(nested, dict):
+            latency = nested.get('latency_ms', nested.get('processingTime'))
+            if latency is not None:
+                return float(latency)
+    return 0.0
+
+
+@model
+class Vector(ResponseModel):
+    """Represents a latent space vector"""
+    id: int
+    name: str
+    description: str
+    category: str
+    dimension: int
+    pricing_per_call: float
+    pricing_subscription: Optional[float]
+    creator_id: int
+    performance_metrics: Dict[str, Any]
+    created_at: datetime
+    
+    # Sources in a GET /api/vectors/catalog row
+    __response_fields__: ClassVar[Dict[str, Getter]] = {
+        'name': field_from('title', 'name', default=''),
+        'description': field_from('description', default=''),
+        'category': field_from('category', default=''),
+        'dimension': field_from('vectorDimension', 'dimension', default=0),
+        'pricing_per_call': field_from('basePrice', 'pricing_per_call', convert=float, default=0.0),
+        'pricing_subscription': _subscription_price,
+        'creator_id': field_from('creatorId', 'creator_id', default=0),
+        'performance_metrics': _performance_metrics,
+        'created_at': timestamp_from('createdAt', 'created_at'),
+    }
+
+
+@model
+class Purchase(ResponseModel):
+    """Represents a vector purchase"""
+    id: int
+    vector_id: int
+    buyer_id: int
+    pricing_tier: str
+    access_token: str
+    expires_at: Optional[datetime]
+    call_limit: Optional[int]
+    calls_used: int
+    calls_remaining: Optional[int] = None
+    
+    # Sources in a GET /api/vectors/my-purchases row
+    __response_fields__: ClassVar[Dict[str, Getter]] = {
+        'id': field_from('transactionId', 'id'),
+        'vector_id': field_from('vectorId', 'vector_id'),
+        'buyer_id': field_from('buyerId', 'buyer_id'),
+        'pricing_tier': field_from('transactionType', 'pricing_tier', default='one-time'),
+        'access_token': field_from('accessToken', 'access_token'),
+        'expires_at': timestamp_from('expiresAt', 'expires_at'),
+        'call_limit': field_from('callLimit', 'call_limit'),
+        'calls_used': field_from('callsUsed', 'calls_used', default=0),
+        'calls_remaining': field_from('callsRemaining', 'calls_remaining'),
+    }
+
+
+@model
+class InvocationResult(ResponseModel):
+    """Represents the result of a vector invocation"""
+    success: bool
+    result: Any
+    latency_ms: float
+    calls_remaining: Optional[int]
+    
+    # Sources in a POST /api/vectors/invoke or batch-invoke result
+    __response_fields__: ClassVar[Dict[str, Getter]] = {
+        'success': field_from('success', default=False),
+        'result': field_from('result', 'output'),
+        'latency_ms': _latency_ms,
+        'calls_remaining': field_from('callsRemaining', 'calls_remaining'),
+    }
+
+
+@traced("awareness")
+class AsyncAwarenessClient:
+    """
+    Async client for Awareness Network API
+    
+    Example:
+        async with AsyncAwarenessClient(api_key="your_key") as client:
+            vectors = await client.vectors.list()
+            result = await client.vectors.invoke(1, {"text": "Hello"})
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://awareness-network.com",
+        timeout: int = 30,
+        max_retries: int = 3,
+        memory_cache_size: int = 0,
+        numpy_vectors: bool = False,
+        quota_reroute: bool = True,
+        rate_limiter: Union[RateLimiter, bool] = True,
+        compress_requests: Union[bool, str] = False,
+        compression_threshold: int = DEFAULT_THRESHOLD,
+        instrumentation: Optional[Instrumentation] = None,
+        tracer: Optional[Tracer] = None
+    ):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self._timeout_seconds = timeout
+        self.max_retries = max_retries
+        self._session: Optional[Any] = None
+        # Read-through cache for memory.get (0 disables it)
+        self.memory_cache = TTLCache(max_size=memory_cache_size)
+        # Return LatentMAS vectors as NumPy float32 arrays (requires NumPy)
+        self.numpy_vectors = numpy_vectors
+        # Per-access-token quotas checked before each invocation
+        self.quota = QuotaTracker(reroute=quota_reroute)
+        # Paces requests to the advertised limits (True: shared limiter)
+        if rate_limiter is True:
+            rate_limiter = shared_rate_limiter()
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter or None
+        # Stream-compress JSON bodies of at least compression_threshold bytes
+        self.request_encoding = resolve_encoding(compress_requests)
+        self.compression_threshold = compression_threshold
+        # Per-request phase timings, sizes and server time for hooks/exporters
+        # (a tracer adds hooks giving each request a span and a traceparent)
+        self.tracer = tracer
+        if tracer is not None:
+            instrumentation = tracer.instrument(instrumentation or Instrumentation())
+        self.instrumentation = instrumentation
+        
+        # Initialize sub-clients
+        self.vectors = VectorsAsyncClient(self)
+        self.latentmas = LatentMASAsyncClient(self)
+        self.memory = MemoryAsyncClient(self)
+    
+    @property
+    def timeout(self) -> Any:
+        """``aiohttp.ClientTimeout`` for every request"""
+        import aiohttp
+        return aiohttp.ClientTimeout(total=self._timeout_seconds)
+    
+    async def __aenter__(self):
+        """Async context manager entry"""
+        # aiohttp is imported on first use so that importing the SDK stays cheap
+        import aiohttp
+        self._session = aiohttp.ClientSession(
+            headers={
+                'X-API-Key': self.api_key,
+                'Content-Type': 'application/json',
+                'Accept-Encoding': ACCEPT_ENCODING,
+                'User-Agent': 'awareness-network-sdk-async/1.0.0'
+            },
+            timeout=self.timeout,
+            trace_configs=[trace_config()] if self.instrumentation is not None else None
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        if self._session:
+            await self._session.close()
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        stream: bool = False
+    ) -> Any:
+        """Make an async HTTP request with retry logic"""
+        if not self._session:
+            raise RuntimeError("Client must be used as async context manager")
+        
+        import asyncio
+        import aiohttp
+        url = f"{self.base_url}{endpoint}"
+        event = None
+        if self.instrumentation is not None:
+            event = self.instrumentation.start(method, endpoint)
+        payload, headers, compress = None, None, False
+        if data is not None and (self.request_encoding is not None or event is not None):
+            payload, headers, compress = encode_json_body(
+                data, self.request_encoding, self.compression_threshold
+            )
+        if event is not None and event.headers:
+            headers = {**event.headers, **(headers or {})}
+        
+        error: Optional[BaseException] = None
+        streamed = False
+        try:
+            for attempt in range(self.max_retries):
+                if self.rate_limiter is not None:
+                    waited = time.perf_counter()
+                    await self.rate_limiter.acquire_async(self.api_key, endpoint)
+                    if event is not None:
+                        event.add('throttle', time.perf_counter() - waited)
+                body: Dict[str, Any]
+                if payload is None:
+                    body = {'json': data}
+                elif compress:
+                    # A fresh generator per attempt; it is consumed as it is sent
+                    # (compress is only set when a request encoding is configured)
+                    chunks = aiter_compressed(payload, cast(str, self.request_encoding))
+                    body = {'data': acount_sent(chunks, event) if event is not None else chunks}
+                else:
+                    body = {'data': payload}
+                if event is not None:
+                    event.attempts = attempt + 1
+                    event.request_bytes = 0 if compress else len(payload or b'')
+                try:
+                    request = self._session.request(
+                        method,
+                        url,
+                        params=params,
+                        headers=headers,
+                        trace_request_ctx=event,
+                        **body
+                    )
+                    if stream:
+                        # Left open: the caller reads and releases it, which finishes the event
+                        response = await request
+                        if event is None or self.instrumentation is None:
+                            return response
+                        event.server_seconds = server_timing(response.headers.get('Server-Timing'))
+                        streamed = True
+                        return StreamedResponse(response, event, self.instrumentation)
+                    async with request as response:
+                        if event is not None:
+                            event.server_seconds = server_timing(
+                                response.headers.get('Server-Timing')
+                            )
+                        response.raise_for_status()
+                        if event is None:
+                            return loads(await response.read())
+                        received = time.perf_counter()
+                        content = await response.read()
+                        downloaded = time.perf_counter()
+                        event.add('download', downloaded - received)
+                        event.response_bytes = response.content_length or len(content)
+                        result = loads(content)
+                        event.add('decode', time.perf_counter() - downloaded)
+                        event.server_seconds = server_seconds(result) or event.server_seconds
+                        return result
+                        
+                except aiohttp.ClientError as e:
+                    if attempt == self.max_retries - 1:
+                        raise Exception(f"Request failed after {self.max_retries} attempts: {e}")
+                    if (
+                        isinstance(e, aiohttp.ClientResponseError)
+                        and e.status == 429
+                        and self.rate_limiter is not None
+                    ):
+                        # The limiter holds back the retry (and other tasks) for Retry-After
+                        header = e.headers.get('Retry-After') if e.headers else None
+                        self.rate_limiter.pause(self.api_key, endpoint, retry_after(header))
+                        continue
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if event is not None and self.instrumentation is not None and not streamed:
+                self.instrumentation.finish(event, error)
+    
+    async def sync_rate_limits(self) -> Dict[str, Dict[str, float]]:
+        """Load the server's advertised rate limits into ``rate_limiter``"""
+        data = await self._request('GET', '/api/mcp/discover')
+        if self.rate_limiter is None:
+            return {}
+        if data.get('rate_limits'):
+            self.rate_limiter.configure(data['rate_limits'])
+        return self.rate_limiter.limits()
+    
+    def mcp_session(self) -> 'AsyncMcpSession':
+        """
+        Multiplexed MCP session (``AsyncMcpSession``) over one persistent stream
+        
+        Use as ``async with client.mcp_session() as session``; concurrent
+        tasks share the stream and results complete out of order.
+        """
+        from .mcp_session import AsyncMcpSession
+        return AsyncMcpSession(self)
+
+
+@traced("vectors")
+class VectorsAsyncClient:
+    """Async client for vector operations"""
+    
+    def __init__(self, client: AsyncAwarenessClient):
+        self.client = client
+    
+    async def list(
+        self,
+        category: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[Vector]:
+        """List available vectors"""
+        params = {'limit': limit, 'offset': offset}
+        if category:
+            params['category'] = category
+        
+        data = await self.client._request('GET', '/api/vectors', params=params)
+        return [Vector.from_response(item) for item in data]
+    
+    async def get(self, vector_id: int) -> Vector:
+        """Get vector details"""
+        data = await self.client._request('GET', f'/api/vectors/{vector_id}')
+        return Vector.from_response(data)
+    
+    async def purchase(
+        self,
+        vector_id: int,
+        pricing_tier: str = 'per-call',
+        call_limit: Optional[int] = None
+    ) -> Purchase:
+        """Purchase a vector"""
+        data = await self.client._request(
+            'POST',
+            '/api/vectors/purchase',
+            data={
+                'vectorId': vector_id,
+                'pricingTier': pricing_tier,
+                'callLimit': call_limit
+            }
+        )
+        purchase = Purchase.from_response(data)
+        self._track(purchase)
+        return purchase
+    
+    def _track(self, purchase: Purchase) -> None:
+        if purchase.access_token:
+            self.client.quota.track(
+                purchase.access_token,
+                purchase.vector_id,
+                purchase.calls_remaining,
+                purchase.expires_at,
+            )
+    
+    async def invoke(
+        self,
+        vector_id: int,
+        input_data: Dict[str, Any],
+        access_token: Optional[str] = None
+    ) -> InvocationResult:
+        """
+        Invoke a purchased vector
+        
+        Raises ``QuotaExceededError`` without a request when the token's
+        tracked quota is used up and no other token for the vector has any.
+        """
+        quota = self.client.quota
+        token = quota.acquire(vector_id, access_token)
+        try:
+            data = await self.client._request(
+                'POST',
+                '/api/vectors/invoke',
+                data={
+                    'vectorId': vector_id,
+                    'inputData': input_data,
+                    'accessToken': token
+                }
+            )
+        except Exception as e:
+            quota.settle(token, error=e)
+            raise
+        result = InvocationResult.from_response(data)
+        quota.settle(token, result.calls_remaining)
+        return result
+    
+    async def invoke_stream(
+        self,
+        vector_id: int,
+        input_data: Dict[str, Any],
+        access_token: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Invoke a vector with streaming response (SSE)"""
+        quota = self.client.quota
+        token = quota.acquire(vector_id, access_token)
+        try:
+            response = await self.client._request(
+                'POST',
+                '/api/vectors/invoke/stream',
+                data={
+                    'vectorId': vector_id,
+                    'inputData': input_data,
+                    'accessToken': token
+                },
+                stream=True
+            )
+        except Exception as e:
+            quota.settle(token, error=e)
+            raise
+        quota.settle(token)
+        
+        try:
+            async for line in response.content:
+                line = line.decode('utf-8').strip()
+                if line.startswith('data: '):
+                    try:
+                        yield loads(line[6:])
+                    except ValueError:
+                        continue
+        finally:
+            response.release()
+    
+    async def batch_invoke(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> ResultSet[InvocationResult]:
+        """
+        Batch invoke multiple vectors
+        
+        Results come back as a columnar ``ResultSet`` (a read-only sequence
+        that builds each ``InvocationResult`` on access).
+        """
+        data = await self.client._request(
+            'POST',
+            '/api/vectors/batch-invoke',
+            data={'requests': requests}
+        )
+        return ResultSet.from_responses(InvocationResult, data['results'], strict=True)
+    
+    async def aiter_vectors(
+        self,
+        category: Optional[str] = None,
+        page_size: int = 1000,
+        prefetch: bool = True
+    ) -> AsyncIterator[Vector]:
+        """
+        Scan every active vector with keyset cursors, requesting the next
+        page while the current one is being processed
+        """
+        params = {'status': 'active'}
+        if category:
+            params['category'] = category
+        async for item in AsyncCursorPaginator(
+            lambda page_params: self.client._request(
+                'GET', '/api/vectors/catalog', params=page_params
+            ),
+            'vectors',
+            parse=Vector.from_response,
+            params=params,
+            page_size=page_size,
+            prefetch=prefetch,
+        ):
+            yield item
+    
+    async def list_all(
+        self, category: Optional[str] = None, page_size: int = 1000
+    ) -> ResultSet[Vector]:
+        """
+        Download every active vector into a columnar ``ResultSet``
+        
+        Rows are parsed straight into columns page by page, so holding the
+        full catalog costs far less than a list of ``Vector`` objects.
+        """
+        params = {'status': 'active'}
+        if category:
+            params['category'] = category
+        vectors = ResultSet(Vector)
+        async for page in AsyncCursorPaginator(
+            lambda page_params: self.client._request(
+                'GET', '/api/vectors/catalog', params=page_params
+            ),
+            'vectors',
+            params=params,
+            page_size=page_size,
+        ).pages():
+            vectors.extend(page, strict=True)
+        return vectors
+    
+    async def my_purchases(self) -> List[Purchase]:
+        """Get user's purchase history"""
+        data = await self.client._request('GET', '/api/vectors/my-purchases')
+        purchases = [Purchase.from_response(item) for item in data.get('purchases', [])]
+        for purchase in purchases:
+            self._track(purchase)
+        return purchases
+    
+    async def aiter_purchases(
+        self, page_size: int = 100, prefetch: bool = True
+    ) -> AsyncIterator[Purchase]:
+        """Iterate over the purchase history page by page, oldest first"""
+        async for item in AsyncCursorPaginator(
+            lambda params: self.client._request('GET', '/api/vectors/my-purchases', params=params),
+            'purchases',
+            parse=Purchase.from_response,
+            page_size=page_size,
+            prefetch=prefetch
+        ):
+            self._track(item)
+            yield item
+    
+    async def sync_quotas(self) -> List[QuotaSnapshot]:
+        """Seed the client's quota tracker from the purchase history"""
+        async for _ in self.aiter_purchases():
+            pass
+        return self.client.quota.snapshot()
+    
+    async def recommendations(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Get precomputed personalized recommendations"""
+        data = await self.client._request(
+            'GET', '/api/ai/recommendations', params={'limit': limit}
+        )
+        recommendations: List[Dict[str, Any]] = data.get('recommendations', [])
+        return recommendations
+
+
+@traced("latentmas")
+class LatentMASAsyncClient:
+    """Async client for LatentMAS protocol operations"""
+    
+    def __init__(self, client: AsyncAwarenessClient):
+        self.client = client
+    
+    async def align(
+        self,
+        source_vector: List[float],
+        source_model: str,
+        target_model: str
+    ) -> Dict[str, Any]:
+        """Align vector from source model to target model"""
+        data = await self.client._request(
+            'POST',
+            '/api/latentmas/align',
+            data={
+                'source_vector': source_vector,
+                'source_model': source_model,
+                'target_model': target_model
+            }
+        )
+        result: Dict[str, Any] = vectors_to_numpy(data) if self.client.numpy_vectors else data
+        return result
+    
+    async def transform(
+        self,
+        vector: List[float],
+        target_dimension: int,
+        method: str = 'pca'
+    ) -> Dict[str, Any]:
+        """Transform vector to different dimension"""
+        data = await self.client._request(
+            'POST',
+            '/api/latentmas/transform',
+            data={
+                'vector': vector,
+                'target_dimension': target_dimension,
+                'method': method
+            }
+        )
+        result: Dict[str, Any] = vectors_to_numpy(data) if self.client.numpy_vectors else data
+        return result
+    
+    async def validate(
+        self,
+        original_vector: List[float],
+        aligned_vector: List[float]
+    ) -> Dict[str, Any]:
+        """Validate alignment quality"""
+        data = await self.client._request(
+            'POST',
+            '/api/latentmas/validate',
+            data={
+                'original_vector': original_vector,
+                'aligned_vector': aligned_vector
+            }
+        )
+        return data
+
+
+@traced("memory")
+class MemoryAsyncClient:
+    """Async client for AI memory operations"""
+    
+    def __init__(self, client: AsyncAwarenessClient):
+        self.client = client
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get memory value (served from the local cache while it is fresh)"""
+        cache_key = (self.client.api_key, key)
+        cached: Optional[Dict[str, Any]] = self.client.memory_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        generation = self.client.memory_cache.generation()
+        try:
+            data: Dict[str, Any] = await self.client._request('GET', f'/api/ai/memory/{key}')
+        except Exception:
+            return None
+        
+        self.client.memory_cache.set(
+            cache_key, data, ttl=seconds_until(data.get('expiresAt')), generation=generation
+        )
+        return data
+    
+    async def set(self, key: str, value: Dict[str, Any]) -> bool:
+        """Set memory value"""
+        try:
+            await self.client._request(
+                'PUT',
+                f'/api/ai/memory/{key}',
+                data={'value': value}
+            )
+            return True
+        except Exception:
+            return False
+        finally:
+            # After the write, so a concurrent get cannot re-cache the old value
+            self.client.memory_cache.invalidate((self.client.api_key, key))
+    
+    async def delete(self, key: str) -> bool:
+        """Delete memory value"""
+        try:
+            await self.client._request('DELETE', f'/api/ai/memory/{key}')
+            return True
+        except Exception:
+            return False
+        finally:
+            self.client.memory_cache.invalidate((self.client.api_key, key))
+    
+    async def set_many(
+        self,
+        writes: List[Dict[str, Any]],
+        deletes: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Apply many writes ({"key", "data", "ttlDays"}) and deletes in one request"""
+        try:
+            result: Dict[str, Any] = await self.client._request(
+                'POST',
+                '/api/ai/memory/batch',
+                data={'writes': writes, 'deletes': deletes or []}
+            )
+            return result
+        finally:
+            for key in [w['key'] for w in writes] + (deletes or []):
+                self.client.memory_cache.invalidate((self.client.api_key, key))
+    
+    async def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get many memories by key (cached entries are served locally)"""
+        found: Dict[str, Dict[str, Any]] = {}
+        to_fetch = []
+        for key in dict.fromkeys(keys):
+            cached = self.client.memory_cache.get((self.client.api_key, key))
+            if cached is not None:
+                found[key] = cached
+            else:
+                to_fetch.append(key)
+        
+        generation = self.client.memory_cache.generation()
+        for start in range(0, len(to_fetch), 1000):
+            data = await self.client._request(
+                'POST',
+                '/api/ai/memory/mget',
+                data={'keys': to_fetch[start:start + 1000]}
+            )
+            for item in data.get('memories', []):
+                self.client.memory_cache.set(
+                    (self.client.api_key, item['key']),
+                    item,
+                    ttl=seconds_until(item.get('expiresAt')),
+                    generation=generation
+                )
+                found[item['key']] = item
+        return found
+    
+    async def iter_memories(
+        self, page_size: int = 500, prefetch: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every memory (with values) using keyset-paginated pages"""
+        async for item in AsyncCursorPaginator[Dict[str, Any]](
+            lambda params: self.client._request('GET', '/api/ai/memory', params=params),
+            'memories',
+            params={'includeValues': 'true'},
+            page_size=page_size,
+            prefetch=prefetch
+        ):
+            yield item
+    
+    async def list_keys(self) -> List[str]:
+        """List all memory keys"""
+        data = await self.client._request('GET', '/api/ai/memory')
+        return data.get('keys', [])
+
+
+# Convenience function for quick async usage
+async def quick_invoke(
+    api_key: str,
+    vector_id: int,
+    input_data: Dict[str, Any],
+    base_url: str = "https://awareness-network.com"
+) -> InvocationResult:
+    """Quick async vector invocation"""
+    async with AsyncAwarenessClient(api_key, base_url) as client:
+        return await client.vectors.invoke(vector_id, input_data)
+
+
+# Example usage
+if __name__ == "__main__":
+    import asyncio
+
+    async def main():
+        api_key = "your_api_key_here"
+        
+        async with AsyncAwarenessClient(api_key) as client:
+            # List vectors
+            vectors = await client.vectors.list(category="nlp", limit=10)
+            print(f"Found {len(vectors)} NLP vectors")
+            
+            # Get vector details
+            if vectors:
+                vector = await client.vectors.get(vectors[0].id)
+                print(f"Vector: {vector.name}")
+                
+                # Purchase vector
+                purchase = await client.vectors.purchase(
+                    vector.id,
+                    pricing_tier="per-call"
+                )
+                print(f"Purchased: {purchase.access_token}")
+                
+                # Invoke vector
+                result = await client.vectors.invoke(
+                    vector.id,
+                    {"text": "Hello, world!"},
+                    access_token=purchase.access_token
+                )
+                print(f"Result: {result.result}")
+                
+                # Stream invocation
+                print("Streaming response:")
+                async for chunk in client.vectors.invoke_stream(
+                    vector.id,
+                    {"text": "Tell me a story"},
+                    access_token=purchase.access_token
+                ):
+                    print(chunk, end='', flush=True)
+                
+                # Batch invocation
+                requests = [
+                    {"vectorId": vector.id, "inputData": {"text": f"Request {i}"}}
+                    for i in range(5)
+                ]
+                results = await client.vectors.batch_invoke(requests)
+                print(f"\nBatch results: {len(results)} completed")
+    
+    asyncio.run(main())
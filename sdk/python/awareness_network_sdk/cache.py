@@ -0,0 +1,124 @@
+"""
+Awareness Network SDK - Local Caches
+Bounded in-process caches shared by the sync and async clients
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp as returned by the API (``...Z`` allowed)"""
+    if value is None or isinstance(value, datetime):
+        return value
+    text = str(value)
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(text)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def seconds_until(expires_at: Any) -> Optional[float]:
+    """Seconds from now until an API expiry timestamp (None if it never expires)"""
+    parsed = parse_timestamp(expires_at)
+    if parsed is None:
+        return None
+    return (parsed - datetime.now(timezone.utc)).total_seconds()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with a per-entry time-to-live
+
+    Entries without a TTL live until they are evicted or invalidated.
+
+    Every invalidation advances ``generation()``. A read-through fetch takes
+    the generation before its request and passes it to ``set``, so a value
+    read while a write was landing is not cached over the write's
+    invalidation.
+    """
+
+    def __init__(self, max_size: int = 1024, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live entry and mark it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, deadline = entry
+            if deadline is not None and deadline <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self) -> int:
+        """Number of invalidations so far"""
+        with self._lock:
+            return self._generation
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store an entry
+
+        Args:
+            key: Cache key
+            value: Cached value
+            ttl: Seconds until expiry; entries with ``ttl <= 0`` are not stored
+            generation: ``generation()`` when ``value`` was requested; the
+                entry is not stored if anything was invalidated since
+        """
+        if self.max_size <= 0 or (ttl is not None and ttl <= 0):
+            return
+        deadline = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (value, deadline)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop an entry if present"""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
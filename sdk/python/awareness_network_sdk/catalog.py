@@ -0,0 +1,320 @@
+"""
+Awareness Network SDK - Catalog Mirror
+Local columnar copy of the marketplace catalog with incremental sync
+
+Agents that repeatedly enumerate the marketplace keep a mirror instead of
+paging through the API: one bulk snapshot from ``GET /vectors/catalog``,
+then incremental syncs that fetch only rows updated since the previous
+sync. Filterable fields live in NumPy columns (price, rating, dimension,
+popularity, category codes), so ``search_vectors`` is a handful of
+vectorized comparisons and one sort, with no network round trip.
+
+Usage:
+    from awareness_network_sdk.catalog import CatalogMirror
+
+    catalog = CatalogMirror(client)
+    catalog.sync()  # snapshot, then only changes
+    vectors = catalog.search_vectors(category="nlp", min_rating=4.0, sort_by="price")
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, cast
+
+import numpy as np
+
+from .cache import parse_timestamp
+from .client import LatentVector
+
+# Re-read this much before the previous sync to cover rows committed with
+# the same (second-granularity) updatedAt while that sync was running
+SYNC_OVERLAP = timedelta(seconds=1)
+
+SORT_KEYS = (
+    "relevance",
+    "price",
+    "price_low",
+    "price_high",
+    "rating",
+    "popular",
+    "newest",
+    "oldest",
+)
+
+
+def _to_float(value: Any, default: float = 0.0) -> float:
+    return default if value is None else float(value)
+
+
+class CatalogMirror:
+    """
+    Columnar in-memory mirror of the vector catalog
+
+    Rows are upserted in place by vector id; deactivated vectors are
+    masked out and their slots compacted away once they make up half of
+    the table. Safe to query from multiple threads while syncing.
+    """
+
+    def __init__(self, client: Any, page_size: int = 1000, active_only: bool = True):
+        """
+        Args:
+            client: ``AwarenessNetworkClient`` used for catalog requests
+            page_size: Rows per catalog page
+            active_only: Only mirror vectors with status ``active``. The
+                catalog sends other statuses as tombstones without listing
+                data, which are removed either way.
+        """
+        self.client = client
+        self.page_size = page_size
+        self.active_only = active_only
+        self.last_synced_at: Optional[datetime] = None
+
+        self._lock = threading.RLock()
+        self._rows: Dict[int, int] = {}
+        self._records: List[Optional[Dict[str, Any]]] = []
+        self._categories: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+        self._size = 0
+        self._capacity = 0
+        self._allocate(256)
+
+    def _allocate(self, capacity: int) -> None:
+        def grow(column: Optional[np.ndarray], dtype: Any, fill: Any) -> np.ndarray:
+            new = np.full(capacity, fill, dtype=dtype)
+            if column is not None:
+                new[:self._size] = column[:self._size]
+            return new
+
+        self.ids = grow(getattr(self, "ids", None), np.int64, -1)
+        self.price = grow(getattr(self, "price", None), np.float64, 0.0)
+        self.rating = grow(getattr(self, "rating", None), np.float32, 0.0)
+        self.dimension = grow(getattr(self, "dimension", None), np.int32, -1)
+        self.category = grow(getattr(self, "category", None), np.int32, -1)
+        self.total_calls = grow(getattr(self, "total_calls", None), np.int64, 0)
+        self.created_at = grow(getattr(self, "created_at", None), np.float64, 0.0)
+        self.live = grow(getattr(self, "live", None), bool, False)
+        self._records.extend([None] * (capacity - len(self._records)))
+        self._capacity = capacity
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_codes.get(category)
+        if code is None:
+            code = self._category_codes[category] = len(self._categories)
+            self._categories.append(category)
+        return code
+
+    @property
+    def categories(self) -> List[str]:
+        """Categories seen so far"""
+        return list(self._categories)
+
+    # ==================== Sync ====================
+
+    def apply(self, vectors: List[Dict[str, Any]]) -> int:
+        """
+        Upsert catalog rows as returned by ``GET /vectors/catalog``
+
+        Returns:
+            Number of rows inserted, updated or removed
+        """
+        changed = 0
+        with self._lock:
+            for vector in vectors:
+                vector_id = int(vector["id"])
+                row = self._rows.get(vector_id)
+                # Non-active rows arrive as tombstones ({id, status, updatedAt})
+                if vector.get("status", "active") != "active" and (
+                    self.active_only or "category" not in vector
+                ):
+                    if row is not None:
+                        self._remove_row(vector_id, row)
+                        changed += 1
+                    continue
+
+                if row is None:
+                    if self._size == self._capacity:
+                        self._allocate(self._capacity * 2)
+                    row = self._size
+                    self._size += 1
+                    self._rows[vector_id] = row
+
+                created_at = parse_timestamp(vector.get("createdAt"))
+                dimension = vector.get("vectorDimension")
+                self.ids[row] = vector_id
+                self.price[row] = _to_float(vector.get("basePrice"))
+                self.rating[row] = _to_float(vector.get("averageRating"))
+                self.dimension[row] = -1 if dimension is None else int(dimension)
+                self.category[row] = self._category_code(vector["category"])
+                self.total_calls[row] = int(vector.get("totalCalls") or 0)
+                self.created_at[row] = created_at.timestamp() if created_at else 0.0
+                self.live[row] = True
+                self._records[row] = vector
+                changed += 1
+
+            if self._size > 64 and len(self._rows) * 2 < self._size:
+                self._compact()
+        return changed
+
+    def _remove_row(self, vector_id: int, row: int) -> None:
+        del self._rows[vector_id]
+        self.live[row] = False
+        self._records[row] = None
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self.live[:self._size])
+        for column in (
+            "ids",
+            "price",
+            "rating",
+            "dimension",
+            "category",
+            "total_calls",
+            "created_at",
+            "live",
+        ):
+            values = getattr(self, column)
+            values[:len(keep)] = values[keep]
+            values[len(keep):self._size] = False if column == "live" else 0
+        self._records[:len(keep)] = [self._records[i] for i in keep.tolist()]
+        self._records[len(keep):self._size] = [None] * (self._size - len(keep))
+        self._size = len(keep)
+        self._rows = {
+            int(vector_id): row for row, vector_id in enumerate(self.ids[: self._size].tolist())
+        }
+
+    def sync(self) -> int:
+        """
+        Fetch the snapshot on first call, then only rows updated since the
+        previous sync
+
+        Returns:
+            Number of rows changed
+        """
+        params: Dict[str, Any] = {"limit": self.page_size}
+        if self.last_synced_at is not None:
+            params["updatedSince"] = (self.last_synced_at - SYNC_OVERLAP).isoformat()
+
+        changed = 0
+        started_at: Optional[datetime] = None
+        while True:
+            page = self.client._request("GET", "/vectors/catalog", params=params)
+            if started_at is None:
+                started_at = parse_timestamp(page.get("serverTime")) or datetime.now(timezone.utc)
+            changed += self.apply(page.get("vectors", []))
+            cursor = page.get("nextCursor")
+            if not cursor:
+                break
+            params["cursor"] = cursor
+
+        self.last_synced_at = started_at
+        return changed
+
+    # ==================== Queries ====================
+
+    def _to_latent_vector(self, row: int) -> LatentVector:
+        # Only live rows are converted, and those always hold a record
+        record = cast(Dict[str, Any], self._records[row])
+        return LatentVector(
+            id=int(self.ids[row]),
+            name=record.get("title", ""),
+            description=record.get("description", ""),
+            category=record["category"],
+            price=float(self.price[row]),
+            dimension=int(self.dimension[row]),
+            model_architecture=record.get("modelArchitecture") or "",
+            rating=float(self.rating[row]),
+            total_calls=int(self.total_calls[row]),
+            creator_id=int(record.get("creatorId") or 0),
+        )
+
+    def search_rows(
+        self,
+        category: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_rating: Optional[float] = None,
+        sort_by: str = "relevance",
+        limit: int = 20,
+        offset: int = 0
+    ) -> np.ndarray:
+        """
+        Row indices matching the filters, sorted and paginated
+
+        Indices stay valid only until the mirror next changes; hold
+        ``_lock`` across this call and their use, as ``search_vectors`` does.
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {SORT_KEYS}")
+
+        with self._lock:
+            n = self._size
+            mask = self.live[:n].copy()
+            if category is not None:
+                code = self._category_codes.get(category)
+                if code is None:
+                    return np.zeros(0, dtype=np.int64)
+                mask &= self.category[:n] == code
+            if min_price is not None:
+                mask &= self.price[:n] >= min_price
+            if max_price is not None:
+                mask &= self.price[:n] <= max_price
+            if min_rating is not None:
+                mask &= self.rating[:n] >= min_rating
+            rows = np.flatnonzero(mask)
+
+            if sort_by in ("price", "price_low"):
+                keys = [self.price[rows]]
+            elif sort_by == "price_high":
+                keys = [-self.price[rows]]
+            elif sort_by == "rating":
+                keys = [-self.rating[rows]]
+            elif sort_by == "popular":
+                keys = [-self.total_calls[rows]]
+            elif sort_by == "newest":
+                keys = [-self.created_at[rows]]
+            elif sort_by == "oldest":
+                keys = [self.created_at[rows]]
+            else:
+                # relevance: rating, then popularity as tie-breaker
+                keys = [-self.total_calls[rows], -self.rating[rows]]
+
+            end = offset + limit
+            if len(keys) == 1 and end < len(rows):
+                # Only the first ``end`` rows are needed
+                part = np.argpartition(keys[0], end - 1)[:end]
+                rows, keys = rows[part], [keys[0][part]]
+            order = np.lexsort(keys) if len(keys) > 1 else np.argsort(keys[0], kind="stable")
+            return rows[order][offset:end]
+
+    def search_vectors(
+        self,
+        category: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_rating: Optional[float] = None,
+        sort_by: str = "relevance",
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[LatentVector]:
+        """
+        Search the local mirror (same arguments as
+        ``AwarenessNetworkClient.search_vectors``)
+
+        Returns:
+            List of LatentVector objects
+        """
+        with self._lock:
+            rows = self.search_rows(
+                category, min_price, max_price, min_rating, sort_by, limit, offset
+            )
+            return [self._to_latent_vector(row) for row in rows.tolist()]
+
+    def get(self, vector_id: int) -> Optional[LatentVector]:
+        """Look up one mirrored vector by id"""
+        with self._lock:
+            row = self._rows.get(vector_id)
+            return None if row is None else self._to_latent_vector(row)
@@ -0,0 +1,1002 @@
+"""
+Awareness Network Python SDK for AI Agents
+
+This SDK enables AI agents to autonomously discover, purchase, and use
+latent space vectors from the Awareness Network marketplace.
+
+Installation:
+    pip install requests numpy
+
+Usage:
+    from awareness_network_sdk import AwarenessNetworkClient
+    
+    # Initialize client
+    client = AwarenessNetworkClient(api_key="your_api_key")
+    
+    # Register as AI agent
+    client.register_agent("MyAI", "GPT-4")
+    
+    # Browse marketplace
+    vectors = client.search_vectors(category="nlp", min_rating=4.0)
+    
+    # Purchase and use
+    access = client.purchase_vector(vector_id=123)
+    result = client.invoke_vector(access_token, input_data)
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, List, Dict, Any, ClassVar, Iterator, Optional, Union, cast
+from enum import Enum
+
+from .cache import TTLCache, seconds_until
+from .codec import loads, vectors_to_numpy
+from .compression import (
+    ACCEPT_ENCODING,
+    DEFAULT_THRESHOLD,
+    encode_json_body,
+    iter_compressed,
+    resolve_encoding,
+)
+from .instrumentation import (
+    Instrumentation,
+    RequestEvent,
+    activate,
+    count_sent,
+    server_seconds,
+    server_timing,
+    timed_adapter,
+)
+from .models import Getter, ResponseModel, ResultSet, field_from, model
+from .pagination import CursorPaginator
+from .quota import QuotaSnapshot, QuotaTracker
+from .ratelimit import RateLimiter, retry_after, shared_rate_limiter
+from .tracing import Tracer, traced
+
+if TYPE_CHECKING:
+    from requests import Response, Session
+
+    from .catalog import CatalogMirror
+    from .mcp_session import McpSession
+
+class AlignmentMethod(Enum):
+    LINEAR = "linear"
+    NONLINEAR = "nonlinear"
+    LEARNED = "learned"
+
+class TransformMethod(Enum):
+    PCA = "pca"
+    AUTOENCODER = "autoencoder"
+    INTERPOLATION = "interpolation"
+
+@model
+class LatentVector(ResponseModel):
+    """Represents a latent space vector listing"""
+    id: int
+    name: str
+    description: str
+    category: str
+    price: float
+    dimension: int
+    model_architecture: str
+    rating: float
+    total_calls: int
+    creator_id: int
+    
+    # Sources in a GET /vectors/catalog row
+    __response_fields__: ClassVar[Dict[str, Getter]] = {
+        "name": field_from("title", "name", default=""),
+        "description": field_from("description", default=""),
+        "category": field_from("category", default=""),
+        "price": field_from("basePrice", "price", convert=float, default=0.0),
+        "dimension": field_from("vectorDimension", "dimension", default=0),
+        "model_architecture": field_from("modelArchitecture", "model_architecture", default=""),
+        "rating": field_from("averageRating", "rating", convert=float, default=0.0),
+        "total_calls": field_from("totalCalls", "total_calls", default=0),
+        "creator_id": field_from("creatorId", "creator_id", default=0),
+    }
+
+@model
+class PurchaseAccess(ResponseModel):
+    """Represents purchased access to a vector"""
+    access_token: str
+    vector_id: int
+    expires_at: str
+    call_limit: Optional[int]
+    remaining_calls: Optional[int]
+    
+    # Sources in a GET /vectors/my-purchases row
+    __response_fields__: ClassVar[Dict[str, Getter]] = {
+        "access_token": field_from("accessToken", "access_token"),
+        "vector_id": field_from("vectorId", "vector_id"),
+        "expires_at": field_from("expiresAt", "expires_at"),
+        "call_limit": field_from("callLimit", "call_limit"),
+        "remaining_calls": field_from("callsRemaining", "remaining_calls"),
+    }
+
+@model
+class Memory(ResponseModel):
+    """AI agent memory entry"""
+    key: str
+    value: Any
+    created_at: str
+    updated_at: str
+    version: Optional[int] = None
+    expires_at: Optional[str] = None
+    
+    # Sources in a GET /ai/memory/{key} response
+    __response_fields__: ClassVar[Dict[str, Getter]] = {
+        "value": field_from("data", "value"),
+        "created_at": field_from("createdAt", "created_at"),
+        "updated_at": field_from("updatedAt", "updated_at"),
+        "expires_at": field_from("expiresAt", "expires_at"),
+    }
+
+@traced("awareness")
+class AwarenessNetworkClient:
+    """
+    Main client for interacting with Awareness Network API
+    
+    Provides methods for:
+    - AI agent registration and authentication
+    - Marketplace browsing and search
+    - Vector purchase and invocation
+    - Memory synchronization
+    - LatentMAS transformations
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "https://awareness-network.com/api",
+        api_key: Optional[str] = None,
+        memory_cache_size: int = 0,
+        catalog_sync_interval: float = 60.0,
+        numpy_vectors: bool = False,
+        quota_reroute: bool = True,
+        rate_limiter: Union[RateLimiter, bool] = True,
+        compress_requests: Union[bool, str] = False,
+        compression_threshold: int = DEFAULT_THRESHOLD,
+        instrumentation: Optional[Instrumentation] = None,
+        tracer: Optional[Tracer] = None
+    ):
+        """
+        Initialize the client
+        
+        Args:
+            base_url: Base URL of the Awareness Network API
+            api_key: API key for authentication (obtain via register_agent)
+            memory_cache_size: Number of memories to keep in a local read-through
+                cache (0 disables caching). Entries expire at the server's
+                ``expiresAt`` and are invalidated by this client's writes.
+            catalog_sync_interval: Seconds before ``search_vectors`` syncs its
+                local catalog mirror again
+            numpy_vectors: Return vectors in LatentMAS responses as NumPy
+                float32 arrays instead of lists (requires NumPy)
+            quota_reroute: When an access token's tracked quota is used up,
+                invoke with another tracked token for the same vector instead
+                of raising ``QuotaExceededError``
+            rate_limiter: ``RateLimiter`` pacing requests to the server's
+                advertised limits; True uses the process-wide shared limiter,
+                False disables pacing
+            compress_requests: Compress JSON request bodies with "gzip"
+                (or True) or "deflate", streamed in chunks
+            compression_threshold: Smallest body in bytes worth compressing
+            instrumentation: Hooks and exporters receiving per-request phase
+                timings, payload sizes and server processing times
+            tracer: ``Tracer`` opening a span per method call and per request,
+                propagated to the server as a W3C ``traceparent`` header
+        """
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self._session: Optional["Session"] = None
+        self._headers: Dict[str, str] = {}
+        self.memory_cache = TTLCache(max_size=memory_cache_size)
+        self.catalog_sync_interval = catalog_sync_interval
+        self._catalog: Optional["CatalogMirror"] = None
+        self._catalog_synced_at: Optional[float] = None
+        self._catalog_lock = threading.Lock()
+        self.numpy_vectors = numpy_vectors
+        self.quota = QuotaTracker(reroute=quota_reroute)
+        if rate_limiter is True:
+            rate_limiter = shared_rate_limiter()
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter or None
+        self.request_encoding = resolve_encoding(compress_requests)
+        self.compression_threshold = compression_threshold
+        self.tracer = tracer
+        if tracer is not None:
+            instrumentation = tracer.instrument(instrumentation or Instrumentation())
+        self.instrumentation = instrumentation
+        
+        if api_key:
+            self._headers.update({
+                'X-API-Key': api_key,
+                'Content-Type': 'application/json'
+            })
+    
+    @property
+    def session(self) -> "Session":
+        """``requests.Session`` used for API calls, created on first use"""
+        if self._session is None:
+            # Imported here so that importing the SDK stays cheap
+            import requests
+            self._session = requests.Session()
+            self._session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+            self._session.headers.update(self._headers)
+            if self.instrumentation is not None:
+                self._session.mount("http://", timed_adapter())
+                self._session.mount("https://", timed_adapter())
+        return self._session
+    
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Make HTTP request to API"""
+        url = f"{self.base_url}{endpoint}"
+        session = self.session
+        from requests.exceptions import HTTPError
+        
+        event = None
+        if self.instrumentation is not None:
+            event = self.instrumentation.start(method, endpoint)
+            headers = {**event.headers, **(headers or {})}
+        
+        body: Dict[str, Any] = {"json": data}
+        if data is not None and (self.request_encoding is not None or event is not None):
+            payload, body_headers, compress = encode_json_body(
+                data, self.request_encoding, self.compression_threshold
+            )
+            # A generator body is sent chunked, compressed as it goes out
+            if compress:
+                body = {"data": iter_compressed(payload, body_headers["Content-Encoding"])}
+            else:
+                body = {"data": payload}
+            headers = {**body_headers, **(headers or {})}
+            if event is not None:
+                body["data"] = count_sent(body["data"], event) if compress else payload
+                event.request_bytes = 0 if compress else len(payload)
+        
+        if self.rate_limiter is not None:
+            waited = time.perf_counter()
+            self.rate_limiter.acquire(self.api_key, endpoint)
+            if event is not None:
+                event.add("throttle", time.perf_counter() - waited)
+        error: Optional[Exception] = None
+        try:
+            if event is not None:
+                return self._send_instrumented(
+                    event, method=method, url=url, params=params, headers=headers, **body
+                )
+            response = session.request(
+                method=method,
+                url=url,
+                params=params,
+                headers=headers,
+                timeout=30,
+                **body
+            )
+            response.raise_for_status()
+            result: Dict[str, Any] = loads(response.content)
+            return result
+        except HTTPError as e:
+            # raise_for_status always attaches the response it rejected
+            failed = cast("Response", e.response)
+            if failed.status_code == 429 and self.rate_limiter is not None:
+                self.rate_limiter.pause(
+                    self.api_key, endpoint, retry_after(failed.headers.get("Retry-After"))
+                )
+            error_detail = loads(failed.content) if failed.content else {}
+            error = Exception(f"API Error: {failed.status_code} - {error_detail}")
+            raise error
+        except Exception as e:
+            error = Exception(f"Request failed: {str(e)}")
+            raise error
+        finally:
+            if event is not None and self.instrumentation is not None:
+                self.instrumentation.finish(event, error)
+    
+    def _send_instrumented(self, event: RequestEvent, **request: Any) -> Dict[str, Any]:
+        """Send a request, recording its phases into ``event``"""
+        event.attempts = 1
+        with activate(event):
+            sent = time.perf_counter()
+            # Streamed so that headers (TTFB) and body (download) are timed apart
+            response = self.session.request(timeout=30, stream=True, **request)
+        received = time.perf_counter()
+        checkout = event.phases.get("pool_wait", 0.0) + event.phases.get("connect", 0.0)
+        event.add("ttfb", received - sent - checkout)
+        event.status = response.status_code
+        event.server_seconds = server_timing(response.headers.get("Server-Timing"))
+        content = response.content
+        downloaded = time.perf_counter()
+        event.add("download", downloaded - received)
+        # Bytes off the wire, before any Content-Encoding is undone
+        tell = getattr(response.raw, "tell", None)
+        event.response_bytes = tell() if callable(tell) else len(content)
+        response.raise_for_status()
+        result: Dict[str, Any] = loads(content)
+        event.add("decode", time.perf_counter() - downloaded)
+        # Processing time reported in the body is more specific than the header's
+        event.server_seconds = server_seconds(result) or event.server_seconds
+        return result
+    
+    def _vectors(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert vector fields to NumPy arrays when ``numpy_vectors`` is set"""
+        return vectors_to_numpy(response) if self.numpy_vectors else response
+    
+    # ==================== AI Authentication ====================
+    
+    def register_agent(
+        self,
+        agent_name: str,
+        agent_type: str = "Custom",
+        email: Optional[str] = None,
+        metadata: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Register as a new AI agent
+        
+        Args:
+            agent_name: Name of your AI agent
+            agent_type: Type/model (e.g., "GPT-4", "Claude", "Custom")
+            email: Optional email for notifications
+            metadata: Optional metadata about your agent
+            
+        Returns:
+            Registration response with user_id and initial API key
+        """
+        data = {
+            "agentName": agent_name,
+            "agentType": agent_type
+        }
+        if email:
+            data["email"] = email
+        if metadata:
+            data["metadata"] = metadata
+        
+        response = self._request("POST", "/ai/register", data=data)
+        
+        # Store API key if provided
+        if "apiKey" in response:
+            self.api_key = response["apiKey"]
+            self.session.headers.update({'X-API-Key': self.api_key})
+        
+        return response
+    
+    def create_api_key(
+        self,
+        name: str,
+        permissions: Optional[List[str]] = None,
+        expires_in_days: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a new API key
+        
+        Args:
+            name: Descriptive name for the key
+            permissions: List of permissions (e.g., ["read", "write", "purchase"])
+            expires_in_days: Optional expiration in days
+            
+        Returns:
+            API key details including the key value (only shown once)
+        """
+        data = {"name": name}
+        if permissions:
+            data["permissions"] = permissions
+        if expires_in_days:
+            data["expiresInDays"] = expires_in_days
+        
+        return self._request("POST", "/ai/keys", data=data)
+    
+    def list_api_keys(self) -> List[Dict[str, Any]]:
+        """List all API keys for the current agent"""
+        return self._request("GET", "/ai/keys")
+    
+    def iter_api_keys(
+        self, page_size: int = 100, prefetch: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all API keys, one keyset-paginated page at a time
+        
+        Args:
+            page_size: Keys per request (max 1000)
+            prefetch: Fetch the next page while the current one is consumed
+        """
+        yield from CursorPaginator(
+            lambda params: self._request("GET", "/ai/keys", params=params),
+            "keys",
+            page_size=page_size,
+            prefetch=prefetch
+        )
+    
+    def revoke_api_key(self, key_id: int) -> Dict[str, Any]:
+        """Revoke an API key"""
+        return self._request("DELETE", f"/ai/keys/{key_id}")
+    
+    # ==================== Memory Synchronization ====================
+    
+    def store_memory(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> Memory:
+        """
+        Store a memory entry
+        
+        Args:
+            key: Memory key (e.g., "last_purchase", "preferences")
+            value: Any JSON-serializable value
+            ttl_seconds: Optional time-to-live in seconds
+            
+        Returns:
+            Memory object
+        """
+        data = {"value": value}
+        if ttl_seconds:
+            data["ttl"] = ttl_seconds
+        
+        try:
+            response = self._request("PUT", f"/ai/memory/{key}", data=data)
+        finally:
+            # After the write, so a concurrent read cannot re-cache the old value
+            self.memory_cache.invalidate((self.api_key, key))
+        return Memory.from_response(response)
+    
+    def retrieve_memory(self, key: str) -> Optional[Memory]:
+        """
+        Retrieve a memory entry
+        
+        Served from the local cache when ``memory_cache_size`` is enabled and
+        the entry has not expired.
+        
+        Args:
+            key: Memory key
+            
+        Returns:
+            Memory object or None if not found
+        """
+        cache_key = (self.api_key, key)
+        cached: Optional[Memory] = self.memory_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        generation = self.memory_cache.generation()
+        try:
+            response = self._request("GET", f"/ai/memory/{key}")
+            memory = Memory.from_response(response)
+        except:
+            return None
+        
+        self.memory_cache.set(
+            cache_key, memory, ttl=seconds_until(memory.expires_at), generation=generation
+        )
+        return memory
+    
+    def delete_memory(self, key: str) -> Dict[str, Any]:
+        """Delete a memory entry"""
+        try:
+            return self._request("DELETE", f"/ai/memory/{key}")
+        finally:
+            self.memory_cache.invalidate((self.api_key, key))
+    
+    def store_memory_batch(
+        self,
+        writes: List[Dict[str, Any]],
+        deletes: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Apply many memory writes and deletes in one request
+        
+        Args:
+            writes: Entries of the form {"key": ..., "data": {...}, "ttlDays": ...}
+            deletes: Memory keys to delete
+            
+        Returns:
+            Batch result with the new version of each written key
+        """
+        data = {"writes": writes, "deletes": deletes or []}
+        try:
+            return self._request("POST", "/ai/memory/batch", data=data)
+        finally:
+            for key in [w["key"] for w in writes] + (deletes or []):
+                self.memory_cache.invalidate((self.api_key, key))
+    
+    def retrieve_memories(self, keys: List[str]) -> Dict[str, Memory]:
+        """
+        Retrieve many memory entries in as few requests as possible
+        
+        Cached entries are served locally; the rest are fetched with
+        POST /ai/memory/mget in chunks of up to 1000 keys.
+        
+        Args:
+            keys: Memory keys
+            
+        Returns:
+            Mapping of key to Memory for every key that exists
+        """
+        found: Dict[str, Memory] = {}
+        to_fetch = []
+        for key in dict.fromkeys(keys):
+            cached = self.memory_cache.get((self.api_key, key))
+            if cached is not None:
+                found[key] = cached
+            else:
+                to_fetch.append(key)
+        
+        generation = self.memory_cache.generation()
+        for start in range(0, len(to_fetch), 1000):
+            response = self._request(
+                "POST",
+                "/ai/memory/mget",
+                data={"keys": to_fetch[start:start + 1000]}
+            )
+            for item in response.get("memories", []):
+                memory = Memory.from_response(item)
+                self.memory_cache.set(
+                    (self.api_key, memory.key),
+                    memory,
+                    ttl=seconds_until(memory.expires_at),
+                    generation=generation
+                )
+                found[memory.key] = memory
+        return found
+    
+    def iter_memories(self, page_size: int = 500, prefetch: bool = True) -> Iterator[Memory]:
+        """
+        Stream every memory (with values) page by page
+        
+        Pages are fetched with keyset cursors, so hydrating an agent holds
+        at most two pages in memory at a time: the one being consumed and
+        the one being prefetched.
+        
+        Args:
+            page_size: Memories per request (max 1000)
+            prefetch: Fetch the next page while the current one is consumed
+            
+        Yields:
+            Memory objects in storage order
+        """
+        yield from CursorPaginator(
+            lambda params: self._request("GET", "/ai/memory", params=params),
+            "memories",
+            parse=Memory.from_response,
+            params={"includeValues": "true"},
+            page_size=page_size,
+            prefetch=prefetch
+        )
+    
+    def list_memories(self) -> List[Memory]:
+        """List all memories for the current agent"""
+        response = self._request("GET", "/ai/memory")
+        return [Memory.from_response(m) for m in response.get("memories", [])]
+    
+    # ==================== Marketplace ====================
+    
+    def search_vectors(
+        self,
+        category: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        min_rating: Optional[float] = None,
+        sort_by: str = "relevance",
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[LatentVector]:
+        """
+        Search for latent vectors in the marketplace
+        
+        Queries run against a local catalog mirror, which is synced
+        incrementally at most every ``catalog_sync_interval`` seconds.
+        
+        Args:
+            category: Filter by category (e.g., "nlp", "vision", "audio")
+            min_price: Minimum price filter
+            max_price: Maximum price filter
+            min_rating: Minimum rating filter (0-5)
+            sort_by: Sort order ("relevance", "price", "price_high", "rating",
+                "popular", "newest", "oldest")
+            limit: Number of results to return
+            offset: Pagination offset
+            
+        Returns:
+            List of LatentVector objects
+        """
+        return self.catalog.search_vectors(
+            category=category,
+            min_price=min_price,
+            max_price=max_price,
+            min_rating=min_rating,
+            sort_by=sort_by,
+            limit=limit,
+            offset=offset
+        )
+    
+    def iter_vectors(
+        self,
+        category: Optional[str] = None,
+        page_size: int = 1000,
+        prefetch: bool = True
+    ) -> Iterator[LatentVector]:
+        """
+        Scan the whole marketplace catalog without building a local mirror
+        
+        Uses keyset cursors on ``GET /vectors/catalog``, so late pages cost
+        the same as early ones, and requests the next page while the
+        current one is being processed.
+        
+        Args:
+            category: Only vectors in this category
+            page_size: Vectors per request (max 5000)
+            prefetch: Fetch the next page while the current one is consumed
+            
+        Yields:
+            Active LatentVector listings
+        """
+        params = {"status": "active"}
+        if category:
+            params["category"] = category
+        yield from CursorPaginator(
+            lambda page_params: self._request("GET", "/vectors/catalog", params=page_params),
+            "vectors",
+            parse=LatentVector.from_response,
+            params=params,
+            page_size=page_size,
+            prefetch=prefetch
+        )
+    
+    def list_vectors(
+        self, category: Optional[str] = None, page_size: int = 1000
+    ) -> ResultSet[LatentVector]:
+        """
+        Download every active listing into a columnar ``ResultSet``
+        
+        Rows are parsed straight into per-field columns page by page (numeric
+        fields as packed arrays) and ``LatentVector`` objects are only built
+        when a row is accessed, so a 100k-row catalog stays compact.
+        
+        Args:
+            category: Only vectors in this category
+            page_size: Vectors per request (max 5000)
+        """
+        params = {"status": "active"}
+        if category:
+            params["category"] = category
+        vectors = ResultSet(LatentVector)
+        paginator = CursorPaginator[Dict[str, Any]](
+            lambda page_params: self._request("GET", "/vectors/catalog", params=page_params),
+            "vectors",
+            params=params,
+            page_size=page_size
+        )
+        for page in paginator.pages():
+            vectors.extend(page, strict=True)
+        return vectors
+    
+    def iter_purchases(
+        self, page_size: int = 100, prefetch: bool = True
+    ) -> Iterator[PurchaseAccess]:
+        """
+        Iterate over this agent's purchases, oldest first
+        
+        Args:
+            page_size: Purchases per request (max 1000)
+            prefetch: Fetch the next page while the current one is consumed
+        """
+        for purchase in CursorPaginator(
+            lambda params: self._request("GET", "/vectors/my-purchases", params=params),
+            "purchases",
+            parse=PurchaseAccess.from_response,
+            page_size=page_size,
+            prefetch=prefetch
+        ):
+            self.quota.track(
+                purchase.access_token,
+                purchase.vector_id,
+                purchase.remaining_calls,
+                purchase.expires_at,
+            )
+            yield purchase
+    
+    def sync_quotas(self) -> List[QuotaSnapshot]:
+        """
+        Seed the local quota tracker from this agent's purchases
+        
+        Returns:
+            The tracker's snapshot after the sync
+        """
+        for _ in self.iter_purchases():
+            pass
+        return self.quota.snapshot()
+    
+    @property
+    def catalog(self) -> "CatalogMirror":
+        """Local catalog mirror (``CatalogMirror``), synced when stale"""
+        # Concurrent callers wait for one sync instead of each starting their own
+        with self._catalog_lock:
+            if self._catalog is None:
+                from .catalog import CatalogMirror
+                self._catalog = CatalogMirror(self)
+            now = time.monotonic()
+            if (
+                self._catalog_synced_at is None
+                or now - self._catalog_synced_at >= self.catalog_sync_interval
+            ):
+                self._catalog.sync()
+                self._catalog_synced_at = now
+            return self._catalog
+    
+    def get_recommendations(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Get personalized vector recommendations
+        
+        Recommendations are precomputed on the server and refreshed in the
+        background when this agent's behavior changes, so this is a cache read.
+        
+        Args:
+            limit: Number of recommendations (max 20)
+            
+        Returns:
+            List of {"vectorId", "score", "reason"} dicts, best first
+        """
+        response = self._request("GET", "/ai/recommendations", params={"limit": limit})
+        recommendations: List[Dict[str, Any]] = response.get("recommendations", [])
+        return recommendations
+    
+    def get_vector_details(self, vector_id: int) -> LatentVector:
+        """Get detailed information about a specific vector"""
+        # Placeholder - would call /api/vectors/{id}
+        raise NotImplementedError("Use tRPC client or REST API directly")
+    
+    def purchase_vector(
+        self,
+        vector_id: int,
+        call_limit: Optional[int] = None,
+        duration_days: Optional[int] = 30
+    ) -> PurchaseAccess:
+        """
+        Purchase access to a latent vector
+        
+        Args:
+            vector_id: ID of the vector to purchase
+            call_limit: Optional limit on number of calls
+            duration_days: Access duration in days
+            
+        Returns:
+            PurchaseAccess object with access token
+        """
+        # Placeholder - would integrate with Stripe and access management
+        raise NotImplementedError("Use web interface or tRPC client for purchases")
+    
+    def invoke_vector(
+        self,
+        access_token: str,
+        input_data: Any,
+        parameters: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Invoke a purchased vector capability
+        
+        Args:
+            access_token: Access token from purchase
+            input_data: Input data for the vector
+            parameters: Optional parameters
+            
+        Returns:
+            Vector output
+        """
+        # Placeholder - would call MCP invoke endpoint
+        raise NotImplementedError("Use MCP protocol for invocation")
+    
+    # ==================== LatentMAS Transformations ====================
+    
+    def align_vector(
+        self,
+        source_vector: List[float],
+        source_model: str,
+        target_model: str,
+        method: AlignmentMethod = AlignmentMethod.LINEAR
+    ) -> Dict[str, Any]:
+        """
+        Align a vector from one model's latent space to another
+        
+        Args:
+            source_vector: Source latent vector
+            source_model: Source model name (e.g., "gpt-3.5", "bert")
+            target_model: Target model name
+            method: Alignment method
+            
+        Returns:
+            Aligned vector and quality metrics
+        """
+        data = {
+            "source_vector": source_vector,
+            "source_model": source_model,
+            "target_model": target_model,
+            "alignment_method": method.value
+        }
+        
+        return self._vectors(self._request("POST", "/latentmas/align", data=data))
+    
+    def transform_dimension(
+        self,
+        vector: List[float],
+        target_dimension: int,
+        method: TransformMethod = TransformMethod.PCA
+    ) -> Dict[str, Any]:
+        """
+        Transform a vector to a different dimensionality
+        
+        Args:
+            vector: Input vector
+            target_dimension: Target dimension count
+            method: Transformation method
+            
+        Returns:
+            Transformed vector and quality metrics
+        """
+        data = {
+            "vector": vector,
+            "target_dimension": target_dimension,
+            "method": method.value
+        }
+        
+        return self._vectors(self._request("POST", "/latentmas/transform", data=data))
+    
+    def validate_vector(
+        self,
+        vector: List[float],
+        expected_dimension: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate vector quality and integrity
+        
+        Args:
+            vector: Vector to validate
+            expected_dimension: Expected dimension (optional)
+            
+        Returns:
+            Validation results and statistics
+        """
+        data = {"vector": vector}
+        if expected_dimension:
+            data["expected_dimension"] = expected_dimension
+        
+        return self._request("POST", "/latentmas/validate", data=data)
+    
+    def get_supported_models(self) -> Dict[str, Any]:
+        """
+        Get list of supported models for alignment
+        
+        Returns:
+            Dictionary with models and compatibility pairs
+        """
+        return self._request("GET", "/latentmas/models")
+    
+    # ==================== MCP Protocol ====================
+    
+    def mcp_discover(self, category: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Discover available vectors via MCP protocol
+        
+        Args:
+            category: Optional category filter
+            
+        Returns:
+            Discovery payload: ``vectors`` (available capabilities) and the
+            ``rate_limits`` it advertises, which are applied to ``rate_limiter``
+        """
+        params = {}
+        if category:
+            params["category"] = category
+        
+        response = self._request("GET", "/mcp/discover", params=params)
+        if self.rate_limiter is not None and response.get("rate_limits"):
+            self.rate_limiter.configure(response["rate_limits"])
+        return response
+    
+    def sync_rate_limits(self) -> Dict[str, Dict[str, float]]:
+        """
+        Load the server's advertised rate limits into ``rate_limiter``
+        
+        Returns:
+            The limits now applied, by endpoint class
+        """
+        self.mcp_discover()
+        return self.rate_limiter.limits() if self.rate_limiter is not None else {}
+    
+    def mcp_invoke(
+        self,
+        vector_id: int,
+        input_data: Any,
+        access_token: str
+    ) -> Dict[str, Any]:
+        """
+        Invoke a vector via MCP protocol
+        
+        The call is checked against the token's tracked quota first; an
+        exhausted or expired token is rerouted (see ``quota_reroute``) or
+        rejected with ``QuotaExceededError`` without contacting the server.
+        
+        Args:
+            vector_id: Vector ID
+            input_data: Input data (sent as the MCP ``context``)
+            access_token: Access token
+            
+        Returns:
+            Invocation result
+        """
+        token = self.quota.acquire(vector_id, access_token)
+        data = {
+            "vector_id": vector_id,
+            "context": input_data
+        }
+        
+        try:
+            result = self._request(
+                "POST", "/mcp/invoke", data=data, headers={"Authorization": f"Bearer {token}"}
+            )
+        except Exception as e:
+            self.quota.settle(token, error=e)
+            raise
+        self.quota.settle(token, (result.get("usage") or {}).get("calls_remaining"))
+        return result
+    
+    def mcp_session(self, timeout: float = 30.0) -> "McpSession":
+        """
+        Multiplexed MCP session (``McpSession``) over one persistent stream
+        
+        Use as a context manager. Calls from any number of threads share the
+        stream and complete out of order as the server finishes them.
+        
+        Args:
+            timeout: Seconds to wait for the session stream to open
+        """
+        from .mcp_session import McpSession
+        return McpSession(self, timeout=timeout)
+
+
+# ==================== Convenience Functions ====================
+
+def quick_start(agent_name: str, agent_type: str = "Custom") -> AwarenessNetworkClient:
+    """
+    Quick start: Register and return authenticated client
+    
+    Args:
+        agent_name: Your AI agent name
+        agent_type: Agent type/model
+        
+    Returns:
+        Authenticated AwarenessNetworkClient
+    """
+    client = AwarenessNetworkClient()
+    response = client.register_agent(agent_name, agent_type)
+    print(f"✓ Registered as {agent_name} (User ID: {response['userId']})")
+    print(f"✓ API Key: {response.get('apiKey', 'N/A')}")
+    return client
+
+
+if __name__ == "__main__":
+    # Example usage
+    print("Awareness Network SDK - Example Usage\n")
+    
+    # Quick start
+    client = quick_start("TestAI", "GPT-4")
+    
+    # Store memory
+    client.store_memory("preferences", {"category": "nlp", "max_price": 50})
+    print("✓ Stored preferences in memory")
+    
+    # Retrieve memory
+    prefs = client.retrieve_memory("preferences")
+    print(f"✓ Retrieved preferences: {prefs.value if prefs else 'None'}")
+    
+    # Get supported models
+    models = client.get_supported_models()
+    print(f"✓ Supported models: {models.get('models', [])}")
+    
+    # Validate a test vector
+    test_vector = [0.1] * 768
+    validation = client.validate_vector(test_vector, expected_dimension=768)
+    print(f"✓ Vector validation: {'Valid' if validation['valid'] else 'Invalid'}")
+    
+    print("\n✓ SDK test complete!")
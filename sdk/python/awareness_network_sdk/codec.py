@@ -0,0 +1,145 @@
+"""
+Awareness Network SDK - JSON Decoding
+Pluggable response decoder with typed and NumPy-aware helpers
+
+Both clients decode response bodies through ``loads``, which uses the
+fastest installed backend: ``orjson``, then ``msgspec``, then the standard
+library. ``set_json_backend`` pins one explicitly. On top of that:
+
+- ``decode_models`` decodes a body and validates it into SDK models (or a
+  columnar ``ResultSet``) in one step, raising ``ResponseValidationError``
+  with the offending field instead of a ``TypeError`` deep in user code.
+- ``vectors_to_numpy`` turns vector fields (``aligned_vector``, ...) into
+  NumPy arrays right after decoding, so they never linger as lists of
+  Python floats.
+
+Usage:
+    from awareness_network_sdk.codec import set_json_backend, decode_models
+
+    set_json_backend("json")  # e.g. to rule out decoder differences
+    vectors = decode_models(body, LatentVector, items_key="vectors")
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar, Union, cast
+
+from .models import ResponseModel, ResponseValidationError, ResultSet
+
+M = TypeVar("M", bound=ResponseModel)
+
+# Preference order when no backend is pinned
+BACKENDS = ("orjson", "msgspec", "json")
+
+# Response fields holding latent vectors in LatentMAS responses
+VECTOR_FIELDS = ("aligned_vector", "transformed_vector", "vector", "embedding")
+
+_loads: Optional[Callable[[Union[bytes, str]], Any]] = None
+_backend: Optional[str] = None
+
+
+def _load_backend(name: str) -> Callable[[Union[bytes, str]], Any]:
+    if name == "orjson":
+        import orjson
+        return orjson.loads
+    if name == "msgspec":
+        import msgspec
+        decode: Callable[[Union[bytes, str]], Any] = msgspec.json.Decoder().decode
+        return decode
+    if name == "json":
+        return json.loads
+    raise ValueError(f"Unknown JSON backend {name!r}; expected one of {BACKENDS}")
+
+
+def set_json_backend(name: Optional[str] = None) -> str:
+    """
+    Select the decoder used by both clients
+
+    Args:
+        name: ``"orjson"``, ``"msgspec"`` or ``"json"``; ``None`` picks the
+            first installed one in that order
+
+    Returns:
+        Name of the backend now in use
+
+    Raises:
+        ImportError: If the requested backend is not installed
+    """
+    global _loads, _backend
+    if name is not None:
+        _loads, _backend = _load_backend(name), name
+        return name
+    for candidate in BACKENDS[:-1]:
+        try:
+            _loads, _backend = _load_backend(candidate), candidate
+            return candidate
+        except ImportError:
+            continue
+    _loads, _backend = json.loads, "json"
+    return _backend
+
+
+def get_json_backend() -> str:
+    """Name of the decoder in use (selecting one on first call)"""
+    if _backend is None:
+        return set_json_backend()
+    return _backend
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document with the selected backend"""
+    if _loads is None:
+        set_json_backend()
+    return cast(Callable[[Union[bytes, str]], Any], _loads)(data)
+
+
+def vectors_to_numpy(
+    payload: Any, fields: Iterable[str] = VECTOR_FIELDS, dtype: Any = "float32"
+) -> Any:
+    """
+    Replace list-valued vector fields of a decoded object with NumPy arrays
+
+    Only top-level keys of a dict payload are converted. Requires NumPy
+    (``pip install awareness-network-sdk[local]``).
+    """
+    import numpy as np
+
+    if isinstance(payload, dict):
+        for field in fields:
+            value = payload.get(field)
+            if isinstance(value, list):
+                payload[field] = np.asarray(value, dtype=dtype)
+    return payload
+
+
+def decode_models(
+    data: Union[bytes, str, Dict[str, Any], List[Any]],
+    model_cls: Type[M],
+    items_key: Optional[str] = None,
+    columnar: bool = False
+) -> Union[List[M], ResultSet[M]]:
+    """
+    Decode a response body into validated SDK models
+
+    Args:
+        data: Raw body, or an already decoded object
+        model_cls: Model declared with ``@model`` (``LatentVector``, ...)
+        items_key: Field holding the list of rows (``None`` if the body
+            is the list itself)
+        columnar: Return a ``ResultSet`` instead of a list of objects
+
+    Raises:
+        ResponseValidationError: If the body or a row does not match the model
+    """
+    payload = loads(data) if isinstance(data, (bytes, str)) else data
+    rows = payload
+    if items_key is not None:
+        if not isinstance(payload, dict) or not isinstance(payload.get(items_key), list):
+            raise ResponseValidationError(f"expected an object with a {items_key!r} list")
+        rows = payload[items_key]
+    elif not isinstance(rows, list):
+        raise ResponseValidationError("expected a list of rows")
+
+    if columnar:
+        return ResultSet.from_responses(model_cls, rows, strict=True)
+    parse = model_cls.__response_values_strict__
+    return [model_cls(*parse(row)) for row in rows]
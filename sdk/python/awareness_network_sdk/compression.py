@@ -0,0 +1,96 @@
+"""
+Awareness Network SDK - Request Compression
+Streamed gzip/deflate compression of large request bodies (stdlib only)
+
+KV-cache alignments, batch invocations and memory writes are large JSON
+bodies of mostly floats, which compress well. With ``compress_requests``
+set, a client serializes such a body once and sends it through a
+``zlib.compressobj`` chunk by chunk (chunked transfer encoding), so the
+compressed copy never exists in full next to the plain one. Bodies below
+the threshold are sent as they are.
+
+Responses need no help: both clients advertise ``Accept-Encoding: gzip,
+deflate`` and their HTTP libraries decompress transparently. The server
+compresses the LatentMAS, batch-invoke and memory routes.
+
+Usage:
+    from awareness_network_sdk import AwarenessNetworkClient
+
+    client = AwarenessNetworkClient(api_key="your_api_key", compress_requests=True)
+    client.align_vector(large_vector, "gpt-4", "claude")  # sent gzip-compressed
+"""
+
+import json
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple, Union
+
+ACCEPT_ENCODING = "gzip, deflate"
+ENCODINGS = ("gzip", "deflate")
+
+# Bodies smaller than this are not worth a compressor
+DEFAULT_THRESHOLD = 8 * 1024
+DEFAULT_LEVEL = 6
+CHUNK_SIZE = 64 * 1024
+
+# zlib window bits producing each Content-Encoding's framing
+_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def resolve_encoding(compress_requests: Union[bool, str]) -> Optional[str]:
+    """Map a client's ``compress_requests`` option to a Content-Encoding"""
+    if compress_requests is True:
+        return "gzip"
+    if not compress_requests:
+        return None
+    if compress_requests not in ENCODINGS:
+        raise ValueError(
+            f"Unsupported request encoding {compress_requests!r} (use one of {ENCODINGS})"
+        )
+    return compress_requests
+
+
+def iter_compressed(
+    body: bytes,
+    encoding: str = "gzip",
+    level: int = DEFAULT_LEVEL,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Compress ``body`` incrementally, yielding compressed chunks"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _WBITS[encoding])
+    view = memoryview(body)
+    for start in range(0, len(view), chunk_size):
+        chunk = compressor.compress(view[start:start + chunk_size])
+        if chunk:
+            yield chunk
+    yield compressor.flush()
+
+
+async def aiter_compressed(
+    body: bytes,
+    encoding: str = "gzip",
+    level: int = DEFAULT_LEVEL,
+    chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """``iter_compressed`` as an async iterator (for aiohttp request bodies)"""
+    for chunk in iter_compressed(body, encoding, level, chunk_size):
+        yield chunk
+
+
+def encode_json_body(
+    data: Any,
+    encoding: Optional[str],
+    threshold: int = DEFAULT_THRESHOLD
+) -> Tuple[bytes, Dict[str, str], bool]:
+    """
+    Serialize a JSON request body and decide whether to compress it
+
+    Returns:
+        ``(body, headers, compress)``: the plain body, the headers to send
+        with it and whether it should go through ``iter_compressed``
+    """
+    body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if encoding is not None and len(body) >= threshold:
+        headers["Content-Encoding"] = encoding
+        return body, headers, True
+    return body, headers, False
@@ -0,0 +1,487 @@
+"""
+Awareness Network SDK - Request Instrumentation
+Per-request phase timings, payload sizes and server time, with pluggable hooks
+
+A client built with ``instrumentation=Instrumentation(...)`` records one
+``RequestEvent`` per ``_request`` call:
+
+- ``phases``: seconds spent in each phase, summed over attempts
+    - ``throttle``: waiting for the client-side rate limiter
+    - ``pool_wait``: checking a connection out of the pool
+    - ``connect``: opening a new connection (TCP and TLS)
+    - ``ttfb``: sending the request until the response headers arrive
+    - ``download``: reading the response body
+    - ``decode``: parsing the JSON
+    - ``total``: the whole call, retries and backoff included
+- ``request_bytes`` / ``response_bytes``: bodies as sent and received
+- ``attempts``: 1 plus the number of retries
+- ``server_seconds``: the server's own processing time, when the response
+  reports it (LatentMAS ``metadata.processing_time_ms``, ``latency_ms``,
+  else the ``Server-Timing`` header)
+
+Pre-hooks run before the request is sent and may add ``event.headers``;
+post-hooks and exporters receive the finished event, failed or not. Hooks
+run inline on the calling thread or task, so keep them cheap.
+
+``HistogramExporter`` keeps recent samples per route and phase for
+p50/p95/p99 and renders everything in the Prometheus text format.
+
+Usage:
+    from awareness_network_sdk import AwarenessNetworkClient, HistogramExporter, Instrumentation
+
+    metrics = HistogramExporter()
+    client = AwarenessNetworkClient(api_key="your_api_key",
+                                    instrumentation=Instrumentation(exporters=[metrics]))
+    client.align_vector(vector, "gpt-4", "claude")
+    metrics.percentiles("/latentmas/align")  # {"p50": ..., "p95": ..., "p99": ...}
+    print(metrics.to_prometheus())
+"""
+
+import math
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+PHASES = ("throttle", "pool_wait", "connect", "ttfb", "download", "decode", "total")
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Path parameters collapsed so that histograms stay per endpoint
+_ROUTE_PATTERNS = (
+    (re.compile(r"^/ai/memory/(?!batch$|mget$)[^/]+$"), "/ai/memory/:key"),
+    (re.compile(r"/\d+(?=/|$)"), "/:id"),
+)
+
+
+def route_of(endpoint: str) -> str:
+    """
+    Low-cardinality route for an endpoint path
+
+    The ``/api`` prefix is dropped (the sync client's base URL includes it,
+    the async client's endpoints do) and ids and memory keys are replaced by
+    placeholders: ``/api/vectors/7`` -> ``/vectors/:id``.
+    """
+    path = endpoint.split("?", 1)[0]
+    if path.startswith("/api/"):
+        path = path[4:]
+    for pattern, replacement in _ROUTE_PATTERNS:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+def server_seconds(data: Any) -> Optional[float]:
+    """Server-reported processing time of a response body, in seconds"""
+    if not isinstance(data, dict):
+        return None
+    metadata = data.get("metadata")
+    if isinstance(metadata, dict):
+        for name in ("processing_time_ms", "processingTimeMs"):
+            if isinstance(metadata.get(name), (int, float)):
+                return float(metadata[name]) / 1000.0
+    if isinstance(data.get("latency_ms"), (int, float)):
+        return float(data["latency_ms"]) / 1000.0
+    return None
+
+
+def server_timing(header: Optional[str]) -> Optional[float]:
+    """Total ``dur`` of a ``Server-Timing`` header, in seconds"""
+    if not header:
+        return None
+    total = None
+    for metric in header.split(","):
+        for param in metric.split(";")[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "dur":
+                try:
+                    total = (total or 0.0) + float(value.strip().strip('"'))
+                except ValueError:
+                    pass
+    return None if total is None else total / 1000.0
+
+
+@dataclass
+class RequestEvent:
+    """Timings and sizes of one client request"""
+    method: str
+    endpoint: str
+    route: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    status: Optional[int] = None
+    attempts: int = 0
+    phases: Dict[str, float] = field(default_factory=dict)
+    request_bytes: int = 0
+    response_bytes: int = 0
+    server_seconds: Optional[float] = None
+    error: Optional[str] = None
+    started: float = field(default_factory=time.perf_counter)
+    # Set by a Tracer's hooks: the request's client span
+    span: Optional[Any] = None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+
+Hook = Callable[[RequestEvent], None]
+
+
+class Instrumentation:
+    """
+    Hooks and exporters shared by the clients that use this instrumentation
+
+    Args:
+        exporters: Objects with a ``record(event)`` method, called with every
+            finished event after the post-hooks
+    """
+
+    def __init__(self, exporters: Iterable[Any] = ()):
+        self.exporters: List[Any] = list(exporters)
+        self._pre_hooks: List[Hook] = []
+        self._post_hooks: List[Hook] = []
+
+    def add_pre_hook(self, hook: Hook) -> Hook:
+        """Run ``hook(event)`` before each request is sent (usable as a decorator)"""
+        self._pre_hooks.append(hook)
+        return hook
+
+    def add_post_hook(self, hook: Hook) -> Hook:
+        """Run ``hook(event)`` after each request finishes (usable as a decorator)"""
+        self._post_hooks.append(hook)
+        return hook
+
+    def add_exporter(self, exporter: Any) -> Any:
+        self.exporters.append(exporter)
+        return exporter
+
+    def start(self, method: str, endpoint: str, request_bytes: int = 0) -> RequestEvent:
+        """New event for a request about to be made; runs the pre-hooks"""
+        event = RequestEvent(method, endpoint, route_of(endpoint), request_bytes=request_bytes)
+        for hook in self._pre_hooks:
+            hook(event)
+        return event
+
+    def finish(self, event: RequestEvent, error: Optional[BaseException] = None) -> None:
+        """Close ``event``; runs the post-hooks and exporters"""
+        event.phases["total"] = time.perf_counter() - event.started
+        if error is not None and event.error is None:
+            event.error = f"{type(error).__name__}: {error}"
+        for hook in self._post_hooks:
+            hook(event)
+        for exporter in self.exporters:
+            exporter.record(event)
+
+
+class _Window:
+    """Most recent samples of one series, plus running count and sum"""
+
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.count = 0
+        self.sum = 0.0
+
+    def add(self, value: float) -> None:
+        self.samples.append(value)
+        self.count += 1
+        self.sum += value
+
+    def quantiles(self, quantiles: Iterable[float]) -> Dict[float, float]:
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {q: 0.0 for q in quantiles}
+        # Nearest rank
+        return {
+            q: ordered[min(len(ordered), max(1, math.ceil(q * len(ordered)))) - 1]
+            for q in quantiles
+        }
+
+
+def _label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class HistogramExporter:
+    """
+    In-memory latency distributions per route and phase
+
+    Quantiles are computed over the last ``window`` samples of each series;
+    counts and sums cover everything recorded. Thread-safe.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        self._lock = threading.Lock()
+        self._phases: Dict[Tuple[str, str], _Window] = {}
+        self._server: Dict[str, _Window] = {}
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._retries: Dict[str, int] = {}
+        self._bytes: Dict[Tuple[str, str], int] = {}
+
+    def record(self, event: RequestEvent) -> None:
+        route = event.route
+        status = str(event.status) if event.status is not None else "error"
+        with self._lock:
+            for phase, seconds in event.phases.items():
+                series = self._phases.get((route, phase))
+                if series is None:
+                    series = self._phases[(route, phase)] = _Window(self.window)
+                series.add(seconds)
+            if event.server_seconds is not None:
+                if route not in self._server:
+                    self._server[route] = _Window(self.window)
+                self._server[route].add(event.server_seconds)
+            key = (route, event.method, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._retries[route] = self._retries.get(route, 0) + event.retries
+            for direction, size in (
+                ("sent", event.request_bytes),
+                ("received", event.response_bytes),
+            ):
+                self._bytes[(route, direction)] = self._bytes.get((route, direction), 0) + size
+
+    def percentiles(self, route: str, phase: str = "total") -> Dict[str, float]:
+        """``{"p50", "p95", "p99"}`` in seconds for one route and phase"""
+        with self._lock:
+            series = (
+                self._server.get(route) if phase == "server" else self._phases.get((route, phase))
+            )
+            values = (
+                series.quantiles(QUANTILES) if series is not None else {q: 0.0 for q in QUANTILES}
+            )
+        return {f"p{int(q * 100)}": v for q, v in values.items()}
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Per route and phase (``server`` included): count and p50/p95/p99"""
+        with self._lock:
+            series = dict(self._phases)
+            series.update(((route, "server"), window) for route, window in self._server.items())
+            result: Dict[str, Dict[str, Dict[str, float]]] = {}
+            for (route, phase), window in sorted(series.items()):
+                stats: Dict[str, float] = {"count": window.count}
+                stats.update(
+                    (f"p{int(q * 100)}", v) for q, v in window.quantiles(QUANTILES).items()
+                )
+                result.setdefault(route, {})[phase] = stats
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            for table in (self._phases, self._server, self._requests, self._retries, self._bytes):
+                table.clear()
+
+    def to_prometheus(self, prefix: str = "awareness_sdk") -> str:
+        """Every series in the Prometheus text exposition format"""
+        lines: List[str] = []
+
+        def summary(name: str, help_text: str, series: Dict[str, _Window]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} summary")
+            for labels, window in sorted(series.items()):
+                for q, value in window.quantiles(QUANTILES).items():
+                    lines.append(f'{name}{{{labels},quantile="{q}"}} {value:.6f}')
+                lines.append(f"{name}_sum{{{labels}}} {window.sum:.6f}")
+                lines.append(f"{name}_count{{{labels}}} {window.count}")
+
+        def counter(name: str, help_text: str, values: Dict[str, int]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in sorted(values.items()):
+                lines.append(f"{name}{{{labels}}} {value}")
+
+        with self._lock:
+            summary(f"{prefix}_request_phase_seconds", "Client-side request phase durations",
+                    {f'route="{_label(r)}",phase="{p}"': w for (r, p), w in self._phases.items()})
+            summary(f"{prefix}_server_processing_seconds", "Server-reported processing time",
+                    {f'route="{_label(r)}"': w for r, w in self._server.items()})
+            counter(
+                f"{prefix}_requests_total",
+                "Requests by route, method and status",
+                {
+                    f'route="{_label(r)}",method="{m}",status="{s}"': n
+                    for (r, m, s), n in self._requests.items()
+                },
+            )
+            counter(f"{prefix}_request_retries_total", "Retried attempts",
+                    {f'route="{_label(r)}"': n for r, n in self._retries.items()})
+            counter(
+                f"{prefix}_payload_bytes_total",
+                "Body bytes on the wire",
+                {f'route="{_label(r)}",direction="{d}"': n for (r, d), n in self._bytes.items()},
+            )
+        return "\n".join(lines) + "\n"
+
+
+# ==================== HTTP library integration ====================
+
+def count_sent(chunks: Iterable[bytes], event: RequestEvent) -> Iterator[bytes]:
+    """Pass a streamed request body through, adding its size to ``event``"""
+    for chunk in chunks:
+        event.request_bytes += len(chunk)
+        yield chunk
+
+
+async def acount_sent(chunks: AsyncIterator[bytes], event: RequestEvent) -> AsyncIterator[bytes]:
+    """``count_sent`` for async request bodies"""
+    async for chunk in chunks:
+        event.request_bytes += len(chunk)
+        yield chunk
+
+
+class StreamedResponse:
+    """
+    Streamed response whose event finishes when the caller releases it
+
+    The time from the headers to ``release()`` is recorded as ``download``,
+    so the event (and its span) covers the body transfer. Other attributes
+    are those of the wrapped response.
+    """
+
+    def __init__(self, response: Any, event: RequestEvent, instrumentation: Instrumentation):
+        self._response = response
+        self._event = event
+        self._instrumentation = instrumentation
+        self._received = time.perf_counter()
+        self._finished = False
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    def release(self) -> Any:
+        try:
+            return self._response.release()
+        finally:
+            if not self._finished:
+                self._finished = True
+                self._event.add("download", time.perf_counter() - self._received)
+                self._instrumentation.finish(self._event)
+
+
+_active = threading.local()
+
+
+def _current() -> Optional[RequestEvent]:
+    return getattr(_active, "event", None)
+
+
+class activate:
+    """Make ``event`` the target of the sync connection-pool timings on this thread"""
+
+    def __init__(self, event: RequestEvent):
+        self.event = event
+
+    def __enter__(self) -> RequestEvent:
+        _active.event = self.event
+        return self.event
+
+    def __exit__(self, *exc: Any) -> None:
+        _active.event = None
+
+
+_ADAPTER: Optional[type] = None
+
+
+def timed_adapter() -> Any:
+    """
+    ``requests`` transport adapter timing pool checkout and connects
+
+    Its urllib3 pools record ``pool_wait`` and ``connect`` into the event
+    activated on the calling thread. Built on first use so that importing
+    the SDK does not import requests.
+    """
+    global _ADAPTER
+    if _ADAPTER is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.connection import HTTPConnection, HTTPSConnection
+        from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+        def timed_connection(base: Type[HTTPConnection]) -> type:
+            def connect(self: Any) -> None:
+                started = time.perf_counter()
+                base.connect(self)
+                event = _current()
+                if event is not None:
+                    event.add("connect", time.perf_counter() - started)
+            return type(f"Timed{base.__name__}", (base,), {"connect": connect})
+
+        def timed_pool(base: Type[HTTPConnectionPool], connection: type) -> type:
+            def _get_conn(self: Any, timeout: Optional[float] = None) -> Any:
+                started = time.perf_counter()
+                conn = base._get_conn(self, timeout)
+                event = _current()
+                if event is not None:
+                    event.add("pool_wait", time.perf_counter() - started)
+                return conn
+            return type(
+                f"Timed{base.__name__}",
+                (base,),
+                {"_get_conn": _get_conn, "ConnectionCls": connection},
+            )
+
+        pools = {
+            "http": timed_pool(HTTPConnectionPool, timed_connection(HTTPConnection)),
+            "https": timed_pool(HTTPSConnectionPool, timed_connection(HTTPSConnection)),
+        }
+
+        class TimedHTTPAdapter(HTTPAdapter):
+            def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+                super().init_poolmanager(*args, **kwargs)
+                self.poolmanager.pool_classes_by_scheme = pools
+
+        _ADAPTER = TimedHTTPAdapter
+    return _ADAPTER()
+
+
+def trace_config() -> Any:
+    """
+    ``aiohttp.TraceConfig`` recording pool wait, connect and TTFB
+
+    Requests pass their ``RequestEvent`` as ``trace_request_ctx``.
+    """
+    import aiohttp
+
+    config = aiohttp.TraceConfig()
+
+    async def on_request_start(session: Any, ctx: Any, params: Any) -> None:
+        ctx.request_started = time.perf_counter()
+        ctx.checkout = 0.0
+
+    async def on_request_end(session: Any, ctx: Any, params: Any) -> None:
+        event = ctx.trace_request_ctx
+        if isinstance(event, RequestEvent):
+            # The connection is checked out between request start and end
+            event.add("ttfb", time.perf_counter() - ctx.request_started - ctx.checkout)
+            event.status = params.response.status
+
+    config.on_request_start.append(on_request_start)
+    config.on_request_end.append(on_request_end)
+
+    for signal, phase in (("connection_queued", "pool_wait"), ("connection_create", "connect")):
+        async def on_start(session: Any, ctx: Any, params: Any, phase: str = phase) -> None:
+            setattr(ctx, phase, time.perf_counter())
+
+        async def on_end(session: Any, ctx: Any, params: Any, phase: str = phase) -> None:
+            elapsed = time.perf_counter() - getattr(ctx, phase)
+            ctx.checkout += elapsed
+            event = ctx.trace_request_ctx
+            if isinstance(event, RequestEvent):
+                event.add(phase, elapsed)
+
+        getattr(config, f"on_{signal}_start").append(on_start)
+        getattr(config, f"on_{signal}_end").append(on_end)
+    return config
@@ -0,0 +1,514 @@
+"""
+Awareness Network SDK - MCP Session Mode
+Many concurrent MCP tool calls multiplexed over one persistent connection
+
+A session holds the server's ``/mcp/session`` Server-Sent Events stream
+open. Each call gets a request id and is POSTed (alone or in a batch) over
+a keep-alive connection; the server answers 202 at once and later writes
+the result to the stream as soon as that call completes. Results are
+matched to their callers by id, so a slow call never holds up a fast one
+and a multi-step plan pays connection setup once instead of per call.
+
+Calls go through the client's quota tracker and rate limiter like
+``mcp_invoke`` does.
+
+Usage:
+    from awareness_network_sdk import AwarenessNetworkClient
+
+    client = AwarenessNetworkClient(api_key="your_api_key")
+    with client.mcp_session() as session:
+        futures = [session.submit_invoke(7, text, access_token=token) for text in texts]
+        results = [future.result() for future in futures]  # completion order is free
+
+    async with async_client.mcp_session() as session:
+        results = await asyncio.gather(*(session.invoke(7, t, token) for t in texts))
+"""
+
+import functools
+import itertools
+import socket
+import threading
+import time
+from concurrent.futures import CancelledError, Future
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .codec import loads
+from .quota import QuotaTracker
+from .ratelimit import RateLimiter
+
+
+class McpCallError(Exception):
+    """A call in an MCP session failed on the server"""
+
+    def __init__(self, status: int, error: Any):
+        self.status = status
+        self.error = error
+        super().__init__(f"API Error: {status} - {error}")
+
+
+class McpSessionClosed(ConnectionError):
+    """The session stream ended while calls were still waiting"""
+
+
+class SSEParser:
+    """Incremental Server-Sent Events parser yielding ``(event, data)`` pairs"""
+
+    def __init__(self) -> None:
+        self._event = "message"
+        self._data: List[str] = []
+
+    def feed(self, line: str) -> Optional[Tuple[str, str]]:
+        """Consume one line (without its newline); returns a completed event"""
+        if not line:
+            if not self._data:
+                return None
+            message = (self._event, "\n".join(self._data))
+            self._event, self._data = "message", []
+            return message
+        if line.startswith(":"):
+            return None
+        name, _, value = line.partition(":")
+        value = value[1:] if value.startswith(" ") else value
+        if name == "event":
+            self._event = value
+        elif name == "data":
+            self._data.append(value)
+        return None
+
+
+class _SessionCalls:
+    """Request-id bookkeeping shared by the sync and async sessions"""
+
+    def __init__(
+        self, quota: QuotaTracker, rate_limiter: Optional[RateLimiter], api_key: Optional[str]
+    ):
+        self.session_id: Optional[str] = None
+        self.max_batch_size = 100
+        self._quota = quota
+        self._rate_limiter = rate_limiter
+        self._api_key = api_key
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Calls submitted and not yet answered"""
+        with self._lock:
+            return len(self._pending)
+
+    def _prepare(
+        self, method: str, params: Optional[Dict[str, Any]], access_token: Optional[str]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Assign a request id and, for invocations, reserve quota"""
+        params = dict(params or {})
+        token = access_token
+        if method == "invoke":
+            token = self._quota.acquire(params.get("vector_id"), access_token)
+        call = {"id": next(self._ids), "method": method, "params": params}
+        if token is not None:
+            call["access_token"] = token
+        return call, token
+
+    def _delay(self, method: str) -> float:
+        """Rate-limiter wait for one call (other methods ride on the POST's own token)"""
+        if self._rate_limiter is None or method != "invoke":
+            return 0.0
+        return self._rate_limiter.reserve(self._api_key, "/mcp/invoke")
+
+    def _settle(self, method: str, token: Optional[str], future: Any) -> None:
+        """Done-callback: report an invocation's outcome to the quota tracker"""
+        if method != "invoke":
+            return
+        if future.cancelled():
+            self._quota.settle(token, error=CancelledError())
+        elif future.exception() is not None:
+            self._quota.settle(token, error=future.exception())
+        else:
+            self._quota.settle(
+                token, ((future.result() or {}).get("usage") or {}).get("calls_remaining")
+            )
+
+    def _on_event(
+        self, event: str, data: str, resolve: Callable[[Any, Any, Optional[BaseException]], None]
+    ) -> None:
+        if event == "session":
+            info = loads(data)
+            self.session_id = info["session_id"]
+            self.max_batch_size = info.get("max_batch_size", self.max_batch_size)
+            return
+        message = loads(data)
+        with self._lock:
+            waiter = self._pending.pop(message.get("id"), None)
+        if waiter is None:
+            return
+        if "error" in message:
+            resolve(waiter, None, McpCallError(message.get("status", 500), message["error"]))
+        else:
+            resolve(waiter, message.get("result"), None)
+
+    def _fail_pending(
+        self, error: BaseException, resolve: Callable[[Any, Any, Optional[BaseException]], None]
+    ) -> None:
+        with self._lock:
+            waiters = list(self._pending.values())
+            self._pending.clear()
+        for waiter in waiters:
+            resolve(waiter, None, error)
+
+
+class McpSession(_SessionCalls):
+    """
+    Multiplexed MCP session for ``AwarenessNetworkClient``
+
+    Thread-safe: any number of threads may submit calls; a background
+    thread reads the stream and completes their futures.
+    """
+
+    def __init__(self, client: Any, timeout: float = 30.0):
+        """
+        Args:
+            client: The ``AwarenessNetworkClient`` whose HTTP session is used
+            timeout: Seconds to wait for the stream to open
+        """
+        super().__init__(client.quota, client.rate_limiter, client.api_key)
+        self.client = client
+        self.timeout = timeout
+        self._response: Any = None
+        self._reader: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._closed = False
+
+    def open(self) -> "McpSession":
+        """Open the stream and wait for the server to assign a session id"""
+        # No read timeout: the stream idles between results
+        response = self.client.session.get(
+            f"{self.client.base_url}/mcp/session", stream=True, timeout=(self.timeout, None),
+            headers={"Accept": "text/event-stream"},
+        )
+        response.raise_for_status()
+        response.encoding = "utf-8"
+        self._response = response
+        self._reader = threading.Thread(target=self._read, name="mcp-session-reader", daemon=True)
+        self._reader.start()
+        if not self._ready.wait(self.timeout) or self.session_id is None:
+            self.close()
+            raise McpSessionClosed("MCP session stream did not start")
+        return self
+
+    def close(self) -> None:
+        """Close the stream; calls still waiting fail with ``McpSessionClosed``"""
+        self._closed = True
+        if self._response is not None:
+            # Closing the response here would wait on the reader's blocked
+            # read; shutting the socket down wakes it, and it closes the response
+            connection = getattr(self._response.raw, "_connection", None)
+            sock = getattr(connection, "sock", None)
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        if self._reader is not None and self._reader is not threading.current_thread():
+            self._reader.join(self.timeout)
+        self._fail_pending(McpSessionClosed("MCP session closed"), self._resolve)
+
+    def __enter__(self) -> "McpSession":
+        return self.open()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def _resolve(future: Future, result: Any, error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _read(self) -> None:
+        parser = SSEParser()
+        reason = "MCP session stream ended"
+        try:
+            for raw in self._response.iter_lines(decode_unicode=True):
+                message = parser.feed(raw.rstrip("\r") if raw else "")
+                if message is not None:
+                    self._on_event(*message, self._resolve)
+                    if message[0] == "session":
+                        self._ready.set()
+        except Exception as e:
+            if not self._closed:
+                reason = f"MCP session stream failed: {e}"
+        finally:
+            self._response.close()
+            self._ready.set()
+            self._fail_pending(McpSessionClosed(reason), self._resolve)
+
+    def submit_many(self, calls: Iterable[Dict[str, Any]]) -> List[Future]:
+        """
+        Send several calls in one POST
+
+        Args:
+            calls: ``{"method", "params", "access_token"}`` dicts
+
+        Returns:
+            One future per call, in the order given
+        """
+        if self.session_id is None or self._closed:
+            raise McpSessionClosed("MCP session is not open")
+        prepared, futures = [], []
+        delay = 0.0
+        try:
+            for spec in calls:
+                call, token = self._prepare(
+                    spec["method"], spec.get("params"), spec.get("access_token")
+                )
+                future: Future = Future()
+                future.add_done_callback(functools.partial(self._settle, spec["method"], token))
+                prepared.append(call)
+                futures.append(future)
+                delay = max(delay, self._delay(spec["method"]))
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+        if delay > 0:
+            time.sleep(delay)
+
+        with self._lock:
+            self._pending.update((call["id"], future) for call, future in zip(prepared, futures))
+        for start in range(0, len(prepared), self.max_batch_size):
+            batch = prepared[start:start + self.max_batch_size]
+            try:
+                self.client._request(
+                    "POST", f"/mcp/session/{self.session_id}", data={"calls": batch}
+                )
+            except Exception as e:
+                with self._lock:
+                    waiters = [self._pending.pop(call["id"], None) for call in batch]
+                for waiter in waiters:
+                    if waiter is not None:
+                        self._resolve(waiter, None, e)
+        return futures
+
+    def submit(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        access_token: Optional[str] = None,
+    ) -> Future:
+        """Send one call; returns a future for its result"""
+        return self.submit_many(
+            [{"method": method, "params": params, "access_token": access_token}]
+        )[0]
+
+    def submit_invoke(
+        self,
+        vector_id: int,
+        context: Any,
+        access_token: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> Future:
+        """Start an invocation (same result as ``mcp_invoke``) without waiting"""
+        params = {"vector_id": vector_id, "context": context}
+        if parameters:
+            params["parameters"] = parameters
+        return self.submit("invoke", params, access_token)
+
+    def invoke(
+        self,
+        vector_id: int,
+        context: Any,
+        access_token: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Invoke a vector over the session and wait for its result"""
+        result: Dict[str, Any] = self.submit_invoke(
+            vector_id, context, access_token, parameters
+        ).result(timeout)
+        return result
+
+    def discover(
+        self, category: Optional[str] = None, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """``mcp_discover`` over the session"""
+        result: Dict[str, Any] = self.submit(
+            "discover", {"category": category} if category else None
+        ).result(timeout)
+        return result
+
+
+class AsyncMcpSession(_SessionCalls):
+    """
+    Multiplexed MCP session for ``AsyncAwarenessClient``
+
+    Use as ``async with client.mcp_session() as session``; any number of
+    tasks may await calls concurrently. Calls issued in the same event loop
+    iteration are sent together in one POST.
+    """
+
+    def __init__(self, client: Any):
+        super().__init__(client.quota, client.rate_limiter, client.api_key)
+        self.client = client
+        self._response: Any = None
+        self._reader: Any = None
+        self._outbox: List[Dict[str, Any]] = []
+        self._flushes: set = set()
+
+    async def open(self) -> "AsyncMcpSession":
+        """Open the stream and wait for the server to assign a session id"""
+        import asyncio
+        if not self.client._session:
+            raise RuntimeError("Client must be used as async context manager")
+        import aiohttp
+        # The client's total timeout would cut the long-lived stream
+        self._response = await self.client._session.get(
+            f"{self.client.base_url}/api/mcp/session", headers={"Accept": "text/event-stream"},
+            timeout=aiohttp.ClientTimeout(total=None, connect=self.client._timeout_seconds)
+        )
+        self._response.raise_for_status()
+        ready = asyncio.get_running_loop().create_future()
+        self._reader = asyncio.ensure_future(self._read(ready))
+        try:
+            await asyncio.wait_for(ready, self.client._timeout_seconds)
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def close(self) -> None:
+        """Close the stream; calls still waiting fail with ``McpSessionClosed``"""
+        import asyncio
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except (asyncio.CancelledError, Exception):
+                pass
+        if self._response is not None:
+            self._response.close()
+        self._fail_pending(McpSessionClosed("MCP session closed"), self._resolve)
+
+    async def __aenter__(self) -> "AsyncMcpSession":
+        return await self.open()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    @staticmethod
+    def _resolve(future: Any, result: Any, error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    async def _read(self, ready: Any) -> None:
+        parser = SSEParser()
+        try:
+            async for raw in self._response.content:
+                message = parser.feed(raw.decode("utf-8").rstrip("\r\n"))
+                if message is not None:
+                    self._on_event(*message, self._resolve)
+                    if message[0] == "session" and not ready.done():
+                        ready.set_result(None)
+            if not ready.done():
+                ready.set_exception(McpSessionClosed("MCP session stream did not start"))
+        finally:
+            self._fail_pending(McpSessionClosed("MCP session stream ended"), self._resolve)
+
+    async def call_many(self, calls: Iterable[Dict[str, Any]]) -> List[Any]:
+        """
+        Send several calls in one POST and await all of their results
+
+        Returns results in the order given; a failed call raises its error.
+        """
+        import asyncio
+        if self.session_id is None:
+            raise McpSessionClosed("MCP session is not open")
+        loop = asyncio.get_running_loop()
+        prepared, waiters = [], []
+        delay = 0.0
+        try:
+            for spec in calls:
+                call, token = self._prepare(
+                    spec["method"], spec.get("params"), spec.get("access_token")
+                )
+                future = loop.create_future()
+                future.add_done_callback(functools.partial(self._settle, spec["method"], token))
+                prepared.append(call)
+                waiters.append(future)
+                delay = max(delay, self._delay(spec["method"]))
+        except Exception:
+            for future in waiters:
+                future.cancel()
+            raise
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        with self._lock:
+            self._pending.update((call["id"], future) for call, future in zip(prepared, waiters))
+        if not self._outbox:
+            loop.call_soon(self._schedule_flush)
+        self._outbox.extend(prepared)
+        return list(await asyncio.gather(*waiters))
+
+    def _schedule_flush(self) -> None:
+        import asyncio
+        task = asyncio.ensure_future(self._flush(self._outbox))
+        self._outbox = []
+        # Keep a reference so the task is not garbage-collected mid-flight
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, calls: List[Dict[str, Any]]) -> None:
+        """POST queued calls; their results arrive on the stream"""
+        for start in range(0, len(calls), self.max_batch_size):
+            batch = calls[start:start + self.max_batch_size]
+            try:
+                await self.client._request(
+                    "POST", f"/api/mcp/session/{self.session_id}", data={"calls": batch}
+                )
+            except Exception as e:
+                with self._lock:
+                    pending = [self._pending.pop(call["id"], None) for call in batch]
+                for waiter in pending:
+                    if waiter is not None:
+                        self._resolve(waiter, None, e)
+
+    async def call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        access_token: Optional[str] = None,
+    ) -> Any:
+        """Send one call and await its result"""
+        results = await self.call_many(
+            [{"method": method, "params": params, "access_token": access_token}]
+        )
+        return results[0]
+
+    async def invoke(
+        self,
+        vector_id: int,
+        context: Any,
+        access_token: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Invoke a vector over the session"""
+        params = {"vector_id": vector_id, "context": context}
+        if parameters:
+            params["parameters"] = parameters
+        result: Dict[str, Any] = await self.call("invoke", params, access_token)
+        return result
+
+    async def discover(self, category: Optional[str] = None) -> Dict[str, Any]:
+        """MCP discovery over the session"""
+        result: Dict[str, Any] = await self.call(
+            "discover", {"category": category} if category else None
+        )
+        return result
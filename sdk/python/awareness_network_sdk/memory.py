@@ -0,0 +1,418 @@
+"""
+Awareness Network SDK - Write-Behind Memory Sync
+Coalesces memory writes locally and flushes them in bulk
+
+Agents tend to rewrite the same handful of keys (``preferences``,
+``last_session``, ...) many times per minute. Instead of one
+``PUT /ai/memory/{key}`` per write, these clients keep the latest value per
+key in a local buffer and send everything in one ``POST /ai/memory/batch``
+every ``flush_interval`` seconds, when ``max_pending`` keys are buffered, and
+on close. Reads consult the buffer first (including writes of a flush still
+in flight), so an agent always sees its own writes even before they reach
+the server.
+
+Writes the server would refuse (a value that is not a dict, an empty or
+over-long key) and batches it rejects as invalid are not retried: their keys
+are dropped and reported in ``rejected``.
+
+Usage:
+    from awareness_network_sdk.memory import WriteBehindMemoryClient
+
+    with WriteBehindMemoryClient(client, flush_interval=2.0) as memory:
+        for step in range(1000):
+            memory.store_memory("last_session", {"step": step})
+        memory.retrieve_memory("last_session").value  # {"step": 999}
+"""
+
+import asyncio
+import atexit
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from .client import AwarenessNetworkClient, Memory
+
+# Upper bound the server accepts for each of writes/deletes in one batch
+MAX_BATCH_SIZE = 1000
+MAX_KEY_LENGTH = 255
+# Statuses meaning the batch itself is invalid; retrying cannot succeed
+REJECTED_STATUSES = (400, 413, 422)
+
+
+@dataclass
+class _PendingWrite:
+    value: Any
+    ttl_seconds: Optional[int]
+    written_at: str
+    deleted: bool = False
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class _WriteBuffer:
+    """
+    Latest pending write (or delete) per memory key
+
+    Drained entries stay readable in ``_in_flight`` until their batch is
+    acknowledged or rejected, or they are restored after a failure.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, _PendingWrite] = {}
+        self._in_flight: Dict[str, _PendingWrite] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def put(self, key: str, value: Any, ttl_seconds: Optional[int]) -> _PendingWrite:
+        write = _PendingWrite(value, ttl_seconds, _now())
+        with self._lock:
+            self._pending[key] = write
+        return write
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pending[key] = _PendingWrite(None, None, _now(), deleted=True)
+
+    def get(self, key: str) -> Optional[_PendingWrite]:
+        with self._lock:
+            pending = self._pending.get(key)
+            return pending if pending is not None else self._in_flight.get(key)
+
+    def drain(self) -> Dict[str, _PendingWrite]:
+        """Move up to ``MAX_BATCH_SIZE`` pending entries in flight"""
+        with self._lock:
+            keys = list(self._pending.keys())[:MAX_BATCH_SIZE]
+            drained = {key: self._pending.pop(key) for key in keys}
+            self._in_flight.update(drained)
+            return drained
+
+    def _settle(self, drained: Dict[str, _PendingWrite]) -> None:
+        for key, write in drained.items():
+            if self._in_flight.get(key) is write:
+                del self._in_flight[key]
+
+    def ack(self, drained: Dict[str, _PendingWrite]) -> None:
+        """Forget entries the server has stored"""
+        with self._lock:
+            self._settle(drained)
+
+    def restore(self, drained: Dict[str, _PendingWrite]) -> None:
+        """Put back entries from a failed flush unless they were superseded"""
+        with self._lock:
+            self._settle(drained)
+            for key, write in drained.items():
+                self._pending.setdefault(key, write)
+
+
+def _validate(key: str, write: _PendingWrite) -> Optional[str]:
+    """Why the server would refuse ``write``, or None"""
+    if not key or len(key) > MAX_KEY_LENGTH:
+        return f"key must be 1-{MAX_KEY_LENGTH} characters"
+    if not write.deleted and not isinstance(write.value, dict):
+        return f"value must be a dict, not {type(write.value).__name__}"
+    return None
+
+
+def _status_of(error: Optional[BaseException]) -> Optional[int]:
+    """HTTP status behind a client error (the clients wrap the original exception)"""
+    while error is not None:
+        status = getattr(error, "status", None)
+        if status is None:
+            status = getattr(getattr(error, "response", None), "status_code", None)
+        if isinstance(status, int):
+            return status
+        error = error.__cause__ or error.__context__
+    return None
+
+
+def _partition(
+    drained: Dict[str, _PendingWrite],
+) -> Tuple[Dict[str, _PendingWrite], Dict[str, str]]:
+    """Split drained entries into sendable ones and ``{key: reason}`` rejections"""
+    valid = {}
+    invalid = {}
+    for key, write in drained.items():
+        reason = _validate(key, write)
+        if reason is None:
+            valid[key] = write
+        else:
+            invalid[key] = reason
+    return valid, invalid
+
+
+def _batch_payload(drained: Dict[str, _PendingWrite]) -> Tuple[List[Dict[str, Any]], List[str]]:
+    writes = []
+    deletes = []
+    for key, write in drained.items():
+        if write.deleted:
+            deletes.append(key)
+            continue
+        entry: Dict[str, Any] = {"key": key, "data": write.value}
+        if write.ttl_seconds:
+            entry["ttlDays"] = write.ttl_seconds / 86400
+        writes.append(entry)
+    return writes, deletes
+
+
+class _Rejections:
+    """Bookkeeping shared by both clients for writes that cannot succeed"""
+
+    rejected: Dict[str, str]
+    last_error: Optional[Exception]
+    _buffer: _WriteBuffer
+
+    def _drop_invalid(self, drained: Dict[str, _PendingWrite]) -> Dict[str, _PendingWrite]:
+        valid, invalid = _partition(drained)
+        if invalid:
+            self._buffer.ack({key: drained[key] for key in invalid})
+            self.rejected.update(invalid)
+            self.last_error = ValueError(f"Dropped invalid memory writes: {invalid}")
+        return valid
+
+    def _fail(self, sent: Dict[str, _PendingWrite], error: Exception) -> None:
+        """Drop a batch the server refused as invalid; restore it otherwise"""
+        if _status_of(error) in REJECTED_STATUSES:
+            self._buffer.ack(sent)
+            self.rejected.update({key: str(error) for key in sent})
+        else:
+            self._buffer.restore(sent)
+
+
+class WriteBehindMemoryClient(_Rejections):
+    """
+    Write-behind wrapper around ``AwarenessNetworkClient`` memory methods
+
+    A daemon thread flushes the buffer periodically; pending writes are also
+    flushed on ``close()`` and at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        client: AwarenessNetworkClient,
+        flush_interval: float = 1.0,
+        max_pending: int = 500
+    ):
+        """
+        Args:
+            client: Authenticated sync client used for flushes and cache misses
+            flush_interval: Seconds between background flushes
+            max_pending: Flush immediately once this many keys are buffered
+        """
+        self.client = client
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.last_error: Optional[Exception] = None
+        # Keys whose writes were dropped as invalid, with the reason
+        self.rejected: Dict[str, str] = {}
+
+        self._buffer = _WriteBuffer()
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="awareness-memory-flush", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def __enter__(self) -> "WriteBehindMemoryClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                # Entries were restored to the buffer (unless rejected); retry on the next tick
+                self.last_error = e
+
+    # ==================== Memory API ====================
+
+    def store_memory(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> Memory:
+        """Buffer a write; repeated writes to ``key`` before a flush are coalesced"""
+        if self._closed.is_set():
+            raise RuntimeError("WriteBehindMemoryClient is closed")
+        write = self._buffer.put(key, value, ttl_seconds)
+        if len(self._buffer) >= self.max_pending:
+            self.flush()
+        return Memory(
+            key=key, value=value, created_at=write.written_at, updated_at=write.written_at
+        )
+
+    def retrieve_memory(self, key: str) -> Optional[Memory]:
+        """Read a memory, preferring this client's unflushed writes"""
+        pending = self._buffer.get(key)
+        if pending is not None:
+            if pending.deleted:
+                return None
+            return Memory(
+                key=key,
+                value=pending.value,
+                created_at=pending.written_at,
+                updated_at=pending.written_at
+            )
+        return self.client.retrieve_memory(key)
+
+    def delete_memory(self, key: str) -> None:
+        """Buffer a delete; it replaces any pending write to ``key``"""
+        if self._closed.is_set():
+            raise RuntimeError("WriteBehindMemoryClient is closed")
+        self._buffer.delete(key)
+
+    @property
+    def pending(self) -> int:
+        """Number of keys waiting to be flushed"""
+        return len(self._buffer)
+
+    def flush(self) -> int:
+        """
+        Send all buffered writes and deletes to the server
+
+        Returns:
+            Number of keys flushed
+        """
+        flushed = 0
+        with self._flush_lock:
+            while True:
+                drained = self._buffer.drain()
+                if not drained:
+                    return flushed
+                valid = self._drop_invalid(drained)
+                if valid:
+                    writes, deletes = _batch_payload(valid)
+                    try:
+                        self.client.store_memory_batch(writes, deletes)
+                    except Exception as e:
+                        self._fail(valid, e)
+                        raise
+                self._buffer.ack(valid)
+                flushed += len(valid)
+
+    def close(self) -> None:
+        """Stop the background thread and flush remaining writes"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        atexit.unregister(self.close)
+        self._thread.join()
+        self.flush()
+
+
+class AsyncWriteBehindMemoryClient(_Rejections):
+    """
+    Write-behind wrapper around ``MemoryAsyncClient``
+
+    Must be used inside a running event loop; remaining writes are flushed
+    when the context manager exits.
+
+    Example:
+        async with AsyncAwarenessClient(api_key) as client:
+            async with AsyncWriteBehindMemoryClient(client.memory) as memory:
+                await memory.set("preferences", {"category": "nlp"})
+    """
+
+    def __init__(self, memory_client: Any, flush_interval: float = 1.0, max_pending: int = 500):
+        """
+        Args:
+            memory_client: ``MemoryAsyncClient`` of an open ``AsyncAwarenessClient``
+            flush_interval: Seconds between background flushes
+            max_pending: Flush immediately once this many keys are buffered
+        """
+        self.memory_client = memory_client
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.last_error: Optional[Exception] = None
+        # Keys whose writes were dropped as invalid, with the reason
+        self.rejected: Dict[str, str] = {}
+
+        self._buffer = _WriteBuffer()
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncWriteBehindMemoryClient":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start the periodic flush task on the running loop"""
+        if self._task is None:
+            self._flush_lock = asyncio.Lock()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                self.last_error = e
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get memory value, preferring unflushed writes"""
+        pending = self._buffer.get(key)
+        if pending is not None:
+            if pending.deleted:
+                return None
+            return {"key": key, "data": pending.value, "updatedAt": pending.written_at}
+        # MemoryAsyncClient.get returns the memory record, or None when absent
+        return cast(Optional[Dict[str, Any]], await self.memory_client.get(key))
+
+    async def set(self, key: str, value: Dict[str, Any], ttl_seconds: Optional[int] = None) -> bool:
+        """Buffer a memory write"""
+        self._buffer.put(key, value, ttl_seconds)
+        if len(self._buffer) >= self.max_pending:
+            await self.flush()
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """Buffer a memory delete"""
+        self._buffer.delete(key)
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Number of keys waiting to be flushed"""
+        return len(self._buffer)
+
+    async def flush(self) -> int:
+        """Send all buffered writes and deletes; returns the number of keys flushed"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        flushed = 0
+        async with self._flush_lock:
+            while True:
+                drained = self._buffer.drain()
+                if not drained:
+                    return flushed
+                valid = self._drop_invalid(drained)
+                if valid:
+                    writes, deletes = _batch_payload(valid)
+                    try:
+                        await self.memory_client.set_many(writes, deletes)
+                    except Exception as e:
+                        self._fail(valid, e)
+                        raise
+                self._buffer.ack(valid)
+                flushed += len(valid)
+
+    async def close(self) -> None:
+        """Cancel the flush task and flush remaining writes"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
@@ -0,0 +1,427 @@
+"""
+Awareness Network SDK - Result Models
+Slotted, immutable response models and a columnar result set
+
+Catalog scans and batch invocations can return hundreds of thousands of
+rows. Plain dataclasses carry a per-instance ``__dict__``, which dominates
+memory at that scale, so every response model is declared with ``@model``:
+a frozen dataclass rebuilt with ``__slots__`` (``dataclass(slots=True)``
+needs Python 3.10). Each model also lists where its fields come from in the
+API's camelCase responses; the parser behind ``ResponseModel.from_response``
+is generated from that table.
+
+``ResultSet`` goes one step further for bulk responses: it keeps one column
+per field (numeric columns as compact ``array.array`` buffers) and builds a
+model object only when a row is accessed.
+
+Usage:
+    rows = ResultSet.from_responses(LatentVector, response["vectors"])
+    prices = rows.column("price")      # array('d', [...])
+    cheapest = rows[int(np.argmin(prices))]
+"""
+
+from array import array
+from dataclasses import MISSING, Field, dataclass, fields
+from typing import (
+    TYPE_CHECKING, Any, Callable, ClassVar, Dict, Generic, Iterable, Iterator, List, Optional,
+    Sequence, Tuple, Type, TypeVar, Union, cast, get_args, get_origin, overload,
+)
+
+from .cache import parse_timestamp
+
+T = TypeVar("T")
+M = TypeVar("M", bound="ResponseModel")
+
+if TYPE_CHECKING:
+    from typing_extensions import dataclass_transform
+else:
+    def dataclass_transform(**kwargs: Any) -> Callable[[T], T]:
+        # Only type checkers read the marker; typing_extensions is not a dependency
+        return lambda decorated: decorated
+
+Getter = Callable[[Dict[str, Any]], Any]
+Parser = Callable[[Dict[str, Any]], Tuple[Any, ...]]
+
+# array.array typecodes for columns whose annotation is exactly int/float
+_ARRAY_TYPECODES: Dict[Any, str] = {int: "q", float: "d"}
+
+
+class FieldGetter:
+    """Getter returned by ``field_from``; ``@model`` inlines its keys, converter and default"""
+
+    __slots__ = ("keys", "convert", "default")
+
+    def __init__(
+        self, keys: Tuple[str, ...], convert: Optional[Callable[[Any], Any]], default: Any
+    ):
+        self.keys = keys
+        self.convert = convert
+        self.default = default
+
+    def __call__(self, response: Dict[str, Any]) -> Any:
+        for key in self.keys:
+            value = response.get(key)
+            if value is not None:
+                return value if self.convert is None else self.convert(value)
+        return self.default
+
+
+def field_from(
+    *keys: str, convert: Optional[Callable[[Any], Any]] = None, default: Any = None
+) -> Getter:
+    """
+    Read a model field from the first of ``keys`` present (and not null) in a
+    response dict, optionally converting it
+
+    ``@model`` inlines these into its generated parser; the returned getter
+    is only called directly when used outside a model.
+    """
+    return FieldGetter(keys, convert, default)
+
+
+def timestamp_from(*keys: str) -> Getter:
+    """Read an ISO-8601 timestamp field as a timezone-aware ``datetime``"""
+    return field_from(*keys, convert=parse_timestamp)
+
+
+class ResponseModel:
+    """
+    Base class of every ``@model`` class
+
+    Declares what ``@model`` generates, so type checkers see a typed
+    ``from_response`` and the parsers without running the decorator.
+    """
+
+    __slots__ = ()
+
+    __response_fields__: ClassVar[Dict[str, Getter]] = {}
+    __response_values__: ClassVar[Parser]
+    __response_values_strict__: ClassVar[Parser]
+
+    if TYPE_CHECKING:
+        __dataclass_fields__: ClassVar[Dict[str, "Field[Any]"]]
+
+        def __init__(self, *values: Any) -> None: ...
+
+    @classmethod
+    def from_response(cls: Type[M], response: Dict[str, Any]) -> M:
+        """Build the model from an API response dict"""
+        return cls(*cls.__response_values__(response))
+
+
+def _getstate(self: ResponseModel) -> Tuple[Any, ...]:
+    names: Tuple[str, ...] = self.__slots__
+    return tuple(getattr(self, name) for name in names)
+
+
+def _setstate(self: ResponseModel, state: Tuple[Any, ...]) -> None:
+    names: Tuple[str, ...] = self.__slots__
+    for name, value in zip(names, state):
+        object.__setattr__(self, name, value)
+
+
+def _compile(name: str, lines: List[str], namespace: Dict[str, Any]) -> Callable[..., Any]:
+    exec("\n".join(lines), namespace)
+    return cast(Callable[..., Any], namespace[name])
+
+
+def _make_init(cls: type, model_fields: Tuple["Field[Any]", ...]) -> Callable[..., None]:
+    """
+    ``__init__`` that stores through the slot descriptors directly: the
+    frozen dataclass version goes through ``object.__setattr__`` per field,
+    which is several times slower
+    """
+    namespace: Dict[str, Any] = {}
+    params, body = [], []
+    for i, f in enumerate(model_fields):
+        namespace[f"_set{i}"] = getattr(cls, f.name).__set__
+        if f.default is not MISSING:
+            namespace[f"_default{i}"] = f.default
+            params.append(f"{f.name}=_default{i}")
+        else:
+            params.append(f.name)
+        body.append(f"    _set{i}(self, {f.name})")
+    return _compile("__init__", [f"def __init__(self, {', '.join(params)}):"] + body, namespace)
+
+
+class ResponseValidationError(ValueError):
+    """An API response does not match the model it is decoded into"""
+
+
+def _is_optional(annotation: Any) -> bool:
+    return annotation is Any or (
+        get_origin(annotation) is Union and type(None) in get_args(annotation)
+    )
+
+
+def _invalid(model_name: str, field: str, problem: Any) -> ResponseValidationError:
+    return ResponseValidationError(f"{model_name}.{field}: {problem}")
+
+
+# Exact annotations checked by strict parsers (float also accepts int)
+_CHECKED_TYPES: Dict[Any, Tuple[type, ...]] = {
+    int: (int,),
+    float: (float, int),
+    str: (str,),
+    bool: (bool,),
+}
+
+
+def _make_parser(
+    model_name: str,
+    model_fields: Tuple["Field[Any]", ...],
+    getters: Tuple[Getter, ...],
+    strict: bool = False
+) -> Parser:
+    """
+    Straight-line function returning a model's field values from a response dict
+
+    The strict variant also validates while it extracts: the response must
+    be an object, fields without a default must be present, converters must
+    succeed and plain int/float/str/bool fields must have that type.
+    """
+    namespace: Dict[str, Any] = {"_invalid": _invalid, "_model": model_name}
+    body = ["def parse(response):"]
+    if strict:
+        body += [
+            "    if not isinstance(response, dict):",
+            "        problem = 'expected an object, got ' + type(response).__name__",
+            "        raise _invalid(_model, '<root>', problem)",
+        ]
+    body.append("    get = response.get")
+    for i, (f, getter) in enumerate(zip(model_fields, getters)):
+        if not isinstance(getter, FieldGetter):
+            namespace[f"_getter{i}"] = getter
+            body.append(f"    v{i} = _getter{i}(response)")
+            continue
+        keys = getter.keys
+        body.append(f"    v{i} = get({keys[0]!r})")
+        for key in keys[1:]:
+            body.append(f"    if v{i} is None:")
+            body.append(f"        v{i} = get({key!r})")
+        namespace[f"_default{i}"] = getter.default
+        required = (
+            strict and getter.default is None and f.default is MISSING and not _is_optional(f.type)
+        )
+        if required:
+            body.append(f"    if v{i} is None:")
+            body.append(f"        raise _invalid(_model, {f.name!r}, 'missing')")
+        if getter.convert is not None:
+            namespace[f"_convert{i}"] = getter.convert
+            line = f"v{i} = _default{i} if v{i} is None else _convert{i}(v{i})"
+            if strict:
+                body += [
+                    "    try:",
+                    f"        {line}",
+                    "    except (TypeError, ValueError) as exc:",
+                    f"        raise _invalid(_model, {f.name!r}, exc) from None",
+                ]
+            else:
+                body.append(f"    {line}")
+        elif getter.default is not None:
+            body.append(f"    if v{i} is None:")
+            body.append(f"        v{i} = _default{i}")
+        if strict and f.type in _CHECKED_TYPES and getter.convert is None:
+            types = _CHECKED_TYPES[f.type]
+            namespace[f"_types{i}"] = types
+            body.append(f"    if v{i} is not None and not isinstance(v{i}, _types{i}):")
+            body.append(
+                f"        raise _invalid(_model, {f.name!r}, 'expected {types[0].__name__}, got '"
+                f" + type(v{i}).__name__)"
+            )
+    body.append(f"    return ({''.join(f'v{i}, ' for i in range(len(getters)))})")
+    return cast(Parser, _compile("parse", body, namespace))
+
+
+class _LazyParser:
+    """
+    Compiles a model's parser on first access and replaces itself with it,
+    keeping parser generation out of import time
+    """
+
+    __slots__ = ("name", "args")
+
+    def __init__(self, name: str, *args: Any, strict: bool):
+        self.name = name
+        self.args = args + (strict,)
+
+    def __get__(self, instance: Any, owner: type) -> Parser:
+        parse = _make_parser(*self.args)
+        setattr(owner, self.name, staticmethod(parse))
+        return parse
+
+
+@dataclass_transform(frozen_default=True)
+def model(cls: Type[M]) -> Type[M]:
+    """
+    Declare a response model: frozen dataclass with ``__slots__``
+
+    The class must derive from ``ResponseModel``. Fields missing from its
+    ``__response_fields__`` table are read from the response key of the same
+    name. The lenient parser behind ``from_response`` and a validating
+    ``__response_values_strict__`` parser are generated from the table the
+    first time each is used.
+    """
+    if not issubclass(cls, ResponseModel):
+        raise TypeError(f"@model class {cls.__name__} must derive from ResponseModel")
+    # Without default factories the dataclass __init__ is replaced below, so skip generating it
+    factories = any(
+        isinstance(value, Field) and value.default_factory is not MISSING
+        for value in vars(cls).values()
+    )
+    cls = dataclass(frozen=True, init=factories)(cls)
+    model_fields = fields(cls)
+    names = tuple(f.name for f in model_fields)
+
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    namespace["__getstate__"] = _getstate
+    namespace["__setstate__"] = _setstate
+    metaclass: Type[type] = type(cls)
+    slotted = cast(Type[M], metaclass(cls.__name__, cls.__bases__, namespace))
+    if not factories:
+        init = _make_init(slotted, model_fields)
+        init.__qualname__ = f"{slotted.__qualname__}.__init__"
+        setattr(slotted, "__init__", init)
+
+    table = slotted.__response_fields__
+    unknown = set(table) - set(names)
+    if unknown:
+        raise TypeError(
+            f"{cls.__name__}.__response_fields__ names unknown fields: {sorted(unknown)}"
+        )
+    getters = tuple(table.get(name) or field_from(name) for name in names)
+    setattr(slotted, "__response_values__", _LazyParser(
+        "__response_values__", cls.__name__, model_fields, getters, strict=False
+    ))
+    setattr(slotted, "__response_values_strict__", _LazyParser(
+        "__response_values_strict__", cls.__name__, model_fields, getters, strict=True
+    ))
+    return slotted
+
+
+def _column_typecodes(model_cls: Type[ResponseModel]) -> Tuple[Optional[str], ...]:
+    return tuple(_ARRAY_TYPECODES.get(f.type) for f in fields(model_cls))
+
+
+def _compact(values: List[Any], typecode: Optional[str]) -> Union[List[Any], array]:
+    """Pack a column into an ``array`` when every value fits its typecode"""
+    if typecode is not None:
+        try:
+            return array(typecode, values)
+        except (TypeError, OverflowError):
+            pass
+    return values
+
+
+class ResultSet(Generic[M], Sequence[M]):
+    """
+    Columnar, read-only sequence of model rows
+
+    Behaves like a list of ``model`` objects (``len``, indexing, slicing,
+    iteration) but stores one column per field and materializes a row only
+    when it is accessed. Slices share no storage with the original.
+    """
+
+    __slots__ = ("model", "_names", "_typecodes", "_columns", "_length")
+
+    def __init__(self, model_cls: Type[M], columns: Optional[Dict[str, Sequence[Any]]] = None):
+        """
+        Args:
+            model_cls: Class declared with ``@model``
+            columns: Optional initial columns by field name (all equally long)
+        """
+        self.model = model_cls
+        self._names = tuple(f.name for f in fields(model_cls))
+        self._typecodes = _column_typecodes(model_cls)
+        if columns is None:
+            self._columns: List[Any] = [[] for _ in self._names]
+            self._length = 0
+        else:
+            self._columns = [columns[name] for name in self._names]
+            lengths = {len(column) for column in self._columns}
+            if len(lengths) > 1:
+                raise ValueError("All columns must have the same length")
+            self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_responses(
+        cls, model_cls: Type[M], responses: Iterable[Dict[str, Any]], strict: bool = False
+    ) -> "ResultSet[M]":
+        """Parse raw API rows column by column, without creating row objects"""
+        result = cls(model_cls)
+        result.extend(responses, strict=strict)
+        return result
+
+    def extend(self, responses: Iterable[Dict[str, Any]], strict: bool = False) -> None:
+        """
+        Append raw API rows (e.g. one page of a paginated listing)
+
+        With ``strict``, rows are validated as they are parsed and a
+        ``ResponseValidationError`` leaves the set unchanged.
+        """
+        rows = responses if isinstance(responses, list) else list(responses)
+        if not rows:
+            return
+        parse = self.model.__response_values_strict__ if strict else self.model.__response_values__
+        parsed = zip(*map(parse, rows))
+        for i, (parsed_column, typecode) in enumerate(zip(parsed, self._typecodes)):
+            values = list(parsed_column)
+            column = self._columns[i]
+            if not self._length:
+                self._columns[i] = _compact(values, typecode)
+            elif isinstance(column, array):
+                packed = _compact(values, typecode)
+                if isinstance(packed, array):
+                    column.extend(packed)
+                else:
+                    # A null arrived: fall back to a plain list for this column
+                    self._columns[i] = column.tolist() + values
+            else:
+                column.extend(values)
+        self._length += len(rows)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """The values of one field, in row order (``array`` for numeric fields)"""
+        try:
+            column: Sequence[Any] = self._columns[self._names.index(name)]
+        except ValueError:
+            raise KeyError(name) from None
+        return column
+
+    def to_numpy(self, name: str) -> Any:
+        """One field as a NumPy array (numeric columns are copied without boxing)"""
+        import numpy as np
+        return np.asarray(self.column(name))
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ResultSet[M]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[M, "ResultSet[M]"]:
+        if isinstance(index, slice):
+            return ResultSet(self.model, {
+                name: column[index] for name, column in zip(self._names, self._columns)
+            })
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ResultSet index out of range")
+        return self.model(*[column[index] for column in self._columns])
+
+    def __iter__(self) -> Iterator[M]:
+        model_cls = self.model
+        for values in zip(*self._columns):
+            yield model_cls(*values)
+
+    def __repr__(self) -> str:
+        return f"<ResultSet[{self.model.__name__}] {self._length} rows>"
@@ -0,0 +1,171 @@
+"""
+Awareness Network SDK - Pagination
+Auto-paginating iterators over keyset-paginated list endpoints
+
+List endpoints return ``{<items>: [...], "nextCursor": "..."}`` when called
+with ``limit``; passing the cursor back fetches the following page. The
+iterators here hide that loop and overlap the network with the caller's
+work: while the current page is being consumed, the next one is already in
+flight (a background thread for the sync client, a task for the async one).
+Items are parsed one at a time as they are yielded, so breaking out early
+never pays for parsing the rest of the page.
+
+Usage:
+    for vector in client.iter_vectors(category="nlp"):
+        ...
+
+    async for purchase in client.vectors.aiter_purchases():
+        ...
+"""
+
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Generic, Iterator, List,
+    Optional, Tuple, TypeVar,
+)
+
+T = TypeVar("T")
+
+Page = Tuple[List[Any], Optional[str]]
+
+
+def _page_params(
+    params: Optional[Dict[str, Any]], page_size: int, cursor: Optional[str]
+) -> Dict[str, Any]:
+    page_params = dict(params or {})
+    page_params["limit"] = page_size
+    if cursor is not None:
+        page_params["cursor"] = cursor
+    return page_params
+
+
+def _identity(item: Any) -> Any:
+    return item
+
+
+class CursorPaginator(Generic[T]):
+    """
+    Iterate every item of a keyset-paginated endpoint
+
+    Args:
+        request: Called with the query params of one page; returns the
+            decoded response body
+        items_key: Response field holding the page's items
+        parse: Converts one raw item into the yielded object
+        params: Extra query params sent with every page
+        page_size: Items per request
+        prefetch: Fetch the next page while the current one is consumed
+    """
+
+    def __init__(
+        self,
+        request: Callable[[Dict[str, Any]], Dict[str, Any]],
+        items_key: str,
+        parse: Callable[[Any], T] = _identity,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 500,
+        prefetch: bool = True
+    ):
+        self.request = request
+        self.items_key = items_key
+        self.parse = parse
+        self.params = params
+        self.page_size = page_size
+        self.prefetch = prefetch
+
+    def fetch_page(self, cursor: Optional[str] = None) -> Page:
+        """Fetch one page; returns its raw items and the next cursor"""
+        response = self.request(_page_params(self.params, self.page_size, cursor))
+        return response.get(self.items_key, []), response.get("nextCursor") or None
+
+    def pages(self) -> Iterator[List[Any]]:
+        """Yield raw pages in order"""
+        if not self.prefetch:
+            cursor = None
+            while True:
+                items, cursor = self.fetch_page(cursor)
+                yield items
+                if cursor is None:
+                    return
+
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="awareness-prefetch")
+        try:
+            future = executor.submit(self.fetch_page, None)
+            while True:
+                items, cursor = future.result()
+                if cursor is not None:
+                    future = executor.submit(self.fetch_page, cursor)
+                yield items
+                if cursor is None:
+                    return
+        finally:
+            # An abandoned prefetch finishes in the background; don't block on it
+            executor.shutdown(wait=False)
+
+    def __iter__(self) -> Iterator[T]:
+        parse = self.parse
+        for items in self.pages():
+            for item in items:
+                yield parse(item)
+
+
+class AsyncCursorPaginator(Generic[T]):
+    """
+    Async counterpart of ``CursorPaginator``
+
+    ``request`` is a coroutine function; the next page is requested as a
+    task as soon as the current one arrives.
+    """
+
+    def __init__(
+        self,
+        request: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+        items_key: str,
+        parse: Callable[[Any], T] = _identity,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 500,
+        prefetch: bool = True
+    ):
+        self.request = request
+        self.items_key = items_key
+        self.parse = parse
+        self.params = params
+        self.page_size = page_size
+        self.prefetch = prefetch
+
+    async def fetch_page(self, cursor: Optional[str] = None) -> Page:
+        """Fetch one page; returns its raw items and the next cursor"""
+        response = await self.request(_page_params(self.params, self.page_size, cursor))
+        return response.get(self.items_key, []), response.get("nextCursor") or None
+
+    async def pages(self) -> AsyncIterator[List[Any]]:
+        """Yield raw pages in order"""
+        if not self.prefetch:
+            cursor = None
+            while True:
+                items, cursor = await self.fetch_page(cursor)
+                yield items
+                if cursor is None:
+                    return
+
+        import asyncio
+        task: Optional["asyncio.Future"] = asyncio.ensure_future(self.fetch_page(None))
+        try:
+            while task is not None:
+                items, cursor = await task
+                task = (
+                    asyncio.ensure_future(self.fetch_page(cursor)) if cursor is not None else None
+                )
+                yield items
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        parse = self.parse
+        async for items in self.pages():
+            for item in items:
+                yield parse(item)
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._iterate()
@@ -0,0 +1,251 @@
+"""
+Awareness Network SDK - Vector Payload Cache
+Byte-bounded LRU with an optional disk tier and single-flight loading
+
+The disk tier uses the same layout as the server's vector payload cache
+(``server/vector-cache.ts``), so a worker on the same host can point both at
+one directory and share downloads::
+
+    <dir>/<sha256(key)>.<sha256(payload)[:16]>.payload
+
+Each file holds the raw payload bytes; the content hash in the name is
+verified on read and mismatching files are discarded.
+
+Usage:
+    from awareness_network_sdk import VectorPayloadCache
+
+    cache = VectorPayloadCache(max_bytes=64 << 20, disk_dir="/var/cache/awareness")
+    data = cache.get("vectors/7/abc.bin", download=fetch_bytes)
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple, cast
+
+from .codec import loads
+
+PAYLOAD_SUFFIX = ".payload"
+
+
+def key_digest(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def content_digest(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+class VectorPayloadCache:
+    """
+    Thread-safe cache of parsed vector payloads
+
+    Memory holds parsed values bounded by their raw byte size; the optional
+    disk tier holds raw bytes. Concurrent misses for one key wait on a single
+    ``download`` call. Cached values are shared and must be treated as
+    read-only.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 256 << 20,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 2 << 30,
+        parse: Callable[[bytes], Any] = loads,
+    ):
+        """
+        Args:
+            max_bytes: In-memory budget, measured in raw payload bytes
+            disk_dir: Directory for the disk tier (None disables it)
+            disk_max_bytes: Disk budget before the least recently used files go
+            parse: Decoder applied to raw bytes (defaults to the JSON backend)
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.shared_loads = 0
+        self._parse = parse
+        self._memory: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: "Optional[OrderedDict[str, Tuple[str, int]]]" = None
+        self._disk_bytes = 0
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, download: Callable[[str], bytes]) -> Any:
+        """Return the parsed payload for key, calling download(key) only on a full miss"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                self.shared_loads += 1
+            else:
+                owner = self._in_flight[key] = Future()
+        if pending is not None:
+            return pending.result()
+
+        try:
+            value = self._load(key, download)
+        except BaseException as exc:
+            owner.set_exception(exc)
+            raise
+        else:
+            owner.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            entry = self._memory.pop(key, None)
+            if entry is not None:
+                self._memory_bytes -= entry[1]
+            if self._disk is not None:
+                digest = key_digest(key)
+                if digest in self._disk:
+                    self._remove_disk_entry(self._disk, digest)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "shared_loads": self.shared_loads,
+                "entries": len(self._memory),
+                "bytes": self._memory_bytes,
+                "disk_entries": len(self._disk or ()),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _load(self, key: str, download: Callable[[str], bytes]) -> Any:
+        digest = key_digest(key)
+        payload = self._read_disk(digest)
+        if payload is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            with self._lock:
+                self.misses += 1
+            payload = download(key)
+            self._write_disk(digest, payload)
+
+        value = self._parse(payload)
+        self._remember(key, value, len(payload))
+        return value
+
+    def _remember(self, key: str, value: Any, size: int) -> None:
+        # A payload larger than the whole budget would evict everything for nothing
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._memory[key] = (value, size)
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_bytes:
+                _, (_, evicted) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted
+
+    def _disk_index(self) -> "Optional[OrderedDict[str, Tuple[str, int]]]":
+        """
+        Index the disk tier once (caller holds the lock)
+
+        Returns None, leaving the next lookup to retry, when the directory
+        cannot be created or listed: the disk tier is best-effort.
+        """
+        if self.disk_dir is None or self._disk is not None:
+            return self._disk
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            names = os.listdir(self.disk_dir)
+        except OSError:
+            return None
+        found = []
+        for name in names:
+            if not name.endswith(PAYLOAD_SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.disk_dir, name))
+            except FileNotFoundError:
+                continue
+            found.append((stat.st_mtime, name.split(".")[0], name, stat.st_size))
+        # Oldest first, matching LRU order
+        self._disk = OrderedDict((digest, (name, size)) for _, digest, name, size in sorted(found))
+        self._disk_bytes = sum(size for _, size in self._disk.values())
+        return self._disk
+
+    def _read_disk(self, digest: str) -> Optional[bytes]:
+        with self._lock:
+            index = self._disk_index()
+            if index is None or digest not in index:
+                return None
+            name = index[digest][0]
+        try:
+            with open(self._disk_path(name), "rb") as handle:
+                payload = handle.read()
+        except OSError:
+            payload = None
+        with self._lock:
+            if payload is None or name != f"{digest}.{content_digest(payload)}{PAYLOAD_SUFFIX}":
+                if index.get(digest, (None,))[0] == name:
+                    self._remove_disk_entry(index, digest)
+                return None
+            if digest in index:
+                index.move_to_end(digest)
+        return payload
+
+    def _write_disk(self, digest: str, payload: bytes) -> None:
+        with self._lock:
+            index = self._disk_index()
+        if index is None or len(payload) > self.disk_max_bytes:
+            return
+
+        name = f"{digest}.{content_digest(payload)}{PAYLOAD_SUFFIX}"
+        target = self._disk_path(name)
+        temp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp, "wb") as handle:
+                handle.write(payload)
+            os.replace(temp, target)
+        except OSError:
+            # The disk tier is best-effort; the payload is still cached in memory
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            previous = index.get(digest)
+            if previous is not None:
+                if previous[0] != name:
+                    self._remove_disk_entry(index, digest)
+                else:
+                    del index[digest]
+                    self._disk_bytes -= previous[1]
+            index[digest] = (name, len(payload))
+            self._disk_bytes += len(payload)
+            while self._disk_bytes > self.disk_max_bytes:
+                self._remove_disk_entry(index, next(iter(index)))
+
+    def _disk_path(self, name: str) -> str:
+        # Only called with names from the index, which exists only when disk_dir is set
+        return os.path.join(cast(str, self.disk_dir), name)
+
+    def _remove_disk_entry(self, index: "OrderedDict[str, Tuple[str, int]]", digest: str) -> None:
+        """Drop a disk entry and its file (caller holds the lock)"""
+        name, size = index.pop(digest)
+        self._disk_bytes -= size
+        try:
+            os.remove(self._disk_path(name))
+        except OSError:
+            pass
@@ -0,0 +1,208 @@
+"""
+Awareness Network SDK - Client-Side Quota Tracking
+Per-access-token call quotas checked before a request is sent
+
+Each client keeps a ``QuotaTracker`` (``client.quota``). It is seeded from
+purchase listings and updated from every invocation result's remaining call
+count, so an exhausted or expired token is rejected (or the call rerouted to
+another token for the same vector) without a round trip.
+
+Usage:
+    from awareness_network_sdk import AwarenessNetworkClient, QuotaExceededError
+
+    client = AwarenessNetworkClient(api_key="your_api_key")
+    client.sync_quotas()
+    try:
+        client.mcp_invoke(vector_id=7, input_data="...", access_token=token)
+    except QuotaExceededError as exc:
+        print(exc.reason)
+    for quota in client.quota.snapshot():
+        print(quota.access_token[:12], quota.remaining_calls)
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from .cache import parse_timestamp
+from .models import ResponseModel, model
+
+# Server error messages meaning the token itself can no longer be used
+QUOTA_ERRORS = ("Call limit exceeded", "No calls remaining", "Access token expired")
+
+
+class QuotaExceededError(Exception):
+    """Raised before sending a call whose access token has no usable quota"""
+
+    def __init__(self, access_token: Optional[str], vector_id: Optional[int], reason: str):
+        self.access_token = access_token
+        self.vector_id = vector_id
+        self.reason = reason
+        token = f"{access_token[:12]}..." if access_token else "no access token"
+        super().__init__(f"Quota unavailable for vector {vector_id} ({token}): {reason}")
+
+
+def is_quota_error(error: BaseException) -> bool:
+    """Whether an API error says the token's quota is exhausted or expired"""
+    return any(message in str(error) for message in QUOTA_ERRORS)
+
+
+@model
+class QuotaSnapshot(ResponseModel):
+    """Point-in-time view of one access token's quota"""
+    access_token: str
+    vector_id: Optional[int]
+    remaining_calls: Optional[int]
+    in_flight: int
+    expires_at: Optional[datetime]
+    exhausted: bool
+
+
+@dataclass
+class _TokenQuota:
+    vector_id: Optional[int]
+    remaining: Optional[int]
+    expires_at: Optional[datetime]
+    in_flight: int = 0
+    rejected: bool = field(default=False)
+
+    def unavailable(self, now: datetime) -> Optional[str]:
+        if self.rejected:
+            return "rejected by the server"
+        if self.expires_at is not None and self.expires_at <= now:
+            return "access token expired"
+        if self.remaining is not None and self.remaining - self.in_flight <= 0:
+            return "call limit exhausted"
+        return None
+
+
+class QuotaTracker:
+    """
+    Thread-safe per-token quota book shared by a client's calls
+
+    ``remaining_calls`` of None means unlimited. Calls in flight count against
+    the quota, so concurrent callers cannot overspend the last calls.
+    """
+
+    def __init__(self, reroute: bool = True):
+        """
+        Args:
+            reroute: When a token is unusable, use another tracked token for
+                the same vector instead of raising
+        """
+        self.reroute = reroute
+        self._tokens: Dict[str, _TokenQuota] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tokens)
+
+    def track(
+        self,
+        access_token: str,
+        vector_id: Optional[int] = None,
+        remaining_calls: Optional[int] = None,
+        expires_at: Any = None,
+    ) -> None:
+        """Record (or refresh) what the server reports for a token"""
+        with self._lock:
+            quota = self._tokens.get(access_token)
+            if quota is None:
+                self._tokens[access_token] = _TokenQuota(
+                    vector_id, remaining_calls, parse_timestamp(expires_at)
+                )
+                return
+            if vector_id is not None:
+                quota.vector_id = vector_id
+            quota.remaining = remaining_calls
+            quota.expires_at = parse_timestamp(expires_at)
+            quota.rejected = False
+
+    def forget(self, access_token: str) -> None:
+        with self._lock:
+            self._tokens.pop(access_token, None)
+
+    def acquire(
+        self, vector_id: Optional[int], access_token: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Reserve one call and return the token to send it with
+
+        Untracked tokens are passed through unchanged. Raises
+        ``QuotaExceededError`` when neither the token nor (with rerouting) any
+        other token for the vector has quota left.
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            quota = self._tokens.get(access_token) if access_token else None
+            if access_token and quota is None:
+                return access_token
+            if quota is not None:
+                reason = quota.unavailable(now)
+                if reason is None:
+                    quota.in_flight += 1
+                    return access_token
+            else:
+                reason = "no access token"
+
+            if self.reroute and vector_id is not None:
+                for token, candidate in self._tokens.items():
+                    if candidate.vector_id == vector_id and candidate.unavailable(now) is None:
+                        candidate.in_flight += 1
+                        return token
+        if access_token is None:
+            return None
+        raise QuotaExceededError(access_token, vector_id, reason)
+
+    def settle(
+        self,
+        access_token: Optional[str],
+        calls_remaining: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Finish a call started with ``acquire``
+
+        ``calls_remaining`` is the server's count after the call (None leaves
+        the local count, decremented by one, in place). A quota error from the
+        server marks the token unusable until it is tracked again.
+        """
+        if access_token is None:
+            return
+        with self._lock:
+            quota = self._tokens.get(access_token)
+            if quota is None:
+                return
+            quota.in_flight = max(0, quota.in_flight - 1)
+            if error is not None:
+                quota.rejected = quota.rejected or is_quota_error(error)
+            elif isinstance(calls_remaining, int):
+                quota.remaining = calls_remaining
+            elif quota.remaining is not None:
+                quota.remaining = max(0, quota.remaining - 1)
+
+    def remaining(self, access_token: str) -> Optional[int]:
+        """Calls left for a token (None if unlimited or untracked)"""
+        with self._lock:
+            quota = self._tokens.get(access_token)
+            if quota is None or quota.remaining is None:
+                return None
+            return quota.remaining - quota.in_flight
+
+    def snapshot(self) -> List[QuotaSnapshot]:
+        """Current quota of every tracked token"""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            return [
+                QuotaSnapshot(
+                    access_token=token,
+                    vector_id=quota.vector_id,
+                    remaining_calls=quota.remaining,
+                    in_flight=quota.in_flight,
+                    expires_at=quota.expires_at,
+                    exhausted=quota.unavailable(now) is not None,
+                )
+                for token, quota in self._tokens.items()
+            ]
@@ -0,0 +1,220 @@
+"""
+Awareness Network SDK - Client-Side Rate Limiting
+Token buckets that pace requests to the limits the server advertises
+
+The MCP discovery payload (``GET /mcp/discover``) carries ``rate_limits``
+per endpoint class, e.g. ``{"invoke": {"calls_per_minute": 60,
+"calls_per_day": 10000}}``. Every request goes through a ``RateLimiter``
+holding one bucket per (API key, endpoint class, window); a request whose
+bucket is empty waits for its token instead of being sent and bounced with
+a 429. Waiting callers queue behind each other, so a burst is spread evenly
+over the window.
+
+Clients share one process-wide limiter by default, so all threads of the
+sync client and all tasks of the async client (and every client using the
+same API key) draw from the same buckets. Classes without advertised
+limits are not paced.
+
+Usage:
+    from awareness_network_sdk import AwarenessNetworkClient
+
+    client = AwarenessNetworkClient(api_key="your_api_key")
+    client.sync_rate_limits()   # or any mcp_discover() call
+    client.rate_limiter.limits()  # {"invoke": {"calls_per_minute": 60, ...}}
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Limit name in the discovery payload -> window in seconds
+WINDOWS: Dict[str, float] = {
+    "calls_per_second": 1.0,
+    "calls_per_minute": 60.0,
+    "calls_per_hour": 3600.0,
+    "calls_per_day": 86400.0,
+}
+
+# Windows at least this long are budgets, not pacing: their whole limit may
+# be spent at once
+_BUDGET_WINDOW = 3600.0
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``rate`` tokens per second
+
+    Not thread-safe on its own; ``RateLimiter`` serializes access.
+    """
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = now
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, now: float) -> float:
+        """
+        Take one token, going into debt if there is none
+
+        Returns the seconds until the token is actually available. Later
+        reservations wait behind the debt, which is what spreads a burst.
+        """
+        self._refill(now)
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Thread-safe token buckets keyed by API key and endpoint class
+
+    ``reserve`` only holds a lock while doing arithmetic, so the same limiter
+    can pace threads (``acquire``) and asyncio tasks (``acquire_async``).
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Any]] = None,
+        burst_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            limits: Initial ``rate_limits`` (as in the discovery payload)
+            burst_seconds: Short windows allow bursts worth this many
+                seconds of their rate; longer windows (an hour or more) allow
+                their whole limit
+            clock: Monotonic clock in seconds (for tests)
+            sleep: Blocking sleep used by ``acquire`` (for tests)
+        """
+        self.burst_seconds = burst_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._limits: Dict[str, Dict[str, float]] = {}
+        self._buckets: Dict[Tuple[Optional[str], str], List[TokenBucket]] = {}
+        self._paused_until: Dict[Tuple[Optional[str], str], float] = {}
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "delayed": 0, "waited_seconds": 0.0}
+        if limits:
+            self.configure(limits)
+
+    @staticmethod
+    def endpoint_class(endpoint: str) -> str:
+        """Class of an endpoint path as named in ``rate_limits``"""
+        return "invoke" if "/invoke" in endpoint else "default"
+
+    def configure(self, rate_limits: Dict[str, Any]) -> None:
+        """
+        Apply ``rate_limits`` from a discovery or vector details payload
+
+        A flat mapping (``{"calls_per_minute": 60}``, as in vector details)
+        is taken as the ``invoke`` limits. Buckets of changed classes restart
+        full.
+        """
+        if any(name in WINDOWS for name in rate_limits):
+            rate_limits = {"invoke": rate_limits}
+        parsed = {
+            endpoint_class: {
+                name: float(value)
+                for name, value in (limits or {}).items()
+                if name in WINDOWS and value
+            }
+            for endpoint_class, limits in rate_limits.items()
+        }
+        with self._lock:
+            for endpoint_class, limits in parsed.items():
+                if self._limits.get(endpoint_class) != limits:
+                    self._limits[endpoint_class] = limits
+                    for key in [key for key in self._buckets if key[1] == endpoint_class]:
+                        del self._buckets[key]
+
+    def limits(self) -> Dict[str, Dict[str, float]]:
+        """Currently applied limits by endpoint class"""
+        with self._lock:
+            return {endpoint_class: dict(limits) for endpoint_class, limits in self._limits.items()}
+
+    def _bucket_list(
+        self, api_key: Optional[str], endpoint_class: str, now: float
+    ) -> List[TokenBucket]:
+        buckets = self._buckets.get((api_key, endpoint_class))
+        if buckets is None:
+            buckets = []
+            for name, limit in self._limits.get(endpoint_class, {}).items():
+                window = WINDOWS[name]
+                rate = limit / window
+                capacity = (
+                    limit
+                    if window >= _BUDGET_WINDOW
+                    else min(limit, max(1.0, rate * self.burst_seconds))
+                )
+                buckets.append(TokenBucket(rate, capacity, now))
+            self._buckets[(api_key, endpoint_class)] = buckets
+        return buckets
+
+    def reserve(self, api_key: Optional[str], endpoint: str) -> float:
+        """Take a token for one request and return the seconds to wait first"""
+        endpoint_class = self.endpoint_class(endpoint)
+        with self._lock:
+            now = self._clock()
+            delay = max(
+                (bucket.reserve(now) for bucket in self._bucket_list(api_key, endpoint_class, now)),
+                default=0.0,
+            )
+            paused_until = self._paused_until.get((api_key, endpoint_class))
+            if paused_until is not None:
+                if paused_until > now:
+                    delay = max(delay, paused_until - now)
+                else:
+                    del self._paused_until[(api_key, endpoint_class)]
+            self.stats["requests"] += 1
+            if delay > 0:
+                self.stats["delayed"] += 1
+                self.stats["waited_seconds"] += delay
+            return delay
+
+    def acquire(self, api_key: Optional[str], endpoint: str) -> float:
+        """Block until a request may be sent; returns the time waited"""
+        delay = self.reserve(api_key, endpoint)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    async def acquire_async(self, api_key: Optional[str], endpoint: str) -> float:
+        """``acquire`` for asyncio tasks"""
+        import asyncio
+        delay = self.reserve(api_key, endpoint)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def pause(self, api_key: Optional[str], endpoint: str, seconds: float) -> None:
+        """
+        Hold back an endpoint class after the server rejected a request
+        (429) with ``Retry-After: seconds``
+        """
+        key = (api_key, self.endpoint_class(endpoint))
+        with self._lock:
+            until = self._clock() + seconds
+            self._paused_until[key] = max(until, self._paused_until.get(key, until))
+
+
+def retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Seconds from a ``Retry-After`` header (delta-seconds form)"""
+    try:
+        return max(0.0, float(value)) if value is not None else default
+    except ValueError:
+        return default
+
+
+_shared = RateLimiter()
+
+
+def shared_rate_limiter() -> RateLimiter:
+    """The process-wide limiter clients use unless given their own"""
+    return _shared
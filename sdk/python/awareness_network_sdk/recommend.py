@@ -0,0 +1,451 @@
+"""
+Awareness Network SDK - Collaborative Filtering
+Sparse user-item recommendation engine for exported behavior logs
+
+Offline counterpart of ``server/collaborative-filtering.ts``. The server
+rebuilds the user-item matrix from every ``userBehavior`` row and compares
+the target user against every other user on each request. Here the matrix
+is built once in CSR form, updated incrementally as new behavior arrives,
+and user-user / item-item cosine similarities are computed with a sparse
+row-by-row product pruned to the top-k neighbors. Neighbor lists can be
+saved and reloaded, so serving a recommendation only touches the target
+user's neighbors.
+
+Usage:
+    from awareness_network_sdk.recommend import CollaborativeFilter, InteractionMatrix
+
+    interactions = InteractionMatrix.from_behaviors(rows)  # userBehavior export
+    cf = CollaborativeFilter(interactions, k=20)
+    cf.compute_user_neighbors()
+    cf.save("neighbors.npz")
+
+    cf.recommend(user_id=42, limit=10)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Same weights as getUserItemMatrix on the server
+ACTION_WEIGHTS = {
+    "view": 1.0,
+    "click": 2.0,
+    "trial": 3.0,
+    "purchase": 5.0,
+    "review": 4.0,
+}
+
+
+@dataclass
+class CSRMatrix:
+    """Minimal compressed sparse row matrix (float64 values)"""
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    shape: Tuple[int, int]
+
+    @classmethod
+    def from_coo(
+        cls,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        values: np.ndarray,
+        shape: Tuple[int, int]
+    ) -> "CSRMatrix":
+        """Build from coordinate triples; duplicate entries are summed"""
+        n_rows, n_cols = shape
+        keys = np.asarray(rows, dtype=np.int64) * n_cols + np.asarray(cols, dtype=np.int64)
+        unique, inverse = np.unique(keys, return_inverse=True)
+        data = np.bincount(inverse, weights=values, minlength=len(unique))
+        row_of = unique // n_cols
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_of, minlength=n_rows), out=indptr[1:])
+        return cls(indptr, unique % n_cols, data, shape)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def to_coo(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rows = np.repeat(np.arange(self.shape[0], dtype=np.int64), np.diff(self.indptr))
+        return rows, self.indices, self.data
+
+    def transpose(self) -> "CSRMatrix":
+        rows, cols, data = self.to_coo()
+        return CSRMatrix.from_coo(cols, rows, data, (self.shape[1], self.shape[0]))
+
+    def row(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Column indices and values of row ``i``"""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def row_norms(self) -> np.ndarray:
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return np.sqrt(np.bincount(rows, weights=self.data ** 2, minlength=self.shape[0]))
+
+    def gather_rows(self, rows: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Concatenate several rows, scaling each by a weight
+
+        Returns:
+            (column indices, scaled values) of all entries in ``rows``
+        """
+        starts = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - starts
+        total = int(lengths.sum())
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        positions = offsets + np.arange(total)
+        return self.indices[positions], self.data[positions] * np.repeat(weights, lengths)
+
+
+class InteractionMatrix:
+    """
+    Weighted user-item matrix with incremental updates
+
+    New interactions accumulate in a small delta buffer that is merged into
+    the CSR matrix lazily (on access, or once it exceeds ``compact_threshold``
+    entries). Users touched since the last ``take_dirty_users()`` are tracked
+    so neighbor lists can be refreshed selectively.
+    """
+
+    def __init__(self, compact_threshold: int = 100_000):
+        self.compact_threshold = compact_threshold
+        self.user_ids: List[int] = []
+        self.item_ids: List[int] = []
+        self._user_index: Dict[int, int] = {}
+        self._item_index: Dict[int, int] = {}
+        self._csr = CSRMatrix(
+            np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0), (0, 0)
+        )
+        self._csc: Optional[CSRMatrix] = None
+        self._delta: Dict[Tuple[int, int], float] = {}
+        self._dirty: set = set()
+
+    @classmethod
+    def from_behaviors(
+        cls, behaviors: Iterable[Mapping[str, Any]], **kwargs: Any
+    ) -> "InteractionMatrix":
+        """Build from ``userBehavior`` rows (``userId``, ``vectorId``, ``actionType``)"""
+        matrix = cls(**kwargs)
+        rows: List[int] = []
+        cols: List[int] = []
+        values: List[float] = []
+        for behavior in behaviors:
+            rows.append(matrix._user_row(int(behavior["userId"])))
+            cols.append(matrix._item_col(int(behavior["vectorId"])))
+            values.append(ACTION_WEIGHTS.get(behavior["actionType"], 1.0))
+        matrix._csr = CSRMatrix.from_coo(
+            np.array(rows, dtype=np.int64),
+            np.array(cols, dtype=np.int64),
+            np.array(values, dtype=np.float64),
+            (len(matrix.user_ids), len(matrix.item_ids))
+        )
+        matrix._dirty = set(range(len(matrix.user_ids)))
+        return matrix
+
+    def _user_row(self, user_id: int) -> int:
+        row = self._user_index.get(user_id)
+        if row is None:
+            row = self._user_index[user_id] = len(self.user_ids)
+            self.user_ids.append(user_id)
+        return row
+
+    def _item_col(self, vector_id: int) -> int:
+        col = self._item_index.get(vector_id)
+        if col is None:
+            col = self._item_index[vector_id] = len(self.item_ids)
+            self.item_ids.append(vector_id)
+        return col
+
+    def user_row(self, user_id: int) -> Optional[int]:
+        return self._user_index.get(user_id)
+
+    def item_col(self, vector_id: int) -> Optional[int]:
+        return self._item_index.get(vector_id)
+
+    def add(self, user_id: int, vector_id: int, action_type: str) -> None:
+        """Record one interaction (mirrors ``trackUserBehavior``)"""
+        key = (self._user_row(user_id), self._item_col(vector_id))
+        self._delta[key] = self._delta.get(key, 0.0) + ACTION_WEIGHTS.get(action_type, 1.0)
+        self._dirty.add(key[0])
+        if len(self._delta) >= self.compact_threshold:
+            self.compact()
+
+    def compact(self) -> None:
+        """Merge buffered interactions into the CSR matrix"""
+        shape = (len(self.user_ids), len(self.item_ids))
+        if not self._delta and shape == self._csr.shape:
+            return
+        rows, cols, data = self._csr.to_coo()
+        if self._delta:
+            delta_keys = np.array(list(self._delta.keys()), dtype=np.int64).reshape(-1, 2)
+            delta_values = np.fromiter(
+                self._delta.values(), dtype=np.float64, count=len(self._delta)
+            )
+            rows = np.concatenate([rows, delta_keys[:, 0]])
+            cols = np.concatenate([cols, delta_keys[:, 1]])
+            data = np.concatenate([data, delta_values])
+        self._csr = CSRMatrix.from_coo(rows, cols, data, shape)
+        self._csc = None
+        self._delta.clear()
+
+    @property
+    def csr(self) -> CSRMatrix:
+        """User x item matrix"""
+        self.compact()
+        return self._csr
+
+    @property
+    def csc(self) -> CSRMatrix:
+        """Item x user matrix (transpose, cached until the next change)"""
+        self.compact()
+        if self._csc is None:
+            self._csc = self._csr.transpose()
+        return self._csc
+
+    def take_dirty_users(self) -> np.ndarray:
+        """Rows changed since the last call"""
+        dirty = np.fromiter(self._dirty, dtype=np.int64, count=len(self._dirty))
+        self._dirty = set()
+        return dirty
+
+
+def _top_k_similar(
+    matrix: CSRMatrix,
+    transposed: CSRMatrix,
+    norms: np.ndarray,
+    row: int,
+    k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Cosine top-k neighbors of one row via sparse row x matrix^T product"""
+    cols, weights = matrix.row(row)
+    if len(cols) == 0 or norms[row] == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+    candidates, contributions = transposed.gather_rows(cols, weights)
+    unique, inverse = np.unique(candidates, return_inverse=True)
+    dots = np.bincount(inverse, weights=contributions, minlength=len(unique))
+    sims = dots / (norms[row] * norms[unique])
+    keep = (unique != row) & (sims > 0)
+    unique, sims = unique[keep], sims[keep]
+    if len(unique) > k:
+        part = np.argpartition(-sims, k - 1)[:k]
+        unique, sims = unique[part], sims[part]
+    order = np.argsort(-sims, kind="stable")
+    return unique[order], sims[order].astype(np.float32)
+
+
+class NeighborLists:
+    """Fixed-width top-k neighbor table (-1 marks unused entries)"""
+
+    def __init__(self, n_rows: int, k: int):
+        self.k = k
+        self.indices = np.full((n_rows, k), -1, dtype=np.int64)
+        self.similarities = np.zeros((n_rows, k), dtype=np.float32)
+
+    def resize(self, n_rows: int) -> None:
+        extra = n_rows - len(self.indices)
+        if extra > 0:
+            self.indices = np.vstack([self.indices, np.full((extra, self.k), -1, dtype=np.int64)])
+            self.similarities = np.vstack(
+                [self.similarities, np.zeros((extra, self.k), dtype=np.float32)]
+            )
+
+    def set(self, row: int, neighbors: np.ndarray, sims: np.ndarray) -> None:
+        self.indices[row] = -1
+        self.similarities[row] = 0
+        self.indices[row, :len(neighbors)] = neighbors
+        self.similarities[row, :len(sims)] = sims
+
+    def get(self, row: int) -> Tuple[np.ndarray, np.ndarray]:
+        valid = self.indices[row] >= 0
+        return self.indices[row][valid], self.similarities[row][valid]
+
+
+class CollaborativeFilter:
+    """
+    Neighborhood collaborative filtering over an ``InteractionMatrix``
+
+    Neighbor lists are precomputed (``compute_user_neighbors`` /
+    ``compute_item_neighbors``) and refreshed incrementally for users whose
+    interactions changed.
+    """
+
+    def __init__(self, interactions: InteractionMatrix, k: int = 20):
+        """
+        Args:
+            interactions: User-item interaction matrix
+            k: Neighbors kept per user / item (the server uses 20 similar users)
+        """
+        self.interactions = interactions
+        self.k = k
+        self.user_neighbors: Optional[NeighborLists] = None
+        self.item_neighbors: Optional[NeighborLists] = None
+
+    def compute_user_neighbors(self, rows: Optional[Sequence[int]] = None) -> NeighborLists:
+        """
+        Compute user-user cosine neighbors
+
+        Args:
+            rows: Matrix rows to (re)compute; all users if omitted
+        """
+        csr, csc = self.interactions.csr, self.interactions.csc
+        if self.user_neighbors is None:
+            self.user_neighbors = NeighborLists(csr.shape[0], self.k)
+        self.user_neighbors.resize(csr.shape[0])
+        norms = csr.row_norms()
+        for row in (range(csr.shape[0]) if rows is None else rows):
+            self.user_neighbors.set(row, *_top_k_similar(csr, csc, norms, row, self.k))
+        if rows is None:
+            self.interactions.take_dirty_users()
+        return self.user_neighbors
+
+    def compute_item_neighbors(self) -> NeighborLists:
+        """Compute item-item cosine neighbors"""
+        csr, csc = self.interactions.csr, self.interactions.csc
+        self.item_neighbors = NeighborLists(csc.shape[0], self.k)
+        norms = csc.row_norms()
+        for row in range(csc.shape[0]):
+            self.item_neighbors.set(row, *_top_k_similar(csc, csr, norms, row, self.k))
+        return self.item_neighbors
+
+    def refresh(self) -> int:
+        """
+        Recompute user neighbors affected by interactions added since the
+        last computation: the changed users and every user sharing an item
+        with them (the only similarities that can have changed)
+
+        Returns:
+            Number of users recomputed
+        """
+        dirty = self.interactions.take_dirty_users()
+        if self.user_neighbors is None:
+            self.compute_user_neighbors()
+            return self.interactions.csr.shape[0]
+        if len(dirty) == 0:
+            return 0
+        csr, csc = self.interactions.csr, self.interactions.csc
+        self.user_neighbors.resize(csr.shape[0])
+        items, _ = csr.gather_rows(dirty, np.ones(len(dirty)))
+        co_users, _ = csc.gather_rows(np.unique(items), np.ones(len(np.unique(items))))
+        rows = np.union1d(dirty, co_users)
+        self.compute_user_neighbors(rows.tolist())
+        return len(rows)
+
+    def similar_users(self, user_id: int, top_n: int = 10) -> List[Dict[str, Any]]:
+        """Most similar users (mirrors ``findSimilarUsers``)"""
+        row = self.interactions.user_row(user_id)
+        if row is None:
+            return []
+        lists = self.user_neighbors
+        if lists is None:
+            lists = self.compute_user_neighbors()
+        neighbors, sims = lists.get(row)
+        user_ids = self.interactions.user_ids
+        return [
+            {"userId": user_ids[n], "similarity": float(s)}
+            for n, s in zip(neighbors[:top_n].tolist(), sims[:top_n].tolist())
+        ]
+
+    def similar_items(self, vector_id: int, top_n: int = 10) -> List[Dict[str, Any]]:
+        """Most similar vectors by co-interaction"""
+        col = self.interactions.item_col(vector_id)
+        if col is None:
+            return []
+        lists = self.item_neighbors
+        if lists is None:
+            lists = self.compute_item_neighbors()
+        neighbors, sims = lists.get(col)
+        item_ids = self.interactions.item_ids
+        return [
+            {"vectorId": item_ids[n], "similarity": float(s)}
+            for n, s in zip(neighbors[:top_n].tolist(), sims[:top_n].tolist())
+        ]
+
+    def recommend(self, user_id: int, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Recommend vectors from similar users' interactions (mirrors
+        ``generateCollaborativeRecommendations``)
+
+        Returns:
+            ``{"vectorId", "score", "reason"}`` dicts, best first
+        """
+        row = self.interactions.user_row(user_id)
+        if row is None:
+            return []
+        lists = self.user_neighbors
+        if lists is None:
+            lists = self.compute_user_neighbors()
+        neighbors, sims = lists.get(row)
+        if len(neighbors) == 0:
+            return []
+
+        csr = self.interactions.csr
+        items, weighted = csr.gather_rows(neighbors, sims.astype(np.float64))
+        seen = csr.row(row)[0]
+        keep = ~np.isin(items, seen)
+        items, weighted = items[keep], weighted[keep]
+        if len(items) == 0:
+            return []
+
+        unique, inverse = np.unique(items, return_inverse=True)
+        counts = np.bincount(inverse)
+        scores = np.bincount(inverse, weights=weighted) / counts
+        top = np.argsort(-scores, kind="stable")[:limit]
+        item_ids = self.interactions.item_ids
+        return [
+            {
+                "vectorId": item_ids[unique[i]],
+                "score": float(scores[i]),
+                "reason": f"Recommended by {counts[i]} similar users",
+            }
+            for i in top.tolist()
+        ]
+
+    # ==================== Persistence ====================
+
+    def save(self, path: str) -> None:
+        """Persist neighbor lists (with the id mappings they refer to) as .npz"""
+        # Any values: numpy's stubs only expect allow_pickle as a savez keyword
+        arrays: Dict[str, Any] = {
+            "k": np.array(self.k),
+            "user_ids": np.array(self.interactions.user_ids, dtype=np.int64),
+            "item_ids": np.array(self.interactions.item_ids, dtype=np.int64),
+        }
+        for name, lists in (("user", self.user_neighbors), ("item", self.item_neighbors)):
+            if lists is not None:
+                arrays[f"{name}_neighbors"] = lists.indices
+                arrays[f"{name}_similarities"] = lists.similarities
+        np.savez(path, **arrays)
+
+    def load(self, path: str) -> None:
+        """
+        Load neighbor lists saved by ``save``
+
+        Rows are remapped through user / vector ids, so the lists can be
+        attached to a freshly rebuilt ``InteractionMatrix``.
+        """
+        with np.load(path) as saved:
+            self.k = int(saved["k"])
+            for name in ("user", "item"):
+                if f"{name}_neighbors" not in saved:
+                    continue
+                saved_ids = saved[f"{name}_ids"]
+                index = self.interactions.user_row if name == "user" else self.interactions.item_col
+                current = np.array(
+                    [-1 if index(int(i)) is None else index(int(i)) for i in saved_ids],
+                    dtype=np.int64,
+                )
+                n_rows = len(
+                    self.interactions.user_ids if name == "user" else self.interactions.item_ids
+                )
+                lists = NeighborLists(n_rows, self.k)
+                neighbors = saved[f"{name}_neighbors"]
+                mapped = np.where(neighbors >= 0, current[np.maximum(neighbors, 0)], -1)
+                similarities = saved[f"{name}_similarities"]
+                for old_row, new_row in enumerate(current.tolist()):
+                    if new_row < 0:
+                        continue
+                    valid = mapped[old_row] >= 0
+                    lists.set(new_row, mapped[old_row][valid], similarities[old_row][valid])
+                setattr(self, f"{name}_neighbors", lists)
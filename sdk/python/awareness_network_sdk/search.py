@@ -0,0 +1,513 @@
+"""
+Awareness Network SDK - Memory Search Index
+Local inverted index over AwarenessMemoryAsset metadata
+
+A drop-in local stand-in for ``server/semantic-index.ts``. Instead of scoring
+every asset with substring matches on each query, assets are tokenized once
+into an inverted index and ranked with BM25 over name, description and
+keywords. Exact-match filters (domain, task_type, model_origin, is_public)
+are kept as boolean bitmaps, so combining filters is a vectorized AND.
+Assets can be added and removed incrementally.
+
+``HybridMemorySearchIndex`` additionally embeds each asset with a pluggable
+local encoder into a float16 matrix and fuses BM25 and cosine rankings with
+reciprocal rank fusion, so paraphrased queries still find relevant memories.
+
+Usage:
+    from awareness_network_sdk.search import MemorySearchIndex
+
+    index = MemorySearchIndex()
+    index.add_many(assets)  # AwarenessMemoryAsset dicts
+    results = index.semantic_search(query="reentrancy audit", domain="blockchain_security")
+    for r in results:
+        print(r.memory["identification"]["name"], r.relevance_score)
+"""
+
+import math
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, cast
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Relative weight of each text field in the term frequency (keywords are the
+# curated discovery terms, so they count the most)
+FIELD_WEIGHTS = {"keywords": 2.0, "name": 1.5, "description": 1.0}
+
+FILTER_FIELDS = ("domain", "task_type", "model_origin", "is_public")
+
+# Maps a batch of texts to an (n, dimension) array of embeddings
+Encoder = Callable[[Sequence[str]], np.ndarray]
+
+# Rows converted to float32 at a time when scoring the float16 matrix (small
+# enough for the converted block to stay in cache)
+_SCORE_CHUNK_ROWS = 8192
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens (``smart_contract`` -> smart, contract)"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+@dataclass
+class SearchResult:
+    """Search result with relevance score (mirrors the server interface)"""
+    memory: Dict[str, Any]
+    relevance_score: float
+    match_type: str
+
+
+def asset_id(asset: Dict[str, Any]) -> str:
+    """Stable identifier of a memory asset (token id, falling back to name)"""
+    identification = asset["identification"]
+    return str(identification.get("id") or identification["name"])
+
+
+def _asset_fields(asset: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "domain": asset["semantic_context"]["domain"],
+        "task_type": asset["semantic_context"]["task_type"],
+        "model_origin": asset["technical_spec"]["model_origin"],
+        "is_public": bool(asset["access_control"]["is_public"]),
+    }
+
+
+def asset_text(asset: Dict[str, Any]) -> str:
+    """Text embedded for an asset: name, description and keywords"""
+    identification = asset["identification"]
+    keywords = ", ".join(asset["semantic_context"].get("keywords", []))
+    return f"{identification['name']}. {identification.get('description', '')} {keywords}"
+
+
+def _weighted_terms(asset: Dict[str, Any]) -> Dict[str, float]:
+    terms: Dict[str, float] = {}
+    texts = {
+        "name": asset["identification"]["name"],
+        "description": asset["identification"].get("description", ""),
+        "keywords": " ".join(asset["semantic_context"].get("keywords", [])),
+    }
+    for field, text in texts.items():
+        for token in tokenize(text):
+            terms[token] = terms.get(token, 0.0) + FIELD_WEIGHTS[field]
+    return terms
+
+
+class MemorySearchIndex:
+    """
+    BM25 inverted index with bitmap filters over memory assets
+
+    Documents occupy integer slots; removed slots are recycled. Posting
+    lists are kept as dicts for cheap incremental updates and materialized
+    into NumPy arrays lazily when a term is queried.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, initial_capacity: int = 1024):
+        """
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+            initial_capacity: Initial number of document slots
+        """
+        self.k1 = k1
+        self.b = b
+
+        self._capacity = initial_capacity
+        self._alive = np.zeros(initial_capacity, dtype=bool)
+        self._doc_len = np.zeros(initial_capacity, dtype=np.float32)
+        self._usage = np.zeros(initial_capacity, dtype=np.int64)
+        self._assets: List[Optional[Dict[str, Any]]] = [None] * initial_capacity
+        self._terms: List[Optional[Dict[str, float]]] = [None] * initial_capacity
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._next_slot = 0
+        self._total_len = 0.0
+
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._posting_arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._bitmaps: Dict[str, Dict[Any, np.ndarray]] = {field: {} for field in FILTER_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._slots
+
+    # ==================== Incremental Updates ====================
+
+    def _grow(self) -> None:
+        new_capacity = self._capacity * 2
+        extra = new_capacity - self._capacity
+        self._alive = np.concatenate([self._alive, np.zeros(extra, dtype=bool)])
+        self._doc_len = np.concatenate([self._doc_len, np.zeros(extra, dtype=np.float32)])
+        self._usage = np.concatenate([self._usage, np.zeros(extra, dtype=np.int64)])
+        self._assets.extend([None] * extra)
+        self._terms.extend([None] * extra)
+        for values in self._bitmaps.values():
+            for value, bitmap in values.items():
+                values[value] = np.concatenate([bitmap, np.zeros(extra, dtype=bool)])
+        self._capacity = new_capacity
+
+    def _bitmap(self, field: str, value: Any) -> np.ndarray:
+        values = self._bitmaps[field]
+        if value not in values:
+            values[value] = np.zeros(self._capacity, dtype=bool)
+        return values[value]
+
+    def add(self, asset: Dict[str, Any]) -> None:
+        """Index an asset, replacing any previous version with the same id"""
+        memory_id = asset_id(asset)
+        if memory_id in self._slots:
+            self.remove(memory_id)
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._next_slot == self._capacity:
+                self._grow()
+            slot = self._next_slot
+            self._next_slot += 1
+
+        terms = _weighted_terms(asset)
+        length = float(sum(terms.values()))
+        for term, weight in terms.items():
+            self._postings.setdefault(term, {})[slot] = weight
+            self._posting_arrays.pop(term, None)
+
+        for field, value in _asset_fields(asset).items():
+            self._bitmap(field, value)[slot] = True
+
+        self._slots[memory_id] = slot
+        self._assets[slot] = asset
+        self._terms[slot] = terms
+        self._alive[slot] = True
+        self._doc_len[slot] = length
+        self._usage[slot] = asset.get("provenance", {}).get("usage_count", 0)
+        self._total_len += length
+
+    def add_many(self, assets: Iterable[Dict[str, Any]]) -> None:
+        """Index many assets"""
+        for asset in assets:
+            self.add(asset)
+
+    def remove(self, memory_id: str) -> bool:
+        """Remove an asset by id; returns False if it was not indexed"""
+        slot = self._slots.pop(memory_id, None)
+        if slot is None:
+            return False
+
+        terms = self._terms[slot] or {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(slot, None)
+                if not postings:
+                    del self._postings[term]
+            self._posting_arrays.pop(term, None)
+
+        # A slot listed in _slots always holds an asset
+        for field, value in _asset_fields(cast(Dict[str, Any], self._assets[slot])).items():
+            self._bitmaps[field][value][slot] = False
+
+        self._total_len -= float(self._doc_len[slot])
+        self._alive[slot] = False
+        self._doc_len[slot] = 0.0
+        self._usage[slot] = 0
+        self._assets[slot] = None
+        self._terms[slot] = None
+        self._free.append(slot)
+        return True
+
+    def get(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        """Return an indexed asset by id"""
+        slot = self._slots.get(memory_id)
+        return None if slot is None else self._assets[slot]
+
+    # ==================== Querying ====================
+
+    def _postings_for(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        arrays = self._posting_arrays.get(term)
+        if arrays is None:
+            postings = self._postings.get(term)
+            if not postings:
+                return None
+            arrays = (
+                np.fromiter(postings.keys(), dtype=np.int64, count=len(postings)),
+                np.fromiter(postings.values(), dtype=np.float32, count=len(postings)),
+            )
+            self._posting_arrays[term] = arrays
+        return arrays
+
+    def filter_mask(
+        self,
+        domain: Optional[str] = None,
+        task_type: Optional[str] = None,
+        model_origin: Optional[str] = None,
+        is_public: Optional[bool] = None,
+    ) -> np.ndarray:
+        """Boolean mask of live slots matching every given filter"""
+        mask: np.ndarray = self._alive.copy()
+        for field, value in (
+            ("domain", domain),
+            ("task_type", task_type),
+            ("model_origin", model_origin),
+            ("is_public", is_public),
+        ):
+            if value is None:
+                continue
+            bitmap = self._bitmaps[field].get(value)
+            if bitmap is None:
+                return np.zeros(self._capacity, dtype=bool)
+            mask &= bitmap
+        return mask
+
+    def bm25_scores(self, query: str) -> np.ndarray:
+        """BM25 score for every slot (0 for slots matching no query term)"""
+        scores = np.zeros(self._capacity, dtype=np.float32)
+        n_docs = len(self._slots)
+        if n_docs == 0:
+            return scores
+        avg_len = self._total_len / n_docs
+        for term in set(tokenize(query)):
+            arrays = self._postings_for(term)
+            if arrays is None:
+                continue
+            slots, tf = arrays
+            df = len(slots)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            norm = self.k1 * (1.0 - self.b + self.b * self._doc_len[slots] / avg_len)
+            scores[slots] += idf * tf * (self.k1 + 1.0) / (tf + norm)
+        return scores
+
+    def _top(self, scores: np.ndarray, candidates: np.ndarray, limit: int) -> np.ndarray:
+        """Slots of the ``limit`` best candidates, best first"""
+        if len(candidates) > limit:
+            part = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[part]
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+    def _results(
+        self, slots: np.ndarray, scores: np.ndarray, match_type: str
+    ) -> List[SearchResult]:
+        return [
+            SearchResult(self._assets[slot], float(scores[slot]), match_type)
+            for slot in slots.tolist()
+        ]
+
+    def semantic_search(
+        self,
+        query: Optional[str] = None,
+        domain: Optional[str] = None,
+        task_type: Optional[str] = None,
+        model_origin: Optional[str] = None,
+        is_public: Optional[bool] = None,
+        limit: int = 20,
+    ) -> List[SearchResult]:
+        """
+        Combined query + filter search (mirrors ``semanticSearch``)
+
+        Without a query every asset matching the filters scores 0.5.
+        """
+        mask = self.filter_mask(domain, task_type, model_origin, is_public)
+        if query:
+            scores = self.bm25_scores(query)
+            mask &= scores > 0
+        else:
+            scores = np.where(mask, 0.5, 0.0).astype(np.float32)
+        candidates = np.flatnonzero(mask)
+        return self._results(self._top(scores, candidates, limit), scores, "semantic")
+
+    def find_memory_by_topic(self, topic: str, limit: int = 10) -> List[SearchResult]:
+        """Keyword search over name, description and keywords"""
+        scores = self.bm25_scores(topic)
+        candidates = np.flatnonzero(self._alive & (scores > 0))
+        return self._results(self._top(scores, candidates, limit), scores, "keyword")
+
+    def find_memory_by_domain(self, domain: str, limit: int = 10) -> List[SearchResult]:
+        """All assets in a domain category"""
+        candidates = np.flatnonzero(self.filter_mask(domain=domain))[:limit]
+        return [SearchResult(self._assets[slot], 1.0, "domain") for slot in candidates.tolist()]
+
+    def find_memory_by_task(self, task_type: str, limit: int = 10) -> List[SearchResult]:
+        """All assets of a task type"""
+        candidates = np.flatnonzero(self.filter_mask(task_type=task_type))[:limit]
+        return [SearchResult(self._assets[slot], 1.0, "task") for slot in candidates.tolist()]
+
+    def leaderboard(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Most used assets (mirrors ``getMemoryLeaderboard``)"""
+        candidates = np.flatnonzero(self._alive)
+        usage = self._usage.astype(np.float64)
+        return [self._assets[slot] for slot in self._top(usage, candidates, limit).tolist()]
+
+
+class HashingEncoder:
+    """
+    Dependency-free local encoder (signed feature hashing of words and
+    character trigrams)
+
+    Catches morphological variants ("audit"/"auditor") but not true
+    paraphrases; plug in a sentence-embedding model for that, e.g.
+    ``SentenceTransformer("all-MiniLM-L6-v2").encode``.
+    """
+
+    def __init__(self, dimension: int = 256):
+        self.dimension = dimension
+
+    def _features(self, text: str) -> Iterable[str]:
+        for token in tokenize(text):
+            yield token
+            padded = f"#{token}#"
+            for i in range(len(padded) - 2):
+                yield padded[i:i + 3]
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                h = zlib.crc32(feature.encode("utf-8"))
+                out[row, h % self.dimension] += 1.0 if h & 0x80000000 else -1.0
+        return out
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.where(norms == 0, 1.0, norms)
+
+
+def reciprocal_rank_fusion(rankings: Sequence[np.ndarray], k: int = 60) -> Dict[int, float]:
+    """Fuse ranked id lists: score(d) = sum over rankings of 1 / (k + rank(d))"""
+    fused: Dict[int, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking.tolist(), start=1):
+            fused[item] = fused.get(item, 0.0) + 1.0 / (k + rank)
+    return fused
+
+
+class HybridMemorySearchIndex(MemorySearchIndex):
+    """
+    BM25 + embedding retrieval with reciprocal rank fusion
+
+    Each lexical and dense ranking is pruned to ``candidates`` entries with
+    ``argpartition`` before fusion, so fusion cost is independent of catalog
+    size. Embeddings are L2-normalized and stored as float16.
+    """
+
+    def __init__(
+        self,
+        encoder: Optional[Encoder] = None,
+        dimension: Optional[int] = None,
+        rrf_k: int = 60,
+        candidates: int = 100,
+        **kwargs: Any
+    ):
+        """
+        Args:
+            encoder: Batch text encoder (default: ``HashingEncoder``)
+            dimension: Embedding dimension (inferred from the encoder if omitted)
+            rrf_k: Reciprocal rank fusion constant
+            candidates: Candidates kept from each ranking before fusion
+            **kwargs: Passed to ``MemorySearchIndex``
+        """
+        super().__init__(**kwargs)
+        self.encoder = encoder or HashingEncoder()
+        if dimension is None:
+            dimension = getattr(self.encoder, "dimension", None)
+        if dimension is None:
+            dimension = self.encoder(["probe"]).shape[-1]
+        self.dimension = dimension
+        self.rrf_k = rrf_k
+        self.candidates = candidates
+        self._embeddings = np.zeros((self._capacity, dimension), dtype=np.float16)
+
+    def _grow(self) -> None:
+        extra = self._capacity
+        super()._grow()
+        self._embeddings = np.concatenate(
+            [self._embeddings, np.zeros((extra, self.dimension), dtype=np.float16)]
+        )
+
+    def add(self, asset: Dict[str, Any]) -> None:
+        """Index and embed an asset"""
+        self.add_many([asset])
+
+    def add_many(self, assets: Iterable[Dict[str, Any]], batch_size: int = 256) -> None:
+        """Index assets, embedding them in batches"""
+        assets = list(assets)
+        for start in range(0, len(assets), batch_size):
+            batch = assets[start:start + batch_size]
+            vectors = _normalize(self.encoder([asset_text(a) for a in batch]))
+            for asset, vector in zip(batch, vectors):
+                super().add(asset)
+                self._embeddings[self._slots[asset_id(asset)]] = vector
+
+    def remove(self, memory_id: str) -> bool:
+        slot = self._slots.get(memory_id)
+        if not super().remove(memory_id):
+            return False
+        self._embeddings[slot] = 0
+        return True
+
+    def cosine_scores(self, query: str, slots: np.ndarray) -> np.ndarray:
+        """Cosine similarity between the query and the given slots"""
+        q = _normalize(self.encoder([query]))[0]
+        # Converting into a reused float32 buffer avoids an allocation per block
+        buffer = np.empty((_SCORE_CHUNK_ROWS, self.dimension), dtype=np.float32)
+
+        def score(block: np.ndarray) -> np.ndarray:
+            out = buffer[:len(block)]
+            np.copyto(out, block)
+            scored: np.ndarray = out @ q
+            return scored
+
+        if 2 * len(slots) >= self._next_slot:
+            # Mostly unfiltered: contiguous blocks avoid a gather per chunk
+            end = self._next_slot
+            full = np.empty(end, dtype=np.float32)
+            for start in range(0, end, _SCORE_CHUNK_ROWS):
+                stop = min(start + _SCORE_CHUNK_ROWS, end)
+                full[start:stop] = score(self._embeddings[start:stop])
+            selected: np.ndarray = full[slots]
+            return selected
+        scores = np.empty(len(slots), dtype=np.float32)
+        for start in range(0, len(slots), _SCORE_CHUNK_ROWS):
+            chunk = slots[start:start + _SCORE_CHUNK_ROWS]
+            scores[start:start + len(chunk)] = score(self._embeddings[chunk])
+        return scores
+
+    def hybrid_search(
+        self,
+        query: str,
+        domain: Optional[str] = None,
+        task_type: Optional[str] = None,
+        model_origin: Optional[str] = None,
+        is_public: Optional[bool] = None,
+        limit: int = 10,
+    ) -> List[SearchResult]:
+        """
+        Fused lexical + semantic search
+
+        Returns:
+            Results ranked by reciprocal rank fusion score
+        """
+        mask = self.filter_mask(domain, task_type, model_origin, is_public)
+        allowed = np.flatnonzero(mask)
+        if len(allowed) == 0:
+            return []
+
+        bm25 = self.bm25_scores(query)
+        lexical = np.flatnonzero(mask & (bm25 > 0))
+        lexical = self._top(bm25, lexical, self.candidates)
+
+        cosine = np.zeros(self._capacity, dtype=np.float32)
+        cosine[allowed] = self.cosine_scores(query, allowed)
+        dense = self._top(cosine, allowed, self.candidates)
+
+        fused = reciprocal_rank_fusion([lexical, dense], k=self.rrf_k)
+        ranked = sorted(fused.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [
+            SearchResult(cast(Dict[str, Any], self._assets[slot]), score, "hybrid")
+            for slot, score in ranked
+        ]
@@ -0,0 +1,309 @@
+"""
+Awareness Network SDK - Shared-Memory Tensor Transport
+Zero-copy hand-off of embedding matrices and KV-cache tensors to worker processes
+
+Publishing a tensor copies it once into a ``multiprocessing.shared_memory``
+segment and returns a ``TensorDescriptor`` (segment name, shape, dtype,
+offset). Descriptors are a few dozen bytes to pickle, so tasks submitted to a
+process pool carry descriptors instead of ``List[float]`` payloads or NumPy
+arrays. Workers call ``attach`` to get an ndarray view of the same memory.
+
+Segments are reference counted on the publishing side and unlinked when the
+last reference is released (or when the store is closed).
+
+Usage:
+    from awareness_network_sdk.shm import SharedTensorStore, attach
+
+    def score(desc, query):
+        matrix = attach(desc)
+        return matrix @ query
+
+    with SharedTensorStore() as store:
+        desc = store.publish(embeddings)
+        with ProcessPoolExecutor() as pool:
+            futures = [store.retain_for(pool.submit(score, desc, q), desc) for q in queries]
+        store.release(desc)
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, Mapping, Tuple
+
+import numpy as np
+
+# Offsets of tensors packed into one segment are aligned for SIMD loads
+_ALIGNMENT = 64
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+@dataclass(frozen=True)
+class TensorDescriptor:
+    """Picklable reference to a tensor stored in a shared-memory segment"""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+    offset: int = 0
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape, dtype=np.int64)) * np.dtype(self.dtype).itemsize
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    # Python 3.13+ can skip resource-tracker registration for attached
+    # segments; the publisher owns the segment and is responsible for unlink
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedTensorStore:
+    """
+    Publisher-side registry of shared-memory segments
+
+    Every segment starts with a reference count of one. ``acquire`` and
+    ``release`` adjust it; the segment is unlinked when it reaches zero.
+    """
+
+    def __init__(self) -> None:
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+        self._refcounts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SharedTensorStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _create(self, size: int) -> shared_memory.SharedMemory:
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        with self._lock:
+            self._segments[segment.name] = segment
+            self._refcounts[segment.name] = 1
+        return segment
+
+    def publish(self, tensor: Any, dtype: Any = np.float32) -> TensorDescriptor:
+        """
+        Copy a tensor into a new shared segment
+
+        Args:
+            tensor: NumPy array or nested ``List[float]``
+            dtype: dtype to store the tensor as
+
+        Returns:
+            Descriptor of the published tensor
+        """
+        return self.publish_many({"tensor": tensor}, dtype=dtype)["tensor"]
+
+    def publish_many(
+        self,
+        tensors: Mapping[str, Any],
+        dtype: Any = np.float32,
+    ) -> Dict[str, TensorDescriptor]:
+        """
+        Pack several tensors into a single segment
+
+        The tensors share one reference count (keyed by segment name).
+        """
+        arrays = {key: np.asarray(value, dtype=dtype) for key, value in tensors.items()}
+        offsets: Dict[str, int] = {}
+        size = 0
+        for key, array in arrays.items():
+            size = _align(size)
+            offsets[key] = size
+            size += array.nbytes
+
+        segment = self._create(size)
+        descriptors = {}
+        for key, array in arrays.items():
+            descriptor = TensorDescriptor(segment.name, array.shape, array.dtype.str, offsets[key])
+            view = np.ndarray(
+                array.shape, dtype=array.dtype, buffer=segment.buf, offset=offsets[key]
+            )
+            view[...] = array
+            del view
+            descriptors[key] = descriptor
+        return descriptors
+
+    def allocate(self, shape: Tuple[int, ...], dtype: Any = np.float32) -> TensorDescriptor:
+        """Create a zeroed output segment for workers to write into"""
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+        segment = self._create(nbytes)
+        return TensorDescriptor(segment.name, tuple(shape), dtype.str, 0)
+
+    def read(self, descriptor: TensorDescriptor, copy: bool = True) -> np.ndarray:
+        """
+        Read a tensor published by this store
+
+        With ``copy=False`` the returned array is a view that is only valid
+        until the segment is released.
+        """
+        with self._lock:
+            segment = self._segments[descriptor.name]
+        view: np.ndarray = np.ndarray(
+            descriptor.shape,
+            dtype=np.dtype(descriptor.dtype),
+            buffer=segment.buf,
+            offset=descriptor.offset,
+        )
+        return view.copy() if copy else view
+
+    def acquire(self, descriptor: TensorDescriptor) -> TensorDescriptor:
+        """Add a reference to the descriptor's segment"""
+        with self._lock:
+            if descriptor.name not in self._refcounts:
+                raise KeyError(f"Segment {descriptor.name} is not owned by this store")
+            self._refcounts[descriptor.name] += 1
+        return descriptor
+
+    def release(self, descriptor: TensorDescriptor) -> None:
+        """Drop a reference; unlinks the segment when none remain"""
+        with self._lock:
+            count = self._refcounts.get(descriptor.name)
+            if count is None:
+                return
+            if count > 1:
+                self._refcounts[descriptor.name] = count - 1
+                return
+            del self._refcounts[descriptor.name]
+            segment = self._segments.pop(descriptor.name)
+        self._destroy(segment)
+
+    def retain_for(self, future: Future, *descriptors: TensorDescriptor) -> Future:
+        """Hold references to ``descriptors`` until ``future`` completes"""
+        for descriptor in descriptors:
+            self.acquire(descriptor)
+
+        def _release(_: Future) -> None:
+            for descriptor in descriptors:
+                self.release(descriptor)
+
+        future.add_done_callback(_release)
+        return future
+
+    def refcount(self, descriptor: TensorDescriptor) -> int:
+        """Current reference count of the descriptor's segment (0 if released)"""
+        with self._lock:
+            return self._refcounts.get(descriptor.name, 0)
+
+    def close(self) -> None:
+        """Unlink every segment regardless of outstanding references"""
+        with self._lock:
+            segments = list(self._segments.values())
+            self._segments.clear()
+            self._refcounts.clear()
+        for segment in segments:
+            self._destroy(segment)
+
+    @staticmethod
+    def _destroy(segment: shared_memory.SharedMemory) -> None:
+        try:
+            segment.close()
+        except BufferError:
+            # A view returned by read(copy=False) is still alive; the mapping
+            # is freed once it is garbage collected
+            pass
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# ==================== Worker Side ====================
+
+# Segments attached by this process, most recently used last. Reusing the
+# handle avoids re-mapping the same source tensor for every task.
+_attached: "OrderedDict[str, shared_memory.SharedMemory]" = OrderedDict()
+_attached_lock = threading.Lock()
+MAX_ATTACHED_SEGMENTS = 64
+
+
+def attach(descriptor: TensorDescriptor, writable: bool = False) -> np.ndarray:
+    """
+    Map a published tensor into this process
+
+    Args:
+        descriptor: Descriptor received from the publisher
+        writable: Return a writable view (for output segments)
+
+    Returns:
+        ndarray view backed by the shared segment (no copy)
+    """
+    with _attached_lock:
+        segment = _attached.get(descriptor.name)
+        if segment is None:
+            segment = _open_segment(descriptor.name)
+            _attached[descriptor.name] = segment
+            _evict_attached()
+        else:
+            _attached.move_to_end(descriptor.name)
+
+    view: np.ndarray = np.ndarray(
+        descriptor.shape,
+        dtype=np.dtype(descriptor.dtype),
+        buffer=segment.buf,
+        offset=descriptor.offset,
+    )
+    if not writable:
+        view.flags.writeable = False
+    return view
+
+
+def _evict_attached() -> None:
+    # Caller holds _attached_lock
+    for name in list(_attached.keys())[:-1]:
+        if len(_attached) <= MAX_ATTACHED_SEGMENTS:
+            break
+        try:
+            _attached[name].close()
+        except BufferError:
+            continue
+        del _attached[name]
+
+
+def detach(descriptor: TensorDescriptor) -> bool:
+    """
+    Unmap a segment attached by this process
+
+    Returns False if views into it are still alive.
+    """
+    with _attached_lock:
+        segment = _attached.get(descriptor.name)
+        if segment is None:
+            return True
+        try:
+            segment.close()
+        except BufferError:
+            return False
+        del _attached[descriptor.name]
+        return True
+
+
+def detach_all() -> None:
+    """Unmap every segment this process can release"""
+    with _attached_lock:
+        for name in list(_attached.keys()):
+            try:
+                _attached[name].close()
+            except BufferError:
+                continue
+            del _attached[name]
+
+
+def share_vectors(
+    store: SharedTensorStore, vectors: Any, dtype: Any = np.float32
+) -> TensorDescriptor:
+    """Publish a batch of ``List[float]`` vectors as one 2-D matrix"""
+    matrix = np.asarray(vectors, dtype=dtype)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return store.publish(matrix, dtype=dtype)
@@ -0,0 +1,659 @@
+"""
+Awareness Network SDK - Local Stand-In Server
+In-process HTTP server reproducing the API's authentication path for tests
+
+The stand-in mirrors ``server/api-key-manager.ts``: validation results are
+cached per key hash with a short TTL (misses for a shorter one), revoking or
+rotating a key drops its cached entry, and ``lastUsedAt`` writes are
+coalesced into periodic batches. Every simulated database statement is
+counted so tests can assert how many round trips a workload costs.
+
+It also serves the MCP routes of ``server/mcp-api.ts`` and the multiplexed
+session stream of ``server/mcp-session.ts`` for access tokens granted with
+``grant_access``; ``set_latency`` slows a vector down so out-of-order
+completion can be observed.
+
+Like ``server/http-compression.ts``, it inflates gzip/deflate request bodies
+(chunked or not) and gzips large memory responses for clients that accept
+it; ``bytes_in`` and ``bytes_out`` count body bytes as sent on the wire.
+Like ``server/trace-context.ts``, it reports each request's handling time
+in ``Server-Timing``; the ``traceparent`` headers it received are kept in
+``traceparents``.
+
+Only the standard library is used; requests go over real loopback HTTP.
+
+Usage:
+    from awareness_network_sdk import AwarenessNetworkClient
+    from awareness_network_sdk.testing import StandInServer
+
+    with StandInServer() as server:
+        key = server.register_agent("TestAgent")["apiKey"]
+        client = AwarenessNetworkClient(base_url=server.base_url, api_key=key)
+        client.list_api_keys()
+        assert server.stats["key_selects"] == 1
+"""
+
+import hashlib
+import json
+import queue
+import re
+import secrets
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+# Mirrors server/api-key-manager.ts
+AUTH_CACHE_TTL = 30.0
+AUTH_NEGATIVE_TTL = 5.0
+USAGE_FLUSH_INTERVAL = 10.0
+
+API_KEY_NOT_FOUND = "API key not found or inactive"
+API_KEY_EXPIRED = "API key expired"
+
+# Mirrors server/mcp-api.ts and server/mcp-session.ts
+MCP_RATE_LIMITS = {"invoke": {"calls_per_minute": 60, "calls_per_day": 10000}}
+MCP_MAX_BATCH_SIZE = 100
+MCP_MAX_SESSIONS_PER_USER = 8
+
+# Mirrors server/http-compression.ts
+COMPRESSED_ROUTES = ("/api/ai/memory",)
+COMPRESSION_THRESHOLD = 8 * 1024
+_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def hash_api_key(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class StandInServer:
+    """
+    Loopback stand-in for the Awareness Network API
+
+    Serves ``/api/ai/register``, ``/api/ai/keys`` (list, create, revoke),
+    ``/api/ai/memory/:key`` (get, put, delete), ``/api/mcp/discover``,
+    ``/api/mcp/invoke`` and ``/api/mcp/session`` with the server's response
+    shapes and authentication caching.
+    """
+
+    def __init__(
+        self,
+        auth_cache_ttl: float = AUTH_CACHE_TTL,
+        negative_ttl: float = AUTH_NEGATIVE_TTL,
+        usage_flush_interval: Optional[float] = USAGE_FLUSH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            auth_cache_ttl: Seconds a successful validation is reused
+            negative_ttl: Seconds an unknown key hash is remembered
+            usage_flush_interval: Seconds between batched lastUsedAt writes
+                (None disables the background flush; call flush_usage())
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.auth_cache_ttl = auth_cache_ttl
+        self.negative_ttl = negative_ttl
+        self.usage_flush_interval = usage_flush_interval
+        self.stats: Dict[str, int] = {
+            "key_selects": 0, "usage_flushes": 0, "cache_hits": 0, "connections": 0, "mcp_calls": 0,
+            "bytes_in": 0, "bytes_out": 0,
+        }
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._next_id = 1
+        self._keys: Dict[int, Dict[str, Any]] = {}
+        self._memories: Dict[Tuple[int, str], Dict[str, Any]] = {}
+        self._cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._cached_hash_by_key_id: Dict[int, str] = {}
+        self._pending_last_used: Dict[int, str] = {}
+        self._grants: Dict[str, Dict[str, Any]] = {}
+        self._latency: Dict[int, float] = {}
+        self._sessions: Dict[str, Tuple[int, "queue.Queue[Dict[str, Any]]"]] = {}
+        self.traceparents: List[Optional[str]] = []
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._threads: List[threading.Thread] = []
+        self._stopped = threading.Event()
+
+    # ==================== Lifecycle ====================
+
+    @property
+    def base_url(self) -> str:
+        if self._httpd is None:
+            raise RuntimeError("StandInServer is not running")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}/api"
+
+    def start(self) -> "StandInServer":
+        handler = type("Handler", (_Handler,), {"stand_in": self})
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._httpd.daemon_threads = True
+        self._stopped.clear()
+        self._threads = [
+            threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+        ]
+        if self.usage_flush_interval is not None:
+            self._threads.append(threading.Thread(target=self._flush_loop, daemon=True))
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        for thread in self._threads:
+            thread.join()
+        self.flush_usage()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    # ==================== Key management ====================
+
+    def register_agent(
+        self, agent_name: str, permissions: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Create an agent and its first key (as POST /api/ai/register does)"""
+        with self._lock:
+            user_id = self._allocate_id()
+        key = self._insert_key(
+            user_id, "Default Key", permissions or ["read", "write", "purchase"], None
+        )
+        return {"success": True, "userId": user_id, "apiKey": key}
+
+    def create_key(
+        self,
+        user_id: int,
+        name: str,
+        permissions: Optional[List[str]] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> str:
+        return self._insert_key(user_id, name, permissions or ["read"], expires_at)
+
+    def revoke_key(self, key_id: int, user_id: int) -> bool:
+        with self._lock:
+            record = self._keys.get(key_id)
+            if record is None or record["userId"] != user_id:
+                return False
+            record["isActive"] = False
+            self._invalidate(key_id)
+            return True
+
+    def rotate_key(self, key_id: int, user_id: int) -> Optional[str]:
+        """Issue a replacement key with the same scopes and revoke the old one"""
+        with self._lock:
+            old = self._keys.get(key_id)
+            if old is None or old["userId"] != user_id:
+                return None
+            new_key = self._insert_key(
+                user_id, f"{old['name']} (Rotated)", old["permissions"], old["expiresAt"]
+            )
+            self.revoke_key(key_id, user_id)
+            return new_key
+
+    def key_record(self, key_id: int) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._keys[key_id])
+
+    # ==================== MCP ====================
+
+    def grant_access(
+        self,
+        vector_id: int,
+        calls_remaining: Optional[int] = None,
+        expires_at: Optional[datetime] = None,
+    ) -> str:
+        """Create an access permission for a vector and return its token"""
+        token = secrets.token_hex(32)
+        with self._lock:
+            self._grants[token] = {
+                "vectorId": vector_id,
+                "callsRemaining": calls_remaining,
+                "expiresAt": expires_at,
+            }
+        return token
+
+    def set_latency(self, vector_id: int, seconds: float) -> None:
+        """Delay every invocation of a vector by ``seconds``"""
+        self._latency[vector_id] = seconds
+
+    def mcp_invoke(self, access_token: Optional[str], request: Any) -> Tuple[int, Dict[str, Any]]:
+        """Run one invocation as ``invokeVector`` does; returns (status, body)"""
+        if not access_token:
+            return 401, {"error": "Missing or invalid authorization header"}
+        request = request if isinstance(request, dict) else {}
+        vector_id, context = request.get("vector_id"), request.get("context")
+        if not vector_id or not context:
+            return 400, {"error": "Missing required fields: vector_id, context"}
+        time.sleep(self._latency.get(vector_id, 0.0))
+        with self._lock:
+            self.stats["mcp_calls"] += 1
+            grant = self._grants.get(access_token)
+            if grant is None:
+                return 403, {"error": "Invalid or expired access token"}
+            if grant["vectorId"] != vector_id:
+                return 403, {"error": "Access token not valid for this vector"}
+            if grant["expiresAt"] is not None and grant["expiresAt"] < datetime.now(timezone.utc):
+                return 403, {"error": "Access token expired"}
+            remaining = grant["callsRemaining"]
+            if remaining is not None and remaining <= 0:
+                return 429, {"error": "Call limit exceeded"}
+            if remaining is not None:
+                grant["callsRemaining"] = remaining - 1
+        return 200, {
+            "protocol": "MCP/1.0",
+            "vector_id": vector_id,
+            "result": {
+                "embedding": [0.0] * 8,
+                "confidence": 0.95,
+                "metadata": {"context": context},
+            },
+            "usage": {"calls_remaining": None if remaining is None else remaining - 1},
+        }
+
+    def _mcp_discover(self) -> Dict[str, Any]:
+        with self._lock:
+            vector_ids = sorted({grant["vectorId"] for grant in self._grants.values()})
+        vectors = [
+            {"id": vector_id, "name": f"Vector {vector_id}", "version": "1.0.0"}
+            for vector_id in vector_ids
+        ]
+        return {
+            "protocol": "MCP/1.0",
+            "vectors": vectors,
+            "total": len(vectors),
+            "rate_limits": MCP_RATE_LIMITS,
+        }
+
+    def _mcp_call(self, call: Dict[str, Any]) -> Dict[str, Any]:
+        params = call.get("params") or {}
+        if call["method"] == "invoke":
+            status, body = self.mcp_invoke(call.get("access_token"), params)
+        elif call["method"] == "discover":
+            status, body = 200, self._mcp_discover()
+        else:
+            status, body = 400, {"error": f"Unknown method: {call['method']}"}
+        if status < 400:
+            return {"id": call["id"], "status": status, "result": body}
+        return {"id": call["id"], "status": status, "error": body.get("error", body)}
+
+    def _open_session(self, user_id: int) -> Optional[Tuple[str, "queue.Queue[Dict[str, Any]]"]]:
+        """Register a stream for ``user_id``; None when the user is at the session cap"""
+        session_id = secrets.token_hex(16)
+        events: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        with self._lock:
+            if (
+                sum(1 for owner, _ in self._sessions.values() if owner == user_id)
+                >= MCP_MAX_SESSIONS_PER_USER
+            ):
+                return None
+            self._sessions[session_id] = (user_id, events)
+        return session_id, events
+
+    def _close_session(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def _submit_calls(self, session_id: str, user_id: int, body: Any) -> Tuple[int, Dict[str, Any]]:
+        with self._lock:
+            owner, events = self._sessions.get(session_id, (None, None))
+        if events is None or owner != user_id:
+            return 404, {"error": "Session not found"}
+        calls = (
+            body.get("calls")
+            if isinstance(body, dict) and isinstance(body.get("calls"), list)
+            else [body]
+        )
+        if not calls or len(calls) > MCP_MAX_BATCH_SIZE:
+            return 400, {"error": f"A batch holds 1 to {MCP_MAX_BATCH_SIZE} calls"}
+        if any(
+            not isinstance(c, dict) or c.get("id") is None or not isinstance(c.get("method"), str)
+            for c in calls
+        ):
+            return 400, {"error": "Every call needs an id and a method"}
+        # Every call runs concurrently and reports on the stream when done
+        for call in calls:
+            threading.Thread(
+                target=lambda call=call: events.put(self._mcp_call(call)), daemon=True
+            ).start()
+        return 202, {"accepted": len(calls)}
+
+    # ==================== Authentication ====================
+
+    def validate(self, api_key: str) -> Dict[str, Any]:
+        """Validate a key through the cache, recording usage for a later flush"""
+        key_hash = hash_api_key(api_key)
+        now = self._clock()
+        with self._lock:
+            cached = self._cache.get(key_hash)
+            if cached is not None and cached[1] > now:
+                self.stats["cache_hits"] += 1
+                result = cached[0]
+                if result["valid"]:
+                    self._pending_last_used[result["keyId"]] = _now_iso()
+                return result
+
+            self.stats["key_selects"] += 1
+            record = next(
+                (r for r in self._keys.values() if r["keyHash"] == key_hash and r["isActive"]), None
+            )
+            if record is None:
+                result = {"valid": False, "error": API_KEY_NOT_FOUND}
+                self._cache[key_hash] = (result, now + self.negative_ttl)
+                return result
+
+            expires_in = None
+            if record["expiresAt"] is not None:
+                expires_in = (record["expiresAt"] - datetime.now(timezone.utc)).total_seconds()
+                if expires_in <= 0:
+                    return {"valid": False, "error": API_KEY_EXPIRED}
+
+            result = {
+                "valid": True,
+                "userId": record["userId"],
+                "keyId": record["id"],
+                "permissions": record["permissions"],
+            }
+            ttl = (
+                self.auth_cache_ttl if expires_in is None else min(self.auth_cache_ttl, expires_in)
+            )
+            self._cache[key_hash] = (result, now + ttl)
+            self._cached_hash_by_key_id[record["id"]] = key_hash
+            self._pending_last_used[record["id"]] = _now_iso()
+            return result
+
+    def flush_usage(self) -> int:
+        """Apply pending lastUsedAt timestamps as one batched write"""
+        with self._lock:
+            if not self._pending_last_used:
+                return 0
+            batch, self._pending_last_used = self._pending_last_used, {}
+            for key_id, used_at in batch.items():
+                if key_id in self._keys:
+                    self._keys[key_id]["lastUsedAt"] = used_at
+            self.stats["usage_flushes"] += 1
+            return len(batch)
+
+    def _flush_loop(self) -> None:
+        while not self._stopped.wait(self.usage_flush_interval):
+            self.flush_usage()
+
+    def _invalidate(self, key_id: int) -> None:
+        key_hash = self._cached_hash_by_key_id.pop(key_id, None)
+        if key_hash is not None:
+            self._cache.pop(key_hash, None)
+
+    def _allocate_id(self) -> int:
+        next_id = self._next_id
+        self._next_id += 1
+        return next_id
+
+    def _insert_key(
+        self, user_id: int, name: str, permissions: List[str], expires_at: Optional[datetime]
+    ) -> str:
+        raw_key = f"ak_{secrets.token_hex(32)}"
+        with self._lock:
+            key_id = self._allocate_id()
+            self._keys[key_id] = {
+                "id": key_id,
+                "userId": user_id,
+                "keyHash": hash_api_key(raw_key),
+                "keyPrefix": raw_key[:12],
+                "name": name,
+                "permissions": permissions,
+                "lastUsedAt": None,
+                "expiresAt": expires_at,
+                "isActive": True,
+                "createdAt": _now_iso(),
+            }
+        return raw_key
+
+    # ==================== Routes ====================
+
+    def handle(
+        self, method: str, path: str, query: Dict[str, List[str]], headers: Any, body: Any
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Dispatch one request; returns (status, payload)"""
+        if path == "/api/mcp/discover" and method == "GET":
+            return 200, self._mcp_discover()
+        if path == "/api/mcp/invoke" and method == "POST":
+            auth = headers.get("Authorization") or ""
+            return self.mcp_invoke(auth[7:] if auth.startswith("Bearer ") else None, body)
+        if method == "POST" and path == "/api/ai/register":
+            if not isinstance(body, dict) or not body.get("agentName"):
+                return 400, {"error": "Invalid request"}
+            response = self.register_agent(body["agentName"])
+            response["message"] = "AI agent registered successfully."
+            return 201, response
+
+        api_key = headers.get("X-API-Key")
+        if not api_key:
+            return 401, {"error": "API key required"}
+        auth = self.validate(api_key)
+        if not auth["valid"]:
+            error = "API key expired" if auth["error"] == API_KEY_EXPIRED else "Invalid API key"
+            return 401, {"error": error}
+        user_id = auth["userId"]
+
+        match = re.fullmatch(r"/api/mcp/session/([0-9a-f]+)", path)
+        if match and method == "POST":
+            return self._submit_calls(match.group(1), user_id, body)
+
+        if path == "/api/ai/keys":
+            if method == "GET":
+                return 200, self._list_keys(user_id, query)
+            if method == "POST":
+                days = body.get("expiresInDays")
+                expires_at = datetime.now(timezone.utc) + timedelta(days=days) if days else None
+                key = self.create_key(
+                    user_id, body.get("name", "API Key"), body.get("permissions"), expires_at
+                )
+                return 201, {"success": True, "apiKey": key}
+
+        match = re.fullmatch(r"/api/ai/keys/(\d+)", path)
+        if match and method == "DELETE":
+            self.revoke_key(int(match.group(1)), user_id)
+            return 200, {"success": True, "message": "API key revoked"}
+
+        match = re.fullmatch(r"/api/ai/memory/([^/]+)", path)
+        if match:
+            return self._memory(method, user_id, match.group(1), body)
+
+        return 404, {"error": "Not found"}
+
+    def _list_keys(self, user_id: int, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        with self._lock:
+            rows = sorted(
+                (r for r in self._keys.values() if r["userId"] == user_id), key=lambda r: r["id"]
+            )
+        if "cursor" in query:
+            rows = [r for r in rows if r["id"] > int(query["cursor"][0])]
+        fields = (
+            "id",
+            "name",
+            "keyPrefix",
+            "permissions",
+            "lastUsedAt",
+            "expiresAt",
+            "isActive",
+            "createdAt",
+        )
+        keys = [{f: r[f] for f in fields} for r in rows]
+        for key in keys:
+            if key["expiresAt"] is not None:
+                key["expiresAt"] = key["expiresAt"].isoformat().replace("+00:00", "Z")
+        if "limit" not in query:
+            return {"keys": keys}
+        limit = int(query["limit"][0])
+        next_cursor = str(keys[limit - 1]["id"]) if len(keys) > limit else None
+        return {"keys": keys[:limit], "nextCursor": next_cursor}
+
+    def _memory(
+        self, method: str, user_id: int, key: str, body: Any
+    ) -> Tuple[int, Dict[str, Any]]:
+        with self._lock:
+            existing = self._memories.get((user_id, key))
+            if method == "GET":
+                if existing is None:
+                    return 404, {"error": "Memory not found"}
+                return 200, existing
+            if method == "DELETE":
+                self._memories.pop((user_id, key), None)
+                return 200, {"success": True, "message": "Memory deleted"}
+            if method == "PUT":
+                if not isinstance(body, dict) or not isinstance(body.get("data"), dict):
+                    return 400, {"error": "Invalid request"}
+                version = existing["version"] + 1 if existing else 1
+                now = _now_iso()
+                self._memories[(user_id, key)] = {
+                    "key": key,
+                    "data": body["data"],
+                    "version": version,
+                    "createdAt": existing["createdAt"] if existing else now,
+                    "updatedAt": now,
+                    "expiresAt": None,
+                }
+                message = "Memory updated" if existing else "Memory created"
+                return (200 if existing else 201), {
+                    "success": True,
+                    "key": key,
+                    "version": version,
+                    "message": message,
+                }
+        return 404, {"error": "Not found"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    stand_in: StandInServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, delayed ACKs
+    # add ~40 ms to every keep-alive request
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        super().setup()
+        with self.stand_in._lock:
+            self.stand_in.stats["connections"] += 1
+
+    def _dispatch(self) -> None:
+        self._started = time.perf_counter()
+        with self.stand_in._lock:
+            self.stand_in.traceparents.append(self.headers.get("traceparent"))
+        url = urlsplit(self.path)
+        if self.command == "GET" and url.path == "/api/mcp/session":
+            self._stream_session()
+            return
+        raw = self._read_body()
+        encoding = (self.headers.get("Content-Encoding") or "identity").lower()
+        try:
+            if raw and encoding in _WBITS:
+                raw = zlib.decompress(raw, _WBITS[encoding])
+            elif encoding != "identity":
+                self._send(415, {"error": f"Unsupported Content-Encoding {encoding}"})
+                return
+            body = json.loads(raw) if raw else {}
+        except (ValueError, zlib.error):
+            self._send(400, {"error": "Invalid JSON"})
+            return
+        status, payload = self.stand_in.handle(
+            self.command, url.path, parse_qs(url.query), self.headers, body
+        )
+        self._send(status, payload, compressible=url.path.startswith(COMPRESSED_ROUTES))
+
+    def _read_body(self) -> bytes:
+        """Request body as sent, whether Content-Length framed or chunked"""
+        if (self.headers.get("Transfer-Encoding") or "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            raw = b"".join(chunks)
+        else:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+        with self.stand_in._lock:
+            self.stand_in.stats["bytes_in"] += len(raw)
+        return raw
+
+    def _send(self, status: int, payload: Any, compressible: bool = False) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        gzip_ok = "gzip" in (self.headers.get("Accept-Encoding") or "").lower()
+        compress = compressible and gzip_ok and len(data) >= COMPRESSION_THRESHOLD
+        if compress:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, _WBITS["gzip"])
+            data = compressor.compress(data) + compressor.flush()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if compressible:
+            self.send_header("Vary", "Accept-Encoding")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header(
+            "Server-Timing", f"app;dur={(time.perf_counter() - self._started) * 1000.0:.1f}"
+        )
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        with self.stand_in._lock:
+            self.stand_in.stats["bytes_out"] += len(data)
+        self.wfile.write(data)
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _stream_session(self) -> None:
+        """Hold an SSE stream open, writing call results as they complete"""
+        api_key = self.headers.get("X-API-Key")
+        auth = self.stand_in.validate(api_key) if api_key else {"valid": False}
+        if not auth["valid"]:
+            self._send(401, {"error": "API key required" if not api_key else "Invalid API key"})
+            return
+        opened = self.stand_in._open_session(auth["userId"])
+        if opened is None:
+            self._send(
+                429, {"error": f"At most {MCP_MAX_SESSIONS_PER_USER} open sessions per user"}
+            )
+            return
+        session_id, events = opened
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        hello = {"session_id": session_id, "max_batch_size": MCP_MAX_BATCH_SIZE}
+        try:
+            self._write_chunk(f"event: session\ndata: {json.dumps(hello)}\n\n".encode("utf-8"))
+            while not self.stand_in._stopped.is_set():
+                try:
+                    event = events.get(timeout=0.05)
+                except queue.Empty:
+                    continue
+                self._write_chunk(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.stand_in._close_session(session_id)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
@@ -0,0 +1,299 @@
+"""
+Awareness Network SDK - Tracing
+Spans around client methods, W3C ``traceparent`` propagation and local export
+
+A client built with ``tracer=Tracer(...)`` opens a span for every public
+method call (``awareness.mcp_discover``, ``vectors.invoke``, ...) and a
+client span for every HTTP request made inside it, whose id is sent to the
+server in a ``traceparent`` header (https://www.w3.org/TR/trace-context/).
+The server continues the trace and reports its own time in
+``Server-Timing``; HTTP spans carry it as ``server.duration_ms`` next to the
+client-side phase timings, so an agent step's time can be split between
+network, server and SDK.
+
+The current span lives in a ``contextvars.ContextVar``: spans opened by an
+agent around a pipeline step parent the SDK's spans, including those made
+from asyncio tasks started inside it. Finished spans go to exporters, which
+are callables or objects with an ``export(span)`` method; no collector is
+needed.
+
+Usage:
+    from awareness_network_sdk import AwarenessNetworkClient, JsonLinesSpanExporter, Tracer
+
+    tracer = Tracer(exporters=[JsonLinesSpanExporter("spans.jsonl")])
+    client = AwarenessNetworkClient(api_key="your_api_key", tracer=tracer)
+    with tracer.span("agent.step", {"step": "summarize"}):
+        client.mcp_discover()
+        client.mcp_invoke(vector_id=7, input_data="...", access_token=token)
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .instrumentation import Instrumentation, RequestEvent
+
+_current_span: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar(
+    "awareness_span", default=None
+)
+
+
+def _random_id(nbytes: int) -> str:
+    while True:
+        value = os.urandom(nbytes).hex()
+        # All-zero ids are invalid in Trace Context
+        if value.strip("0"):
+            return value
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[Tuple[str, str, bool]]:
+    """``(trace_id, span_id, sampled)`` from a traceparent header, or None if invalid"""
+    if not header:
+        return None
+    parts = header.strip().lower().split("-")
+    if len(parts) < 4:
+        return None
+    version, trace_id, span_id, flags = parts[:4]
+    if (len(version), len(trace_id), len(span_id), len(flags)) != (2, 32, 16, 2):
+        return None
+    try:
+        int(version + trace_id + span_id + flags, 16)
+    except ValueError:
+        return None
+    if version == "ff" or (version == "00" and len(parts) > 4):
+        return None
+    if not trace_id.strip("0") or not span_id.strip("0"):
+        return None
+    return trace_id, span_id, bool(int(flags, 16) & 1)
+
+
+@dataclass
+class Span:
+    """One timed operation of a trace"""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    kind: str = "internal"
+    sampled: bool = True
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_time: float = field(default_factory=time.time)
+    end_time: Optional[float] = None
+    status: str = "unset"
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return None if self.end_time is None else (self.end_time - self.start_time) * 1000.0
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+def current_span() -> Optional[Span]:
+    """Span active in the calling thread or task, if any"""
+    return _current_span.get()
+
+
+class Tracer:
+    """
+    Creates spans and hands finished, sampled ones to the exporters
+
+    Args:
+        exporters: Callables or objects with ``export(span)``
+        service_name: Recorded as the ``service.name`` attribute of root spans
+    """
+
+    def __init__(self, exporters: Any = (), service_name: str = "awareness-network-sdk"):
+        self.service_name = service_name
+        self._exporters: List[Callable[[Span], Any]] = []
+        self._instrumented: List[Instrumentation] = []
+        for exporter in exporters:
+            self.add_exporter(exporter)
+
+    def add_exporter(self, exporter: Any) -> Any:
+        self._exporters.append(getattr(exporter, "export", exporter))
+        return exporter
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: str = "internal",
+        parent: Optional[Span] = None,
+        traceparent: Optional[str] = None
+    ) -> Span:
+        """
+        New span, not made current
+
+        Its parent is ``parent``, else the remote span in ``traceparent``,
+        else the current span; without any, a new trace is started.
+        """
+        remote = parse_traceparent(traceparent) if parent is None else None
+        if parent is None and remote is None:
+            parent = _current_span.get()
+        if parent is not None:
+            trace_id, parent_id, sampled = parent.trace_id, parent.span_id, parent.sampled
+        elif remote is not None:
+            trace_id, parent_id, sampled = remote
+        else:
+            trace_id, parent_id, sampled = _random_id(16), None, True
+        span = Span(name, trace_id, _random_id(8), parent_id, kind, sampled, dict(attributes or {}))
+        if parent_id is None:
+            span.attributes.setdefault("service.name", self.service_name)
+        return span
+
+    def end_span(self, span: Span, error: Any = None) -> None:
+        """Finish ``span`` (as failed when ``error`` is given) and export it"""
+        if span.end_time is not None:
+            return
+        span.end_time = time.time()
+        if error is not None:
+            span.status = "error"
+            span.error = error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+        elif span.status == "unset":
+            span.status = "ok"
+        if span.sampled:
+            for export in self._exporters:
+                export(span)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: str = "internal",
+        traceparent: Optional[str] = None
+    ) -> Iterator[Span]:
+        """Run the block in a new current span"""
+        span = self.start_span(name, attributes, kind, traceparent=traceparent)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            self.end_span(span, exc)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    # ==================== HTTP spans ====================
+
+    def instrument(self, instrumentation: Instrumentation) -> Instrumentation:
+        """Add hooks to ``instrumentation`` giving each request a client span"""
+        if any(existing is instrumentation for existing in self._instrumented):
+            return instrumentation
+        self._instrumented.append(instrumentation)
+        instrumentation.add_pre_hook(self._start_request)
+        instrumentation.add_post_hook(self._end_request)
+        return instrumentation
+
+    def _start_request(self, event: RequestEvent) -> None:
+        span = self.start_span(f"HTTP {event.method} {event.route}", {
+            "http.method": event.method,
+            "http.route": event.route,
+            "http.target": event.endpoint,
+        }, kind="client")
+        event.span = span
+        event.headers["traceparent"] = span.traceparent
+
+    def _end_request(self, event: RequestEvent) -> None:
+        span = event.span
+        if not isinstance(span, Span):
+            return
+        span.attributes.update({
+            "http.status_code": event.status,
+            "http.attempts": event.attempts,
+            "http.request_bytes": event.request_bytes,
+            "http.response_bytes": event.response_bytes,
+        })
+        for phase, seconds in event.phases.items():
+            span.attributes[f"http.{phase}_ms"] = round(seconds * 1000.0, 3)
+        if event.server_seconds is not None:
+            span.attributes["server.duration_ms"] = round(event.server_seconds * 1000.0, 3)
+        self.end_span(span, event.error)
+
+
+class JsonLinesSpanExporter:
+    """Appends each span to a file as one JSON object per line"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(line)
+
+
+def _tracer_of(obj: Any) -> Optional[Tracer]:
+    tracer = getattr(obj, "tracer", None)
+    if tracer is None and hasattr(obj, "client"):
+        tracer = getattr(obj.client, "tracer", None)
+    return tracer
+
+
+def traced(prefix: str) -> Callable[[type], type]:
+    """
+    Class decorator opening a span named ``<prefix>.<method>`` around each
+    public method, when the instance (or its ``client``) has a ``tracer``
+
+    Generators are left alone: their work happens after the call returns.
+    """
+    def decorate(cls: type) -> type:
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(method):
+                continue
+            if inspect.isgeneratorfunction(method) or inspect.isasyncgenfunction(method):
+                continue
+            setattr(cls, name, _traced_method(f"{prefix}.{name}", method))
+        return cls
+    return decorate
+
+
+def _traced_method(span_name: str, method: Callable) -> Callable:
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            tracer = _tracer_of(self)
+            if tracer is None:
+                return await method(self, *args, **kwargs)
+            with tracer.span(span_name):
+                return await method(self, *args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        tracer = _tracer_of(self)
+        if tracer is None:
+            return method(self, *args, **kwargs)
+        with tracer.span(span_name):
+            return method(self, *args, **kwargs)
+    return wrapper
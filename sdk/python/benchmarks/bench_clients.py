@@ -0,0 +1,583 @@
+"""
+Client benchmarks for the Awareness Network SDK against a local mock server
+
+Scenarios are named ``<operation>/<transport>/<variant>`` and cover the
+SDK's hot paths:
+
+- sync vs async transport
+- JSON decoding with the stdlib vs orjson, and NumPy float32 vectors
+- memory reads with and without the read-through cache
+- MCP calls one request at a time vs multiplexed over a session
+- plain vs gzip-compressed memory writes
+- vector invoke, streamed invoke and batch invoke (async client)
+
+Each scenario runs ``--warmup`` untimed operations, then ``--iterations``
+timed ones at its concurrency (threads for the sync client, tasks for the
+async one), reporting throughput and per-operation latency percentiles.
+A second, shorter pass under ``tracemalloc`` reports the peak memory
+allocated by the client. Startup (import, client construction and first
+request) is timed in fresh interpreters.
+
+The mock server (``mock_server.py``) runs in a child process. Results can be
+written as JSON and compared against a baseline run, failing when
+throughput drops or p99 latency grows beyond ``--tolerance``.
+
+Usage:
+    python benchmarks/bench_clients.py
+    python benchmarks/bench_clients.py --filter memory --iterations 500
+    python benchmarks/bench_clients.py --output results.json
+    python benchmarks/bench_clients.py --compare baseline.json --tolerance 0.15
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+SDK_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SDK_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_server import MockServer  # noqa: E402
+
+API_KEY = "ak_benchmark"
+ACCESS_TOKEN = "tok_benchmark"
+MEMORY_KEYS = 64
+MEMORY_PAYLOAD_ITEMS = 2000  # ~30 KB of JSON, above the compression threshold
+
+_STARTUP_PROBE = """
+import sys, time
+started = time.perf_counter()
+from awareness_network_sdk import {cls}
+imported = time.perf_counter()
+{construct}
+constructed = time.perf_counter()
+{first_request}
+finished = time.perf_counter()
+print((imported - started) * 1000, (constructed - imported) * 1000, (finished - constructed) * 1000)
+"""
+
+STARTUP = {
+    "sync": {
+        "cls": "AwarenessNetworkClient",
+        "construct": (
+            "client = AwarenessNetworkClient("
+            "base_url={api_url!r}, api_key={key!r}, rate_limiter=False)"
+        ),
+        "first_request": "client.mcp_discover()",
+    },
+    "async": {
+        "cls": "AsyncAwarenessClient",
+        "construct": (
+            "client = AsyncAwarenessClient("
+            "api_key={key!r}, base_url={base_url!r}, rate_limiter=False)"
+        ),
+        "first_request": (
+            "import asyncio\n"
+            "async def first():\n"
+            "    async with client:\n"
+            "        await client.vectors.get(1)\n"
+            "asyncio.run(first())"
+        ),
+    },
+}
+
+
+@dataclass
+class Scenario:
+    """
+    One benchmark
+
+    ``setup(server, stack)`` builds the clients (registering their cleanup on
+    ``stack``, an ``ExitStack`` or ``AsyncExitStack``) and returns the
+    operation, called with the iteration number; async scenarios have
+    coroutine setups and operations.
+    """
+    name: str
+    setup: Callable[..., Any]
+    concurrency: int = 1
+    json_backend: Optional[str] = None
+    requires: Optional[str] = None
+
+    @property
+    def transport(self) -> str:
+        return self.name.split("/")[1]
+
+
+def _available(module: Optional[str]) -> bool:
+    if module is None:
+        return True
+    try:
+        __import__(module)
+        return True
+    except ImportError:
+        return False
+
+
+def _vector(dimension: int) -> List[float]:
+    return [math.sin(i) for i in range(dimension)]
+
+
+def _memory_value(index: int) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "items": [{"id": i, "score": i / 7.0} for i in range(MEMORY_PAYLOAD_ITEMS // 4)],
+    }
+
+
+# ==================== Scenario setups ====================
+
+def _sync_client(server: MockServer, **options: Any) -> Any:
+    from awareness_network_sdk import AwarenessNetworkClient
+    return AwarenessNetworkClient(
+        base_url=server.api_url, api_key=API_KEY, rate_limiter=False, **options
+    )
+
+
+async def _async_client(
+    server: MockServer, stack: contextlib.AsyncExitStack, **options: Any
+) -> Any:
+    from awareness_network_sdk import AsyncAwarenessClient
+    client = AsyncAwarenessClient(
+        api_key=API_KEY, base_url=server.base_url, rate_limiter=False, **options
+    )
+    return await stack.enter_async_context(client)
+
+
+def _sync_align(dimension: int, **options: Any) -> Callable[..., Any]:
+    def setup(server: MockServer, stack: contextlib.ExitStack) -> Callable[[int], Any]:
+        client = _sync_client(server, **options)
+        vector = _vector(dimension)
+        return lambda i: client.align_vector(vector, "gpt-4", "claude-3")
+    return setup
+
+
+def _async_align(dimension: int, **options: Any) -> Callable[..., Any]:
+    async def setup(server: MockServer, stack: contextlib.AsyncExitStack) -> Callable[[int], Any]:
+        client = await _async_client(server, stack, **options)
+        vector = _vector(dimension)
+        return lambda i: client.latentmas.align(vector, "gpt-4", "claude-3")
+    return setup
+
+
+def _sync_memory_get(**options: Any) -> Callable[..., Any]:
+    def setup(server: MockServer, stack: contextlib.ExitStack) -> Callable[[int], Any]:
+        client = _sync_client(server, **options)
+        for index in range(MEMORY_KEYS):
+            client.store_memory(f"bench-{index}", {"index": index})
+            client.retrieve_memory(f"bench-{index}")  # Fills the cache, if any
+        return lambda i: client.retrieve_memory(f"bench-{i % MEMORY_KEYS}")
+    return setup
+
+
+def _async_memory_get(**options: Any) -> Callable[..., Any]:
+    async def setup(server: MockServer, stack: contextlib.AsyncExitStack) -> Callable[[int], Any]:
+        client = await _async_client(server, stack, **options)
+        for index in range(MEMORY_KEYS):
+            await client.memory.set(f"bench-{index}", {"index": index})
+            await client.memory.get(f"bench-{index}")  # Fills the cache, if any
+        return lambda i: client.memory.get(f"bench-{i % MEMORY_KEYS}")
+    return setup
+
+
+def _sync_memory_put(**options: Any) -> Callable[..., Any]:
+    def setup(server: MockServer, stack: contextlib.ExitStack) -> Callable[[int], Any]:
+        client = _sync_client(server, **options)
+        return lambda i: client.store_memory(f"put-{i % MEMORY_KEYS}", _memory_value(i))
+    return setup
+
+
+def _async_memory_put(**options: Any) -> Callable[..., Any]:
+    async def setup(server: MockServer, stack: contextlib.AsyncExitStack) -> Callable[[int], Any]:
+        client = await _async_client(server, stack, **options)
+        return lambda i: client.memory.set(f"put-{i % MEMORY_KEYS}", _memory_value(i))
+    return setup
+
+
+def _sync_mcp_call(server: MockServer, stack: contextlib.ExitStack) -> Callable[[int], Any]:
+    client = _sync_client(server)
+    return lambda i: client.mcp_invoke(1 + i % 8, f"input {i}", access_token=ACCESS_TOKEN)
+
+
+def _sync_mcp_session(server: MockServer, stack: contextlib.ExitStack) -> Callable[[int], Any]:
+    session = stack.enter_context(_sync_client(server).mcp_session())
+    return lambda i: session.invoke(1 + i % 8, f"input {i}", ACCESS_TOKEN)
+
+
+async def _async_mcp_session(
+    server: MockServer, stack: contextlib.AsyncExitStack
+) -> Callable[[int], Any]:
+    client = await _async_client(server, stack)
+    session = await stack.enter_async_context(client.mcp_session())
+    return lambda i: session.invoke(1 + i % 8, f"input {i}", ACCESS_TOKEN)
+
+
+async def _async_invoke(
+    server: MockServer, stack: contextlib.AsyncExitStack
+) -> Callable[[int], Any]:
+    client = await _async_client(server, stack)
+    return lambda i: client.vectors.invoke(1 + i % 8, {"text": f"input {i}"}, ACCESS_TOKEN)
+
+
+async def _async_invoke_stream(
+    server: MockServer, stack: contextlib.AsyncExitStack
+) -> Callable[[int], Any]:
+    client = await _async_client(server, stack)
+
+    async def op(i: int) -> int:
+        events = 0
+        async for _ in client.vectors.invoke_stream(
+            1 + i % 8, {"text": f"input {i}"}, ACCESS_TOKEN
+        ):
+            events += 1
+        return events
+    return op
+
+
+def _async_batch_invoke(size: int) -> Callable[..., Any]:
+    async def setup(server: MockServer, stack: contextlib.AsyncExitStack) -> Callable[[int], Any]:
+        client = await _async_client(server, stack)
+        batch = [
+            {"vectorId": 1 + n % 8, "inputData": {"n": n}, "accessToken": ACCESS_TOKEN}
+            for n in range(size)
+        ]
+        return lambda i: client.vectors.batch_invoke(batch)
+    return setup
+
+
+def build_scenarios(dimension: int) -> List[Scenario]:
+    return [
+        Scenario("latentmas.align/sync/json", _sync_align(dimension), json_backend="json"),
+        Scenario(
+            "latentmas.align/sync/orjson",
+            _sync_align(dimension),
+            json_backend="orjson",
+            requires="orjson",
+        ),
+        Scenario(
+            "latentmas.align/sync/numpy",
+            _sync_align(dimension, numpy_vectors=True),
+            requires="numpy",
+        ),
+        Scenario("latentmas.align/async/json", _async_align(dimension), json_backend="json"),
+        Scenario(
+            "latentmas.align/async/orjson",
+            _async_align(dimension),
+            json_backend="orjson",
+            requires="orjson",
+        ),
+        Scenario(
+            "latentmas.align/async/numpy",
+            _async_align(dimension, numpy_vectors=True),
+            requires="numpy",
+        ),
+        Scenario("memory.get/sync/uncached", _sync_memory_get()),
+        Scenario("memory.get/sync/cached", _sync_memory_get(memory_cache_size=MEMORY_KEYS)),
+        Scenario("memory.get/async/uncached", _async_memory_get()),
+        Scenario("memory.get/async/cached", _async_memory_get(memory_cache_size=MEMORY_KEYS)),
+        Scenario("memory.put/sync/plain", _sync_memory_put()),
+        Scenario("memory.put/sync/gzip", _sync_memory_put(compress_requests=True)),
+        Scenario("memory.put/async/plain", _async_memory_put()),
+        Scenario("memory.put/async/gzip", _async_memory_put(compress_requests=True)),
+        Scenario("mcp.invoke/sync/per-call", _sync_mcp_call, concurrency=8),
+        Scenario("mcp.invoke/sync/session", _sync_mcp_session, concurrency=8),
+        Scenario("mcp.invoke/async/session", _async_mcp_session, concurrency=8),
+        Scenario("vectors.invoke/async/single", _async_invoke, concurrency=8),
+        Scenario("vectors.invoke_stream/async/sse", _async_invoke_stream),
+        Scenario("vectors.batch_invoke/async/16", _async_batch_invoke(16)),
+    ]
+
+
+# ==================== Measurement ====================
+
+def _percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of sorted ``samples``"""
+    return samples[max(0, math.ceil(q * len(samples)) - 1)]
+
+
+def summarize(latencies: List[float], wall: float) -> Dict[str, float]:
+    """Throughput and latency statistics (milliseconds) of one timed run"""
+    samples = sorted(latencies)
+    return {
+        "iterations": len(samples),
+        "ops_per_sec": round(len(samples) / wall, 2) if wall > 0 else 0.0,
+        "mean_ms": round(statistics.fmean(samples) * 1000, 4),
+        "p50_ms": round(_percentile(samples, 0.50) * 1000, 4),
+        "p95_ms": round(_percentile(samples, 0.95) * 1000, 4),
+        "p99_ms": round(_percentile(samples, 0.99) * 1000, 4),
+        "max_ms": round(samples[-1] * 1000, 4),
+    }
+
+
+def _run_sync(op: Callable[[int], Any], start: int, count: int, concurrency: int) -> List[float]:
+    def timed(i: int) -> float:
+        began = time.perf_counter()
+        op(i)
+        return time.perf_counter() - began
+
+    if concurrency <= 1:
+        return [timed(i) for i in range(start, start + count)]
+    with ThreadPoolExecutor(concurrency) as pool:
+        return list(pool.map(timed, range(start, start + count)))
+
+
+async def _run_async(
+    op: Callable[[int], Any], start: int, count: int, concurrency: int
+) -> List[float]:
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def timed(i: int) -> float:
+        async with semaphore:
+            began = time.perf_counter()
+            await op(i)
+            return time.perf_counter() - began
+
+    return list(await asyncio.gather(*(timed(i) for i in range(start, start + count))))
+
+
+def _peak_kib() -> float:
+    return round(tracemalloc.get_traced_memory()[1] / 1024.0, 1)
+
+
+def measure_sync(scenario: Scenario, server: MockServer, iterations: int, warmup: int,
+                 memory_iterations: int) -> Dict[str, Any]:
+    with contextlib.ExitStack() as stack:
+        op = scenario.setup(server, stack)
+        _run_sync(op, 0, warmup, scenario.concurrency)
+        began = time.perf_counter()
+        latencies = _run_sync(op, warmup, iterations, scenario.concurrency)
+        result = summarize(latencies, time.perf_counter() - began)
+        tracemalloc.start()
+        try:
+            _run_sync(op, warmup + iterations, memory_iterations, scenario.concurrency)
+            result["peak_memory_kib"] = _peak_kib()
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def measure_async(scenario: Scenario, server: MockServer, iterations: int, warmup: int,
+                  memory_iterations: int) -> Dict[str, Any]:
+    async def run() -> Dict[str, Any]:
+        async with contextlib.AsyncExitStack() as stack:
+            op = await scenario.setup(server, stack)
+            await _run_async(op, 0, warmup, scenario.concurrency)
+            began = time.perf_counter()
+            latencies = await _run_async(op, warmup, iterations, scenario.concurrency)
+            result = summarize(latencies, time.perf_counter() - began)
+            tracemalloc.start()
+            try:
+                await _run_async(op, warmup + iterations, memory_iterations, scenario.concurrency)
+                result["peak_memory_kib"] = _peak_kib()
+            finally:
+                tracemalloc.stop()
+            return result
+
+    return asyncio.run(run())
+
+
+def run_scenario(scenario: Scenario, server: MockServer, iterations: int, warmup: int,
+                 memory_iterations: int) -> Dict[str, Any]:
+    """Measure one scenario; skipped ones report why"""
+    if not _available(scenario.requires):
+        return {"skipped": f"{scenario.requires} is not installed"}
+    from awareness_network_sdk.codec import get_json_backend, set_json_backend
+
+    previous = get_json_backend()
+    set_json_backend(scenario.json_backend)
+    try:
+        measure = measure_async if scenario.transport == "async" else measure_sync
+        result = measure(scenario, server, iterations, warmup, memory_iterations)
+    finally:
+        set_json_backend(previous)
+    result.update(
+        {"concurrency": scenario.concurrency, "json_backend": scenario.json_backend or previous}
+    )
+    return result
+
+
+def measure_startup(server: MockServer, runs: int) -> Dict[str, Dict[str, float]]:
+    """Median import, construction and first-request times in fresh interpreters"""
+    results = {}
+    for transport, parts in STARTUP.items():
+        fields = {"api_url": server.api_url, "base_url": server.base_url, "key": API_KEY}
+        probe = _STARTUP_PROBE.format(
+            cls=parts["cls"],
+            construct=parts["construct"].format(**fields),
+            first_request=parts["first_request"],
+        )
+        samples = []
+        for _ in range(runs):
+            output = subprocess.run(
+                [sys.executable, "-c", probe],
+                cwd=SDK_ROOT,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout.split()
+            samples.append([float(value) for value in output])
+        imports, constructs, firsts = zip(*samples)
+        results[transport] = {
+            "import_ms": round(statistics.median(imports), 2),
+            "construct_ms": round(statistics.median(constructs), 2),
+            "first_request_ms": round(statistics.median(firsts), 2),
+            "total_ms": round(statistics.median([sum(sample) for sample in samples]), 2),
+        }
+    return results
+
+
+# ==================== Results ====================
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=SDK_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(params: Dict[str, Any]) -> Dict[str, Any]:
+    from awareness_network_sdk import __version__
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "sdk_version": __version__,
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": params,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Regressions of ``results`` against ``baseline``
+
+    A scenario regresses when its throughput falls, or its p99 latency or
+    peak memory grows, by more than ``tolerance`` (a fraction). Scenarios
+    missing or skipped in either run are not compared; startup times are
+    compared on their totals.
+    """
+    regressions = []
+    checks = (("ops_per_sec", -1), ("p99_ms", 1), ("peak_memory_kib", 1))
+    for name, current in results.get("scenarios", {}).items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous or "skipped" in previous or "skipped" in current:
+            continue
+        for metric, direction in checks:
+            if metric not in previous or metric not in current or not previous[metric]:
+                continue
+            change = (current[metric] - previous[metric]) / previous[metric]
+            if change * direction > tolerance:
+                regressions.append(
+                    f"{name}: {metric} {previous[metric]:g} -> {current[metric]:g} ({change:+.1%})"
+                )
+    for transport, current in results.get("startup", {}).items():
+        previous = baseline.get("startup", {}).get(transport)
+        if previous and previous.get("total_ms"):
+            change = (current["total_ms"] - previous["total_ms"]) / previous["total_ms"]
+            if change > tolerance:
+                regressions.append(
+                    f"startup/{transport}: total_ms {previous['total_ms']:g} -> "
+                    f"{current['total_ms']:g} ({change:+.1%})"
+                )
+    return regressions
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    params = {
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "memory_iterations": args.memory_iterations,
+        "latency_ms": args.latency_ms,
+        "dimension": args.dimension,
+        "filter": args.filter,
+        "startup_runs": args.startup_runs,
+    }
+    scenarios = [
+        s for s in build_scenarios(args.dimension) if not args.filter or args.filter in s.name
+    ]
+    results: Dict[str, Any] = {"meta": metadata(params), "scenarios": {}, "startup": {}}
+    with MockServer(latency_ms=args.latency_ms) as server:
+        for scenario in scenarios:
+            results["scenarios"][scenario.name] = run_scenario(
+                scenario, server, args.iterations, args.warmup, args.memory_iterations
+            )
+            if not args.json:
+                print(_format_row(scenario.name, results["scenarios"][scenario.name]), flush=True)
+        if args.startup_runs:
+            results["startup"] = measure_startup(server, args.startup_runs)
+    return results
+
+
+def _format_row(name: str, result: Dict[str, Any]) -> str:
+    if "skipped" in result:
+        return f"{name:<36} skipped: {result['skipped']}"
+    return (f"{name:<36} {result['ops_per_sec']:>9.1f} ops/s  p50 {result['p50_ms']:>8.3f} ms  "
+            f"p99 {result['p99_ms']:>8.3f} ms  peak {result['peak_memory_kib']:>8.1f} KiB")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--memory-iterations", type=int, default=50,
+                        help="operations run under tracemalloc for the peak memory figure")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="server-side delay per request"
+    )
+    parser.add_argument("--dimension", type=int, default=1024, help="LatentMAS vector dimension")
+    parser.add_argument("--filter", help="only run scenarios whose name contains this")
+    parser.add_argument(
+        "--startup-runs",
+        type=int,
+        default=5,
+        help="fresh interpreters per startup figure (0 skips)",
+    )
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results of an earlier run")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.10, help="allowed regression as a fraction"
+    )
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for transport, startup in results["startup"].items():
+            print(
+                f"startup/{transport:<28} import {startup['import_ms']:>7.2f} ms  construct "
+                f"{startup['construct_ms']:>6.2f} ms  "
+                f"first request {startup['first_request_ms']:>7.2f} ms"
+            )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            regressions = compare(results, json.load(handle), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
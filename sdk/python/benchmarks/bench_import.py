@@ -0,0 +1,96 @@
+"""
+Import-time benchmark for the Awareness Network SDK
+
+Each sample runs in a fresh interpreter so nothing is served from an
+already-populated ``sys.modules``. Interpreter startup is excluded; only the
+import statement itself is timed. The package is byte-compiled first, as an
+installed wheel would be, so samples don't include compiling the sources.
+
+Every statement, not just the bare package import, is held to the target:
+agents import the client classes, so that is the cost they pay.
+
+Usage:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --runs 50 --target-ms 20
+"""
+
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+SDK_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = {
+    "package": "import awareness_network_sdk",
+    "sync client": "from awareness_network_sdk import AwarenessNetworkClient",
+    "async client": "from awareness_network_sdk import AsyncAwarenessClient",
+}
+
+HEAVY_MODULES = ("requests", "aiohttp", "numpy", "asyncio")
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = (time.perf_counter() - start) * 1000
+print(elapsed)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def sample(statement: str) -> Dict:
+    """Time one import in a fresh interpreter"""
+    probe = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", probe], cwd=SDK_ROOT, check=True,
+        capture_output=True, text=True,
+    ).stdout.splitlines()
+    return {"ms": float(output[0]), "loaded": [m for m in output[1].split(",") if m]}
+
+
+def run(runs: int) -> Dict[str, Dict]:
+    compileall.compile_dir(os.path.join(SDK_ROOT, "awareness_network_sdk"), quiet=1)
+    results = {}
+    for name, statement in STATEMENTS.items():
+        samples: List[Dict] = [sample(statement) for _ in range(runs)]
+        times = sorted(s["ms"] for s in samples)
+        results[name] = {
+            "statement": statement,
+            "median_ms": round(statistics.median(times), 2),
+            "p90_ms": round(times[int(0.9 * (len(times) - 1))], 2),
+            "heavy_modules": samples[-1]["loaded"],
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--target-ms", type=float, default=20.0)
+    parser.add_argument("--json", action="store_true", help="emit machine-readable results")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, result in results.items():
+            heavy = ", ".join(result["heavy_modules"]) or "none"
+            print(f"{name:<14} median {result['median_ms']:>7.2f} ms  "
+                  f"p90 {result['p90_ms']:>7.2f} ms  heavy deps: {heavy}")
+
+    over = [name for name, result in results.items() if result["median_ms"] > args.target_ms]
+    if over:
+        print(f"OVER {args.target_ms:g} ms target: {', '.join(over)}", file=sys.stderr)
+    else:
+        print(f"all imports within {args.target_ms:g} ms target", file=sys.stderr)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
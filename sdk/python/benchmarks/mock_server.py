@@ -0,0 +1,527 @@
+"""
+Mock Awareness Network API for benchmarks
+aiohttp server answering the SDK's hot routes with configurable latency and payload sizes
+
+Unlike ``awareness_network_sdk.testing.StandInServer`` (a threaded stdlib
+server reproducing the authentication path for tests), this server is
+built to stay out of the way of the numbers: it runs in its own process,
+accepts any API key and access token, and does no work beyond shaping
+responses like the real routes do:
+
+- ``/api/latentmas/align|transform|validate``
+- ``/api/ai/memory``, ``/api/ai/memory/:key``, ``/api/ai/memory/mget|batch``
+- ``/api/mcp/discover``, ``/api/mcp/invoke``, ``/api/mcp/session[/:id]``
+- ``/api/vectors/:id``, ``/api/vectors/invoke[/stream]``,
+  ``/api/vectors/batch-invoke``
+
+Every response waits ``latency_ms`` (plus up to ``jitter_ms``) first; a
+request can override it with an ``X-Mock-Latency-Ms`` header. Vector
+responses have ``dimension`` floats (LatentMAS responses default to the
+request's own dimension), discovery lists ``catalog_size`` vectors and
+streams send ``stream_chunks`` events. Large JSON responses on the
+LatentMAS, batch-invoke and memory routes are gzip-compressed as the real
+server does. ``POST /__mock/config`` changes the settings at runtime and
+``GET /__mock/stats`` counts requests per route.
+
+Usage:
+    python benchmarks/mock_server.py --port 8787 --latency-ms 5
+
+    from mock_server import MockServer
+
+    with MockServer(latency_ms=2) as server:
+        client = AwarenessNetworkClient(base_url=server.api_url, api_key="ak_bench")
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import secrets
+import subprocess
+import sys
+import time
+import urllib.request
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, List, Optional
+
+# Mirrors server/http-compression.ts and server/mcp-api.ts
+COMPRESSED_PREFIXES = ("/api/latentmas", "/api/vectors/batch-invoke", "/api/ai/memory")
+COMPRESSION_THRESHOLD = 8 * 1024
+MCP_RATE_LIMITS = {"invoke": {"calls_per_minute": 60, "calls_per_day": 10000}}
+MCP_MAX_BATCH_SIZE = 100
+
+READY_LINE = "MOCK_SERVER_READY"
+
+
+@dataclass
+class MockConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    dimension: int = 0  # 0: LatentMAS responses match the request's vector
+    catalog_size: int = 20
+    stream_chunks: int = 10
+    compress: bool = True
+
+
+def _now_iso() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+
+
+def _vector(dimension: int) -> List[float]:
+    return [round(((i * 7919) % 1000) / 1000.0 - 0.5, 6) for i in range(dimension)]
+
+
+def _catalog_row(vector_id: int) -> Dict[str, Any]:
+    return {
+        "id": vector_id, "title": f"Vector {vector_id}", "description": "Benchmark vector",
+        "category": "nlp", "vectorDimension": 1024, "basePrice": "0.01", "creatorId": 1,
+        "averageRating": "4.5", "totalCalls": 100, "reviewCount": 3, "createdAt": _now_iso(),
+    }
+
+
+def create_app(config: MockConfig) -> Any:
+    from aiohttp import web
+
+    memories: Dict[str, Dict[str, Any]] = {}
+    sessions: Dict[str, "asyncio.Queue[Optional[Dict[str, Any]]]"] = {}
+    stats: Dict[str, int] = {}
+
+    @web.middleware
+    async def shape(request: web.Request, handler: Any) -> web.StreamResponse:
+        route = (
+            request.match_info.route.resource.canonical
+            if request.match_info.route.resource
+            else "unmatched"
+        )
+        key = f"{request.method} {route}"
+        stats[key] = stats.get(key, 0) + 1
+        if not route.startswith("/__mock"):
+            override = request.headers.get("X-Mock-Latency-Ms")
+            delay = float(override) if override is not None else config.latency_ms
+            delay += random.uniform(0, config.jitter_ms) if config.jitter_ms else 0.0
+            if delay > 0:
+                await asyncio.sleep(delay / 1000.0)
+        response = await handler(request)
+        if (
+            config.compress
+            and isinstance(response, web.Response)
+            and request.path.startswith(COMPRESSED_PREFIXES)
+            and response.body is not None
+            and len(response.body) >= COMPRESSION_THRESHOLD
+            and "gzip" in request.headers.get("Accept-Encoding", "")
+        ):
+            response.enable_compression(web.ContentCoding.gzip)
+        return response
+
+    def reply(payload: Any, status: int = 200) -> web.Response:
+        return web.json_response(
+            payload, status=status, dumps=lambda data: json.dumps(data, separators=(",", ":"))
+        )
+
+    async def body_of(request: web.Request) -> Dict[str, Any]:
+        # aiohttp inflates gzip/deflate request bodies itself
+        if not request.can_read_body:
+            return {}
+        data = await request.json(loads=json.loads)
+        return data if isinstance(data, dict) else {}
+
+    # ----- LatentMAS -----
+
+    async def align(request: web.Request) -> web.Response:
+        body = await body_of(request)
+        dimension = config.dimension or len(body.get("source_vector") or []) or 768
+        return reply(
+            {
+                "protocol": "LatentMAS/1.0",
+                "aligned_vector": _vector(dimension),
+                "source_dimension": len(body.get("source_vector") or []),
+                "target_dimension": dimension,
+                "alignment_quality": {
+                    "cosine_similarity": 0.97,
+                    "euclidean_distance": 0.12,
+                    "confidence": 0.9,
+                },
+                "metadata": {
+                    "method": body.get("alignment_method", "linear"),
+                    "processing_time_ms": config.latency_ms,
+                },
+            }
+        )
+
+    async def transform(request: web.Request) -> web.Response:
+        body = await body_of(request)
+        dimension = int(body.get("target_dimension") or config.dimension or 768)
+        return reply(
+            {
+                "protocol": "LatentMAS/1.0",
+                "transformed_vector": _vector(dimension),
+                "source_dimension": len(body.get("vector") or []),
+                "target_dimension": dimension,
+                "transformation_quality": {
+                    "information_retention": 0.95,
+                    "reconstruction_error": 0.05,
+                },
+                "metadata": {
+                    "method": body.get("method", "pca"),
+                    "processing_time_ms": config.latency_ms,
+                },
+            }
+        )
+
+    async def validate(request: web.Request) -> web.Response:
+        await body_of(request)
+        return reply(
+            {"protocol": "LatentMAS/1.0", "is_valid": True, "quality": {"cosine_similarity": 0.97}}
+        )
+
+    # ----- Memory -----
+
+    async def memory_get(request: web.Request) -> web.Response:
+        memory = memories.get(request.match_info["key"])
+        if memory is None:
+            return reply({"error": "Memory not found"}, 404)
+        return reply(memory)
+
+    async def memory_put(request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        body = await body_of(request)
+        existing = memories.get(key)
+        now = _now_iso()
+        memory = {
+            "key": key,
+            # The sync client sends "value", the API takes "data"
+            "data": body.get("data", body.get("value")),
+            "version": existing["version"] + 1 if existing else 1,
+            "createdAt": existing["createdAt"] if existing else now,
+            "updatedAt": now,
+            "expiresAt": None,
+        }
+        memories[key] = memory
+        return reply({"success": True, **memory}, 200 if existing else 201)
+
+    async def memory_delete(request: web.Request) -> web.Response:
+        memories.pop(request.match_info["key"], None)
+        return reply({"success": True, "message": "Memory deleted"})
+
+    async def memory_list(request: web.Request) -> web.Response:
+        return reply(
+            {"keys": sorted(memories), "memories": [memories[k] for k in sorted(memories)]}
+        )
+
+    async def memory_mget(request: web.Request) -> web.Response:
+        keys = (await body_of(request)).get("keys") or []
+        return reply({"memories": [memories[k] for k in keys if k in memories]})
+
+    async def memory_batch(request: web.Request) -> web.Response:
+        body = await body_of(request)
+        now = _now_iso()
+        for write in body.get("writes") or []:
+            existing = memories.get(write["key"])
+            memories[write["key"]] = {
+                "key": write["key"],
+                "data": write.get("data"),
+                "version": existing["version"] + 1 if existing else 1,
+                "createdAt": existing["createdAt"] if existing else now,
+                "updatedAt": now,
+                "expiresAt": None,
+            }
+        for key in body.get("deletes") or []:
+            memories.pop(key, None)
+        return reply(
+            {
+                "success": True,
+                "written": len(body.get("writes") or []),
+                "deleted": len(body.get("deletes") or []),
+            }
+        )
+
+    # ----- MCP -----
+
+    def discover_payload() -> Dict[str, Any]:
+        vectors = [{"id": i, "name": f"Vector {i}", "version": "1.0.0", "category": "nlp"}
+                   for i in range(1, config.catalog_size + 1)]
+        return {
+            "protocol": "MCP/1.0",
+            "vectors": vectors,
+            "total": len(vectors),
+            "rate_limits": MCP_RATE_LIMITS,
+        }
+
+    def invoke_payload(vector_id: Any, context: Any) -> Dict[str, Any]:
+        return {
+            "protocol": "MCP/1.0",
+            "vector_id": vector_id,
+            "result": {
+                "embedding": _vector(config.dimension or 8),
+                "confidence": 0.95,
+                "metadata": {"context": context},
+            },
+            "usage": {"calls_remaining": None},
+        }
+
+    async def mcp_discover(request: web.Request) -> web.Response:
+        return reply(discover_payload())
+
+    async def mcp_invoke(request: web.Request) -> web.Response:
+        body = await body_of(request)
+        if not body.get("vector_id") or not body.get("context"):
+            return reply({"error": "Missing required fields: vector_id, context"}, 400)
+        return reply(invoke_payload(body["vector_id"], body["context"]))
+
+    async def mcp_session(request: web.Request) -> web.StreamResponse:
+        session_id = secrets.token_hex(16)
+        events: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+        sessions[session_id] = events
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await response.prepare(request)
+        hello = {"session_id": session_id, "max_batch_size": MCP_MAX_BATCH_SIZE}
+        try:
+            await response.write(f"event: session\ndata: {json.dumps(hello)}\n\n".encode("utf-8"))
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                await response.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+        except (ConnectionResetError, asyncio.CancelledError):
+            pass
+        finally:
+            sessions.pop(session_id, None)
+        return response
+
+    async def mcp_session_calls(request: web.Request) -> web.Response:
+        events = sessions.get(request.match_info["session_id"])
+        if events is None:
+            return reply({"error": "Session not found"}, 404)
+        calls = (await body_of(request)).get("calls") or []
+        for call in calls:
+            params = call.get("params") or {}
+            if call.get("method") == "discover":
+                events.put_nowait({"id": call["id"], "status": 200, "result": discover_payload()})
+            else:
+                result = invoke_payload(params.get("vector_id"), params.get("context"))
+                events.put_nowait({"id": call["id"], "status": 200, "result": result})
+        return reply({"accepted": len(calls)}, 202)
+
+    # ----- Vectors -----
+
+    async def vector_get(request: web.Request) -> web.Response:
+        return reply(_catalog_row(int(request.match_info["vector_id"])))
+
+    def invocation(vector_id: Any, input_data: Any) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "vectorId": vector_id,
+            "result": {
+                "output": _vector(config.dimension or 8),
+                "input": input_data,
+                "latency_ms": config.latency_ms,
+            },
+            "callsRemaining": None,
+        }
+
+    async def vectors_invoke(request: web.Request) -> web.Response:
+        body = await body_of(request)
+        return reply(invocation(body.get("vectorId"), body.get("inputData")))
+
+    async def vectors_invoke_stream(request: web.Request) -> web.StreamResponse:
+        body = await body_of(request)
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"}
+        )
+        await response.prepare(request)
+        for index in range(config.stream_chunks):
+            chunk = {
+                "index": index,
+                "vectorId": body.get("vectorId"),
+                "delta": _vector(max(config.dimension // 8, 8)),
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+        await response.write(b'data: {"done": true}\n\n')
+        await response.write_eof()
+        return response
+
+    async def vectors_batch_invoke(request: web.Request) -> web.Response:
+        requests = (await body_of(request)).get("requests") or []
+        return reply(
+            {"results": [invocation(r.get("vectorId"), r.get("inputData")) for r in requests]}
+        )
+
+    # ----- Mock control -----
+
+    async def get_config(request: web.Request) -> web.Response:
+        return reply(asdict(config))
+
+    async def set_config(request: web.Request) -> web.Response:
+        body = await body_of(request)
+        for f in fields(MockConfig):
+            if f.name in body:
+                setattr(config, f.name, type(getattr(config, f.name))(body[f.name]))
+        return reply(asdict(config))
+
+    async def get_stats(request: web.Request) -> web.Response:
+        return reply(stats)
+
+    async def reset(request: web.Request) -> web.Response:
+        stats.clear()
+        memories.clear()
+        return reply({"success": True})
+
+    async def close_sessions(app: Any) -> None:
+        for events in sessions.values():
+            events.put_nowait(None)
+
+    app = web.Application(middlewares=[shape], client_max_size=64 * 1024 * 1024)
+    app.on_shutdown.append(close_sessions)
+    app.router.add_post("/api/latentmas/align", align)
+    app.router.add_post("/api/latentmas/transform", transform)
+    app.router.add_post("/api/latentmas/validate", validate)
+    app.router.add_get("/api/ai/memory", memory_list)
+    app.router.add_post("/api/ai/memory/mget", memory_mget)
+    app.router.add_post("/api/ai/memory/batch", memory_batch)
+    app.router.add_get("/api/ai/memory/{key}", memory_get)
+    app.router.add_put("/api/ai/memory/{key}", memory_put)
+    app.router.add_delete("/api/ai/memory/{key}", memory_delete)
+    app.router.add_get("/api/mcp/discover", mcp_discover)
+    app.router.add_post("/api/mcp/invoke", mcp_invoke)
+    app.router.add_get("/api/mcp/session", mcp_session)
+    app.router.add_post("/api/mcp/session/{session_id}", mcp_session_calls)
+    app.router.add_post("/api/vectors/invoke", vectors_invoke)
+    app.router.add_post("/api/vectors/invoke/stream", vectors_invoke_stream)
+    app.router.add_post("/api/vectors/batch-invoke", vectors_batch_invoke)
+    app.router.add_get(r"/api/vectors/{vector_id:\d+}", vector_get)
+    app.router.add_get("/__mock/config", get_config)
+    app.router.add_post("/__mock/config", set_config)
+    app.router.add_get("/__mock/stats", get_stats)
+    app.router.add_post("/__mock/reset", reset)
+    return app
+
+
+async def serve(config: MockConfig, host: str, port: int) -> None:
+    from aiohttp import web
+
+    runner = web.AppRunner(create_app(config), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port, backlog=1024)
+    await site.start()
+    bound_port = runner.addresses[0][1]
+    print(f"{READY_LINE} http://{host}:{bound_port}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+class MockServer:
+    """
+    The mock server in a child process, so that it does not compete with
+    the client under test for the GIL
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, **config: Any):
+        self.host = host
+        self.port = port
+        self.config = MockConfig(**config)
+        self.base_url: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+
+    @property
+    def api_url(self) -> str:
+        """Base URL for the sync client (which expects the ``/api`` prefix)"""
+        return f"{self.base_url}/api"
+
+    def start(self, timeout: float = 15.0) -> "MockServer":
+        args = [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--host",
+            self.host,
+            "--port",
+            str(self.port),
+        ]
+        for f in fields(MockConfig):
+            value = getattr(self.config, f.name)
+            if f.type is bool or isinstance(value, bool):
+                args += [] if value else [f"--no-{f.name.replace('_', '-')}"]
+            else:
+                args += [f"--{f.name.replace('_', '-')}", str(value)]
+        self._process = subprocess.Popen(args, stdout=subprocess.PIPE, text=True)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            line = self._process.stdout.readline()
+            if line.startswith(READY_LINE):
+                self.base_url = line.split()[1]
+                return self
+            if not line and self._process.poll() is not None:
+                break
+        self.stop()
+        raise RuntimeError("mock server did not start")
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+            if self._process.stdout is not None:
+                self._process.stdout.close()
+            self._process = None
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _call(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = urllib.request.Request(
+            f"{self.base_url}{path}",
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return json.loads(response.read())
+
+    def configure(self, **settings: Any) -> Dict[str, Any]:
+        """Change ``MockConfig`` settings of the running server"""
+        return self._call("POST", "/__mock/config", settings)
+
+    def stats(self) -> Dict[str, int]:
+        return self._call("GET", "/__mock/stats")
+
+    def reset(self) -> None:
+        self._call("POST", "/__mock/reset", {})
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    defaults = MockConfig()
+    for f in fields(MockConfig):
+        flag = f"--{f.name.replace('_', '-')}"
+        if isinstance(getattr(defaults, f.name), bool):
+            parser.add_argument(
+                f"--no-{f.name.replace('_', '-')}", dest=f.name, action="store_false"
+            )
+        else:
+            parser.add_argument(
+                flag, type=type(getattr(defaults, f.name)), default=getattr(defaults, f.name)
+            )
+    args = parser.parse_args()
+    config = MockConfig(**{f.name: getattr(args, f.name) for f in fields(MockConfig)})
+    try:
+        asyncio.run(serve(config, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
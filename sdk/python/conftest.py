@@ -0,0 +1,31 @@
+"""
+Shared fixtures for the SDK tests
+"""
+
+import pytest
+
+
+class FakeClock:
+    """Clock advanced by hand (``now``) or by its own ``sleep``"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(request):
+    """
+    A ``FakeClock``, also set as ``self.clock`` on ``unittest`` test cases
+
+    Starts at the test class's ``clock_start`` attribute, or 0.
+    """
+    clock = FakeClock(getattr(request.cls, "clock_start", 0.0))
+    if request.instance is not None:
+        request.instance.clock = clock
+    return clock
@@ -28,6 +28,7 @@ setup(
         "Homepage": "https://awareness-network.com",
     },
     packages=find_packages(exclude=["tests", "tests.*", "examples"]),
+    py_modules=["awareness_network_async"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -50,6 +51,12 @@ setup(
         "aiohttp>=3.8.0",
     ],
     extras_require={
+        "local": [
+            "numpy>=1.22.0",
+        ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",
@@ -0,0 +1,98 @@
+"""
+Unit tests for bulk KV-cache alignment
+
+Tests cover:
+- W-Matrix transforms, including the server's fallback paths
+- Parallel KV-cache alignment against the in-process path
+- Resolving target model names through a provider
+"""
+
+import unittest
+
+import numpy as np
+
+from awareness_network_sdk.alignment import AlignmentScheduler, WMatrix, transform_tensor
+
+
+class TestTransformTensor(unittest.TestCase):
+    """Test single-tensor transforms"""
+
+    def setUp(self):
+        self.tensor = np.random.default_rng(7).standard_normal((1, 2, 3, 8)).astype(np.float32)
+
+    def test_learned_scaling(self):
+        w_matrix = WMatrix("learned", 8, shared_parameters=np.array([2.0, 0.5], dtype=np.float32))
+        result = transform_tensor(self.tensor, w_matrix)
+        np.testing.assert_allclose(result[..., 0], self.tensor[..., 0] * 2.0)
+        np.testing.assert_allclose(result[..., 1:], self.tensor[..., 1:] * 0.5)
+
+    def test_fallbacks(self):
+        """Without rules, hybrid keeps the input and other methods interpolate"""
+        hybrid = transform_tensor(self.tensor, WMatrix("hybrid", 4))
+        np.testing.assert_array_equal(hybrid, self.tensor)
+        interpolated = transform_tensor(self.tensor, WMatrix("orthogonal", 4))
+        self.assertEqual(interpolated.shape, (1, 2, 3, 4))
+        np.testing.assert_allclose(interpolated[..., 0], self.tensor[..., 0])
+
+
+class TestAlignmentScheduler(unittest.TestCase):
+    """Test parallel KV-cache alignment"""
+
+    def setUp(self):
+        rng = np.random.default_rng(42)
+        self.kv_cache = {
+            "sourceModel": "gpt-4",
+            "keys": rng.standard_normal((2, 4, 8, 128)).tolist(),
+            "values": rng.standard_normal((2, 4, 8, 128)).tolist(),
+            "metadata": {"sequenceLength": 8, "tokenCount": 8},
+        }
+        matrix, _ = np.linalg.qr(rng.standard_normal((128, 128)))
+        self.w_matrices = {
+            "llama-3-8b": WMatrix.orthogonal(matrix, target_dimension=128),
+            "claude-3-haiku": WMatrix.orthogonal(matrix, target_dimension=64),
+            "gpt-4o": WMatrix.identity(target_dimension=128),
+        }
+
+    def test_parallel_matches_serial(self):
+        """Pool results equal the in-process alignment"""
+        scheduler = AlignmentScheduler(max_workers=2)
+        results = scheduler.align_all(self.kv_cache, self.w_matrices)
+
+        self.assertEqual(set(results), set(self.w_matrices))
+        for target, w_matrix in self.w_matrices.items():
+            expected = scheduler.align(self.kv_cache, target, w_matrix)
+            np.testing.assert_allclose(results[target]["keys"], expected["keys"], rtol=1e-5)
+            np.testing.assert_allclose(results[target]["values"], expected["values"], rtol=1e-5)
+            self.assertEqual(results[target]["targetModel"], target)
+
+    def test_orthogonal_preserves_energy(self):
+        """Square orthogonal W-Matrix retains all information"""
+        result = AlignmentScheduler().align(
+            self.kv_cache, "llama-3-8b", self.w_matrices["llama-3-8b"]
+        )
+        self.assertAlmostEqual(result["alignmentQuality"]["informationRetention"], 1.0, places=4)
+
+    def test_model_names_require_provider(self):
+        """A list of model names is resolved through the provider"""
+        with self.assertRaises(ValueError):
+            AlignmentScheduler().align_all(self.kv_cache, ["gpt-4o"])
+
+        scheduler = AlignmentScheduler(
+            max_workers=1,
+            w_matrix_provider=lambda source, target: self.w_matrices[target],
+        )
+        results = scheduler.align_all(self.kv_cache, ["gpt-4o"])
+        self.assertEqual(results["gpt-4o"]["keys"].shape, (2, 4, 8, 128))
+
+    def test_hybrid_without_rules_in_pool(self):
+        """Output segments take the source dimension when the tensor is unchanged"""
+        results = AlignmentScheduler(max_workers=1).align_all(
+            self.kv_cache, {"mixtral": WMatrix("hybrid", 64)}
+        )
+        np.testing.assert_allclose(
+            results["mixtral"]["keys"], np.asarray(self.kv_cache["keys"]), rtol=1e-6
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
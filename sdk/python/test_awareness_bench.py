@@ -0,0 +1,94 @@
+"""
+Unit tests for the client benchmark harness
+
+Tests cover:
+- Latency summaries and nearest-rank percentiles
+- Regression detection against a baseline run, skipped scenarios
+- The mock server answering both clients, runtime configuration
+- Short sync and async scenario runs, JSON backend restored afterwards
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+from bench_clients import build_scenarios, compare, run_scenario, summarize  # noqa: E402
+from mock_server import MockServer  # noqa: E402
+
+from awareness_network_sdk.codec import get_json_backend  # noqa: E402
+
+
+def _results(ops, p99, total_ms=100.0, **extra):
+    scenario = {"ops_per_sec": ops, "p99_ms": p99, "peak_memory_kib": 50.0}
+    return {
+        "scenarios": {"memory.get/sync/cached": scenario, **extra},
+        "startup": {"sync": {"total_ms": total_ms}},
+    }
+
+
+class TestResults(unittest.TestCase):
+    """Test statistics and baseline comparison"""
+
+    def test_summarize(self):
+        result = summarize([ms / 1000.0 for ms in range(100, 0, -1)], wall=2.0)
+        self.assertEqual(result["iterations"], 100)
+        self.assertEqual(result["ops_per_sec"], 50.0)
+        self.assertEqual(
+            (result["p50_ms"], result["p99_ms"], result["max_ms"]), (50.0, 99.0, 100.0)
+        )
+
+    def test_compare(self):
+        baseline = _results(1000.0, 2.0, skipped={"skipped": "numpy is not installed"})
+        self.assertEqual(compare(_results(950.0, 2.1), baseline, 0.10), [])
+        regressions = compare(
+            _results(800.0, 3.0, total_ms=150.0, skipped={"ops_per_sec": 1.0}), baseline, 0.10
+        )
+        self.assertEqual(len(regressions), 3)
+        self.assertIn("memory.get/sync/cached: ops_per_sec 1000 -> 800 (-20.0%)", regressions)
+        self.assertIn("startup/sync", regressions[-1])
+        # Faster is never a regression
+        self.assertEqual(compare(_results(5000.0, 0.5, total_ms=10.0), baseline, 0.10), [])
+
+
+class TestHarness(unittest.TestCase):
+    """Test scenarios against the mock server"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = MockServer().start()
+        cls.scenarios = {s.name: s for s in build_scenarios(dimension=64)}
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_configure(self):
+        self.assertEqual(self.server.configure(stream_chunks=3)["stream_chunks"], 3)
+        self.addCleanup(self.server.configure, stream_chunks=10)
+        result = run_scenario(
+            self.scenarios["vectors.invoke_stream/async/sse"], self.server, 3, 1, 1
+        )
+        self.assertEqual(result["iterations"], 3)
+        self.assertGreater(self.server.stats()["POST /api/vectors/invoke/stream"], 0)
+
+    def test_scenarios(self):
+        backend = get_json_backend()
+        for name in (
+            "latentmas.align/sync/json",
+            "memory.get/async/cached",
+            "mcp.invoke/sync/session",
+            "memory.put/async/gzip",
+        ):
+            with self.subTest(name):
+                result = run_scenario(self.scenarios[name], self.server, 10, 2, 2)
+                self.assertEqual(result["iterations"], 10)
+                self.assertGreater(result["ops_per_sec"], 0)
+                self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+                self.assertIn("peak_memory_kib", result)
+        self.assertEqual(get_json_backend(), backend)
+
+
+if __name__ == "__main__":
+    unittest.main()
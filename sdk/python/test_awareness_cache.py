@@ -0,0 +1,181 @@
+"""
+Unit tests for the local memory read-through cache
+
+Tests cover:
+- TTL expiry and LRU eviction
+- Sync client caching honoring server expiresAt
+- Invalidation on local writes and deletes, after the write lands
+- Reads racing a write never cache the old value
+- Async client caching
+"""
+
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from awareness_network_sdk import AwarenessNetworkClient
+from awareness_network_sdk.async_client import AsyncAwarenessClient
+from awareness_network_sdk.cache import TTLCache, parse_timestamp
+
+
+def _memory_response(key, data, expires_in=None):
+    expires_at = None
+    if expires_in is not None:
+        expires_at = (datetime.now(timezone.utc) + timedelta(seconds=expires_in)).isoformat()
+        expires_at = expires_at.replace("+00:00", "Z")
+    return {
+        "key": key,
+        "data": data,
+        "version": 1,
+        "createdAt": "2026-01-01T00:00:00.000Z",
+        "updatedAt": "2026-01-01T00:00:00.000Z",
+        "expiresAt": expires_at,
+    }
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cache primitives"""
+
+    @pytest.mark.usefixtures("fake_clock")
+    def test_expiry(self):
+        """Entries disappear after their TTL"""
+        cache = TTLCache(max_size=4, clock=self.clock)
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2)
+        self.clock.now = 11
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+
+    def test_lru_eviction(self):
+        """Least recently used entry is evicted first"""
+        cache = TTLCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+    def test_already_expired_not_stored(self):
+        """Non-positive TTLs are never cached"""
+        cache = TTLCache()
+        cache.set("a", 1, ttl=0)
+        self.assertEqual(len(cache), 0)
+
+    def test_generation(self):
+        """Entries fetched before an invalidation are not stored"""
+        cache = TTLCache()
+        generation = cache.generation()
+        cache.invalidate("b")
+        cache.set("a", 1, generation=generation)
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", 1, generation=cache.generation())
+        self.assertEqual(cache.get("a"), 1)
+
+    def test_parse_timestamp(self):
+        """API timestamps with a Z suffix are timezone-aware"""
+        parsed = parse_timestamp("2026-01-02T10:00:00.000Z")
+        self.assertEqual(parsed.tzinfo, timezone.utc)
+        self.assertIsNone(parse_timestamp(None))
+
+
+class TestSyncMemoryCache(unittest.TestCase):
+    """Test AwarenessNetworkClient memory caching"""
+
+    def setUp(self):
+        self.client = AwarenessNetworkClient(
+            base_url="https://test.awareness-network.com/api",
+            api_key="ak_test",
+            memory_cache_size=16
+        )
+
+    def test_read_through(self):
+        """Second read is served locally"""
+        with patch.object(self.client, "_request") as request:
+            request.return_value = _memory_response("preferences", {"category": "nlp"})
+            first = self.client.retrieve_memory("preferences")
+            second = self.client.retrieve_memory("preferences")
+        self.assertEqual(first.value, {"category": "nlp"})
+        self.assertIs(first, second)
+        request.assert_called_once_with("GET", "/ai/memory/preferences")
+
+    def test_honors_server_expiry(self):
+        """Memories already past expiresAt are not cached"""
+        with patch.object(self.client, "_request") as request:
+            request.return_value = _memory_response("session", {"step": 1}, expires_in=-5)
+            self.client.retrieve_memory("session")
+            self.client.retrieve_memory("session")
+        self.assertEqual(request.call_count, 2)
+
+    def test_invalidated_by_writes(self):
+        """store_memory and delete_memory drop the cached entry"""
+        with patch.object(self.client, "_request") as request:
+            request.return_value = _memory_response("preferences", {"v": 1})
+            self.client.retrieve_memory("preferences")
+            self.client.delete_memory("preferences")
+            self.client.retrieve_memory("preferences")
+        self.assertEqual(request.call_count, 3)
+
+    def test_read_during_write_not_cached(self):
+        """A read served while a PUT is in flight is dropped once it lands"""
+        old = _memory_response("preferences", {"v": 1})
+
+        def request(method, endpoint, data=None):
+            if method == "PUT":
+                self.client.retrieve_memory("preferences")
+                return _memory_response("preferences", {"v": 2})
+            return old
+
+        with patch.object(self.client, "_request", side_effect=request) as request_mock:
+            self.client.store_memory("preferences", {"v": 2})
+            self.client.retrieve_memory("preferences")
+        self.assertEqual([c.args[0] for c in request_mock.call_args_list], ["PUT", "GET", "GET"])
+
+    def test_write_during_read_not_cached(self):
+        """A read that started before a write does not cache its result"""
+        def request(method, endpoint, data=None):
+            if method == "GET" and request_mock.call_count == 1:
+                self.client.store_memory("preferences", {"v": 2})
+                return _memory_response("preferences", {"v": 1})
+            return _memory_response("preferences", {"v": 2})
+
+        with patch.object(self.client, "_request", side_effect=request) as request_mock:
+            self.assertEqual(self.client.retrieve_memory("preferences").value, {"v": 1})
+            self.assertEqual(self.client.retrieve_memory("preferences").value, {"v": 2})
+        self.assertEqual(request_mock.call_count, 3)
+
+    def test_disabled_by_default(self):
+        """Without memory_cache_size every read hits the API"""
+        client = AwarenessNetworkClient(api_key="ak_test")
+        with patch.object(client, "_request") as request:
+            request.return_value = _memory_response("preferences", {"v": 1})
+            client.retrieve_memory("preferences")
+            client.retrieve_memory("preferences")
+        self.assertEqual(request.call_count, 2)
+
+
+class TestAsyncMemoryCache(unittest.TestCase):
+    """Test MemoryAsyncClient caching"""
+
+    def test_read_through_and_invalidate(self):
+        """Async get is cached until set invalidates it"""
+        client = AsyncAwarenessClient(api_key="ak_test", memory_cache_size=16)
+        client._request = AsyncMock(return_value=_memory_response("preferences", {"v": 1}))
+
+        async def run():
+            await client.memory.get("preferences")
+            await client.memory.get("preferences")
+            self.assertEqual(client._request.await_count, 1)
+            await client.memory.set("preferences", {"v": 2})
+            await client.memory.get("preferences")
+            self.assertEqual(client._request.await_count, 3)
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
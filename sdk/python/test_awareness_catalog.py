@@ -0,0 +1,184 @@
+"""
+Unit tests for the local catalog mirror
+
+Tests cover:
+- Paginated snapshot and incremental updated-since sync
+- Upserts, deactivation and compaction
+- Vectorized filters and sort orders matching a reference implementation
+- search_vectors on the sync client served from the mirror
+- Concurrent first searches sharing one sync
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from awareness_network_sdk import AwarenessNetworkClient
+from awareness_network_sdk.catalog import CatalogMirror
+
+CATEGORIES = ["nlp", "vision", "audio", "finance"]
+
+
+def _vector(vector_id, status="active", **overrides):
+    rng = np.random.default_rng(vector_id)
+    vector = {
+        "id": vector_id,
+        "creatorId": 7,
+        "title": f"Vector {vector_id}",
+        "description": "",
+        "category": CATEGORIES[vector_id % len(CATEGORIES)],
+        "modelArchitecture": "GPT-4",
+        "vectorDimension": 768,
+        "basePrice": f"{rng.uniform(1, 100):.2f}",
+        "averageRating": f"{rng.uniform(0, 5):.2f}",
+        "totalCalls": int(rng.integers(0, 10000)),
+        "status": status,
+        "createdAt": f"2026-01-{1 + vector_id % 28:02d}T00:00:00.000Z",
+        "updatedAt": "2026-02-01T00:00:00.000Z",
+    }
+    vector.update(overrides)
+    return vector
+
+
+class FakeCatalogClient:
+    """Serves catalog pages the way GET /vectors/catalog does"""
+
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.requests = []
+
+    def _request(self, method, endpoint, data=None, params=None):
+        self.requests.append(dict(params))
+        start = int(params.get("cursor", 0))
+        page = self.vectors[start:start + params["limit"]]
+        end = start + len(page)
+        return {
+            "vectors": page,
+            "nextCursor": str(end) if end < len(self.vectors) else None,
+            "serverTime": "2026-02-02T00:00:00.000Z",
+        }
+
+
+class TestCatalogMirror(unittest.TestCase):
+    """Test CatalogMirror"""
+
+    def setUp(self):
+        self.vectors = [_vector(i) for i in range(1, 201)]
+        self.client = FakeCatalogClient(self.vectors)
+        self.catalog = CatalogMirror(self.client, page_size=64)
+        self.catalog.sync()
+
+    def test_snapshot_pages(self):
+        """The first sync pages through the whole catalog"""
+        self.assertEqual(len(self.catalog), 200)
+        self.assertEqual(len(self.client.requests), 4)
+        self.assertNotIn("updatedSince", self.client.requests[0])
+        self.assertEqual(self.client.requests[1]["cursor"], "64")
+
+    def test_incremental_sync(self):
+        """Later syncs ask only for changes and apply them in place"""
+        self.client.vectors = [
+            _vector(5, basePrice="0.50"),
+            _vector(6, status="inactive"),
+            _vector(500, category="robotics"),
+        ]
+        self.assertEqual(self.catalog.sync(), 3)
+        self.assertEqual(self.client.requests[-1]["updatedSince"], "2026-02-01T23:59:59+00:00")
+
+        self.assertEqual(len(self.catalog), 200)
+        self.assertEqual(self.catalog.get(5).price, 0.5)
+        self.assertIsNone(self.catalog.get(6))
+        self.assertEqual([v.id for v in self.catalog.search_vectors(category="robotics")], [500])
+
+    def test_tombstones(self):
+        """Non-active rows without listing data remove the vector in any mode"""
+        catalog = CatalogMirror(self.client, active_only=False)
+        catalog.apply([_vector(1), _vector(2, status="inactive")])
+        self.assertEqual(len(catalog), 2)
+        catalog.apply([{"id": 1, "status": "suspended", "updatedAt": "2026-02-02T00:00:00.000Z"}])
+        self.assertIsNone(catalog.get(1))
+        self.assertEqual(catalog.get(2).id, 2)
+
+    def test_filters_and_sorts_match_reference(self):
+        """Vectorized search equals a plain Python filter + sort"""
+        def reference(category, min_price, max_price, min_rating, key):
+            rows = [
+                v for v in self.vectors
+                if v["category"] == category
+                and min_price <= float(v["basePrice"]) <= max_price
+                and float(v["averageRating"]) >= min_rating
+            ]
+            return [v["id"] for v in sorted(rows, key=key)]
+
+        cases = {
+            "price": lambda v: float(v["basePrice"]),
+            "price_high": lambda v: -float(v["basePrice"]),
+            "popular": lambda v: -v["totalCalls"],
+        }
+        for sort_by, key in cases.items():
+            expected = reference("nlp", 10, 80, 1.0, key)
+            actual = self.catalog.search_vectors(
+                category="nlp", min_price=10, max_price=80, min_rating=1.0,
+                sort_by=sort_by, limit=5, offset=2
+            )
+            self.assertEqual([v.id for v in actual], expected[2:7], sort_by)
+
+        self.assertEqual(self.catalog.search_vectors(category="unknown"), [])
+        with self.assertRaises(ValueError):
+            self.catalog.search_vectors(sort_by="random")
+
+    def test_compaction(self):
+        """Removing most rows compacts the columns without losing survivors"""
+        self.catalog.apply([_vector(i, status="inactive") for i in range(1, 151)])
+        self.assertEqual(len(self.catalog), 50)
+        self.assertEqual(self.catalog._size, 50)
+        ids = sorted(v.id for v in self.catalog.search_vectors(limit=100))
+        self.assertEqual(ids, list(range(151, 201)))
+        self.assertEqual(self.catalog.get(175).name, "Vector 175")
+
+
+class TestClientSearchVectors(unittest.TestCase):
+    """Test AwarenessNetworkClient.search_vectors"""
+
+    def test_served_locally_between_syncs(self):
+        """Only the first search within the sync interval hits the API"""
+        client = AwarenessNetworkClient(api_key="ak_test", catalog_sync_interval=3600)
+        fake = FakeCatalogClient([_vector(i) for i in range(1, 21)])
+        with patch.object(client, "_request", side_effect=fake._request) as request:
+            first = client.search_vectors(category="vision", sort_by="rating")
+            client.search_vectors(min_price=50)
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual({v.category for v in first}, {"vision"})
+        ratings = [v.rating for v in first]
+        self.assertEqual(ratings, sorted(ratings, reverse=True))
+
+    def test_concurrent_first_searches_share_sync(self):
+        """Threads racing on a cold mirror trigger one sync between them"""
+        client = AwarenessNetworkClient(api_key="ak_test", catalog_sync_interval=3600)
+        fake = FakeCatalogClient([_vector(i) for i in range(1, 21)])
+        barrier = threading.Barrier(8)
+        results = []
+
+        def search():
+            barrier.wait()
+            results.append(len(client.search_vectors(limit=50)))
+
+        def slow_request(*args, **kwargs):
+            time.sleep(0.05)
+            return fake._request(*args, **kwargs)
+
+        with patch.object(client, "_request", side_effect=slow_request) as request:
+            threads = [threading.Thread(target=search) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual(results, [20] * 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
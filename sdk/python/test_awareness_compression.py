@@ -0,0 +1,117 @@
+"""
+Unit tests for request/response compression
+
+Tests cover:
+- gzip and deflate streams that inflate back to the body
+- The size threshold and the headers sent with each body
+- Large memory writes sent compressed and chunked through the stand-in
+- Large memory reads returned gzip-compressed and decoded transparently
+- The async client's compressed request bodies
+"""
+
+import asyncio
+import unittest
+import zlib
+
+from awareness_network_sdk import AsyncAwarenessClient, AwarenessNetworkClient
+from awareness_network_sdk.compression import (
+    encode_json_body,
+    iter_compressed,
+    resolve_encoding,
+)
+from awareness_network_sdk.testing import StandInServer
+
+# A KV-cache sized memory: a few thousand floats
+LARGE_DATA = {"kv": [round(i * 0.001, 3) for i in range(4000)], "model": "gpt-4"}
+
+
+class TestCompression(unittest.TestCase):
+    """Test the streaming compressor and body encoding"""
+
+    def test_round_trip(self):
+        """Chunked gzip and deflate output inflates back to the body"""
+        body = b'{"v": [' + b", ".join(b"0.125" for _ in range(50000)) + b"]}"
+        for encoding, wbits in (("gzip", 31), ("deflate", 15)):
+            chunks = list(iter_compressed(body, encoding, chunk_size=4096))
+            self.assertGreater(len(chunks), 1)
+            compressed = b"".join(chunks)
+            self.assertLess(len(compressed), len(body) // 10)
+            self.assertEqual(zlib.decompress(compressed, wbits), body)
+
+    def test_threshold(self):
+        """Small bodies go out plain; large ones get a Content-Encoding"""
+        body, headers, compress = encode_json_body({"a": 1}, "gzip")
+        self.assertEqual((body, compress), (b'{"a":1}', False))
+        self.assertNotIn("Content-Encoding", headers)
+        body, headers, compress = encode_json_body(LARGE_DATA, "deflate")
+        self.assertTrue(compress)
+        self.assertEqual(headers["Content-Encoding"], "deflate")
+        self.assertFalse(encode_json_body(LARGE_DATA, None)[2])
+
+    def test_resolve_encoding(self):
+        """True means gzip; unknown encodings are rejected"""
+        self.assertEqual(resolve_encoding(True), "gzip")
+        self.assertIsNone(resolve_encoding(False))
+        self.assertEqual(resolve_encoding("deflate"), "deflate")
+        with self.assertRaises(ValueError):
+            resolve_encoding("br")
+
+
+class TestCompressedTraffic(unittest.TestCase):
+    """Test compressed bodies over loopback HTTP"""
+
+    def setUp(self):
+        self.server = StandInServer(usage_flush_interval=None).start()
+        self.addCleanup(self.server.stop)
+        self.key = self.server.register_agent("CompressAgent")["apiKey"]
+
+    def _put_and_get(self, **options):
+        client = AwarenessNetworkClient(base_url=self.server.base_url, api_key=self.key,
+                                        rate_limiter=False, **options)
+        before = self.server.stats["bytes_in"]
+        response = client._request("PUT", "/ai/memory/kv", data={"data": LARGE_DATA})
+        self.assertTrue(response["success"])
+        sent = self.server.stats["bytes_in"] - before
+        before = self.server.stats["bytes_out"]
+        memory = client._request("GET", "/ai/memory/kv")
+        self.assertEqual(memory["data"], LARGE_DATA)
+        return sent, self.server.stats["bytes_out"] - before
+
+    def test_sync_client(self):
+        """A compressed write costs a fraction of the plain one"""
+        plain_in, plain_out = self._put_and_get()
+        gzip_in, gzip_out = self._put_and_get(compress_requests=True)
+        deflate_in, _ = self._put_and_get(compress_requests="deflate")
+        self.assertLess(gzip_in, plain_in // 3)
+        self.assertLess(deflate_in, plain_in // 3)
+        # Responses are compressed either way; the client asks for it
+        for received in (plain_out, gzip_out):
+            self.assertLess(received, len(str(LARGE_DATA)) // 3)
+
+    def test_small_body_not_compressed(self):
+        """Bodies under the threshold are sent as they are"""
+        client = AwarenessNetworkClient(base_url=self.server.base_url, api_key=self.key,
+                                        rate_limiter=False, compress_requests=True)
+        client._request("PUT", "/ai/memory/small", data={"data": {"a": 1}})
+        self.assertEqual(self.server.stats["bytes_in"], len(b'{"data":{"a":1}}'))
+
+    def test_async_client(self):
+        """The async client streams compressed bodies too"""
+        base_url = self.server.base_url[:-len("/api")]
+
+        async def run(**options):
+            async with AsyncAwarenessClient(api_key=self.key, base_url=base_url,
+                                            rate_limiter=False, **options) as client:
+                await client._request("PUT", "/api/ai/memory/kv", data={"data": LARGE_DATA})
+                return await client.memory.get("kv")
+
+        memory = asyncio.run(run())
+        plain = self.server.stats["bytes_in"]
+        self.assertEqual(memory["data"], LARGE_DATA)
+        memory = asyncio.run(run(compress_requests=True))
+        self.assertEqual(memory["version"], 2)
+        self.assertLess(self.server.stats["bytes_in"] - plain, plain // 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Unit tests for lazy package imports
+
+Tests cover:
+- Importing the package loads no heavy dependencies
+- Each client pulls in only its own transport, asyncio only when used
+- The deprecated awareness_network_async module warns and re-exports
+- Public names resolve lazily and are listed in __all__
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+import warnings
+
+import awareness_network_sdk
+
+SDK_ROOT = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ("requests", "aiohttp", "numpy", "asyncio")
+
+
+def loaded_after(statement):
+    """Heavy modules present in a fresh interpreter after running statement"""
+    probe = (
+        f"import sys\n{statement}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe], cwd=SDK_ROOT, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+    return set(filter(None, output.split(",")))
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test what each import actually loads"""
+
+    def test_package_import_is_light(self):
+        """import awareness_network_sdk loads no heavy dependency"""
+        self.assertEqual(loaded_after("import awareness_network_sdk"), set())
+
+    def test_sync_client_defers_requests(self):
+        """requests loads when the first session is created, not on import"""
+        self.assertEqual(
+            loaded_after("from awareness_network_sdk import AwarenessNetworkClient"), set()
+        )
+        self.assertIn("requests", loaded_after(
+            "from awareness_network_sdk import AwarenessNetworkClient\n"
+            "AwarenessNetworkClient(api_key='ak_test').session"
+        ))
+
+    def test_async_client_defers_aiohttp(self):
+        """Neither asyncio nor aiohttp loads until the client is used"""
+        self.assertEqual(
+            loaded_after("from awareness_network_sdk import AsyncAwarenessClient"), set()
+        )
+
+    def test_deprecated_async_module(self):
+        """The old module path still works but warns"""
+        sys.modules.pop("awareness_network_async", None)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            import awareness_network_async
+        self.assertTrue(any(issubclass(w.category, DeprecationWarning) for w in caught))
+        self.assertIs(
+            awareness_network_async.AsyncAwarenessClient, awareness_network_sdk.AsyncAwarenessClient
+        )
+
+    def test_public_names(self):
+        """Every exported name resolves and unknown names raise AttributeError"""
+        for name in awareness_network_sdk.__all__:
+            self.assertTrue(hasattr(awareness_network_sdk, name), name)
+        self.assertIn("CatalogMirror", dir(awareness_network_sdk))
+        with self.assertRaises(AttributeError):
+            awareness_network_sdk.NoSuchThing
+
+
+if __name__ == "__main__":
+    unittest.main()
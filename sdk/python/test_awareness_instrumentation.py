@@ -0,0 +1,199 @@
+"""
+Unit tests for request instrumentation
+
+Tests cover:
+- Route normalization and server-reported processing times
+- Nearest-rank percentiles per route and phase
+- The Prometheus text dump
+- Pre-hooks adding headers, post-hooks seeing failed requests
+- Phase timings and wire sizes from the sync client over loopback HTTP
+- Phase timings and retries from the async client
+- Streamed responses finishing their event on release
+"""
+
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from awareness_network_sdk import (
+    AsyncAwarenessClient,
+    AwarenessNetworkClient,
+    HistogramExporter,
+    Instrumentation,
+    RequestEvent,
+)
+from awareness_network_sdk.instrumentation import StreamedResponse, route_of, server_seconds
+from awareness_network_sdk.testing import StandInServer
+
+
+def _event(route, total, status=200, **fields):
+    event = RequestEvent("GET", route, route, status=status, attempts=1, **fields)
+    event.phases["total"] = total
+    return event
+
+
+class TestHelpers(unittest.TestCase):
+    """Test route and server-time extraction"""
+
+    def test_route_of(self):
+        self.assertEqual(route_of("/api/vectors/7"), "/vectors/:id")
+        self.assertEqual(route_of("/vectors/7/reviews?limit=5"), "/vectors/:id/reviews")
+        self.assertEqual(route_of("/ai/memory/preferences"), "/ai/memory/:key")
+        self.assertEqual(route_of("/api/ai/memory/mget"), "/ai/memory/mget")
+        self.assertEqual(route_of("/latentmas/align"), "/latentmas/align")
+
+    def test_server_seconds(self):
+        self.assertEqual(server_seconds({"metadata": {"processing_time_ms": 250}}), 0.25)
+        self.assertEqual(server_seconds({"latency_ms": 40}), 0.04)
+        self.assertIsNone(server_seconds({"metadata": {}}))
+        self.assertIsNone(server_seconds([1, 2]))
+
+    def test_streamed_response(self):
+        """A streamed event finishes once, when the body is released"""
+        instrumentation = Instrumentation()
+        finished = []
+        instrumentation.add_post_hook(finished.append)
+        response = MagicMock(status=200)
+        event = instrumentation.start("POST", "/api/vectors/invoke/stream")
+        streamed = StreamedResponse(response, event, instrumentation)
+        self.assertEqual(streamed.status, 200)
+        self.assertEqual(finished, [])
+        streamed.release()
+        streamed.release()
+        self.assertEqual(finished, [event])
+        self.assertIn("download", event.phases)
+        self.assertEqual(response.release.call_count, 2)
+
+
+class TestHistogramExporter(unittest.TestCase):
+    """Test percentiles and the Prometheus dump"""
+
+    def test_percentiles(self):
+        exporter = HistogramExporter()
+        for ms in range(1, 101):
+            exporter.record(_event("/latentmas/align", ms / 1000.0, server_seconds=ms / 2000.0))
+        self.assertEqual(
+            exporter.percentiles("/latentmas/align"), {"p50": 0.05, "p95": 0.095, "p99": 0.099}
+        )
+        self.assertEqual(exporter.percentiles("/latentmas/align", "server")["p50"], 0.025)
+        self.assertEqual(exporter.summary()["/latentmas/align"]["total"]["count"], 100)
+        self.assertEqual(exporter.percentiles("/unknown")["p99"], 0.0)
+
+    def test_window(self):
+        """Quantiles follow the most recent samples"""
+        exporter = HistogramExporter(window=10)
+        for seconds in [5.0] * 50 + [0.1] * 10:
+            exporter.record(_event("/x", seconds))
+        self.assertEqual(exporter.percentiles("/x")["p99"], 0.1)
+        self.assertEqual(exporter.summary()["/x"]["total"]["count"], 60)
+
+    def test_prometheus(self):
+        exporter = HistogramExporter()
+        exporter.record(_event("/vectors/:id", 0.2, request_bytes=10, response_bytes=300))
+        exporter.record(_event("/vectors/:id", 0.4, status=None))
+        text = exporter.to_prometheus()
+        self.assertIn("# TYPE awareness_sdk_request_phase_seconds summary", text)
+        self.assertIn(
+            'awareness_sdk_request_phase_seconds'
+            '{route="/vectors/:id",phase="total",quantile="0.99"} 0.400000',
+            text,
+        )
+        self.assertIn(
+            'awareness_sdk_request_phase_seconds_count{route="/vectors/:id",phase="total"} 2', text
+        )
+        self.assertIn(
+            'awareness_sdk_requests_total{route="/vectors/:id",method="GET",status="error"} 1', text
+        )
+        self.assertIn(
+            'awareness_sdk_payload_bytes_total{route="/vectors/:id",direction="received"} 300', text
+        )
+        self.assertTrue(text.endswith("\n"))
+
+
+class TestClientInstrumentation(unittest.TestCase):
+    """Test events produced by the clients against the stand-in server"""
+
+    def setUp(self):
+        self.server = StandInServer(usage_flush_interval=None).start()
+        self.addCleanup(self.server.stop)
+        self.key = self.server.register_agent("MetricsAgent")["apiKey"]
+        self.events = []
+        self.exporter = HistogramExporter()
+        self.instrumentation = Instrumentation(exporters=[self.exporter])
+        self.instrumentation.add_post_hook(self.events.append)
+
+        @self.instrumentation.add_pre_hook
+        def tag(event):
+            event.headers["X-Request-Tag"] = "bench"
+
+    def test_sync_client(self):
+        client = AwarenessNetworkClient(base_url=self.server.base_url, api_key=self.key,
+                                        rate_limiter=False, instrumentation=self.instrumentation)
+        data = {"data": {"kv": list(range(3000))}}
+        client._request("PUT", "/ai/memory/kv", data=data)
+        client._request("GET", "/ai/memory/kv")
+        with self.assertRaises(Exception):
+            client._request("GET", "/ai/memory/missing")
+
+        put, get, missing = self.events
+        self.assertEqual(put.route, "/ai/memory/:key")
+        self.assertEqual((put.status, put.attempts, put.error), (201, 1, None))
+        self.assertEqual(put.request_bytes, self.server.stats["bytes_in"])
+        # One connection for all three requests
+        self.assertIn("connect", put.phases)
+        self.assertNotIn("connect", get.phases)
+        for phase in ("pool_wait", "ttfb", "download", "decode", "total"):
+            self.assertGreaterEqual(get.phases[phase], 0.0)
+        self.assertGreaterEqual(get.phases["total"], get.phases["ttfb"] + get.phases["download"])
+        # The memory response is gzip-compressed on the wire
+        self.assertLess(get.response_bytes, len(str(data)) // 2)
+        self.assertEqual(missing.status, 404)
+        self.assertIn("404", missing.error)
+        self.assertEqual(get.headers, {"X-Request-Tag": "bench"})
+        self.assertEqual(self.exporter.summary()["/ai/memory/:key"]["total"]["count"], 3)
+
+    def test_async_client(self):
+        base_url = self.server.base_url[:-len("/api")]
+
+        async def run():
+            async with AsyncAwarenessClient(api_key=self.key, base_url=base_url, rate_limiter=False,
+                                            instrumentation=self.instrumentation) as client:
+                await client._request("PUT", "/api/ai/memory/a", data={"data": {"x": 1}})
+                return await client.memory.get("a")
+
+        self.assertEqual(asyncio.run(run())["data"], {"x": 1})
+        put, get = self.events
+        self.assertEqual((put.status, get.status), (201, 200))
+        self.assertEqual(put.request_bytes, len(b'{"data":{"x":1}}'))
+        self.assertIn("connect", put.phases)
+        # aiohttp reports pool_wait only when a request queues for a connection
+        self.assertNotIn("connect", get.phases)
+        for phase in ("ttfb", "download", "decode"):
+            self.assertIn(phase, get.phases)
+        self.assertGreater(get.response_bytes, 0)
+
+    def test_async_retries(self):
+        """Failed attempts are counted on one event"""
+        base_url = self.server.base_url[:-len("/api")]
+
+        async def run():
+            async with AsyncAwarenessClient(
+                api_key="wrong",
+                base_url=base_url,
+                rate_limiter=False,
+                max_retries=2,
+                instrumentation=self.instrumentation,
+            ) as client:
+                with self.assertRaises(Exception):
+                    await client._request("GET", "/api/ai/keys")
+
+        sleep = asyncio.sleep
+        with patch("asyncio.sleep", lambda seconds: sleep(0)):
+            asyncio.run(run())
+        event, = self.events
+        self.assertEqual((event.status, event.attempts, event.retries), (401, 2, 1))
+        self.assertIn("after 2 attempts", event.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+Unit tests for the JSON decoding layer
+
+Tests cover:
+- Backend selection, pinning and stdlib fallback
+- Typed, validating decode into models and ResultSets
+- Vector fields decoded into NumPy arrays
+- Both clients decoding response bodies through the selected backend
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import numpy as np
+
+from awareness_network_sdk import AwarenessNetworkClient, LatentVector, codec
+from awareness_network_sdk.async_client import AsyncAwarenessClient
+from awareness_network_sdk.codec import (
+    ResponseValidationError,
+    decode_models,
+    get_json_backend,
+    loads,
+    set_json_backend,
+    vectors_to_numpy,
+)
+from awareness_network_sdk.models import ResultSet
+
+
+def _body(**payload):
+    return json.dumps(payload).encode()
+
+
+class TestBackends(unittest.TestCase):
+    """Test backend selection"""
+
+    def tearDown(self):
+        set_json_backend()
+
+    def test_auto_prefers_fast_backend(self):
+        """The first installed backend wins; stdlib is the last resort"""
+        try:
+            import orjson  # noqa: F401
+            expected = "orjson"
+        except ImportError:
+            expected = "json"
+        self.assertEqual(set_json_backend(), expected)
+        self.assertEqual(get_json_backend(), expected)
+
+    def test_falls_back_to_stdlib(self):
+        """Missing optional decoders are skipped"""
+        def missing(name):
+            if name != "json":
+                raise ImportError(name)
+            return json.loads
+
+        with patch.object(codec, "_load_backend", side_effect=missing):
+            self.assertEqual(set_json_backend(), "json")
+        self.assertEqual(loads(b'{"a": [1, 2.5]}'), {"a": [1, 2.5]})
+
+    def test_pin_backend(self):
+        """Backends can be pinned; unknown names are rejected"""
+        self.assertEqual(set_json_backend("json"), "json")
+        self.assertEqual(loads('{"ok": true}'), {"ok": True})
+        with self.assertRaises(ValueError):
+            set_json_backend("yaml")
+
+
+class TestDecodeModels(unittest.TestCase):
+    """Test typed decoding"""
+
+    def setUp(self):
+        self.body = _body(vectors=[
+            {"id": 1, "title": "a", "basePrice": "1.50", "averageRating": "4.00", "totalCalls": 3},
+            {"id": 2, "title": "b", "basePrice": "2.00", "averageRating": None, "totalCalls": 9},
+        ], nextCursor=None)
+
+    def test_decode_list(self):
+        """Rows become models with converted fields"""
+        vectors = decode_models(self.body, LatentVector, items_key="vectors")
+        self.assertEqual(
+            [(v.id, v.price, v.rating) for v in vectors], [(1, 1.5, 4.0), (2, 2.0, 0.0)]
+        )
+
+    def test_decode_columnar(self):
+        """columnar=True returns a ResultSet"""
+        vectors = decode_models(self.body, LatentVector, items_key="vectors", columnar=True)
+        self.assertIsInstance(vectors, ResultSet)
+        self.assertEqual(list(vectors.column("total_calls")), [3, 9])
+
+    def test_validation_errors(self):
+        """Bad rows name the model and field"""
+        cases = [
+            (_body(vectors=[{"title": "no id"}]), "LatentVector.id: missing"),
+            (_body(vectors=[{"id": "7"}]), "LatentVector.id: expected int"),
+            (_body(vectors=[{"id": 1, "basePrice": "free"}]), "LatentVector.price"),
+            (_body(vectors=[[1, 2]]), "expected an object"),
+            (_body(items=[]), "'vectors' list"),
+        ]
+        for body, message in cases:
+            with self.assertRaises(ResponseValidationError) as ctx:
+                decode_models(body, LatentVector, items_key="vectors", columnar=True)
+            self.assertIn(message, str(ctx.exception))
+
+    def test_vectors_to_numpy(self):
+        """Vector fields become float32 arrays; other fields are untouched"""
+        payload = vectors_to_numpy(loads(_body(aligned_vector=[0.5, -1.0], quality={"score": 0.9})))
+        self.assertIsInstance(payload["aligned_vector"], np.ndarray)
+        self.assertEqual(payload["aligned_vector"].dtype, np.float32)
+        self.assertEqual(payload["quality"], {"score": 0.9})
+
+
+class TestClientDecoding(unittest.TestCase):
+    """Test that clients decode through the JSON layer"""
+
+    def test_sync_client(self):
+        """Response bytes are decoded by loads; vectors optionally as NumPy"""
+        client = AwarenessNetworkClient(api_key="ak_test", numpy_vectors=True)
+        response = Mock(content=_body(aligned_vector=[1.0, 2.0], success=True))
+        with patch.object(client.session, "request", return_value=response), \
+                patch("awareness_network_sdk.client.loads", wraps=loads) as decode:
+            result = client.align_vector([1.0, 2.0], "gpt-4", "claude")
+        decode.assert_called_once_with(response.content)
+        np.testing.assert_array_equal(
+            result["aligned_vector"], np.array([1.0, 2.0], dtype=np.float32)
+        )
+
+    def test_async_client(self):
+        """The async client reads raw bytes and decodes them itself"""
+        response = MagicMock()
+        response.read = AsyncMock(return_value=_body(transformed_vector=[3.0], success=True))
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=False)
+
+        async def run():
+            async with AsyncAwarenessClient(api_key="ak_test", numpy_vectors=True) as client:
+                with patch.object(client._session, "request", return_value=response):
+                    return await client.latentmas.transform([1.0, 2.0], 1)
+
+        result = asyncio.run(run())
+        self.assertIsInstance(result["transformed_vector"], np.ndarray)
+        response.json.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
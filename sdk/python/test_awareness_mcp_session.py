@@ -0,0 +1,189 @@
+"""
+Unit tests for MCP session mode
+
+Tests cover:
+- Server-Sent Events parsing (event names, multi-line data, comments)
+- Results delivered out of order to the waiting callers
+- Many calls sharing one stream and one keep-alive connection
+- Calls from many threads multiplexed over one session
+- Server errors raised per call, quota tracking of session calls
+- Closing a session failing the calls still waiting
+- Streams requiring an API key, capped per user and owned by their opener
+- The async session, with concurrent calls coalesced into one POST
+"""
+
+import asyncio
+import threading
+import unittest
+from concurrent.futures import wait
+
+import requests
+
+from awareness_network_sdk import (
+    AsyncAwarenessClient,
+    AwarenessNetworkClient,
+    McpCallError,
+    McpSessionClosed,
+    QuotaExceededError,
+)
+from awareness_network_sdk.mcp_session import SSEParser
+from awareness_network_sdk.testing import MCP_MAX_SESSIONS_PER_USER, StandInServer
+
+
+class TestSSEParser(unittest.TestCase):
+    """Test the incremental event parser"""
+
+    def test_events(self):
+        """Named events, joined data lines and ignored comments"""
+        parser = SSEParser()
+        lines = [": ping", "", "event: session", 'data: {"a":', "data: 1}", "", "data: x", ""]
+        events = [e for e in (parser.feed(line) for line in lines) if e is not None]
+        self.assertEqual(events, [("session", '{"a":\n1}'), ("message", "x")])
+
+
+class TestMcpSession(unittest.TestCase):
+    """Test the sync session against the stand-in server"""
+
+    def setUp(self):
+        self.server = StandInServer(usage_flush_interval=None).start()
+        self.addCleanup(self.server.stop)
+        key = self.server.register_agent("SessionAgent")["apiKey"]
+        self.client = AwarenessNetworkClient(
+            base_url=self.server.base_url, api_key=key, rate_limiter=False
+        )
+        self.slow_token = self.server.grant_access(7)
+        self.fast_token = self.server.grant_access(8)
+        self.server.set_latency(7, 0.3)
+
+    def test_out_of_order(self):
+        """Fast calls complete while an earlier slow call is still running"""
+        with self.client.mcp_session() as session:
+            slow = session.submit_invoke(7, "slow", self.slow_token)
+            fast = [session.submit_invoke(8, f"fast {i}", self.fast_token) for i in range(5)]
+            wait(fast, timeout=5)
+            self.assertFalse(slow.done())
+            self.assertEqual(slow.result(5)["result"]["metadata"]["context"], "slow")
+            self.assertEqual([f.result()["result"]["metadata"]["context"] for f in fast],
+                             [f"fast {i}" for i in range(5)])
+
+    def test_one_stream_keep_alive(self):
+        """Thirty calls cost the stream plus one keep-alive connection"""
+        with self.client.mcp_session() as session:
+            futures = [session.submit_invoke(8, f"call {i}", self.fast_token) for i in range(30)]
+            wait(futures, timeout=5)
+        self.assertEqual(self.server.stats["mcp_calls"], 30)
+        self.assertEqual(self.server.stats["connections"], 2)
+
+    def test_batch_and_threads(self):
+        """One POST may carry many calls, and threads may share the session"""
+        with self.client.mcp_session() as session:
+            batch = session.submit_many(
+                [
+                    {
+                        "method": "invoke",
+                        "params": {"vector_id": 8, "context": i},
+                        "access_token": self.fast_token,
+                    }
+                    for i in range(1, 11)
+                ]
+                + [{"method": "discover"}]
+            )
+            results = []
+            threads = [
+                threading.Thread(
+                    target=lambda i=i: results.append(session.invoke(8, i, self.fast_token))
+                )
+                for i in range(1, 9)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(len(results), 8)
+            self.assertIn("rate_limits", batch[-1].result(5))
+            self.assertEqual(sum(1 for f in batch[:-1] if f.result(5)["protocol"] == "MCP/1.0"), 10)
+            self.assertEqual(session.pending, 0)
+
+    def test_errors_and_quota(self):
+        """Server errors fail their own call and feed the quota tracker"""
+        token = self.server.grant_access(9, calls_remaining=1)
+        self.client.quota.track(token, 9, remaining_calls=5)
+        with self.client.mcp_session() as session:
+            with self.assertRaises(McpCallError) as ctx:
+                session.invoke(8, "x", self.slow_token)
+            self.assertEqual(ctx.exception.status, 403)
+            self.assertEqual(session.invoke(9, "x", token)["usage"]["calls_remaining"], 0)
+            with self.assertRaises(QuotaExceededError):
+                session.submit_invoke(9, "x", token)
+        self.assertEqual(self.server.stats["mcp_calls"], 2)
+
+    def test_close_fails_waiting_calls(self):
+        """Calls still running when the session closes are not left hanging"""
+        session = self.client.mcp_session().open()
+        slow = session.submit_invoke(7, "slow", self.slow_token)
+        session.close()
+        with self.assertRaises(McpSessionClosed):
+            slow.result(5)
+        with self.assertRaises(McpSessionClosed):
+            session.submit("discover")
+
+    def test_stream_access(self):
+        """Streams need a key, are capped per user and only accept their owner's calls"""
+        stream = requests.get(f"{self.server.base_url}/mcp/session", stream=True, timeout=5)
+        self.assertEqual(stream.status_code, 401)
+
+        other_key = self.server.register_agent("OtherAgent")["apiKey"]
+        with self.client.mcp_session() as session:
+            response = requests.post(f"{self.server.base_url}/mcp/session/{session.session_id}",
+                                     json={"calls": [{"id": 1, "method": "discover"}]},
+                                     headers={"X-API-Key": other_key}, timeout=5)
+            self.assertEqual(response.status_code, 404)
+            self.assertIn("rate_limits", session.submit("discover").result(5))
+
+        other = AwarenessNetworkClient(
+            base_url=self.server.base_url, api_key=other_key, rate_limiter=False
+        )
+        sessions = [other.mcp_session().open() for _ in range(MCP_MAX_SESSIONS_PER_USER)]
+        try:
+            with self.assertRaises(requests.HTTPError) as ctx:
+                other.mcp_session().open()
+            self.assertEqual(ctx.exception.response.status_code, 429)
+        finally:
+            for session in sessions:
+                session.close()
+
+
+class TestAsyncMcpSession(unittest.TestCase):
+    """Test the async session against the stand-in server"""
+
+    def test_gather(self):
+        """Concurrent tasks complete out of order over two connections"""
+        with StandInServer(usage_flush_interval=None) as server:
+            key = server.register_agent("AsyncAgent")["apiKey"]
+            slow_token, fast_token = server.grant_access(7), server.grant_access(8)
+            server.set_latency(7, 0.3)
+            finished = []
+
+            async def run():
+                base_url = server.base_url[:-len("/api")]
+                async with AsyncAwarenessClient(
+                    api_key=key, base_url=base_url, rate_limiter=False
+                ) as client:
+                    async with client.mcp_session() as session:
+                        async def invoke(vector_id, token, name):
+                            await session.invoke(vector_id, name, token)
+                            finished.append(name)
+
+                        await asyncio.gather(
+                            invoke(7, slow_token, "slow"),
+                            *(invoke(8, fast_token, f"fast {i}") for i in range(10)),
+                        )
+
+            asyncio.run(run())
+            self.assertEqual(len(finished), 11)
+            self.assertEqual(finished[-1], "slow")
+            self.assertEqual(server.stats["connections"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,241 @@
+"""
+Unit tests for write-behind memory sync
+
+Tests cover:
+- Coalescing repeated writes to the same key
+- Read-your-writes before a flush
+- Flush on size threshold and on close
+- Retry of failed flushes
+- Reads of writes whose flush is still in flight
+- Dropping writes the server would refuse or rejected as invalid
+- Async client flushing through MemoryAsyncClient.set_many
+- Bulk multi-get and cursor-paginated listing
+"""
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from awareness_network_sdk import AwarenessNetworkClient, Memory
+from awareness_network_sdk.async_client import AsyncAwarenessClient
+from awareness_network_sdk.memory import AsyncWriteBehindMemoryClient, WriteBehindMemoryClient
+
+
+def _memory(key, data):
+    return {"key": key, "data": data, "version": 1, "createdAt": None,
+            "updatedAt": None, "expiresAt": None}
+
+
+class TestWriteBehindMemoryClient(unittest.TestCase):
+    """Test sync write-behind client"""
+
+    def setUp(self):
+        self.client = Mock()
+        self.client.store_memory_batch.return_value = {"success": True}
+        self.client.retrieve_memory.return_value = None
+        # Long interval so only explicit flushes reach the mock
+        self.memory = WriteBehindMemoryClient(self.client, flush_interval=3600)
+
+    def tearDown(self):
+        self.memory.close()
+
+    def test_coalesces_writes(self):
+        """Only the last write per key is sent"""
+        for step in range(100):
+            self.memory.store_memory("last_session", {"step": step})
+        self.memory.store_memory("preferences", {"category": "nlp"}, ttl_seconds=86400)
+
+        self.assertEqual(self.memory.flush(), 2)
+        writes, deletes = self.client.store_memory_batch.call_args[0]
+        self.assertEqual(
+            writes,
+            [
+                {"key": "last_session", "data": {"step": 99}},
+                {"key": "preferences", "data": {"category": "nlp"}, "ttlDays": 1.0},
+            ]
+        )
+        self.assertEqual(deletes, [])
+        self.assertEqual(self.client.store_memory_batch.call_count, 1)
+
+    def test_read_your_writes(self):
+        """Pending writes and deletes are visible before a flush"""
+        self.memory.store_memory("preferences", {"category": "vision"})
+        memory = self.memory.retrieve_memory("preferences")
+        self.assertIsInstance(memory, Memory)
+        self.assertEqual(memory.value, {"category": "vision"})
+
+        self.memory.delete_memory("preferences")
+        self.assertIsNone(self.memory.retrieve_memory("preferences"))
+        self.client.retrieve_memory.assert_not_called()
+
+        self.memory.flush()
+        self.memory.retrieve_memory("preferences")
+        self.client.retrieve_memory.assert_called_once_with("preferences")
+
+    def test_delete_replaces_pending_write(self):
+        """A delete after a write sends only the delete"""
+        self.memory.store_memory("scratch", {"a": 1})
+        self.memory.delete_memory("scratch")
+        self.memory.flush()
+        self.client.store_memory_batch.assert_called_once_with([], ["scratch"])
+
+    def test_flushes_at_threshold(self):
+        """Reaching max_pending triggers an immediate flush"""
+        memory = WriteBehindMemoryClient(self.client, flush_interval=3600, max_pending=3)
+        for i in range(3):
+            memory.store_memory(f"key_{i}", {"i": i})
+        self.assertEqual(self.client.store_memory_batch.call_count, 1)
+        self.assertEqual(memory.pending, 0)
+        memory.close()
+
+    def test_failed_flush_is_retried(self):
+        """Entries survive a failed flush without overwriting newer writes"""
+        self.client.store_memory_batch.side_effect = Exception("Request failed")
+        self.memory.store_memory("preferences", {"v": 1})
+        with self.assertRaises(Exception):
+            self.memory.flush()
+        self.memory.store_memory("preferences", {"v": 2})
+
+        self.client.store_memory_batch.side_effect = None
+        self.memory.flush()
+        writes, _ = self.client.store_memory_batch.call_args[0]
+        self.assertEqual(writes, [{"key": "preferences", "data": {"v": 2}}])
+
+    def test_read_during_flush(self):
+        """A write stays visible while its batch is being sent"""
+        sending, release = threading.Event(), threading.Event()
+
+        def slow_batch(writes, deletes):
+            sending.set()
+            release.wait(5)
+            return {"success": True}
+
+        self.client.store_memory_batch.side_effect = slow_batch
+        self.client.retrieve_memory.return_value = Memory("preferences", {"v": "old"}, None, None)
+        self.memory.store_memory("preferences", {"v": "new"})
+        flusher = threading.Thread(target=self.memory.flush)
+        flusher.start()
+        self.assertTrue(sending.wait(5))
+        self.assertEqual(self.memory.pending, 0)
+        self.assertEqual(self.memory.retrieve_memory("preferences").value, {"v": "new"})
+        self.client.retrieve_memory.assert_not_called()
+        release.set()
+        flusher.join()
+        # Acknowledged: reads go to the server again
+        self.assertEqual(self.memory.retrieve_memory("preferences").value, {"v": "old"})
+
+    def test_invalid_writes_are_dropped(self):
+        """Values the server would refuse are reported, not retried"""
+        self.memory.store_memory("scores", [1, 2, 3])
+        self.memory.store_memory("preferences", {"v": 1})
+        self.assertEqual(self.memory.flush(), 1)
+        self.client.store_memory_batch.assert_called_once_with(
+            [{"key": "preferences", "data": {"v": 1}}], []
+        )
+        self.assertIn("list", self.memory.rejected["scores"])
+        self.assertIsInstance(self.memory.last_error, ValueError)
+        self.client.retrieve_memory.return_value = None
+        self.assertIsNone(self.memory.retrieve_memory("scores"))
+        self.assertEqual(self.memory.flush(), 0)
+
+    def test_rejected_batch_is_dropped(self):
+        """A batch refused with 400 is not restored; a 503 is"""
+        error = Exception("API Error: 400 - Invalid request")
+        error.status = 400
+        self.client.store_memory_batch.side_effect = error
+        self.memory.store_memory("preferences", {"v": 1})
+        with self.assertRaises(Exception):
+            self.memory.flush()
+        self.assertEqual(self.memory.pending, 0)
+        self.assertIn("preferences", self.memory.rejected)
+
+        error.status = 503
+        self.memory.store_memory("preferences", {"v": 2})
+        with self.assertRaises(Exception):
+            self.memory.flush()
+        self.assertEqual(self.memory.pending, 1)
+        self.client.store_memory_batch.side_effect = None
+
+    def test_close_flushes(self):
+        """Pending writes are flushed on close"""
+        self.memory.store_memory("preferences", {"category": "audio"})
+        self.memory.close()
+        self.client.store_memory_batch.assert_called_once()
+        with self.assertRaises(RuntimeError):
+            self.memory.store_memory("preferences", {})
+
+
+class TestAsyncWriteBehindMemoryClient(unittest.TestCase):
+    """Test async write-behind client"""
+
+    def test_flush_on_exit(self):
+        """Writes are coalesced and flushed when the context exits"""
+        memory_client = Mock()
+        memory_client.set_many = AsyncMock(return_value={"success": True})
+        memory_client.get = AsyncMock(return_value=None)
+
+        async def run():
+            async with AsyncWriteBehindMemoryClient(memory_client, flush_interval=3600) as memory:
+                await memory.set("preferences", {"v": 1})
+                await memory.set("preferences", {"v": 2})
+                self.assertEqual((await memory.get("preferences"))["data"], {"v": 2})
+                await memory.delete("old")
+
+        asyncio.run(run())
+        memory_client.set_many.assert_awaited_once_with(
+            [{"key": "preferences", "data": {"v": 2}}], ["old"]
+        )
+        memory_client.get.assert_not_awaited()
+
+
+class TestBulkMemoryFetch(unittest.TestCase):
+    """Test multi-get and paginated listing"""
+
+    def test_retrieve_memories_uses_cache_and_mget(self):
+        """Only uncached keys are requested, in one call"""
+        client = AwarenessNetworkClient(api_key="ak_test", memory_cache_size=16)
+        client.memory_cache.set(("ak_test", "a"), Memory("a", {"v": 0}, None, None))
+        with patch.object(client, "_request") as request:
+            request.return_value = {"memories": [_memory("b", {"v": 1})], "missing": ["c"]}
+            found = client.retrieve_memories(["a", "b", "c", "b"])
+
+        request.assert_called_once_with("POST", "/ai/memory/mget", data={"keys": ["b", "c"]})
+        self.assertEqual(found["a"].value, {"v": 0})
+        self.assertEqual(found["b"].value, {"v": 1})
+        self.assertNotIn("c", found)
+
+    def test_iter_memories_follows_cursor(self):
+        """Pages are requested lazily until nextCursor is null"""
+        client = AwarenessNetworkClient(api_key="ak_test")
+        pages = [
+            {"memories": [_memory("a", {}), _memory("b", {})], "nextCursor": "2"},
+            {"memories": [_memory("c", {})], "nextCursor": None},
+        ]
+        with patch.object(client, "_request", side_effect=pages) as request:
+            iterator = client.iter_memories(page_size=2, prefetch=False)
+            self.assertEqual(next(iterator).key, "a")
+            self.assertEqual(request.call_count, 1)
+            self.assertEqual([m.key for m in iterator], ["b", "c"])
+
+        self.assertEqual(
+            request.call_args_list[1][1]["params"],
+            {"includeValues": "true", "limit": 2, "cursor": "2"}
+        )
+
+    def test_async_iter_memories(self):
+        """Async iterator streams every page"""
+        client = AsyncAwarenessClient(api_key="ak_test")
+        client._request = AsyncMock(side_effect=[
+            {"memories": [_memory("a", {})], "nextCursor": "1"},
+            {"memories": [_memory("b", {})], "nextCursor": None},
+        ])
+
+        async def run():
+            return [item["key"] async for item in client.memory.iter_memories(page_size=1)]
+
+        self.assertEqual(asyncio.run(run()), ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+Unit tests for result models
+
+Tests cover:
+- Slotted, frozen models (no __dict__, immutable, picklable, defaults)
+- from_response parsing of camelCase and snake_case responses
+- @model requiring the ResponseModel base
+- Vector.created_at parsed to datetime
+- ResultSet columns, lazy rows, slicing and multi-page extend
+- batch_invoke returning a ResultSet
+"""
+
+import asyncio
+import pickle
+import unittest
+from array import array
+from dataclasses import FrozenInstanceError, replace
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from awareness_network_sdk import LatentVector, Memory
+from awareness_network_sdk.async_client import (
+    AsyncAwarenessClient,
+    InvocationResult,
+    Purchase,
+    Vector,
+)
+from awareness_network_sdk.models import ResponseModel, ResultSet, field_from, model
+
+
+def _catalog_row(vector_id, **overrides):
+    row = {
+        "id": vector_id, "creatorId": 3, "title": f"Vector {vector_id}", "description": None,
+        "category": "nlp", "modelArchitecture": "GPT-4", "vectorDimension": 768,
+        "basePrice": "9.50", "pricingModel": "subscription", "status": "active",
+        "totalCalls": vector_id * 10, "averageRating": "4.20", "reviewCount": 3,
+        "createdAt": "2026-01-05T12:00:00.000Z",
+    }
+    row.update(overrides)
+    return row
+
+
+class TestModels(unittest.TestCase):
+    """Test @model classes"""
+
+    def test_slotted_and_frozen(self):
+        """Instances have no __dict__ and reject assignment"""
+        memory = Memory("preferences", {"category": "nlp"}, "2026-01-01", "2026-01-02")
+        self.assertFalse(hasattr(memory, "__dict__"))
+        self.assertIsNone(memory.version)
+        with self.assertRaises(FrozenInstanceError):
+            memory.value = {}
+        self.assertEqual(replace(memory, version=2).version, 2)
+        self.assertEqual(pickle.loads(pickle.dumps(memory)), memory)
+
+    def test_keyword_and_positional_construction(self):
+        """Generated __init__ accepts the dataclass signature"""
+        vector = LatentVector(id=1, name="a", description="", category="nlp", price=1.0,
+                              dimension=8, model_architecture="x", rating=5.0,
+                              total_calls=0, creator_id=2)
+        self.assertEqual(vector, LatentVector(1, "a", "", "nlp", 1.0, 8, "x", 5.0, 0, 2))
+        with self.assertRaises(TypeError):
+            LatentVector(1, "a")
+
+    def test_from_response(self):
+        """camelCase rows are converted; snake_case keys still work"""
+        vector = LatentVector.from_response(_catalog_row(4))
+        self.assertEqual(
+            (vector.name, vector.description, vector.price, vector.rating),
+            ("Vector 4", "", 9.5, 4.2),
+        )
+        self.assertEqual(LatentVector.from_response({"id": 1, "price": 2.0}).price, 2.0)
+
+        memory = Memory.from_response(
+            {"key": "k", "data": [1], "version": 3, "createdAt": "c", "updatedAt": "u"}
+        )
+        self.assertEqual((memory.value, memory.version, memory.created_at), ([1], 3, "c"))
+
+    def test_vector_created_at_is_datetime(self):
+        """Vector.created_at matches its datetime annotation"""
+        vector = Vector.from_response(_catalog_row(1))
+        self.assertEqual(vector.created_at, datetime(2026, 1, 5, 12, tzinfo=timezone.utc))
+        self.assertEqual(vector.pricing_subscription, 9.5)
+        self.assertEqual(vector.performance_metrics["totalCalls"], 10)
+
+    def test_invocation_and_purchase(self):
+        """Invocation latency and purchase fields come from the right keys"""
+        batch = InvocationResult.from_response(
+            {"vectorId": 1, "success": True, "result": {"output": "x", "latency_ms": 75}}
+        )
+        self.assertEqual((batch.success, batch.latency_ms), (True, 75.0))
+        single = InvocationResult.from_response(
+            {"success": True, "output": {"processingTime": 45}, "callsRemaining": 9}
+        )
+        self.assertEqual((single.latency_ms, single.calls_remaining), (45.0, 9))
+        failed = InvocationResult.from_response(
+            {"vectorId": 2, "success": False, "error": "Processing failed"}
+        )
+        self.assertEqual((failed.success, failed.result, failed.latency_ms), (False, None, 0.0))
+
+        purchase = Purchase.from_response({"transactionId": 7, "vectorId": 4, "accessToken": "tok",
+                                           "expiresAt": "2026-03-01T00:00:00Z"})
+        self.assertEqual(
+            (purchase.id, purchase.pricing_tier, purchase.calls_used), (7, "one-time", 0)
+        )
+        self.assertEqual(purchase.expires_at.month, 3)
+
+    def test_field_from_standalone(self):
+        """field_from getters also work when called directly"""
+        get = field_from("basePrice", "price", convert=float, default=0.0)
+        self.assertEqual(get({"price": "3"}), 3.0)
+        self.assertEqual(get({}), 0.0)
+
+    def test_response_model_base(self):
+        """from_response is inherited from ResponseModel, which @model requires"""
+        self.assertIs(LatentVector.from_response.__func__, ResponseModel.from_response.__func__)
+        self.assertIsInstance(Memory("k", 1, "c", "u"), ResponseModel)
+
+        class Plain:
+            id: int
+
+        with self.assertRaises(TypeError):
+            model(Plain)
+
+
+class TestResultSet(unittest.TestCase):
+    """Test the columnar ResultSet"""
+
+    def setUp(self):
+        self.rows = [_catalog_row(i) for i in range(1, 11)]
+        self.results = ResultSet.from_responses(LatentVector, self.rows)
+
+    def test_rows_match_from_response(self):
+        """Materialized rows equal per-row parsing"""
+        self.assertEqual(len(self.results), 10)
+        self.assertEqual(list(self.results), [LatentVector.from_response(r) for r in self.rows])
+        self.assertEqual(self.results[-1].id, 10)
+        with self.assertRaises(IndexError):
+            self.results[10]
+
+    def test_numeric_columns_are_packed(self):
+        """int/float fields are stored as arrays, others as lists"""
+        self.assertIsInstance(self.results.column("price"), array)
+        self.assertIsInstance(self.results.column("total_calls"), array)
+        self.assertIsInstance(self.results.column("name"), list)
+        self.assertEqual(list(self.results.column("total_calls")), [i * 10 for i in range(1, 11)])
+        with self.assertRaises(KeyError):
+            self.results.column("missing")
+
+    def test_slice_and_extend(self):
+        """Slices are ResultSets; pages append column-wise"""
+        head = self.results[2:5]
+        self.assertIsInstance(head, ResultSet)
+        self.assertEqual([v.id for v in head], [3, 4, 5])
+
+        self.results.extend([_catalog_row(11)])
+        self.assertEqual(len(self.results), 11)
+        self.assertEqual(self.results[10].total_calls, 110)
+
+    def test_nullable_numeric_column_falls_back_to_list(self):
+        """A null in a later page converts the packed column"""
+        results = ResultSet.from_responses(Purchase, [
+            {"transactionId": 1, "vectorId": 1, "buyerId": 5, "accessToken": "a"},
+        ])
+        self.assertIsInstance(results.column("buyer_id"), array)
+        results.extend([{"transactionId": 2, "vectorId": 1, "accessToken": "b"}])
+        self.assertEqual(list(results.column("buyer_id")), [5, None])
+        self.assertIsNone(results[1].buyer_id)
+
+    def test_batch_invoke_returns_result_set(self):
+        """Async batch_invoke parses results into columns"""
+        client = AsyncAwarenessClient(api_key="ak_test")
+        client._request = AsyncMock(return_value={
+            "summary": {"total": 2, "successful": 1, "failed": 1},
+            "results": [
+                {"vectorId": 1, "success": True, "result": {"latency_ms": 60}},
+                {"vectorId": 2, "success": False, "error": "Vector not found or inactive"},
+            ],
+        })
+        results = asyncio.run(client.vectors.batch_invoke([{"vectorId": 1}, {"vectorId": 2}]))
+        self.assertIsInstance(results, ResultSet)
+        self.assertEqual([r.success for r in results], [True, False])
+        self.assertEqual(list(results.column("latency_ms")), [60.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,201 @@
+"""
+Unit tests for auto-paginating iterators
+
+Tests cover:
+- Following nextCursor until it is null, with and without prefetch
+- The next page being requested while the current one is consumed
+- Stopping early without requesting further pages
+- iter_vectors / iter_purchases / iter_api_keys on the sync client
+- aiter_vectors / aiter_purchases on the async client
+"""
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from awareness_network_sdk import AwarenessNetworkClient, LatentVector, PurchaseAccess
+from awareness_network_sdk.async_client import AsyncAwarenessClient, Purchase, Vector
+from awareness_network_sdk.pagination import AsyncCursorPaginator, CursorPaginator
+
+
+def _pages(total, page_size, key="items"):
+    """Responses for ``total`` integer items split into pages"""
+    pages = []
+    for start in range(0, total, page_size):
+        end = min(start + page_size, total)
+        pages.append(
+            {key: list(range(start, end)), "nextCursor": str(end) if end < total else None}
+        )
+    return pages
+
+
+def _catalog_row(vector_id):
+    return {
+        "id": vector_id, "creatorId": 3, "title": f"Vector {vector_id}", "description": None,
+        "category": "nlp", "modelArchitecture": "GPT-4", "vectorDimension": 768,
+        "basePrice": "9.50", "pricingModel": "per-call", "status": "active",
+        "totalCalls": 12, "averageRating": "4.20", "reviewCount": 3,
+        "createdAt": "2026-01-05T00:00:00.000Z", "updatedAt": "2026-01-06T00:00:00.000Z",
+    }
+
+
+def _purchase_row(transaction_id):
+    return {
+        "transactionId": transaction_id, "buyerId": 5, "transactionType": "one-time",
+        "vectorId": 40 + transaction_id, "accessToken": f"tok_{transaction_id}",
+        "expiresAt": None, "callsRemaining": 100, "isActive": True,
+    }
+
+
+class TestCursorPaginator(unittest.TestCase):
+    """Test the sync paginator"""
+
+    def test_follows_cursor(self):
+        """Every page is fetched in order with the previous cursor"""
+        for prefetch in (False, True):
+            calls = []
+            pages = iter(_pages(10, 4))
+
+            def request(params):
+                calls.append(params)
+                return next(pages)
+
+            paginator = CursorPaginator(request, "items", parse=lambda x: x * 2,
+                                        params={"status": "active"}, page_size=4, prefetch=prefetch)
+            self.assertEqual(list(paginator), [x * 2 for x in range(10)])
+            self.assertEqual(calls, [
+                {"status": "active", "limit": 4},
+                {"status": "active", "limit": 4, "cursor": "4"},
+                {"status": "active", "limit": 4, "cursor": "8"},
+            ])
+
+    def test_prefetches_next_page(self):
+        """The second page is requested before the first is fully consumed"""
+        pages = _pages(4, 2)
+        second_requested = threading.Event()
+
+        def request(params):
+            if "cursor" in params:
+                second_requested.set()
+                return pages[1]
+            return pages[0]
+
+        iterator = iter(CursorPaginator(request, "items", page_size=2))
+        self.assertEqual(next(iterator), 0)
+        self.assertTrue(second_requested.wait(timeout=5))
+        self.assertEqual(list(iterator), [1, 2, 3])
+
+    def test_stops_early(self):
+        """Breaking out does not walk the remaining pages"""
+        calls = []
+        pages = _pages(100, 10)
+
+        def request(params):
+            calls.append(params)
+            return pages[int(params.get("cursor", 0)) // 10]
+
+        for item in CursorPaginator(request, "items", page_size=10, prefetch=False):
+            if item == 12:
+                break
+        self.assertEqual(len(calls), 2)
+
+    def test_empty(self):
+        """An empty first page ends iteration"""
+        paginator = CursorPaginator(lambda params: {"items": [], "nextCursor": None}, "items")
+        self.assertEqual(list(paginator), [])
+
+
+class TestAsyncCursorPaginator(unittest.TestCase):
+    """Test the async paginator"""
+
+    def test_prefetches_next_page(self):
+        """The next page is in flight while the caller awaits other work"""
+        pages = _pages(6, 2)
+        started = []
+
+        async def request(params):
+            started.append(params.get("cursor"))
+            await asyncio.sleep(0)
+            return pages[int(params.get("cursor", 0)) // 2]
+
+        async def run():
+            seen = []
+            async for item in AsyncCursorPaginator(request, "items", page_size=2):
+                if item == 0:
+                    await asyncio.sleep(0.01)
+                    seen.append(list(started))
+                seen.append(item)
+            return seen
+
+        seen = asyncio.run(run())
+        self.assertEqual(seen[0], [None, "2"])
+        self.assertEqual(seen[1:], list(range(6)))
+
+
+class TestClientIterators(unittest.TestCase):
+    """Test the iterators exposed by the clients"""
+
+    def test_iter_vectors(self):
+        """Catalog rows are parsed into LatentVector listings"""
+        client = AwarenessNetworkClient(api_key="ak_test")
+        pages = [
+            {"vectors": [_catalog_row(1), _catalog_row(2)], "nextCursor": "c1"},
+            {"vectors": [_catalog_row(3)], "nextCursor": None},
+        ]
+        with patch.object(client, "_request", side_effect=pages) as request:
+            vectors = list(client.iter_vectors(category="nlp", page_size=2, prefetch=False))
+
+        self.assertEqual([v.id for v in vectors], [1, 2, 3])
+        self.assertIsInstance(vectors[0], LatentVector)
+        self.assertEqual(
+            (vectors[0].price, vectors[0].rating, vectors[0].description), (9.5, 4.2, "")
+        )
+        request.assert_called_with(
+            "GET", "/vectors/catalog",
+            params={"status": "active", "category": "nlp", "limit": 2, "cursor": "c1"}
+        )
+
+    def test_iter_purchases_and_keys(self):
+        """Purchases and API keys follow their cursors"""
+        client = AwarenessNetworkClient(api_key="ak_test")
+        with patch.object(client, "_request", side_effect=[
+            {"purchases": [_purchase_row(1)], "nextCursor": "1"},
+            {"purchases": [_purchase_row(2)], "nextCursor": None},
+        ]):
+            purchases = list(client.iter_purchases(page_size=1))
+        self.assertEqual(purchases[1], PurchaseAccess("tok_2", 42, None, None, 100))
+
+        with patch.object(
+            client, "_request", return_value={"keys": [{"id": 1}], "nextCursor": None}
+        ) as request:
+            self.assertEqual(list(client.iter_api_keys()), [{"id": 1}])
+        request.assert_called_once_with("GET", "/ai/keys", params={"limit": 100})
+
+    def test_async_iterators(self):
+        """Async iterators parse Vector and Purchase objects"""
+        client = AsyncAwarenessClient(api_key="ak_test")
+        client._request = AsyncMock(side_effect=[
+            {"vectors": [_catalog_row(1)], "nextCursor": "c1"},
+            {"vectors": [_catalog_row(2)], "nextCursor": None},
+            {"purchases": [_purchase_row(7)], "nextCursor": None},
+        ])
+
+        async def run():
+            vectors = [v async for v in client.vectors.aiter_vectors(page_size=1)]
+            purchases = [p async for p in client.vectors.aiter_purchases()]
+            return vectors, purchases
+
+        vectors, purchases = asyncio.run(run())
+        self.assertEqual([v.id for v in vectors], [1, 2])
+        self.assertIsInstance(vectors[0], Vector)
+        self.assertEqual(vectors[0].created_at.year, 2026)
+        self.assertEqual(vectors[0].performance_metrics["totalCalls"], 12)
+        self.assertIsInstance(purchases[0], Purchase)
+        self.assertEqual(
+            (purchases[0].id, purchases[0].vector_id, purchases[0].access_token), (7, 47, "tok_7")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
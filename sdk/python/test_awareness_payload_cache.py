@@ -0,0 +1,178 @@
+"""
+Unit tests for the vector payload cache
+
+Tests cover:
+- Memory LRU bounded by payload bytes
+- Disk tier persistence, integrity checks and eviction
+- Falling back to memory when the disk tier is unusable
+- Single-flight loading under concurrent misses
+- The on-disk layout shared with the server cache
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from awareness_network_sdk.payload_cache import VectorPayloadCache, content_digest, key_digest
+
+
+def payload(n):
+    return b'{"weights": [' + b",".join(b"1" for _ in range(n)) + b"]}"
+
+
+class CountingDownload:
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+
+    def __call__(self, key):
+        self.calls.append(key)
+        time.sleep(self.delay)
+        return payload(len(key))
+
+
+class TestMemoryTier(unittest.TestCase):
+    """Test the in-process LRU"""
+
+    def test_hit_after_miss(self):
+        """The second get is served from memory"""
+        cache = VectorPayloadCache()
+        download = CountingDownload()
+        first = cache.get("vectors/1/a.bin", download)
+        self.assertIs(cache.get("vectors/1/a.bin", download), first)
+        self.assertEqual(len(download.calls), 1)
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (1, 1))
+
+    def test_evicts_by_bytes(self):
+        """The least recently used payload is dropped once the byte budget is exceeded"""
+        size = len(payload(len("k1")))
+        cache = VectorPayloadCache(max_bytes=2 * size)
+        download = CountingDownload()
+        cache.get("k1", download)
+        cache.get("k2", download)
+        cache.get("k1", download)
+        cache.get("k3", download)
+        self.assertEqual(cache.stats()["bytes"], 2 * size)
+        cache.get("k1", download)
+        cache.get("k2", download)
+        self.assertEqual(download.calls, ["k1", "k2", "k3", "k2"])
+
+    def test_oversized_payload_not_kept(self):
+        """A payload larger than the whole budget is returned but not cached"""
+        cache = VectorPayloadCache(max_bytes=4)
+        self.assertEqual(cache.get("big", CountingDownload()), {"weights": [1, 1, 1]})
+        self.assertEqual(cache.stats()["entries"], 0)
+
+
+class TestDiskTier(unittest.TestCase):
+    """Test the persistent tier"""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def test_shared_layout(self):
+        """Files are named <sha256(key)>.<sha256(payload)[:16]>.payload"""
+        VectorPayloadCache(disk_dir=self.dir.name).get("vectors/9/x.bin", CountingDownload())
+        body = payload(len("vectors/9/x.bin"))
+        expected = (
+            f"{hashlib.sha256(b'vectors/9/x.bin').hexdigest()}."
+            f"{hashlib.sha256(body).hexdigest()[:16]}.payload"
+        )
+        self.assertEqual(os.listdir(self.dir.name), [expected])
+        with open(os.path.join(self.dir.name, expected), "rb") as handle:
+            self.assertEqual(handle.read(), body)
+
+    def test_survives_restart(self):
+        """A new cache over the same directory loads from disk, not the network"""
+        VectorPayloadCache(disk_dir=self.dir.name).get("k", CountingDownload())
+        download = CountingDownload()
+        cache = VectorPayloadCache(disk_dir=self.dir.name)
+        self.assertEqual(cache.get("k", download), {"weights": [1]})
+        self.assertEqual(download.calls, [])
+        self.assertEqual(cache.stats()["disk_hits"], 1)
+
+    def test_reads_server_written_file(self):
+        """A file placed by another process with the shared layout is used"""
+        body = b'{"dims": 4}'
+        name = f"{key_digest('vectors/2/y.bin')}.{content_digest(body)}.payload"
+        with open(os.path.join(self.dir.name, name), "wb") as handle:
+            handle.write(body)
+        self.assertEqual(
+            VectorPayloadCache(disk_dir=self.dir.name).get("vectors/2/y.bin", CountingDownload()),
+            {"dims": 4},
+        )
+
+    def test_unusable_directory_skipped(self):
+        """A disk tier that cannot be created falls back to memory and download"""
+        blocker = os.path.join(self.dir.name, "blocker")
+        with open(blocker, "wb"):
+            pass
+        download = CountingDownload()
+        cache = VectorPayloadCache(disk_dir=os.path.join(blocker, "cache"))
+        self.assertEqual(cache.get("k", download), {"weights": [1]})
+        self.assertEqual(download.calls, ["k"])
+        self.assertEqual(cache.stats()["disk_entries"], 0)
+
+    def test_corrupt_file_discarded(self):
+        """Bytes that do not match the content hash are re-downloaded"""
+        VectorPayloadCache(disk_dir=self.dir.name).get("k", CountingDownload())
+        (name,) = os.listdir(self.dir.name)
+        with open(os.path.join(self.dir.name, name), "wb") as handle:
+            handle.write(b'{"weights": [')
+        download = CountingDownload()
+        cache = VectorPayloadCache(disk_dir=self.dir.name)
+        self.assertEqual(cache.get("k", download), {"weights": [1]})
+        self.assertEqual(download.calls, ["k"])
+        self.assertEqual(os.listdir(self.dir.name), [name])
+
+    def test_disk_eviction_and_invalidate(self):
+        """The disk tier stays under its byte budget; invalidate removes files"""
+        size = len(payload(2))
+        cache = VectorPayloadCache(disk_dir=self.dir.name, disk_max_bytes=2 * size)
+        for key in ("k1", "k2", "k3"):
+            cache.get(key, CountingDownload())
+        self.assertEqual(len(os.listdir(self.dir.name)), 2)
+        self.assertNotIn(key_digest("k1"), {n.split(".")[0] for n in os.listdir(self.dir.name)})
+        cache.invalidate("k3")
+        self.assertEqual(len(os.listdir(self.dir.name)), 1)
+        self.assertEqual(cache.stats()["entries"], 2)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test concurrent miss deduplication"""
+
+    def test_concurrent_misses_share_download(self):
+        """Threads missing on one key wait for a single download"""
+        cache = VectorPayloadCache()
+        download = CountingDownload(delay=0.05)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get("hot", download)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(download.calls, ["hot"])
+        self.assertEqual(len(results), 8)
+        self.assertEqual(cache.stats()["shared_loads"] + cache.stats()["hits"], 7)
+
+    def test_failure_propagates_and_clears(self):
+        """Waiters see the download error and the next call retries"""
+        cache = VectorPayloadCache()
+
+        def failing(key):
+            raise ConnectionError("storage unavailable")
+
+        with self.assertRaises(ConnectionError):
+            cache.get("k", failing)
+        self.assertEqual(cache.get("k", CountingDownload()), {"weights": [1]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+Unit tests for client-side quota tracking
+
+Tests cover:
+- Exhausted and expired tokens rejected before any request is sent
+- Local counts updated from each result's remaining calls
+- Rerouting to another token for the same vector
+- Server quota errors marking a token unusable until re-tracked
+- Calls in flight counted against the quota across threads
+- Seeding from purchase listings and the snapshot API
+- The async client's invoke path
+"""
+
+import asyncio
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+from awareness_network_sdk import AwarenessNetworkClient, QuotaExceededError, QuotaTracker
+from awareness_network_sdk.async_client import AsyncAwarenessClient
+
+
+def _mcp_result(calls_remaining):
+    return {
+        "success": True,
+        "result": {"output": []},
+        "usage": {"calls_remaining": calls_remaining},
+    }
+
+
+class TestQuotaTracker(unittest.TestCase):
+    """Test the tracker on its own"""
+
+    def setUp(self):
+        self.quota = QuotaTracker()
+
+    def test_untracked_token_passes_through(self):
+        """Tokens the tracker has never seen are not second-guessed"""
+        self.assertEqual(self.quota.acquire(1, "unknown"), "unknown")
+        self.quota.settle("unknown", 0)
+        self.assertIsNone(self.quota.remaining("unknown"))
+
+    def test_in_flight_counts_against_quota(self):
+        """The last calls cannot be handed out twice"""
+        self.quota.track("tok", 1, remaining_calls=2)
+        self.quota.acquire(1, "tok")
+        self.quota.acquire(1, "tok")
+        self.assertEqual(self.quota.remaining("tok"), 0)
+        with self.assertRaises(QuotaExceededError) as ctx:
+            self.quota.acquire(1, "tok")
+        self.assertEqual(ctx.exception.reason, "call limit exhausted")
+
+    def test_settle_without_count_decrements(self):
+        """A result without a remaining count still uses up one call"""
+        self.quota.track("tok", 1, remaining_calls=3)
+        self.quota.settle(self.quota.acquire(1, "tok"))
+        self.assertEqual(self.quota.remaining("tok"), 2)
+
+    def test_unlimited_token(self):
+        """A null call limit never runs out"""
+        self.quota.track("tok", 1, remaining_calls=None)
+        for _ in range(100):
+            self.quota.settle(self.quota.acquire(1, "tok"))
+        self.assertFalse(self.quota.snapshot()[0].exhausted)
+
+    def test_expired_token(self):
+        """Tokens past their expiry are rejected"""
+        expired = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+        self.quota.track("tok", 1, remaining_calls=10, expires_at=expired)
+        with self.assertRaises(QuotaExceededError) as ctx:
+            self.quota.acquire(1, "tok")
+        self.assertEqual(ctx.exception.reason, "access token expired")
+
+    def test_concurrent_acquire(self):
+        """Threads racing for a quota get exactly the calls that exist"""
+        self.quota.track("tok", 1, remaining_calls=50)
+        granted, rejected = [], []
+
+        def worker():
+            for _ in range(20):
+                try:
+                    granted.append(self.quota.acquire(1, "tok"))
+                except QuotaExceededError:
+                    rejected.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(granted), 50)
+        self.assertEqual(len(rejected), 110)
+        self.assertEqual(self.quota.snapshot()[0].in_flight, 50)
+
+
+class TestClientQuota(unittest.TestCase):
+    """Test quota checks in the sync client"""
+
+    def setUp(self):
+        self.client = AwarenessNetworkClient(api_key="test_key")
+
+    def test_rejected_without_request(self):
+        """An exhausted token fails before the network is touched"""
+        self.client.quota.reroute = False
+        self.client.quota.track("tok", 7, remaining_calls=0)
+        with patch.object(self.client, "_request") as request:
+            with self.assertRaises(QuotaExceededError) as ctx:
+                self.client.mcp_invoke(7, "hello", "tok")
+        request.assert_not_called()
+        self.assertEqual((ctx.exception.access_token, ctx.exception.vector_id), ("tok", 7))
+
+    def test_count_updated_from_result(self):
+        """The server's remaining count replaces the local estimate"""
+        self.client.quota.track("tok", 7, remaining_calls=10)
+        with patch.object(
+            self.client, "_request", side_effect=[_mcp_result(1), _mcp_result(0)]
+        ) as request:
+            self.client.mcp_invoke(7, "hello", "tok")
+            self.client.mcp_invoke(7, "hello", "tok")
+            with self.assertRaises(QuotaExceededError):
+                self.client.mcp_invoke(7, "hello", "tok")
+        self.assertEqual(request.call_count, 2)
+        call = request.call_args
+        self.assertEqual(call.kwargs["headers"], {"Authorization": "Bearer tok"})
+        self.assertEqual(call.kwargs["data"], {"vector_id": 7, "context": "hello"})
+
+    def test_reroute(self):
+        """An exhausted token is swapped for another token on the same vector"""
+        self.client.quota.track("spent", 7, remaining_calls=0)
+        self.client.quota.track("other-vector", 8, remaining_calls=5)
+        self.client.quota.track("fresh", 7, remaining_calls=5)
+        with patch.object(self.client, "_request", return_value=_mcp_result(4)) as request:
+            self.client.mcp_invoke(7, "hello", "spent")
+        self.assertEqual(request.call_args.kwargs["headers"], {"Authorization": "Bearer fresh"})
+        self.assertEqual(self.client.quota.remaining("fresh"), 4)
+
+    def test_server_quota_error(self):
+        """A server-side limit error marks the token until it is tracked again"""
+        self.client.quota.track("tok", 7, remaining_calls=5)
+        error = Exception("API Error: 429 - {'error': 'Call limit exceeded'}")
+        with patch.object(self.client, "_request", side_effect=error):
+            with self.assertRaises(Exception):
+                self.client.mcp_invoke(7, "hello", "tok")
+        snapshot = self.client.quota.snapshot()[0]
+        self.assertTrue(snapshot.exhausted)
+        self.assertEqual(snapshot.in_flight, 0)
+        self.client.quota.track("tok", 7, remaining_calls=5)
+        self.assertFalse(self.client.quota.snapshot()[0].exhausted)
+
+    def test_other_errors_release_call(self):
+        """A failed call gives its slot back without marking the token"""
+        self.client.quota.track("tok", 7, remaining_calls=1)
+        with patch.object(
+            self.client, "_request", side_effect=Exception("Request failed: timeout")
+        ):
+            with self.assertRaises(Exception):
+                self.client.mcp_invoke(7, "hello", "tok")
+        self.assertEqual(self.client.quota.remaining("tok"), 1)
+
+    def test_sync_quotas(self):
+        """Purchases seed the tracker"""
+        purchases = {
+            "purchases": [
+                {
+                    "accessToken": "a",
+                    "vectorId": 1,
+                    "callsRemaining": 3,
+                    "expiresAt": "2099-01-01T00:00:00Z",
+                },
+                {"accessToken": "b", "vectorId": 2, "callsRemaining": None, "expiresAt": None},
+            ],
+            "nextCursor": None,
+        }
+        with patch.object(self.client, "_request", return_value=purchases):
+            snapshot = self.client.sync_quotas()
+        self.assertEqual(
+            [(q.access_token, q.remaining_calls) for q in snapshot], [("a", 3), ("b", None)]
+        )
+        self.assertEqual(snapshot[0].expires_at.year, 2099)
+
+
+class TestAsyncClientQuota(unittest.TestCase):
+    """Test quota checks in the async client"""
+
+    def test_invoke(self):
+        """Results update the tracker and exhausted tokens are never sent"""
+        client = AsyncAwarenessClient(api_key="test_key", quota_reroute=False)
+        client.quota.track("tok", 3, remaining_calls=2)
+        client._request = AsyncMock(
+            return_value={"success": True, "output": {}, "callsRemaining": 0}
+        )
+
+        async def run():
+            result = await client.vectors.invoke(3, {"text": "hi"}, access_token="tok")
+            self.assertEqual(result.calls_remaining, 0)
+            with self.assertRaises(QuotaExceededError):
+                await client.vectors.invoke(3, {"text": "hi"}, access_token="tok")
+
+        asyncio.run(run())
+        self.assertEqual(client._request.await_count, 1)
+        self.assertEqual(client.quota.remaining("tok"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
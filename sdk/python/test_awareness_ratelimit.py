@@ -0,0 +1,136 @@
+"""
+Unit tests for client-side rate limiting
+
+Tests cover:
+- Bursts allowed up to the bucket size, then paced at the advertised rate
+- Daily budgets spent freely until exhausted
+- Separate buckets per API key and endpoint class
+- Limits read from the discovery payload
+- Retry-After pauses after a 429
+- Threads and asyncio tasks sharing one limiter
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from awareness_network_sdk import AwarenessNetworkClient, RateLimiter
+from awareness_network_sdk.async_client import AsyncAwarenessClient
+
+INVOKE_LIMITS = {"invoke": {"calls_per_minute": 60, "calls_per_day": 10000}}
+
+
+@pytest.mark.usefixtures("fake_clock")
+class TestRateLimiter(unittest.TestCase):
+    """Test bucket arithmetic with a fake clock"""
+
+    def setUp(self):
+        self.limiter = RateLimiter(INVOKE_LIMITS, clock=self.clock, sleep=self.clock.sleep)
+
+    def test_burst_then_paced(self):
+        """Ten seconds' worth of calls go at once, the rest one per second"""
+        delays = [self.limiter.reserve("key", "/mcp/invoke") for _ in range(13)]
+        self.assertEqual(delays[:10], [0.0] * 10)
+        self.assertEqual(delays[10:], [1.0, 2.0, 3.0])
+        self.assertEqual(self.limiter.stats["delayed"], 3)
+
+    def test_sustained_rate(self):
+        """Blocking acquire settles at the per-minute rate"""
+        for _ in range(130):
+            self.limiter.acquire("key", "/mcp/invoke")
+        self.assertAlmostEqual(self.clock.now, 120.0)
+
+    def test_daily_budget(self):
+        """A daily limit is a budget, not a pace"""
+        limiter = RateLimiter({"invoke": {"calls_per_day": 5}}, clock=self.clock)
+        self.assertEqual([limiter.reserve("key", "/invoke") for _ in range(5)], [0.0] * 5)
+        self.assertAlmostEqual(limiter.reserve("key", "/invoke"), 86400 / 5)
+
+    def test_buckets_per_key_and_class(self):
+        """Other keys and unlimited classes are unaffected by a drained bucket"""
+        for _ in range(10):
+            self.limiter.reserve("key", "/mcp/invoke")
+        self.assertGreater(self.limiter.reserve("key", "/mcp/invoke"), 0)
+        self.assertEqual(self.limiter.reserve("other", "/mcp/invoke"), 0.0)
+        self.assertEqual(self.limiter.reserve("key", "/ai/memory/notes"), 0.0)
+
+    def test_flat_limits_apply_to_invoke(self):
+        """Vector details' flat rate_limits configure the invoke class"""
+        limiter = RateLimiter({"calls_per_minute": 6})
+        self.assertEqual(limiter.limits(), {"invoke": {"calls_per_minute": 6.0}})
+
+    def test_pause(self):
+        """Retry-After holds a class back even without advertised limits"""
+        self.limiter.pause("key", "/ai/memory/notes", 5)
+        self.assertEqual(self.limiter.reserve("key", "/ai/memory/notes"), 5.0)
+        self.clock.now += 5
+        self.assertEqual(self.limiter.reserve("key", "/ai/memory/notes"), 0.0)
+
+    def test_threads_share_buckets(self):
+        """Concurrent threads never overdraw a bucket"""
+        limiter = RateLimiter({"invoke": {"calls_per_second": 100}}, burst_seconds=0.1)
+        started = time.monotonic()
+        threads = [
+            threading.Thread(target=lambda: [limiter.acquire("key", "/invoke") for _ in range(10)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 40 calls, 10 in the first burst, then 100/s
+        self.assertGreaterEqual(time.monotonic() - started, 0.25)
+
+
+class TestClientRateLimiting(unittest.TestCase):
+    """Test the clients' use of the limiter"""
+
+    def test_discovery_configures_limiter(self):
+        """mcp_discover applies the advertised limits"""
+        client = AwarenessNetworkClient(api_key="ak_test", rate_limiter=RateLimiter())
+        with patch.object(
+            client, "_request", return_value={"vectors": [], "rate_limits": INVOKE_LIMITS}
+        ):
+            limits = client.sync_rate_limits()
+        self.assertEqual(limits["invoke"]["calls_per_minute"], 60.0)
+
+    def test_sync_requests_paced(self):
+        """Each request waits for a token before it is sent"""
+        limiter = RateLimiter({"invoke": {"calls_per_minute": 60}}, burst_seconds=1)
+        limiter._sleep = MagicMock()
+        client = AwarenessNetworkClient(api_key="ak_test", rate_limiter=limiter)
+        response = MagicMock(content=b'{"usage": {"calls_remaining": null}}')
+        with patch.object(client.session, "request", return_value=response) as request:
+            client.mcp_invoke(1, "hi", "tok")
+            client.mcp_invoke(1, "hi", "tok")
+        self.assertEqual(request.call_count, 2)
+        limiter._sleep.assert_called_once()
+
+    def test_shared_by_default(self):
+        """Clients share the process-wide limiter unless told otherwise"""
+        first = AwarenessNetworkClient(api_key="ak_test")
+        second = AsyncAwarenessClient(api_key="ak_test")
+        self.assertIs(first.rate_limiter, second.rate_limiter)
+        self.assertIsNone(AwarenessNetworkClient(rate_limiter=False).rate_limiter)
+
+    def test_async_tasks_share_buckets(self):
+        """Tasks awaiting the limiter are spread over the window"""
+        limiter = RateLimiter({"invoke": {"calls_per_second": 50}}, burst_seconds=0.1)
+
+        async def run():
+            started = time.monotonic()
+            await asyncio.gather(
+                *(limiter.acquire_async("key", "/api/vectors/invoke") for _ in range(15))
+            )
+            return time.monotonic() - started
+
+        # 15 calls, 5 in the first burst, then 50/s
+        self.assertGreaterEqual(asyncio.run(run()), 0.18)
+
+
+if __name__ == "__main__":
+    unittest.main()
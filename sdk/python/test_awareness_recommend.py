@@ -0,0 +1,211 @@
+"""
+Unit tests for sparse collaborative filtering
+
+Tests cover:
+- CSR construction with duplicate summing
+- Sparse cosine neighbors against a dense reference
+- Recommendations matching the server's averaging
+- Incremental updates and neighbor refresh
+- Neighbor list persistence
+- Implicit ALS training, fold-in, persistence and JSON export
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from awareness_network_sdk.als import ImplicitALS
+from awareness_network_sdk.recommend import (
+    ACTION_WEIGHTS,
+    CollaborativeFilter,
+    CSRMatrix,
+    InteractionMatrix,
+)
+
+
+def _behaviors(seed=0, users=40, items=25, events=400):
+    rng = np.random.default_rng(seed)
+    actions = list(ACTION_WEIGHTS)
+    return [
+        {"userId": int(u) + 1000, "vectorId": int(v) + 1, "actionType": actions[a]}
+        for u, v, a in zip(
+            rng.integers(0, users, events), rng.integers(0, items, events),
+            rng.integers(0, len(actions), events)
+        )
+    ]
+
+
+def _dense(matrix):
+    dense = np.zeros(matrix.shape)
+    rows, cols, data = matrix.to_coo()
+    dense[rows, cols] = data
+    return dense
+
+
+class TestCSRMatrix(unittest.TestCase):
+    """Test CSR primitives"""
+
+    def test_from_coo_sums_duplicates(self):
+        """Repeated coordinates are summed; transpose round-trips"""
+        m = CSRMatrix.from_coo(
+            np.array([0, 0, 2]), np.array([1, 1, 0]), np.array([1.0, 2.0, 5.0]), (3, 2)
+        )
+        np.testing.assert_array_equal(_dense(m), [[0, 3], [0, 0], [5, 0]])
+        np.testing.assert_array_equal(_dense(m.transpose()), _dense(m).T)
+        np.testing.assert_allclose(m.row_norms(), [3, 0, 5])
+
+
+class TestCollaborativeFilter(unittest.TestCase):
+    """Test CollaborativeFilter"""
+
+    def setUp(self):
+        self.interactions = InteractionMatrix.from_behaviors(_behaviors())
+        self.cf = CollaborativeFilter(self.interactions, k=5)
+
+    def _reference_neighbors(self, row, k):
+        dense = _dense(self.interactions.csr)
+        norms = np.linalg.norm(dense, axis=1)
+        sims = dense @ dense[row] / (norms * norms[row])
+        sims[row] = 0
+        order = np.argsort(-sims, kind="stable")[:k]
+        return sims[order]
+
+    def test_user_neighbors_match_dense(self):
+        """Sparse top-k equals brute-force cosine"""
+        lists = self.cf.compute_user_neighbors()
+        for row in range(len(self.interactions.user_ids)):
+            _, sims = lists.get(row)
+            np.testing.assert_allclose(
+                sims, self._reference_neighbors(row, 5)[: len(sims)], rtol=1e-5
+            )
+
+    def test_item_neighbors(self):
+        """Item-item lists are computed on the transpose"""
+        lists = self.cf.compute_item_neighbors()
+        dense = _dense(self.interactions.csc)
+        norms = np.linalg.norm(dense, axis=1)
+        neighbors, sims = lists.get(0)
+        expected = dense[neighbors] @ dense[0] / (norms[neighbors] * norms[0])
+        np.testing.assert_allclose(sims, expected, rtol=1e-5)
+
+    def test_recommend(self):
+        """Scores are the similarity-weighted average over similar users"""
+        user_id = self.interactions.user_ids[0]
+        recs = self.cf.recommend(user_id, limit=3)
+        self.assertLessEqual(len(recs), 3)
+
+        dense = _dense(self.interactions.csr)
+        neighbors, sims = self.cf.user_neighbors.get(0)
+        seen = set(np.flatnonzero(dense[0]).tolist())
+        for rec in recs:
+            col = self.interactions.item_col(rec["vectorId"])
+            self.assertNotIn(col, seen)
+            mask = dense[neighbors, col] > 0
+            expected = (dense[neighbors, col] * sims)[mask].sum() / mask.sum()
+            self.assertAlmostEqual(rec["score"], expected, places=4)
+            self.assertEqual(rec["reason"], f"Recommended by {mask.sum()} similar users")
+
+        self.assertEqual(self.cf.recommend(999999), [])
+
+    def test_incremental_refresh(self):
+        """New interactions update the matrix and affected neighbor lists"""
+        self.cf.compute_user_neighbors()
+        self.assertEqual(self.cf.refresh(), 0)
+
+        # A brand new user copying user 0's history becomes their top neighbor
+        target = self.interactions.user_ids[0]
+        dense_row = _dense(self.interactions.csr)[0]
+        for col in np.flatnonzero(dense_row).tolist():
+            self.interactions.add(777, self.interactions.item_ids[col], "purchase")
+        self.assertGreater(self.cf.refresh(), 1)
+
+        similar = self.cf.similar_users(777, top_n=1)
+        self.assertEqual(similar[0]["userId"], target)
+        self.assertEqual(self.cf.similar_users(target, top_n=1)[0]["userId"], 777)
+
+    def test_save_and_load(self):
+        """Persisted lists are remapped onto a rebuilt matrix"""
+        self.cf.compute_user_neighbors()
+        self.cf.compute_item_neighbors()
+        expected = self.cf.similar_users(self.interactions.user_ids[3])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "neighbors.npz")
+            self.cf.save(path)
+            # Same data in a different order yields different row numbers
+            rebuilt = InteractionMatrix.from_behaviors(reversed(_behaviors()))
+            loaded = CollaborativeFilter(rebuilt)
+            loaded.load(path)
+
+        self.assertEqual(loaded.k, 5)
+        actual = loaded.similar_users(self.interactions.user_ids[3])
+        self.assertEqual([u["userId"] for u in actual], [u["userId"] for u in expected])
+        self.assertIsNotNone(loaded.item_neighbors)
+
+
+def _two_communities():
+    """Users 0-19 use vectors 1-10, users 20-39 use vectors 11-20; each skips one"""
+    rows = []
+    for user in range(40):
+        items = range(1, 11) if user < 20 else range(11, 21)
+        for item in items:
+            if item % 10 != user % 10:
+                rows.append({"userId": user, "vectorId": item, "actionType": "purchase"})
+    return rows
+
+
+class TestImplicitALS(unittest.TestCase):
+    """Test ImplicitALS"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.interactions = InteractionMatrix.from_behaviors(_two_communities())
+        cls.model = ImplicitALS(factors=4, iterations=10, seed=0).fit(cls.interactions)
+
+    def test_recommends_within_community(self):
+        """The skipped vector of the user's own community ranks first"""
+        recs = self.model.recommend(3, limit=2)
+        self.assertEqual(recs[0]["vectorId"], 3)
+        self.assertTrue(all(r["vectorId"] not in (1, 2, 4) for r in recs))
+        self.assertEqual(self.model.recommend(12345), [])
+
+    def test_fold_in(self):
+        """Unseen users are scored against the trained item factors"""
+        recs = self.model.recommend_for_interactions({11: 5.0, 12: 2.0, 999: 1.0}, limit=3)
+        self.assertEqual(len(recs), 3)
+        for rec in recs:
+            self.assertIn(rec["vectorId"], range(13, 21))
+        self.assertTrue(np.allclose(self.model.fold_in({999: 1.0}), 0))
+
+    def test_threaded_matches_serial(self):
+        """workers only changes scheduling, not the result"""
+        serial = ImplicitALS(factors=4, iterations=2, seed=1).fit(self.interactions)
+        threaded = ImplicitALS(factors=4, iterations=2, seed=1, workers=2)
+        with patch("awareness_network_sdk.als._SOLVE_BATCH", 7):
+            threaded.fit(self.interactions)
+        np.testing.assert_allclose(serial.item_factors, threaded.item_factors, rtol=1e-6, atol=1e-9)
+
+    def test_save_load_and_export(self):
+        """Saved models recommend identically; JSON export carries item factors"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "als.npz")
+            self.model.save(path)
+            loaded = ImplicitALS.load(path)
+            self.assertEqual(loaded.recommend(25), self.model.recommend(25))
+
+            export_path = os.path.join(tmp, "mf-model.json")
+            self.model.export_json(export_path)
+            with open(export_path) as f:
+                exported = json.load(f)
+
+        self.assertEqual(exported["factors"], 4)
+        self.assertEqual(len(exported["itemFactors"]), 4 * len(exported["itemIds"]))
+        self.assertEqual(len(exported["gramian"]), 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
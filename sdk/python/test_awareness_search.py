@@ -0,0 +1,155 @@
+"""
+Unit tests for the local memory search index
+
+Tests cover:
+- BM25 ranking over name, description and keywords
+- Bitmap filters on domain, task_type, model_origin and is_public
+- Incremental add, replace and remove (including slot reuse)
+- Hybrid BM25 + embedding retrieval with reciprocal rank fusion
+"""
+
+import unittest
+
+import numpy as np
+
+from awareness_network_sdk.search import (
+    HybridMemorySearchIndex,
+    MemorySearchIndex,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+
+
+def _asset(token_id, name, description, keywords, domain="nlp", task_type="classification",
+           model_origin="gpt-4", is_public=True, usage_count=0):
+    return {
+        "identification": {
+            "id": token_id,
+            "name": name,
+            "description": description,
+            "version": "1.0.0",
+        },
+        "technical_spec": {"model_origin": model_origin, "latent_dimension": 4096},
+        "semantic_context": {"keywords": keywords, "domain": domain, "task_type": task_type},
+        "access_control": {"is_public": is_public, "price_per_call": 0.001},
+        "provenance": {"usage_count": usage_count, "created_at": "2026-01-01T00:00:00Z"},
+    }
+
+
+ASSETS = [
+    _asset("1", "Solidity Reentrancy Auditor", "Detects reentrancy in smart contracts",
+           ["solidity", "reentrancy", "audit"], domain="blockchain_security",
+           task_type="vulnerability_detection", usage_count=50),
+    _asset("2", "DeFi Risk Analyzer", "Flash loan and oracle manipulation risk",
+           ["defi", "flash_loan", "audit"], domain="blockchain_security",
+           task_type="risk_analysis", model_origin="claude-3-opus", usage_count=200),
+    _asset("3", "Sentiment Classifier", "Sentiment analysis for product reviews",
+           ["sentiment", "reviews"], is_public=False, usage_count=10),
+]
+
+
+class TestMemorySearchIndex(unittest.TestCase):
+    """Test MemorySearchIndex"""
+
+    def setUp(self):
+        self.index = MemorySearchIndex(initial_capacity=2)
+        self.index.add_many(ASSETS)
+
+    def test_tokenize(self):
+        """Snake case and punctuation split into lowercase terms"""
+        self.assertEqual(tokenize("Flash_Loan, DeFi!"), ["flash", "loan", "defi"])
+
+    def test_bm25_ranking(self):
+        """The asset matching more (and rarer) terms ranks first"""
+        results = self.index.find_memory_by_topic("reentrancy audit")
+        self.assertEqual([r.memory["identification"]["id"] for r in results], ["1", "2"])
+        self.assertGreater(results[0].relevance_score, results[1].relevance_score)
+        self.assertEqual(results[0].match_type, "keyword")
+        self.assertEqual(self.index.find_memory_by_topic("unknown"), [])
+
+    def test_filters(self):
+        """Filters intersect with each other and with the query"""
+        results = self.index.semantic_search(query="audit", model_origin="claude-3-opus")
+        self.assertEqual([r.memory["identification"]["id"] for r in results], ["2"])
+
+        results = self.index.semantic_search(is_public=False)
+        self.assertEqual([r.memory["identification"]["id"] for r in results], ["3"])
+        self.assertEqual(results[0].relevance_score, 0.5)
+
+        self.assertEqual(self.index.semantic_search(domain="no_such_domain"), [])
+        self.assertEqual(len(self.index.find_memory_by_domain("blockchain_security")), 2)
+        self.assertEqual(len(self.index.find_memory_by_task("classification")), 1)
+
+    def test_remove_and_replace(self):
+        """Removed assets disappear; re-adding an id replaces it"""
+        self.assertTrue(self.index.remove("1"))
+        self.assertFalse(self.index.remove("1"))
+        self.assertEqual(self.index.find_memory_by_topic("reentrancy"), [])
+        self.assertEqual(len(self.index), 2)
+
+        updated = _asset("2", "DeFi Risk Analyzer", "MEV sandwich detection", ["mev"],
+                         domain="defi")
+        self.index.add(updated)
+        self.assertEqual(self.index.find_memory_by_topic("flash"), [])
+        self.assertEqual(len(self.index.find_memory_by_topic("mev")), 1)
+        self.assertEqual(self.index.find_memory_by_domain("blockchain_security"), [])
+
+        # Freed slot is reused without leaking old filter bits
+        self.index.add(_asset("4", "Vision Tagger", "Image tags", ["vision"], domain="vision"))
+        self.assertEqual(len(self.index.semantic_search()), 3)
+        self.assertEqual(len(self.index.find_memory_by_domain("vision")), 1)
+
+    def test_leaderboard(self):
+        """Assets are ordered by usage count"""
+        ids = [a["identification"]["id"] for a in self.index.leaderboard(limit=2)]
+        self.assertEqual(ids, ["2", "1"])
+
+
+class TestHybridMemorySearchIndex(unittest.TestCase):
+    """Test HybridMemorySearchIndex"""
+
+    def test_rrf(self):
+        """Items ranked high in both lists win"""
+        fused = reciprocal_rank_fusion([np.array([1, 2, 3]), np.array([2, 1, 4])], k=60)
+        self.assertAlmostEqual(fused[1], fused[2])
+        self.assertGreater(fused[1], fused[3])
+        self.assertAlmostEqual(fused[4], 1 / 63)
+
+    def test_paraphrase_found_by_embedding(self):
+        """A query sharing no terms is still matched via the encoder"""
+        concepts = {"reentrancy": 0, "exploit": 0, "sentiment": 1, "opinion": 1, "defi": 2}
+
+        def encoder(texts):
+            out = np.zeros((len(texts), 4), dtype=np.float32)
+            for row, text in enumerate(texts):
+                for token in tokenize(text):
+                    if token in concepts:
+                        out[row, concepts[token]] += 1
+            return out
+
+        index = HybridMemorySearchIndex(encoder=encoder, dimension=4, initial_capacity=2)
+        index.add_many(ASSETS)
+        self.assertEqual(index._embeddings.dtype, np.float16)
+
+        results = index.hybrid_search("opinion mining", limit=1)
+        self.assertEqual(results[0].memory["identification"]["id"], "3")
+        self.assertEqual(results[0].match_type, "hybrid")
+
+        results = index.hybrid_search("reentrancy audit", domain="blockchain_security")
+        self.assertEqual(results[0].memory["identification"]["id"], "1")
+        self.assertEqual(len(results), 2)
+
+        index.remove("3")
+        ids = [r.memory["identification"]["id"] for r in index.hybrid_search("opinion")]
+        self.assertNotIn("3", ids)
+
+    def test_default_encoder(self):
+        """The hashing encoder matches morphological variants"""
+        index = HybridMemorySearchIndex()
+        index.add_many(ASSETS)
+        results = index.hybrid_search("sentimental classification", limit=1)
+        self.assertEqual(results[0].memory["identification"]["id"], "3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Unit tests for shared-memory tensor transport
+
+Tests cover:
+- Publishing, reading and reference-counted cleanup
+- Worker-side attach across a process pool
+"""
+
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from awareness_network_sdk.shm import SharedTensorStore, attach, detach_all, share_vectors
+
+
+def _row_sums(descriptor):
+    return attach(descriptor).sum(axis=1).tolist()
+
+
+def _segment_exists(name):
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    return True
+
+
+class TestSharedTensorStore(unittest.TestCase):
+    """Test publisher-side lifecycle"""
+
+    def test_publish_and_read(self):
+        """Published tensors round-trip through shared memory"""
+        matrix = np.arange(12, dtype=np.float32).reshape(3, 4)
+        with SharedTensorStore() as store:
+            descriptor = store.publish(matrix)
+            self.assertEqual(descriptor.shape, (3, 4))
+            np.testing.assert_array_equal(store.read(descriptor), matrix)
+
+    def test_publish_many_shares_segment(self):
+        """Tensors packed together share one aligned segment"""
+        with SharedTensorStore() as store:
+            descriptors = store.publish_many({"keys": np.ones(5), "values": np.zeros(7)})
+            self.assertEqual(descriptors["keys"].name, descriptors["values"].name)
+            self.assertEqual(descriptors["values"].offset % 64, 0)
+            np.testing.assert_array_equal(store.read(descriptors["values"]), np.zeros(7))
+
+    def test_refcount_unlinks_on_last_release(self):
+        """Segment is unlinked only after every reference is released"""
+        store = SharedTensorStore()
+        descriptor = share_vectors(store, [[0.1, 0.2], [0.3, 0.4]])
+        store.acquire(descriptor)
+        self.assertEqual(store.refcount(descriptor), 2)
+
+        store.release(descriptor)
+        self.assertTrue(_segment_exists(descriptor.name))
+
+        store.release(descriptor)
+        self.assertEqual(store.refcount(descriptor), 0)
+        self.assertFalse(_segment_exists(descriptor.name))
+
+    def test_close_unlinks_everything(self):
+        """Closing the store removes outstanding segments"""
+        store = SharedTensorStore()
+        descriptor = store.allocate((4, 4))
+        store.close()
+        self.assertFalse(_segment_exists(descriptor.name))
+
+    def test_attach_is_read_only_by_default(self):
+        """Workers cannot mutate published inputs accidentally"""
+        with SharedTensorStore() as store:
+            view = attach(store.publish(np.ones(3)))
+            with self.assertRaises(ValueError):
+                view[0] = 2.0
+            del view
+            detach_all()
+
+    def test_process_pool_attach(self):
+        """Workers read the published matrix by descriptor"""
+        matrix = np.random.default_rng(0).standard_normal((8, 16)).astype(np.float32)
+        with SharedTensorStore() as store:
+            descriptor = store.publish(matrix)
+            with ProcessPoolExecutor(max_workers=2) as pool:
+                future = store.retain_for(pool.submit(_row_sums, descriptor), descriptor)
+                sums = future.result()
+            np.testing.assert_allclose(sums, matrix.sum(axis=1), rtol=1e-5)
+            self.assertEqual(store.refcount(descriptor), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
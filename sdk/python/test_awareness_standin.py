@@ -0,0 +1,106 @@
+"""
+Unit tests for the local stand-in server's authentication path
+
+Tests cover:
+- Validation results reused within the TTL (one key lookup per key)
+- Unknown keys remembered briefly, expiry after the TTL
+- Revocation and rotation invalidating cached validations immediately
+- lastUsedAt writes coalesced into batched flushes
+- The sync client talking to the stand-in over loopback HTTP
+"""
+
+import unittest
+
+import pytest
+
+from awareness_network_sdk import AwarenessNetworkClient
+from awareness_network_sdk.testing import StandInServer
+
+
+@pytest.mark.usefixtures("fake_clock")
+class TestStandInAuth(unittest.TestCase):
+    """Test the cached authentication path"""
+
+    clock_start = 1000.0
+
+    def setUp(self):
+        self.server = StandInServer(usage_flush_interval=None, clock=self.clock).start()
+        self.addCleanup(self.server.stop)
+        registration = self.server.register_agent("TestAgent")
+        self.user_id = registration["userId"]
+        self.client = AwarenessNetworkClient(
+            base_url=self.server.base_url, api_key=registration["apiKey"]
+        )
+
+    def test_validation_cached(self):
+        """Repeated calls with one key cost a single key lookup"""
+        for _ in range(5):
+            self.assertEqual(len(self.client.list_api_keys()["keys"]), 1)
+        self.assertEqual(self.server.stats["key_selects"], 1)
+        self.assertEqual(self.server.stats["cache_hits"], 4)
+
+    def test_ttl_expiry(self):
+        """A cached validation is re-checked once the TTL passes"""
+        self.client.list_api_keys()
+        self.clock.now += self.server.auth_cache_ttl + 1
+        self.client.list_api_keys()
+        self.assertEqual(self.server.stats["key_selects"], 2)
+
+    def test_unknown_key_remembered_briefly(self):
+        """Bad keys are rejected and their lookups cached for the negative TTL"""
+        bad = AwarenessNetworkClient(base_url=self.server.base_url, api_key="ak_" + "0" * 64)
+        for _ in range(2):
+            with self.assertRaisesRegex(Exception, "401"):
+                bad.list_api_keys()
+        self.assertEqual(self.server.stats["key_selects"], 1)
+        self.clock.now += self.server.negative_ttl + 1
+        with self.assertRaisesRegex(Exception, "401"):
+            bad.list_api_keys()
+        self.assertEqual(self.server.stats["key_selects"], 2)
+
+    def test_revoke_invalidates(self):
+        """A revoked key is rejected on its next call, not after the TTL"""
+        second_key = self.client.create_api_key("second")["apiKey"]
+        second = AwarenessNetworkClient(base_url=self.server.base_url, api_key=second_key)
+        second.list_api_keys()
+        key_id = max(k["id"] for k in self.client.list_api_keys()["keys"])
+        self.client.revoke_api_key(key_id)
+        with self.assertRaisesRegex(Exception, "Invalid API key"):
+            second.list_api_keys()
+
+    def test_rotate_invalidates(self):
+        """Rotation keeps scopes, rejects the old key and accepts the new one"""
+        self.client.list_api_keys()
+        key_id = self.client.list_api_keys()["keys"][0]["id"]
+        new_key = self.server.rotate_key(key_id, self.user_id)
+        with self.assertRaisesRegex(Exception, "401"):
+            self.client.list_api_keys()
+        rotated = AwarenessNetworkClient(base_url=self.server.base_url, api_key=new_key)
+        keys = rotated.list_api_keys()["keys"]
+        self.assertEqual(keys[-1]["permissions"], ["read", "write", "purchase"])
+        self.assertEqual(keys[-1]["name"], "Default Key (Rotated)")
+
+    def test_last_used_batched(self):
+        """lastUsedAt is written by a flush, once for many calls"""
+        for _ in range(3):
+            self.client.list_api_keys()
+        key_id = self.client.list_api_keys()["keys"][0]["id"]
+        self.assertIsNone(self.server.key_record(key_id)["lastUsedAt"])
+        self.assertEqual(self.server.flush_usage(), 1)
+        self.assertIsNotNone(self.server.key_record(key_id)["lastUsedAt"])
+        self.assertEqual(self.server.stats["usage_flushes"], 1)
+        self.assertEqual(self.server.flush_usage(), 0)
+
+    def test_memory_round_trip(self):
+        """Authenticated memory routes use the server's response shapes"""
+        self.client._request("PUT", "/ai/memory/notes", data={"data": {"topic": "latent"}})
+        memory = self.client.retrieve_memory("notes")
+        self.assertEqual(
+            (memory.key, memory.value, memory.version), ("notes", {"topic": "latent"}, 1)
+        )
+        self.client.delete_memory("notes")
+        self.assertIsNone(self.client.retrieve_memory("notes"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+Unit tests for tracing
+
+Tests cover:
+- traceparent parsing and formatting
+- Nested spans through the context variable, remote parents, failures
+- JSON-lines and callback exporters
+- A discover -> invoke pipeline: one trace of method, HTTP and step spans,
+  traceparent headers received by the server, server time on HTTP spans
+- Async method spans parented across asyncio tasks
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from awareness_network_sdk import (
+    AsyncAwarenessClient,
+    AwarenessNetworkClient,
+    JsonLinesSpanExporter,
+    Tracer,
+    current_span,
+)
+from awareness_network_sdk.instrumentation import server_timing
+from awareness_network_sdk.testing import StandInServer
+from awareness_network_sdk.tracing import parse_traceparent
+
+TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+class TestTraceparent(unittest.TestCase):
+    """Test header parsing"""
+
+    def test_parse(self):
+        self.assertEqual(parse_traceparent(TRACEPARENT),
+                         ("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7", True))
+        self.assertFalse(parse_traceparent(TRACEPARENT[:-1] + "0")[2])
+        for invalid in (None, "", "garbage", TRACEPARENT + "-extra", "ff" + TRACEPARENT[2:],
+                        "00-" + "0" * 32 + "-00f067aa0ba902b7-01", TRACEPARENT.replace("a", "g")):
+            self.assertIsNone(parse_traceparent(invalid), invalid)
+        # Future versions may append fields
+        self.assertIsNotNone(parse_traceparent("01" + TRACEPARENT[2:] + "-extra"))
+
+    def test_server_timing(self):
+        self.assertEqual(server_timing("app;dur=12.5"), 0.0125)
+        self.assertAlmostEqual(server_timing('db;dur=2, app;desc="x";dur=3'), 0.005)
+        self.assertIsNone(server_timing("cache;desc=hit"))
+
+
+class TestTracer(unittest.TestCase):
+    """Test span bookkeeping"""
+
+    def setUp(self):
+        self.spans = []
+        self.tracer = Tracer(exporters=[self.spans.append])
+
+    def test_nesting(self):
+        with self.tracer.span("agent.step", {"step": 1}) as outer:
+            self.assertIs(current_span(), outer)
+            with self.tracer.span("inner") as inner:
+                self.assertIs(current_span(), inner)
+            self.assertIs(current_span(), outer)
+        self.assertIsNone(current_span())
+        self.assertEqual([s.name for s in self.spans], ["inner", "agent.step"])
+        self.assertEqual(inner.parent_id, outer.span_id)
+        self.assertEqual(inner.trace_id, outer.trace_id)
+        self.assertIsNone(outer.parent_id)
+        self.assertEqual(outer.attributes, {"step": 1, "service.name": "awareness-network-sdk"})
+        self.assertEqual(inner.status, "ok")
+        self.assertGreaterEqual(outer.duration_ms, inner.duration_ms)
+        self.assertEqual(inner.traceparent, f"00-{inner.trace_id}-{inner.span_id}-01")
+
+    def test_remote_parent_and_errors(self):
+        with self.assertRaises(ValueError):
+            with self.tracer.span("remote", traceparent=TRACEPARENT):
+                raise ValueError("boom")
+        span, = self.spans
+        self.assertEqual(
+            (span.trace_id, span.parent_id),
+            ("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"),
+        )
+        self.assertEqual((span.status, span.error), ("error", "ValueError: boom"))
+
+    def test_unsampled_parent_not_exported(self):
+        with self.tracer.span("remote", traceparent=TRACEPARENT[:-1] + "0") as span:
+            pass
+        self.assertEqual(self.spans, [])
+        self.assertTrue(span.traceparent.endswith("-00"))
+
+    def test_json_lines_exporter(self):
+        path = os.path.join(tempfile.mkdtemp(), "spans.jsonl")
+        self.addCleanup(os.remove, path)
+        tracer = Tracer(exporters=[JsonLinesSpanExporter(path)])
+        with tracer.span("a"):
+            with tracer.span("b"):
+                pass
+        with open(path, encoding="utf-8") as handle:
+            records = [json.loads(line) for line in handle]
+        self.assertEqual([r["name"] for r in records], ["b", "a"])
+        self.assertEqual(records[0]["parent_id"], records[1]["span_id"])
+
+
+class TestClientTracing(unittest.TestCase):
+    """Test spans and propagation against the stand-in server"""
+
+    def setUp(self):
+        self.server = StandInServer(usage_flush_interval=None).start()
+        self.addCleanup(self.server.stop)
+        self.key = self.server.register_agent("TracedAgent")["apiKey"]
+        self.spans = []
+        self.tracer = Tracer(exporters=[self.spans.append])
+
+    def test_pipeline(self):
+        token = self.server.grant_access(8)
+        client = AwarenessNetworkClient(base_url=self.server.base_url, api_key=self.key,
+                                        rate_limiter=False, tracer=self.tracer)
+        self.server.traceparents.clear()
+        with self.tracer.span("agent.step") as step:
+            client.mcp_discover()
+            client.mcp_invoke(8, "hello", access_token=token)
+            with self.assertRaises(Exception):
+                client.mcp_invoke(9, "hello", access_token=token)
+
+        names = [s.name for s in self.spans]
+        self.assertEqual(names, [
+            "HTTP GET /mcp/discover", "awareness.mcp_discover",
+            "HTTP POST /mcp/invoke", "awareness.mcp_invoke",
+            "HTTP POST /mcp/invoke", "awareness.mcp_invoke",
+            "agent.step",
+        ])
+        self.assertEqual({s.trace_id for s in self.spans}, {step.trace_id})
+        by_id = {s.span_id: s for s in self.spans}
+        http = [s for s in self.spans if s.kind == "client"]
+        for span in http:
+            self.assertEqual(by_id[span.parent_id].parent_id, step.span_id)
+            self.assertIn("server.duration_ms", span.attributes)
+            self.assertIn("http.ttfb_ms", span.attributes)
+        # The server saw each HTTP span as the caller's span
+        self.assertEqual(self.server.traceparents, [s.traceparent for s in http])
+        self.assertEqual(http[1].attributes["http.status_code"], 200)
+        self.assertEqual((http[2].status, http[2].attributes["http.status_code"]), ("error", 403))
+        self.assertEqual(self.spans[5].status, "error")
+
+    def test_untraced_client(self):
+        client = AwarenessNetworkClient(
+            base_url=self.server.base_url, api_key=self.key, rate_limiter=False
+        )
+        self.server.traceparents.clear()
+        client.mcp_discover()
+        self.assertEqual(self.server.traceparents, [None])
+        self.assertEqual(AwarenessNetworkClient.mcp_discover.__name__, "mcp_discover")
+
+    def test_async_tasks(self):
+        base_url = self.server.base_url[:-len("/api")]
+
+        async def run():
+            async with AsyncAwarenessClient(api_key=self.key, base_url=base_url, rate_limiter=False,
+                                            max_retries=1, tracer=self.tracer) as client:
+                with self.tracer.span("agent.recall") as step:
+                    await asyncio.gather(client.memory.get("a"), client.memory.get("b"))
+                return step
+
+        step = asyncio.run(run())
+        gets = [s for s in self.spans if s.name == "memory.get"]
+        http = [s for s in self.spans if s.kind == "client"]
+        self.assertEqual(len(gets), 2)
+        self.assertTrue(all(s.parent_id == step.span_id for s in gets))
+        self.assertEqual({s.parent_id for s in http}, {s.span_id for s in gets})
+        # Missing memories: the HTTP spans failed, memory.get returned None
+        self.assertEqual({s.status for s in http}, {"error"})
+        self.assertEqual({s.status for s in gets}, {"ok"})
+        self.assertEqual(sorted(self.server.traceparents), sorted(s.traceparent for s in http))
+
+
+if __name__ == "__main__":
+    unittest.main()
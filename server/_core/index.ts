@@ -9,12 +9,19 @@ import { createContext } from "./context";
 import { handleStripeWebhook } from "../stripe-webhook";
 import { serveStatic, setupVite } from "./vite";
 import mcpRouter from "../mcp-api";
+import mcpSessionRouter from "../mcp-session";
 import latentmasRouter from "../latentmas-api";
 import { aiAuthRouter } from "../ai-auth-api";
 import { aiMemoryRouter } from "../ai-memory-api";
+import { aiRecommendationRouter } from "../recommendation-api";
+import { startRecommendationRefresher } from "../recommendation-engine";
+import { shutdownInvocationStats } from "../invocation-stats";
+import { flushApiKeyUsage } from "../api-key-manager";
 import trialRouter from "../trial-api";
 import purchaseRouter from "../purchase-api";
 import streamingRouter from "../streaming-api";
+import { compressResponses } from "../http-compression";
+import { traceContext } from "../trace-context";
 import swaggerUi from "swagger-ui-express";
 import { Server as SocketIOServer } from "socket.io";
 import fs from "fs";
@@ -48,19 +55,45 @@ async function startServer() {
   app.post("/api/stripe/webhook", express.raw({ type: "application/json" }), handleStripeWebhook);
   
   // Configure body parser with larger size limit for file uploads
+  // (gzip/deflate request bodies are inflated by the parser)
   app.use(express.json({ limit: "50mb" }));
   app.use(express.urlencoded({ limit: "50mb", extended: true }));
+  // Continue callers' W3C traces; reports Server-Timing on every API response
+  app.use("/api", traceContext());
+  // Compressed responses for the payload-heavy routes
+  app.use(["/api/latentmas", "/api/vectors/batch-invoke", "/api/ai/memory"], compressResponses());
   // OAuth callback under /api/oauth/callback
   registerOAuthRoutes(app);
   // MCP Protocol API
   app.use("/api/mcp", mcpRouter);
+  app.use("/api/mcp", mcpSessionRouter);
   
   // LatentMAS Transformer API
   app.use("/api/latentmas", latentmasRouter);
   
   // AI Authentication and Memory APIs
   app.use("/api/ai", aiAuthRouter);
+  app.use("/api/ai", aiRecommendationRouter);
   app.use("/api/ai", aiMemoryRouter);
+
+  // Background refresh of materialized recommendations
+  startRecommendationRefresher();
+
+  // Write batched invocation stats and API key lastUsedAt on shutdown: stop
+  // accepting connections, flush, then re-raise the signal so the default
+  // handler ends the process with the usual signal status instead of a
+  // forced exit(0)
+  for (const signal of ["SIGTERM", "SIGINT"] as const) {
+    process.once(signal, () => {
+      server.close();
+      Promise.all([
+        shutdownInvocationStats()
+          .catch(error => console.error("[InvocationStats] Shutdown flush failed:", error)),
+        flushApiKeyUsage()
+          .catch(error => console.error("[API Keys] Shutdown lastUsedAt flush failed:", error)),
+      ]).finally(() => process.kill(process.pid, signal));
+    });
+  }
   
   // Trial API
   app.use("/api/trial", trialRouter);
@@ -2,13 +2,18 @@ import { getDb } from "./db";
 import { abTestExperiments, abTestAssignments, userBehavior } from "../drizzle/schema";
 import { eq, and, sql } from "drizzle-orm";
 import { generateCollaborativeRecommendations } from "./collaborative-filtering";
+import { generateMatrixFactorizationRecommendations } from "./matrix-factorization";
 import { generateRecommendations as generateLLMRecommendations } from "./recommendation-engine";
 
 /**
  * A/B Testing Framework for Recommendation Algorithms
  */
 
-export type RecommendationAlgorithm = "llm_based" | "collaborative_filtering" | "hybrid";
+export type RecommendationAlgorithm =
+  | "llm_based"
+  | "collaborative_filtering"
+  | "matrix_factorization"
+  | "hybrid";
 
 /**
  * Get or create A/B test assignment for a user
@@ -101,6 +106,9 @@ export async function getRecommendationsWithABTest(
       case "collaborative_filtering":
         recommendations = await generateCollaborativeRecommendations(userId, limit);
         break;
+      case "matrix_factorization":
+        recommendations = await generateMatrixFactorizationRecommendations(userId, limit);
+        break;
       case "hybrid":
         // Combine both algorithms
         const llmRecs = await generateLLMRecommendations({ userId, limit: Math.ceil(limit / 2) });
@@ -7,8 +7,9 @@ import express from "express";
 import { z } from "zod";
 import crypto from "crypto";
 import { getDb } from "./db";
+import { API_KEY_EXPIRED, API_KEY_NOT_FOUND, revokeApiKey, validateApiKeyHash } from "./api-key-manager";
 import { apiKeys, users, aiMemory } from "../drizzle/schema";
-import { eq, and } from "drizzle-orm";
+import { eq, and, gt, asc } from "drizzle-orm";
 
 const router = express.Router();
 
@@ -20,40 +21,23 @@ async function validateApiKey(req: express.Request, res: express.Response, next:
     return res.status(401).json({ error: "API key required" });
   }
 
-  const db = await getDb();
-  if (!db) {
-    return res.status(500).json({ error: "Database unavailable" });
-  }
-
   try {
     const keyHash = crypto.createHash("sha256").update(apiKey).digest("hex");
-    const [keyRecord] = await db
-      .select()
-      .from(apiKeys)
-      .where(and(
-        eq(apiKeys.keyHash, keyHash),
-        eq(apiKeys.isActive, true)
-      ))
-      .limit(1);
-
-    if (!keyRecord) {
-      return res.status(401).json({ error: "Invalid API key" });
-    }
-
-    // Check expiration
-    if (keyRecord.expiresAt && new Date(keyRecord.expiresAt) < new Date()) {
-      return res.status(401).json({ error: "API key expired" });
+    const validation = await validateApiKeyHash(keyHash);
+
+    if (!validation.valid) {
+      if (validation.error === API_KEY_EXPIRED) {
+        return res.status(401).json({ error: "API key expired" });
+      }
+      if (validation.error === API_KEY_NOT_FOUND) {
+        return res.status(401).json({ error: "Invalid API key" });
+      }
+      return res.status(500).json({ error: "Database unavailable" });
     }
 
-    // Update last used timestamp
-    await db
-      .update(apiKeys)
-      .set({ lastUsedAt: new Date() })
-      .where(eq(apiKeys.id, keyRecord.id));
-
     // Attach user info to request
-    (req as any).apiKeyUserId = keyRecord.userId;
-    (req as any).apiKeyPermissions = keyRecord.permissions ? JSON.parse(keyRecord.permissions) : [];
+    (req as any).apiKeyUserId = validation.userId;
+    (req as any).apiKeyPermissions = validation.permissions;
     
     next();
   } catch (error) {
@@ -137,16 +121,30 @@ router.post("/register", async (req, res) => {
 /**
  * GET /api/ai/keys
  * List API keys for authenticated agent
+ *
+ * Query params (optional):
+ * - limit: page size; enables keyset pagination via `nextCursor`
+ * - cursor: opaque cursor from a previous page
  */
 router.get("/keys", validateApiKey, async (req, res) => {
   try {
+    const query = z.object({
+      limit: z.coerce.number().int().positive().max(1000).optional(),
+      cursor: z.coerce.number().int().nonnegative().optional(),
+    }).parse(req.query);
+
     const userId = (req as any).apiKeyUserId;
     const db = await getDb();
     if (!db) {
       return res.status(500).json({ error: "Database unavailable" });
     }
 
-    const keys = await db
+    const conditions = [eq(apiKeys.userId, userId)];
+    if (query.cursor !== undefined) {
+      conditions.push(gt(apiKeys.id, query.cursor));
+    }
+
+    const select = db
       .select({
         id: apiKeys.id,
         name: apiKeys.name,
@@ -158,11 +156,25 @@ router.get("/keys", validateApiKey, async (req, res) => {
         createdAt: apiKeys.createdAt,
       })
       .from(apiKeys)
-      .where(eq(apiKeys.userId, userId));
+      .where(and(...conditions))
+      .orderBy(asc(apiKeys.id));
 
-    return res.json({ keys });
+    if (query.limit === undefined) {
+      const keys = await select;
+      return res.json({ keys });
+    }
+
+    // Fetch one extra row to know whether another page exists
+    const rows = await select.limit(query.limit + 1);
+    const keys = rows.slice(0, query.limit);
+    const nextCursor = rows.length > query.limit ? String(keys[keys.length - 1].id) : null;
+
+    return res.json({ keys, nextCursor });
   } catch (error) {
     console.error("[AI Auth] List keys error:", error);
+    if (error instanceof z.ZodError) {
+      return res.status(400).json({ error: "Invalid request", details: error.issues });
+    }
     return res.status(500).json({ error: "Failed to list keys" });
   }
 });
@@ -227,18 +239,9 @@ router.delete("/keys/:keyId", validateApiKey, async (req, res) => {
   try {
     const keyId = parseInt(req.params.keyId);
     const userId = (req as any).apiKeyUserId;
-    const db = await getDb();
-    if (!db) {
-      return res.status(500).json({ error: "Database unavailable" });
-    }
 
-    await db
-      .update(apiKeys)
-      .set({ isActive: false })
-      .where(and(
-        eq(apiKeys.id, keyId),
-        eq(apiKeys.userId, userId)
-      ));
+    // Goes through the key manager so the validation cache is invalidated
+    await revokeApiKey(keyId, userId);
 
     return res.json({ success: true, message: "API key revoked" });
   } catch (error) {
@@ -7,7 +7,7 @@ import express from "express";
 import { z } from "zod";
 import { getDb } from "./db";
 import { aiMemory } from "../drizzle/schema";
-import { eq, and } from "drizzle-orm";
+import { eq, and, or, gt, asc, isNull, inArray } from "drizzle-orm";
 import { validateApiKey } from "./ai-auth-api";
 
 const router = express.Router();
@@ -15,6 +15,20 @@ const router = express.Router();
 // All routes require API key authentication
 router.use(validateApiKey);
 
+/**
+ * Shape a memory row for API responses
+ */
+function formatMemory(memory: typeof aiMemory.$inferSelect) {
+  return {
+    key: memory.memoryKey,
+    data: JSON.parse(memory.memoryData),
+    version: memory.version,
+    createdAt: memory.createdAt,
+    updatedAt: memory.updatedAt,
+    expiresAt: memory.expiresAt,
+  };
+}
+
 /**
  * GET /api/ai/memory/:key
  * Retrieve memory by key
@@ -46,14 +60,7 @@ router.get("/memory/:key", async (req, res) => {
       return res.status(410).json({ error: "Memory expired" });
     }
 
-    return res.json({
-      key: memory.memoryKey,
-      data: JSON.parse(memory.memoryData),
-      version: memory.version,
-      createdAt: memory.createdAt,
-      updatedAt: memory.updatedAt,
-      expiresAt: memory.expiresAt,
-    });
+    return res.json(formatMemory(memory));
   } catch (error) {
     console.error("[AI Memory] Retrieve error:", error);
     return res.status(500).json({ error: "Failed to retrieve memory" });
@@ -63,33 +70,122 @@ router.get("/memory/:key", async (req, res) => {
 /**
  * GET /api/ai/memory
  * List all memory keys for the agent
+ *
+ * Optional query parameters:
+ * - includeValues=true: include memory data (expired memories are skipped)
+ * - limit: page size; enables keyset pagination via `nextCursor`
+ * - cursor: opaque cursor from a previous page
  */
 router.get("/memory", async (req, res) => {
   try {
+    const query = z.object({
+      includeValues: z.enum(["true", "false"]).optional(),
+      limit: z.coerce.number().int().positive().max(1000).optional(),
+      cursor: z.coerce.number().int().nonnegative().optional(),
+    }).parse(req.query);
+
     const userId = (req as any).apiKeyUserId;
     const db = await getDb();
     if (!db) {
       return res.status(500).json({ error: "Database unavailable" });
     }
 
-    const memories = await db
-      .select({
-        key: aiMemory.memoryKey,
-        version: aiMemory.version,
-        createdAt: aiMemory.createdAt,
-        updatedAt: aiMemory.updatedAt,
-        expiresAt: aiMemory.expiresAt,
-      })
+    if (query.includeValues !== "true" && query.limit === undefined) {
+      const memories = await db
+        .select({
+          key: aiMemory.memoryKey,
+          version: aiMemory.version,
+          createdAt: aiMemory.createdAt,
+          updatedAt: aiMemory.updatedAt,
+          expiresAt: aiMemory.expiresAt,
+        })
+        .from(aiMemory)
+        .where(eq(aiMemory.userId, userId));
+
+      return res.json({ memories });
+    }
+
+    const conditions = [eq(aiMemory.userId, userId)];
+    if (query.cursor !== undefined) {
+      conditions.push(gt(aiMemory.id, query.cursor));
+    }
+    if (query.includeValues === "true") {
+      conditions.push(or(isNull(aiMemory.expiresAt), gt(aiMemory.expiresAt, new Date()))!);
+    }
+
+    // Fetch one extra row to know whether another page exists
+    const pageSize = query.limit ?? 1000;
+    const rows = await db
+      .select()
       .from(aiMemory)
-      .where(eq(aiMemory.userId, userId));
+      .where(and(...conditions))
+      .orderBy(asc(aiMemory.id))
+      .limit(pageSize + 1);
+
+    const page = rows.slice(0, pageSize);
+    const nextCursor = rows.length > pageSize ? String(page[page.length - 1].id) : null;
+
+    const memories = page.map((memory) => {
+      const formatted = formatMemory(memory);
+      if (query.includeValues === "true") return formatted;
+      const { data, ...metadata } = formatted;
+      return metadata;
+    });
 
-    return res.json({ memories });
+    return res.json({ memories, nextCursor });
   } catch (error) {
     console.error("[AI Memory] List error:", error);
+    if (error instanceof z.ZodError) {
+      return res.status(400).json({ error: "Invalid request", details: error.issues });
+    }
     return res.status(500).json({ error: "Failed to list memories" });
   }
 });
 
+/**
+ * POST /api/ai/memory/mget
+ * Retrieve many memories by key in one request
+ */
+router.post("/memory/mget", async (req, res) => {
+  try {
+    const schema = z.object({
+      keys: z.array(z.string().min(1).max(255)).min(1).max(1000),
+    });
+
+    const body = schema.parse(req.body);
+    const userId = (req as any).apiKeyUserId;
+    const db = await getDb();
+    if (!db) {
+      return res.status(500).json({ error: "Database unavailable" });
+    }
+
+    const rows = await db
+      .select()
+      .from(aiMemory)
+      .where(and(
+        eq(aiMemory.userId, userId),
+        inArray(aiMemory.memoryKey, body.keys)
+      ));
+
+    const now = new Date();
+    const memories = rows
+      .filter((memory) => !memory.expiresAt || new Date(memory.expiresAt) >= now)
+      .map(formatMemory);
+    const found = new Set(memories.map((memory) => memory.key));
+
+    return res.json({
+      memories,
+      missing: body.keys.filter((key) => !found.has(key)),
+    });
+  } catch (error) {
+    console.error("[AI Memory] Multi-get error:", error);
+    if (error instanceof z.ZodError) {
+      return res.status(400).json({ error: "Invalid request", details: error.issues });
+    }
+    return res.status(500).json({ error: "Failed to retrieve memories" });
+  }
+});
+
 /**
  * PUT /api/ai/memory/:key
  * Store or update memory
@@ -177,6 +273,108 @@ router.put("/memory/:key", async (req, res) => {
   }
 });
 
+/**
+ * POST /api/ai/memory/batch
+ * Apply many writes and deletes in one request (used by write-behind clients)
+ * Writes are last-writer-wins; no per-key version check is performed
+ */
+router.post("/memory/batch", async (req, res) => {
+  try {
+    const schema = z.object({
+      writes: z.array(z.object({
+        key: z.string().min(1).max(255),
+        data: z.record(z.string(), z.any()),
+        ttlDays: z.number().positive().optional(),
+      })).max(1000).default([]),
+      deletes: z.array(z.string().min(1).max(255)).max(1000).default([]),
+    });
+
+    const body = schema.parse(req.body);
+    const userId = (req as any).apiKeyUserId;
+    const db = await getDb();
+    if (!db) {
+      return res.status(500).json({ error: "Database unavailable" });
+    }
+
+    // Keep only the last write per key so a batch never conflicts with itself
+    const writes = new Map(body.writes.map((write) => [write.key, write]));
+    const deletes = body.deletes.filter((key) => !writes.has(key));
+
+    const written = await db.transaction(async (tx) => {
+      const keys = Array.from(writes.keys());
+      const existing = keys.length
+        ? await tx
+            .select({ id: aiMemory.id, key: aiMemory.memoryKey, version: aiMemory.version })
+            .from(aiMemory)
+            .where(and(
+              eq(aiMemory.userId, userId),
+              inArray(aiMemory.memoryKey, keys)
+            ))
+        : [];
+      const existingByKey = new Map(existing.map((row) => [row.key, row]));
+
+      const results: { key: string; version: number }[] = [];
+      const inserts: (typeof aiMemory.$inferInsert)[] = [];
+
+      for (const write of Array.from(writes.values())) {
+        const expiresAt = write.ttlDays
+          ? new Date(Date.now() + write.ttlDays * 24 * 60 * 60 * 1000)
+          : null;
+        const current = existingByKey.get(write.key);
+
+        if (current) {
+          await tx
+            .update(aiMemory)
+            .set({
+              memoryData: JSON.stringify(write.data),
+              version: current.version + 1,
+              expiresAt,
+              updatedAt: new Date(),
+            })
+            .where(eq(aiMemory.id, current.id));
+          results.push({ key: write.key, version: current.version + 1 });
+        } else {
+          inserts.push({
+            userId,
+            memoryKey: write.key,
+            memoryData: JSON.stringify(write.data),
+            version: 1,
+            expiresAt,
+          });
+          results.push({ key: write.key, version: 1 });
+        }
+      }
+
+      if (inserts.length) {
+        await tx.insert(aiMemory).values(inserts);
+      }
+
+      if (deletes.length) {
+        await tx
+          .delete(aiMemory)
+          .where(and(
+            eq(aiMemory.userId, userId),
+            inArray(aiMemory.memoryKey, deletes)
+          ));
+      }
+
+      return results;
+    });
+
+    return res.json({
+      success: true,
+      written,
+      deleted: deletes.length,
+    });
+  } catch (error) {
+    console.error("[AI Memory] Batch error:", error);
+    if (error instanceof z.ZodError) {
+      return res.status(400).json({ error: "Invalid request", details: error.issues });
+    }
+    return res.status(500).json({ error: "Failed to apply memory batch" });
+  }
+});
+
 /**
  * DELETE /api/ai/memory/:key
  * Delete memory by key
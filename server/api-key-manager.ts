@@ -6,7 +6,7 @@
 import crypto from 'crypto';
 import { getDb } from './db.js';
 import { apiKeys } from '../drizzle/schema.ts';
-import { eq, and } from 'drizzle-orm';
+import { eq, and, inArray, sql } from 'drizzle-orm';
 
 /**
  * Generate a secure API key with prefix and checksum
@@ -64,18 +64,115 @@ export async function createApiKey(params: {
   return { id, key, keyPrefix };
 }
 
-/**
- * Validate an API key and return associated user info
- */
-export async function validateApiKey(key: string): Promise<{
+export interface ApiKeyValidation {
   valid: boolean;
   userId?: number;
   keyId?: number;
   permissions?: string[];
   error?: string;
-}> {
-  if (!key || !key.startsWith('ak_live_')) {
-    return { valid: false, error: 'Invalid API key format' };
+}
+
+export const API_KEY_NOT_FOUND = 'API key not found or inactive';
+export const API_KEY_EXPIRED = 'API key expired';
+
+/**
+ * Validation results are cached per key hash so authenticated calls skip the
+ * SELECT, and lastUsedAt is written in periodic batches instead of once per
+ * request. Revoking or rotating a key through this module drops its cached
+ * entry immediately; other server instances converge within the TTL.
+ */
+const AUTH_CACHE_TTL_MS = 30_000;
+const AUTH_NEGATIVE_TTL_MS = 5_000;
+const AUTH_CACHE_MAX_ENTRIES = 50_000;
+const USAGE_FLUSH_INTERVAL_MS = 10_000;
+
+const validationCache = new Map<string, { result: ApiKeyValidation; expiresAt: number }>();
+const cachedHashByKeyId = new Map<number, string>();
+const pendingLastUsed = new Map<number, Date>();
+let usageFlushTimer: ReturnType<typeof setTimeout> | null = null;
+
+function cacheValidation(keyHash: string, result: ApiKeyValidation, keyExpiresAt?: Date | null) {
+  let expiresAt = Date.now() + (result.valid ? AUTH_CACHE_TTL_MS : AUTH_NEGATIVE_TTL_MS);
+  if (keyExpiresAt) {
+    expiresAt = Math.min(expiresAt, new Date(keyExpiresAt).getTime());
+  }
+
+  validationCache.delete(keyHash);
+  validationCache.set(keyHash, { result, expiresAt });
+  if (result.keyId !== undefined) {
+    cachedHashByKeyId.set(result.keyId, keyHash);
+  }
+
+  // Insertion order is age order; drop the oldest beyond the bound
+  for (const [oldest, entry] of validationCache) {
+    if (validationCache.size <= AUTH_CACHE_MAX_ENTRIES) break;
+    validationCache.delete(oldest);
+    if (entry.result.keyId !== undefined) cachedHashByKeyId.delete(entry.result.keyId);
+  }
+}
+
+/**
+ * Drop the cached validation for a key (after revoke, rotate or delete)
+ */
+export function invalidateApiKeyCache(keyId: number): void {
+  const keyHash = cachedHashByKeyId.get(keyId);
+  if (keyHash) {
+    validationCache.delete(keyHash);
+    cachedHashByKeyId.delete(keyId);
+  }
+}
+
+function recordKeyUsage(keyId: number): void {
+  pendingLastUsed.set(keyId, new Date());
+  if (!usageFlushTimer) {
+    usageFlushTimer = setTimeout(() => {
+      usageFlushTimer = null;
+      flushApiKeyUsage().catch(error => console.error('[API Keys] lastUsedAt flush failed:', error));
+    }, USAGE_FLUSH_INTERVAL_MS);
+    usageFlushTimer.unref?.();
+  }
+}
+
+/**
+ * Write pending lastUsedAt timestamps in one UPDATE
+ */
+export async function flushApiKeyUsage(): Promise<number> {
+  if (pendingLastUsed.size === 0) return 0;
+
+  const db = await getDb();
+  if (!db) return 0;
+
+  const batch = new Map(pendingLastUsed);
+  pendingLastUsed.clear();
+  const ids = Array.from(batch.keys());
+  const cases = sql.join(
+    ids.map(id => sql`WHEN ${apiKeys.id} = ${id} THEN ${batch.get(id)}`),
+    sql` `
+  );
+
+  try {
+    await db
+      .update(apiKeys)
+      .set({ lastUsedAt: sql`CASE ${cases} END` })
+      .where(inArray(apiKeys.id, ids));
+  } catch (error) {
+    // Put the batch back unless a newer use was recorded meanwhile
+    for (const [id, usedAt] of batch) {
+      if (!pendingLastUsed.has(id)) pendingLastUsed.set(id, usedAt);
+    }
+    throw error;
+  }
+  return ids.length;
+}
+
+/**
+ * Validate an API key by its SHA-256 hash (cached)
+ */
+export async function validateApiKeyHash(keyHash: string): Promise<ApiKeyValidation> {
+  const cached = validationCache.get(keyHash);
+  if (cached && cached.expiresAt > Date.now()) {
+    if (cached.result.valid) recordKeyUsage(cached.result.keyId!);
+    return cached.result;
   }
 
   const db = await getDb();
@@ -83,8 +180,6 @@ export async function validateApiKey(key: string): Promise<{
     return { valid: false, error: 'Database connection failed' };
   }
 
-  const keyHash = hashApiKey(key);
-
   const [apiKey] = await db
     .select()
     .from(apiKeys)
@@ -97,29 +192,39 @@ export async function validateApiKey(key: string): Promise<{
     .limit(1);
 
   if (!apiKey) {
-    return { valid: false, error: 'API key not found or inactive' };
+    const result = { valid: false, error: API_KEY_NOT_FOUND };
+    cacheValidation(keyHash, result);
+    return result;
   }
 
   // Check expiration
   if (apiKey.expiresAt && new Date(apiKey.expiresAt) < new Date()) {
-    return { valid: false, error: 'API key expired' };
+    return { valid: false, error: API_KEY_EXPIRED };
   }
 
-  // Update last used timestamp
-  await db
-    .update(apiKeys)
-    .set({ lastUsedAt: new Date() })
-    .where(eq(apiKeys.id, apiKey.id));
-
   // Parse scopes
   const permissions = apiKey.permissions ? JSON.parse(apiKey.permissions) : ['*'];
 
-  return {
+  const result = {
     valid: true,
     userId: apiKey.userId,
     keyId: apiKey.id,
     permissions
   };
+  cacheValidation(keyHash, result, apiKey.expiresAt);
+  recordKeyUsage(apiKey.id);
+  return result;
+}
+
+/**
+ * Validate an API key and return associated user info
+ */
+export async function validateApiKey(key: string): Promise<ApiKeyValidation> {
+  if (!key || !key.startsWith('ak_live_')) {
+    return { valid: false, error: 'Invalid API key format' };
+  }
+
+  return validateApiKeyHash(hashApiKey(key));
 }
 
 /**
@@ -203,6 +308,7 @@ export async function revokeApiKey(keyId: number, userId: number): Promise<boole
       )
     );
 
+  invalidateApiKeyCache(keyId);
   return (result as any).affectedRows > 0;
 }
 
@@ -224,6 +330,7 @@ export async function deleteApiKey(keyId: number, userId: number): Promise<boole
       )
     );
 
+  invalidateApiKeyCache(keyId);
   return (result as any).affectedRows > 0;
 }
 
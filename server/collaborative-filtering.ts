@@ -1,12 +1,24 @@
 import { getDb } from "./db";
 import { userBehavior, latentVectors, transactions } from "../drizzle/schema";
 import { eq, and, inArray, sql, desc } from "drizzle-orm";
+import { markRecommendationsStale } from "./recommendation-engine";
 
 /**
  * Collaborative Filtering Recommendation Engine
  * Uses user-item interaction matrix to find similar users and recommend items
  */
 
+/**
+ * Interaction weight per behavior action type
+ */
+export const ACTION_WEIGHTS: Record<string, number> = {
+  view: 1,
+  click: 2,
+  trial: 3,
+  purchase: 5,
+  review: 4,
+};
+
 interface UserItemScore {
   userId: number;
   vectorId: number;
@@ -62,14 +74,6 @@ async function getUserItemMatrix(): Promise<Map<number, Map<number, number>>> {
 
   // Build user-item matrix with weighted scores
   const matrix = new Map<number, Map<number, number>>();
-  
-  const actionWeights = {
-    view: 1,
-    click: 2,
-    trial: 3,
-    purchase: 5,
-    review: 4,
-  };
 
   behaviors.forEach(({ userId, vectorId, actionType }) => {
     if (!matrix.has(userId)) {
@@ -78,7 +82,7 @@ async function getUserItemMatrix(): Promise<Map<number, Map<number, number>>> {
     
     const userScores = matrix.get(userId)!;
     const currentScore = userScores.get(vectorId) || 0;
-    const weight = actionWeights[actionType] || 1;
+    const weight = ACTION_WEIGHTS[actionType] || 1;
     
     userScores.set(vectorId, currentScore + weight);
   });
@@ -190,6 +194,7 @@ export async function trackUserBehavior(
       duration,
       metadata: metadata ? JSON.stringify(metadata) : undefined,
     });
+    markRecommendationsStale(userId);
   } catch (error) {
     console.error("[Collaborative Filtering] Error tracking behavior:", error);
   }
@@ -146,6 +146,13 @@ export async function getLatentVectorById(id: number) {
   return result.length > 0 ? result[0] : undefined;
 }
 
+export async function getLatentVectorsByIds(ids: number[]) {
+  const db = await getDb();
+  if (!db || ids.length === 0) return [];
+  
+  return await db.select().from(latentVectors).where(inArray(latentVectors.id, ids));
+}
+
 export async function getLatentVectorsByCreator(creatorId: number) {
   const db = await getDb();
   if (!db) return [];
@@ -343,17 +350,6 @@ export async function getUserAccessPermissions(userId: number) {
     .where(and(eq(accessPermissions.userId, userId), eq(accessPermissions.isActive, true)));
 }
 
-export async function decrementCallsRemaining(permissionId: number) {
-  const db = await getDb();
-  if (!db) return;
-  
-  await db.update(accessPermissions)
-    .set({
-      callsRemaining: sql`${accessPermissions.callsRemaining} - 1`,
-    })
-    .where(eq(accessPermissions.id, permissionId));
-}
-
 // ===== Reviews =====
 
 export async function createReview(review: typeof reviews.$inferInsert) {
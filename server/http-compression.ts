@@ -0,0 +1,109 @@
+/**
+ * HTTP Compression Middleware
+ * Streams gzip/deflate-compressed responses for payload-heavy routes
+ *
+ * Responses are compressed on the fly: every res.write/res.end chunk goes
+ * straight through a zlib stream to the socket, so a large body is never
+ * held twice (once plain, once compressed). Bodies smaller than the
+ * threshold, non-JSON/text types and event streams are sent as-is.
+ *
+ * Compressed request bodies need nothing extra: express.json() inflates
+ * `Content-Encoding: gzip | deflate` bodies itself, applying its size limit
+ * to the inflated data.
+ */
+
+import type { NextFunction, Request, Response } from "express";
+import zlib from "zlib";
+
+const DEFAULT_THRESHOLD = 8 * 1024;
+const COMPRESSIBLE_TYPE = /^(application\/(json|[\w.+-]+\+json)|text\/(?!event-stream))/i;
+
+type Encoding = "gzip" | "deflate";
+
+function toBuffer(chunk: any, encoding: unknown): Buffer {
+  return typeof chunk === "string" ? Buffer.from(chunk, typeof encoding === "string" ? (encoding as BufferEncoding) : "utf8") : chunk;
+}
+
+/**
+ * Preferred encoding the client accepts (gzip over deflate), if any
+ */
+export function negotiateEncoding(acceptEncoding: string | undefined): Encoding | null {
+  if (!acceptEncoding) return null;
+  const accepted = new Map<string, number>();
+  for (const part of acceptEncoding.split(",")) {
+    const [name, ...params] = part.trim().toLowerCase().split(";");
+    const q = params.map(p => p.trim()).find(p => p.startsWith("q="));
+    accepted.set(name, q ? parseFloat(q.slice(2)) || 0 : 1);
+  }
+  for (const encoding of ["gzip", "deflate"] as const) {
+    if ((accepted.get(encoding) ?? accepted.get("*") ?? 0) > 0) return encoding;
+  }
+  return null;
+}
+
+/**
+ * Compress responses for clients that send Accept-Encoding
+ */
+export function compressResponses(options: { threshold?: number; level?: number } = {}) {
+  const threshold = options.threshold ?? DEFAULT_THRESHOLD;
+  const level = options.level ?? zlib.constants.Z_DEFAULT_COMPRESSION;
+
+  return (req: Request, res: Response, next: NextFunction) => {
+    const encoding = negotiateEncoding(req.headers["accept-encoding"]);
+    res.vary("Accept-Encoding");
+    if (!encoding || req.method === "HEAD") return next();
+
+    const write = res.write.bind(res) as (...args: any[]) => boolean;
+    const end = res.end.bind(res) as (...args: any[]) => Response;
+    let stream: zlib.Gzip | zlib.Deflate | null = null;
+    let decided = false;
+
+    // Decided on the first chunk, once the route has set its headers
+    const shouldCompress = (firstChunkLength: number, ending: boolean): boolean => {
+      if (res.statusCode === 204 || res.statusCode === 304) return false;
+      if (res.getHeader("Content-Encoding")) return false;
+      if (!COMPRESSIBLE_TYPE.test(String(res.getHeader("Content-Type") ?? ""))) return false;
+      const declared = Number(res.getHeader("Content-Length"));
+      const size = Number.isFinite(declared) && declared > 0 ? declared : ending ? firstChunkLength : Infinity;
+      return size >= threshold;
+    };
+
+    const start = (chunk: any, ending: boolean) => {
+      decided = true;
+      const length = chunk ? Buffer.byteLength(chunk) : 0;
+      if (!shouldCompress(length, ending)) return;
+
+      res.setHeader("Content-Encoding", encoding);
+      res.removeHeader("Content-Length");
+      stream = encoding === "gzip" ? zlib.createGzip({ level }) : zlib.createDeflate({ level });
+      stream.on("data", data => {
+        if (!write(data)) stream!.pause();
+      });
+      res.on("drain", () => stream!.resume());
+      stream.on("end", () => end());
+      stream.on("error", error => {
+        console.error("[Compression] Stream error:", error);
+        res.destroy(error);
+      });
+    };
+
+    (res as any).write = (chunk: any, encodingOrCb?: any, cb?: any): boolean => {
+      if (!decided) start(chunk, false);
+      if (!stream) return write(chunk, encodingOrCb, cb);
+      return stream.write(toBuffer(chunk, encodingOrCb), typeof encodingOrCb === "function" ? encodingOrCb : cb);
+    };
+
+    (res as any).end = (chunk?: any, encodingOrCb?: any, cb?: any): Response => {
+      if (typeof chunk === "function") return res.end(undefined, undefined, chunk);
+      if (!decided) start(chunk, true);
+      if (!stream) return end(chunk, encodingOrCb, cb);
+      if (chunk) stream.end(toBuffer(chunk, encodingOrCb));
+      else stream.end();
+      if (typeof encodingOrCb === "function") res.once("finish", encodingOrCb);
+      else if (cb) res.once("finish", cb);
+      return res;
+    };
+
+    next();
+  };
+}
@@ -0,0 +1,42 @@
+import { describe, it, expect, beforeEach, vi } from "vitest";
+
+vi.mock("./db", () => ({ getDb: vi.fn() }));
+
+import { getDb } from "./db";
+import { flushInvocationStats, recordTransaction, recordVectorCall } from "./invocation-stats";
+
+const getDbMock = vi.mocked(getDb);
+
+function fakeDb() {
+  const where = vi.fn(async () => [{ affectedRows: 1 }]);
+  const values = vi.fn(async () => undefined);
+  return {
+    db: {
+      update: vi.fn(() => ({ set: vi.fn(() => ({ where })) })),
+      insert: vi.fn(() => ({ values })),
+    } as any,
+    where,
+    values,
+  };
+}
+
+describe("Invocation stats writer", () => {
+  beforeEach(() => {
+    getDbMock.mockReset();
+  });
+
+  it("keeps pending work when the database is unavailable", async () => {
+    recordVectorCall(1, 0.5);
+    recordTransaction({ buyerId: 1, vectorId: 1, amount: "1.00", platformFee: "0.20", creatorEarnings: "0.80" });
+
+    getDbMock.mockResolvedValueOnce(null);
+    await expect(flushInvocationStats()).rejects.toThrow("Database not available");
+
+    const { db, where, values } = fakeDb();
+    getDbMock.mockResolvedValue(db);
+    await flushInvocationStats();
+
+    expect(where).toHaveBeenCalledTimes(1);
+    expect(values).toHaveBeenCalledWith([expect.objectContaining({ vectorId: 1 })]);
+  });
+});
@@ -0,0 +1,184 @@
+/**
+ * Invocation Stats Writer
+ * Aggregates invocation side effects in memory and writes them in batches
+ *
+ * Per-vector call/revenue counters and transaction rows are accumulated and
+ * flushed every FLUSH_INTERVAL_MS (or as soon as FLUSH_THRESHOLD operations
+ * are pending) as one grouped UPDATE and one multi-row INSERT, so hot vectors
+ * no longer serialize on their row lock once per call.
+ *
+ * Call limits are not batched: acquireCall takes each call from the
+ * database with one conditional UPDATE, so calls_remaining is always exact
+ * and shared by every process and route that spends it.
+ */
+
+import { getDb } from "./db";
+import { accessPermissions, latentVectors, transactions } from "../drizzle/schema";
+import { and, eq, gt, inArray, isNotNull, isNull, or, sql } from "drizzle-orm";
+
+const FLUSH_INTERVAL_MS = 1_000;
+const FLUSH_THRESHOLD = 500;
+
+type TransactionRow = typeof transactions.$inferInsert;
+
+const vectorDeltas = new Map<number, { calls: number; revenue: number }>();
+const pendingTransactions: TransactionRow[] = [];
+
+let pendingOperations = 0;
+let flushTimer: ReturnType<typeof setTimeout> | null = null;
+let flushing: Promise<void> | null = null;
+
+function armFlushTimer(): void {
+  if (flushTimer) return;
+  flushTimer = setTimeout(() => {
+    flushTimer = null;
+    flushInBackground();
+  }, FLUSH_INTERVAL_MS);
+  flushTimer.unref?.();
+}
+
+function flushInBackground(): void {
+  flushInvocationStats().catch(error => {
+    console.error("[InvocationStats] Flush failed:", error);
+    // The failed work was merged back; retry it without waiting for the next call
+    armFlushTimer();
+  });
+}
+
+function scheduleFlush(): void {
+  pendingOperations++;
+  if (pendingOperations >= FLUSH_THRESHOLD) {
+    flushInBackground();
+    return;
+  }
+  armFlushTimer();
+}
+
+/**
+ * Count a successful invocation towards a vector's totals
+ */
+export function recordVectorCall(vectorId: number, revenue: number): void {
+  const delta = vectorDeltas.get(vectorId) ?? { calls: 0, revenue: 0 };
+  delta.calls += 1;
+  delta.revenue += revenue;
+  vectorDeltas.set(vectorId, delta);
+  scheduleFlush();
+}
+
+/**
+ * Queue a transaction row for the next multi-row INSERT
+ */
+export function recordTransaction(row: TransactionRow): void {
+  pendingTransactions.push(row);
+  scheduleFlush();
+}
+
+/**
+ * Write all pending counters and transactions
+ *
+ * Only one flush runs at a time; callers arriving mid-flush wait for it and
+ * then flush whatever accumulated meanwhile.
+ */
+export async function flushInvocationStats(): Promise<void> {
+  while (flushing) await flushing.catch(() => undefined);
+
+  if (vectorDeltas.size === 0 && pendingTransactions.length === 0) return;
+
+  const deltas = new Map(vectorDeltas);
+  const rows = pendingTransactions.splice(0);
+  vectorDeltas.clear();
+  pendingOperations = 0;
+
+  flushing = (async () => {
+    try {
+      const db = await getDb();
+      if (!db) throw new Error("Database not available");
+
+      if (deltas.size > 0) {
+        const ids = Array.from(deltas.keys());
+        const calls = sql.join(ids.map(id => sql`WHEN ${id} THEN ${deltas.get(id)!.calls}`), sql` `);
+        const revenue = sql.join(ids.map(id => sql`WHEN ${id} THEN ${deltas.get(id)!.revenue.toFixed(4)}`), sql` `);
+        await db
+          .update(latentVectors)
+          .set({
+            totalCalls: sql`${latentVectors.totalCalls} + CASE ${latentVectors.id} ${calls} END`,
+            totalRevenue: sql`${latentVectors.totalRevenue} + CASE ${latentVectors.id} ${revenue} END`,
+          })
+          .where(inArray(latentVectors.id, ids));
+        deltas.clear();
+      }
+
+      if (rows.length > 0) {
+        await db.insert(transactions).values(rows);
+      }
+    } catch (error) {
+      // Merge unwritten work back so the next flush retries it
+      for (const [id, delta] of deltas) {
+        const current = vectorDeltas.get(id) ?? { calls: 0, revenue: 0 };
+        vectorDeltas.set(id, { calls: current.calls + delta.calls, revenue: current.revenue + delta.revenue });
+      }
+      pendingTransactions.unshift(...rows);
+      throw error;
+    }
+  })();
+
+  try {
+    await flushing;
+  } finally {
+    flushing = null;
+  }
+}
+
+/**
+ * Take one call from a permission's quota
+ *
+ * A single conditional UPDATE decrements calls_remaining only while it is
+ * positive and the permission is still active and unexpired, so concurrent
+ * callers (in any process) can never overspend a limit and a revoked
+ * permission stops granting calls at once. Every path that spends quota goes
+ * through here. Unlimited permissions (callsRemaining null) succeed without
+ * a write. Returns false when no call could be taken.
+ */
+export async function acquireCall(permission: { id: number; callsRemaining: number | null }): Promise<boolean> {
+  if (permission.callsRemaining === null) return true;
+
+  const db = await getDb();
+  if (!db) throw new Error("Database not available");
+
+  const [result] = await db
+    .update(accessPermissions)
+    .set({ callsRemaining: sql`${accessPermissions.callsRemaining} - 1` })
+    .where(and(
+      eq(accessPermissions.id, permission.id),
+      eq(accessPermissions.isActive, true),
+      gt(accessPermissions.callsRemaining, 0),
+      or(isNull(accessPermissions.expiresAt), gt(accessPermissions.expiresAt, new Date())),
+    ));
+  return (result as any).affectedRows > 0;
+}
+
+/**
+ * Give back a call taken by acquireCall (e.g. the invocation failed)
+ */
+export async function releaseCall(permission: { id: number; callsRemaining: number | null }): Promise<void> {
+  if (permission.callsRemaining === null) return;
+
+  const db = await getDb();
+  if (!db) throw new Error("Database not available");
+
+  await db
+    .update(accessPermissions)
+    .set({ callsRemaining: sql`${accessPermissions.callsRemaining} + 1` })
+    .where(and(eq(accessPermissions.id, permission.id), isNotNull(accessPermissions.callsRemaining)));
+}
+
+/**
+ * Flush everything (call before exiting)
+ */
+export async function shutdownInvocationStats(): Promise<void> {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  await flushInvocationStats();
+}
@@ -0,0 +1,167 @@
+import fs from "fs";
+import { getDb } from "./db";
+import { userBehavior } from "../drizzle/schema";
+import { eq } from "drizzle-orm";
+import { ACTION_WEIGHTS } from "./collaborative-filtering";
+
+/**
+ * Matrix Factorization Recommendation Engine
+ * Scores vectors with item factors trained offline by the Python SDK
+ * (awareness_network_sdk.als.ImplicitALS.export_json). Each user is folded in
+ * from their current behavior rows at request time, so new users and new
+ * interactions are reflected without retraining.
+ */
+
+interface MatrixFactorizationModel {
+  version: number;
+  factors: number;
+  regularization: number;
+  alpha: number;
+  itemIds: number[];
+  itemFactors: Float64Array; // itemIds.length x factors, row-major
+  gramian: Float64Array; // factors x factors
+  itemIndex: Map<number, number>;
+}
+
+let cachedModel: { path: string; mtimeMs: number; model: MatrixFactorizationModel } | null = null;
+
+/**
+ * Load the exported model, reloading when the file changes
+ */
+async function loadModel(): Promise<MatrixFactorizationModel | null> {
+  const modelPath = process.env.MF_MODEL_PATH;
+  if (!modelPath) return null;
+
+  const stat = await fs.promises.stat(modelPath);
+  if (cachedModel && cachedModel.path === modelPath && cachedModel.mtimeMs === stat.mtimeMs) {
+    return cachedModel.model;
+  }
+
+  const raw = JSON.parse(await fs.promises.readFile(modelPath, "utf-8"));
+  const model: MatrixFactorizationModel = {
+    version: raw.version,
+    factors: raw.factors,
+    regularization: raw.regularization,
+    alpha: raw.alpha,
+    itemIds: raw.itemIds,
+    itemFactors: Float64Array.from(raw.itemFactors),
+    gramian: Float64Array.from(raw.gramian),
+    itemIndex: new Map(raw.itemIds.map((id: number, i: number) => [id, i])),
+  };
+  cachedModel = { path: modelPath, mtimeMs: stat.mtimeMs, model };
+  return model;
+}
+
+/**
+ * Solve A x = b for symmetric positive definite A (Cholesky, in place on copies)
+ */
+function solveSPD(a: Float64Array, b: Float64Array, n: number): Float64Array {
+  const l = new Float64Array(n * n);
+  for (let i = 0; i < n; i++) {
+    for (let j = 0; j <= i; j++) {
+      let sum = a[i * n + j];
+      for (let k = 0; k < j; k++) sum -= l[i * n + k] * l[j * n + k];
+      l[i * n + j] = i === j ? Math.sqrt(Math.max(sum, 1e-12)) : sum / l[j * n + j];
+    }
+  }
+
+  const y = new Float64Array(n);
+  for (let i = 0; i < n; i++) {
+    let sum = b[i];
+    for (let k = 0; k < i; k++) sum -= l[i * n + k] * y[k];
+    y[i] = sum / l[i * n + i];
+  }
+
+  const x = new Float64Array(n);
+  for (let i = n - 1; i >= 0; i--) {
+    let sum = y[i];
+    for (let k = i + 1; k < n; k++) sum -= l[k * n + i] * x[k];
+    x[i] = sum / l[i * n + i];
+  }
+  return x;
+}
+
+/**
+ * Fold a user into the trained factor space:
+ * (YtY + Yu^T (Cu - I) Yu + lambda I) x = Yu^T Cu 1
+ */
+function foldIn(model: MatrixFactorizationModel, interactions: Map<number, number>): Float64Array {
+  const n = model.factors;
+  const a = Float64Array.from(model.gramian);
+  const b = new Float64Array(n);
+  for (let i = 0; i < n; i++) a[i * n + i] += model.regularization;
+
+  interactions.forEach((weight, row) => {
+    const confidence = 1 + model.alpha * weight;
+    const offset = row * n;
+    for (let i = 0; i < n; i++) {
+      const yi = model.itemFactors[offset + i];
+      b[i] += confidence * yi;
+      for (let j = 0; j < n; j++) {
+        a[i * n + j] += (confidence - 1) * yi * model.itemFactors[offset + j];
+      }
+    }
+  });
+
+  return solveSPD(a, b, n);
+}
+
+/**
+ * Generate recommendations from latent factors (one matrix-vector product)
+ */
+export async function generateMatrixFactorizationRecommendations(
+  userId: number,
+  limit: number = 10
+): Promise<Array<{ vectorId: number; score: number; reason: string }>> {
+  try {
+    const model = await loadModel();
+    if (!model) return [];
+
+    const db = await getDb();
+    if (!db) throw new Error("Database unavailable");
+
+    const behaviors = await db
+      .select({
+        vectorId: userBehavior.vectorId,
+        actionType: userBehavior.actionType,
+      })
+      .from(userBehavior)
+      .where(eq(userBehavior.userId, userId));
+
+    // Weighted interactions keyed by model row
+    const interactions = new Map<number, number>();
+    behaviors.forEach(({ vectorId, actionType }) => {
+      const row = model.itemIndex.get(vectorId);
+      if (row === undefined) return;
+      interactions.set(row, (interactions.get(row) || 0) + (ACTION_WEIGHTS[actionType] || 1));
+    });
+
+    if (interactions.size === 0) {
+      return [];
+    }
+
+    const userFactors = foldIn(model, interactions);
+    const n = model.factors;
+    const scored: Array<{ vectorId: number; score: number }> = [];
+
+    for (let row = 0; row < model.itemIds.length; row++) {
+      if (interactions.has(row)) continue;
+      let score = 0;
+      const offset = row * n;
+      for (let i = 0; i < n; i++) score += model.itemFactors[offset + i] * userFactors[i];
+      scored.push({ vectorId: model.itemIds[row], score });
+    }
+
+    return scored
+      .sort((a, b) => b.score - a.score)
+      .slice(0, limit)
+      .map(({ vectorId, score }) => ({
+        vectorId,
+        score,
+        reason: "Latent-factor match with your interaction history",
+      }));
+  } catch (error) {
+    console.error("[Matrix Factorization] Error generating recommendations:", error);
+    return [];
+  }
+}
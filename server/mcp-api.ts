@@ -9,27 +9,46 @@
  * - Authentication: Token-based access control
  * - Invocation: Execute vector inference with context
  * - Monitoring: Track usage and performance metrics
+ * - Sessions: Many calls multiplexed over one stream (see mcp-session.ts)
  */
 
 import { Router } from "express";
 import * as db from "./db";
 import { storageGet } from "./storage";
+import { acquireCall, releaseCall } from "./invocation-stats";
 
 const mcpRouter = Router();
 
 /**
- * MCP Discovery Endpoint
- * GET /api/mcp/discover
- * 
- * Returns a list of available vectors with MCP-compatible metadata
+ * Per-API-key request limits by endpoint class, advertised in discovery so
+ * clients can pace themselves instead of bursting into 429s
  */
-mcpRouter.get("/discover", async (req, res) => {
+export const MCP_RATE_LIMITS = {
+  invoke: {
+    calls_per_minute: 60,
+    calls_per_day: 10000,
+  },
+};
+
+/**
+ * Status and JSON body of an MCP call, shared by the REST routes and the
+ * multiplexed session transport (mcp-session.ts)
+ */
+export interface McpResult {
+  status: number;
+  body: any;
+}
+
+/**
+ * List available vectors with MCP-compatible metadata
+ */
+export async function discoverVectors(query: { category?: string; minRating?: string | number }): Promise<McpResult> {
   try {
-    const { category, minRating } = req.query;
+    const { category, minRating } = query;
     
     const vectors = await db.searchLatentVectors({
       category: category as string | undefined,
-      minRating: minRating ? parseFloat(minRating as string) : undefined,
+      minRating: minRating ? parseFloat(String(minRating)) : undefined,
       sortBy: "rating",
       limit: 100,
     });
@@ -60,106 +79,133 @@ mcpRouter.get("/discover", async (req, res) => {
       },
     }));
 
-    res.json({
-      protocol: "MCP/1.0",
-      vectors: mcpVectors,
-      total: mcpVectors.length,
-    });
+    return {
+      status: 200,
+      body: {
+        protocol: "MCP/1.0",
+        vectors: mcpVectors,
+        total: mcpVectors.length,
+        rate_limits: MCP_RATE_LIMITS,
+      },
+    };
   } catch (error) {
     console.error("[MCP] Discovery error:", error);
-    res.status(500).json({ error: "Discovery failed" });
+    return { status: 500, body: { error: "Discovery failed" } };
   }
-});
+}
 
 /**
- * MCP Vector Details Endpoint
- * GET /api/mcp/vectors/:id
+ * MCP Discovery Endpoint
+ * GET /api/mcp/discover
  * 
- * Returns detailed information about a specific vector
+ * Returns a list of available vectors with MCP-compatible metadata
  */
-mcpRouter.get("/vectors/:id", async (req, res) => {
+mcpRouter.get("/discover", async (req, res) => {
+  const { status, body } = await discoverVectors(req.query as { category?: string; minRating?: string });
+  res.status(status).json(body);
+});
+
+/**
+ * Detailed information about a specific vector
+ */
+export async function getVectorDetails(vectorId: number): Promise<McpResult> {
   try {
-    const vectorId = parseInt(req.params.id);
     const vector = await db.getLatentVectorById(vectorId);
 
     if (!vector || vector.status !== "active") {
-      return res.status(404).json({ error: "Vector not found" });
+      return { status: 404, body: { error: "Vector not found" } };
     }
 
-    res.json({
-      protocol: "MCP/1.0",
-      vector: {
-        id: vector.id,
-        name: vector.title,
-        description: vector.description,
-        category: vector.category,
-        model_architecture: vector.modelArchitecture,
-        vector_dimension: vector.vectorDimension,
-        performance_metrics: vector.performanceMetrics ? JSON.parse(vector.performanceMetrics) : {},
-        pricing: {
-          model: vector.pricingModel,
-          base_price: parseFloat(vector.basePrice),
-        },
-        access_requirements: {
-          authentication: "token",
-          rate_limits: {
-            calls_per_minute: 60,
-            calls_per_day: 10000,
+    return {
+      status: 200,
+      body: {
+        protocol: "MCP/1.0",
+        vector: {
+          id: vector.id,
+          name: vector.title,
+          description: vector.description,
+          category: vector.category,
+          model_architecture: vector.modelArchitecture,
+          vector_dimension: vector.vectorDimension,
+          performance_metrics: vector.performanceMetrics ? JSON.parse(vector.performanceMetrics) : {},
+          pricing: {
+            model: vector.pricingModel,
+            base_price: parseFloat(vector.basePrice),
+          },
+          access_requirements: {
+            authentication: "token",
+            rate_limits: MCP_RATE_LIMITS.invoke,
           },
         },
       },
-    });
+    };
   } catch (error) {
     console.error("[MCP] Vector details error:", error);
-    res.status(500).json({ error: "Failed to fetch vector details" });
+    return { status: 500, body: { error: "Failed to fetch vector details" } };
   }
-});
+}
 
 /**
- * MCP Invoke Endpoint
- * POST /api/mcp/invoke
+ * MCP Vector Details Endpoint
+ * GET /api/mcp/vectors/:id
  * 
- * Executes a vector with provided context
- * Requires: Authorization header with access token
+ * Returns detailed information about a specific vector
  */
-mcpRouter.post("/invoke", async (req, res) => {
+mcpRouter.get("/vectors/:id", async (req, res) => {
+  const { status, body } = await getVectorDetails(parseInt(req.params.id));
+  res.status(status).json(body);
+});
+
+/**
+ * Execute a vector with the provided context on behalf of an access token
+ */
+export async function invokeVector(
+  accessToken: string | undefined,
+  request: { vector_id?: number; context?: unknown; parameters?: unknown },
+  traceId?: string
+): Promise<McpResult> {
+  let acquired: { id: number; callsRemaining: number | null } | null = null;
   try {
-    const authHeader = req.headers.authorization;
-    if (!authHeader || !authHeader.startsWith("Bearer ")) {
-      return res.status(401).json({ error: "Missing or invalid authorization header" });
+    if (!accessToken) {
+      return { status: 401, body: { error: "Missing or invalid authorization header" } };
     }
 
-    const accessToken = authHeader.substring(7);
-    const { vector_id, context, parameters } = req.body;
+    const { vector_id, context, parameters } = request ?? {};
 
     if (!vector_id || !context) {
-      return res.status(400).json({ error: "Missing required fields: vector_id, context" });
+      return { status: 400, body: { error: "Missing required fields: vector_id, context" } };
     }
 
     // Verify access token
     const permission = await db.getAccessPermissionByToken(accessToken);
     if (!permission || !permission.isActive) {
-      return res.status(403).json({ error: "Invalid or expired access token" });
+      return { status: 403, body: { error: "Invalid or expired access token" } };
     }
 
     if (permission.vectorId !== vector_id) {
-      return res.status(403).json({ error: "Access token not valid for this vector" });
+      return { status: 403, body: { error: "Access token not valid for this vector" } };
     }
 
     // Check expiration and calls remaining
     if (permission.expiresAt && new Date(permission.expiresAt) < new Date()) {
-      return res.status(403).json({ error: "Access token expired" });
+      return { status: 403, body: { error: "Access token expired" } };
     }
 
     if (permission.callsRemaining !== null && permission.callsRemaining <= 0) {
-      return res.status(429).json({ error: "Call limit exceeded" });
+      return { status: 429, body: { error: "Call limit exceeded" } };
     }
 
     // Get vector file URL
     const vector = await db.getLatentVectorById(vector_id);
     if (!vector) {
-      return res.status(404).json({ error: "Vector not found" });
+      return { status: 404, body: { error: "Vector not found" } };
+    }
+
+    // Take the call atomically; the check above can race with other callers
+    if (!(await acquireCall(permission))) {
+      return { status: 429, body: { error: "Call limit exceeded" } };
     }
+    acquired = permission;
 
     const startTime = Date.now();
 
@@ -179,6 +225,7 @@ mcpRouter.post("/invoke", async (req, res) => {
         metadata: {
           processing_time_ms: Date.now() - startTime,
           model_version: "1.0.0",
+          trace_id: traceId ?? null,
         },
       },
       usage: {
@@ -193,18 +240,31 @@ mcpRouter.post("/invoke", async (req, res) => {
       permissionId: permission.id,
       responseTime: Date.now() - startTime,
       success: true,
+      traceId,
     });
 
-    // Decrement calls remaining
-    if (permission.callsRemaining !== null) {
-      await db.decrementCallsRemaining(permission.id);
-    }
-
-    res.json(mockResult);
+    return { status: 200, body: mockResult };
   } catch (error) {
     console.error("[MCP] Invoke error:", error);
-    res.status(500).json({ error: "Invocation failed" });
+    if (acquired) {
+      await releaseCall(acquired).catch(releaseError => console.error("[MCP] Failed to return call:", releaseError));
+    }
+    return { status: 500, body: { error: "Invocation failed" } };
   }
+}
+
+/**
+ * MCP Invoke Endpoint
+ * POST /api/mcp/invoke
+ * 
+ * Executes a vector with provided context
+ * Requires: Authorization header with access token
+ */
+mcpRouter.post("/invoke", async (req, res) => {
+  const authHeader = req.headers.authorization;
+  const accessToken = authHeader?.startsWith("Bearer ") ? authHeader.substring(7) : undefined;
+  const { status, body } = await invokeVector(accessToken, req.body, res.locals.trace?.traceId);
+  res.status(status).json(body);
 });
 
 /**
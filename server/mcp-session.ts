@@ -0,0 +1,185 @@
+/**
+ * MCP Session Transport
+ * Multiplexes many MCP tool calls over one persistent connection
+ *
+ * GET /api/mcp/session opens a Server-Sent Events stream; its first event
+ * (`event: session`) carries the session id. Calls are POSTed to
+ * /api/mcp/session/:sessionId as `{ calls: [{ id, method, params, access_token }] }`
+ * and acknowledged with 202 right away. Every call runs concurrently and its
+ * outcome is written to the stream as `{ id, status, result }` or
+ * `{ id, status, error }` as soon as it completes, so responses arrive out of
+ * order and clients match them to callers by id.
+ *
+ * An agent running a multi-step plan keeps the stream plus one keep-alive
+ * connection for its POSTs, instead of a fresh connection per tool call.
+ *
+ * Methods: `discover` (params: category, minRating), `vector` (params: id)
+ * and `invoke` (params: vector_id, context, parameters; needs access_token).
+ *
+ * Both routes need an `X-API-Key` header, or an access token as
+ * `Authorization: Bearer <token>`. A session belongs to the user who opened
+ * it; POSTs from anyone else get 404. Open streams are capped per user and
+ * per process.
+ */
+
+import { randomUUID } from "crypto";
+import { Router, Request, Response, NextFunction } from "express";
+import * as db from "./db";
+import { validateApiKey } from "./api-key-manager";
+import { discoverVectors, getVectorDetails, invokeVector, McpResult } from "./mcp-api";
+
+const HEARTBEAT_MS = 15_000;
+const MAX_BATCH_SIZE = 100;
+const MAX_IN_FLIGHT = 256;
+const MAX_SESSIONS = 1_000;
+const MAX_SESSIONS_PER_USER = 8;
+
+interface McpCall {
+  id: string | number;
+  method: string;
+  params?: Record<string, any>;
+  access_token?: string;
+}
+
+interface McpSession {
+  res: Response;
+  userId: number;
+  inFlight: number;
+}
+
+const sessions = new Map<string, McpSession>();
+const sessionsByUser = new Map<number, number>();
+
+const sessionRouter = Router();
+
+/**
+ * Resolve the caller from an API key or an active, unexpired access token
+ */
+async function authenticate(req: Request, res: Response, next: NextFunction) {
+  try {
+    const apiKey = req.headers["x-api-key"] as string | undefined;
+    const authHeader = req.headers.authorization;
+    if (apiKey) {
+      const validation = await validateApiKey(apiKey);
+      if (!validation.valid || !validation.userId) {
+        return res.status(401).json({ error: validation.error || "Invalid API key" });
+      }
+      res.locals.mcpUserId = validation.userId;
+    } else if (authHeader?.startsWith("Bearer ")) {
+      const permission = await db.getAccessPermissionByToken(authHeader.substring(7));
+      if (!permission || !permission.isActive ||
+          (permission.expiresAt && new Date(permission.expiresAt) < new Date())) {
+        return res.status(401).json({ error: "Invalid or expired access token" });
+      }
+      res.locals.mcpUserId = permission.userId;
+    } else {
+      return res.status(401).json({ error: "API key or access token required" });
+    }
+    next();
+  } catch (error) {
+    console.error("[MCP] Session auth error:", error);
+    res.status(500).json({ error: "Authentication failed" });
+  }
+}
+
+function dispatch(call: McpCall, traceId?: string): Promise<McpResult> {
+  const params = call.params ?? {};
+  switch (call.method) {
+    case "discover":
+      return discoverVectors(params);
+    case "vector":
+      return getVectorDetails(Number(params.id));
+    case "invoke":
+      return invokeVector(call.access_token, params, traceId);
+    default:
+      return Promise.resolve({ status: 400, body: { error: `Unknown method: ${call.method}` } });
+  }
+}
+
+function writeEvent(res: Response, data: unknown, event?: string): void {
+  res.write(`${event ? `event: ${event}\n` : ""}data: ${JSON.stringify(data)}\n\n`);
+}
+
+/**
+ * Open a session stream
+ * GET /api/mcp/session
+ */
+sessionRouter.get("/session", authenticate, (req, res) => {
+  const userId: number = res.locals.mcpUserId;
+  if (sessions.size >= MAX_SESSIONS) {
+    return res.status(503).json({ error: "Too many open sessions, retry later" });
+  }
+  const open = sessionsByUser.get(userId) ?? 0;
+  if (open >= MAX_SESSIONS_PER_USER) {
+    return res.status(429).json({ error: `At most ${MAX_SESSIONS_PER_USER} open sessions per user` });
+  }
+
+  res.writeHead(200, {
+    "Content-Type": "text/event-stream",
+    "Cache-Control": "no-cache",
+    Connection: "keep-alive",
+    "X-Accel-Buffering": "no",
+  });
+
+  const sessionId = randomUUID();
+  sessions.set(sessionId, { res, userId, inFlight: 0 });
+  sessionsByUser.set(userId, open + 1);
+  writeEvent(res, { session_id: sessionId, max_batch_size: MAX_BATCH_SIZE, max_in_flight: MAX_IN_FLIGHT }, "session");
+
+  // Comment lines keep proxies from closing an idle stream
+  const heartbeat = setInterval(() => res.write(": ping\n\n"), HEARTBEAT_MS);
+  heartbeat.unref?.();
+
+  req.on("close", () => {
+    clearInterval(heartbeat);
+    sessions.delete(sessionId);
+    const remaining = (sessionsByUser.get(userId) ?? 1) - 1;
+    if (remaining > 0) sessionsByUser.set(userId, remaining);
+    else sessionsByUser.delete(userId);
+  });
+});
+
+/**
+ * Submit calls to a session; results arrive on its stream
+ * POST /api/mcp/session/:sessionId
+ */
+sessionRouter.post("/session/:sessionId", authenticate, (req, res) => {
+  const sessionId = req.params.sessionId;
+  const session = sessions.get(sessionId);
+  if (!session || session.userId !== res.locals.mcpUserId) {
+    return res.status(404).json({ error: "Session not found" });
+  }
+
+  const calls: McpCall[] = Array.isArray(req.body?.calls) ? req.body.calls : [req.body];
+  if (calls.length === 0 || calls.length > MAX_BATCH_SIZE) {
+    return res.status(400).json({ error: `A batch holds 1 to ${MAX_BATCH_SIZE} calls` });
+  }
+  if (calls.some(call => call?.id === undefined || typeof call.method !== "string")) {
+    return res.status(400).json({ error: "Every call needs an id and a method" });
+  }
+  if (session.inFlight + calls.length > MAX_IN_FLIGHT) {
+    return res.status(429).json({ error: "Too many calls in flight" });
+  }
+
+  session.inFlight += calls.length;
+  for (const call of calls) {
+    // Calls are logged under the trace of the POST that carried them
+    dispatch(call, res.locals.trace?.traceId)
+      .catch((error): McpResult => {
+        console.error("[MCP] Session call error:", error);
+        return { status: 500, body: { error: "Call failed" } };
+      })
+      .then(({ status, body }) => {
+        session.inFlight--;
+        // The stream may have closed while the call ran
+        if (sessions.get(sessionId) !== session) return;
+        writeEvent(session.res, status < 400
+          ? { id: call.id, status, result: body }
+          : { id: call.id, status, error: body?.error ?? body });
+      });
+  }
+
+  res.status(202).json({ accepted: calls.length });
+});
+
+export default sessionRouter;
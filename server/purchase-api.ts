@@ -7,9 +7,10 @@ import express from 'express';
 import Stripe from 'stripe';
 import { getDb } from './db.js';
 import { latentVectors, transactions, accessPermissions } from '../drizzle/schema.ts';
-import { eq, and } from 'drizzle-orm';
+import { eq, and, or, gt, gte, asc } from 'drizzle-orm';
 import crypto from 'crypto';
 import { validateApiKey as validateKey } from './api-key-manager.js';
+import { acquireCall, recordVectorCall } from './invocation-stats.js';
 
 const router = express.Router();
 const stripe = new Stripe(process.env.STRIPE_SECRET_KEY!, { apiVersion: '2025-12-15.clover' });
@@ -178,6 +179,99 @@ router.post('/purchase', authenticateApiKey, async (req, res) => {
   }
 });
 
+/**
+ * GET /api/vectors/catalog
+ * Catalog snapshot and incremental sync for client-side mirrors
+ *
+ * Rows are ordered by (updatedAt, id) and paginated with an opaque cursor.
+ * Pass updatedSince (ISO timestamp) to fetch only rows changed since then.
+ * The route is public, so only active listings are returned in full; rows
+ * of any other status (drafts, suspended listings) are tombstones carrying
+ * just id, status and updatedAt, so mirrors can drop deactivated vectors
+ * without unpublished listings leaking. Optional category and status
+ * filters narrow a one-off scan.
+ */
+router.get('/catalog', async (req, res) => {
+  try {
+    const limit = Math.min(Math.max(parseInt(req.query.limit as string) || 1000, 1), 5000);
+    const updatedSince = req.query.updatedSince ? new Date(req.query.updatedSince as string) : null;
+    const cursor = req.query.cursor as string | undefined;
+    const category = req.query.category as string | undefined;
+    const status = req.query.status as string | undefined;
+
+    if (status && !['draft', 'active', 'inactive', 'suspended'].includes(status)) {
+      return res.status(400).json({ error: 'Invalid status' });
+    }
+    if (updatedSince && isNaN(updatedSince.getTime())) {
+      return res.status(400).json({ error: 'Invalid updatedSince timestamp' });
+    }
+
+    const db = await getDb();
+    if (!db) {
+      return res.status(500).json({ error: 'Database connection failed' });
+    }
+
+    const conditions = [];
+    if (updatedSince) {
+      conditions.push(gte(latentVectors.updatedAt, updatedSince));
+    }
+    if (category) {
+      conditions.push(eq(latentVectors.category, category));
+    }
+    if (status) {
+      conditions.push(eq(latentVectors.status, status as 'draft' | 'active' | 'inactive' | 'suspended'));
+    }
+    if (cursor) {
+      const [cursorTime, cursorId] = cursor.split(':').map(Number);
+      if (!Number.isFinite(cursorTime) || !Number.isFinite(cursorId)) {
+        return res.status(400).json({ error: 'Invalid cursor' });
+      }
+      const cursorDate = new Date(cursorTime);
+      conditions.push(or(
+        gt(latentVectors.updatedAt, cursorDate),
+        and(eq(latentVectors.updatedAt, cursorDate), gt(latentVectors.id, cursorId))
+      ));
+    }
+
+    const rows = await db
+      .select({
+        id: latentVectors.id,
+        creatorId: latentVectors.creatorId,
+        title: latentVectors.title,
+        description: latentVectors.description,
+        category: latentVectors.category,
+        modelArchitecture: latentVectors.modelArchitecture,
+        vectorDimension: latentVectors.vectorDimension,
+        basePrice: latentVectors.basePrice,
+        pricingModel: latentVectors.pricingModel,
+        status: latentVectors.status,
+        totalCalls: latentVectors.totalCalls,
+        averageRating: latentVectors.averageRating,
+        reviewCount: latentVectors.reviewCount,
+        vectorType: latentVectors.vectorType,
+        createdAt: latentVectors.createdAt,
+        updatedAt: latentVectors.updatedAt,
+      })
+      .from(latentVectors)
+      .where(conditions.length > 0 ? and(...conditions) : undefined)
+      .orderBy(asc(latentVectors.updatedAt), asc(latentVectors.id))
+      .limit(limit);
+
+    const last = rows[rows.length - 1];
+    res.json({
+      vectors: rows.map((row) =>
+        row.status === 'active' ? row : { id: row.id, status: row.status, updatedAt: row.updatedAt }
+      ),
+      nextCursor: rows.length === limit && last ? `${last.updatedAt.getTime()}:${last.id}` : null,
+      serverTime: new Date().toISOString(),
+    });
+
+  } catch (error: any) {
+    console.error('[Catalog API] Error:', error);
+    res.status(500).json({ error: 'Failed to get catalog' });
+  }
+});
+
 /**
  * GET /api/vectors/:id/pricing
  * Get pricing details for a vector
@@ -284,6 +378,11 @@ router.post('/invoke', authenticateApiKey, async (req, res) => {
       return res.status(404).json({ error: 'Vector not found' });
     }
 
+    // Take the call atomically; the check above can race with other callers
+    if (!(await acquireCall(permission))) {
+      return res.status(403).json({ error: 'No calls remaining' });
+    }
+
     // Simulate vector invocation (in production, load vector and run inference)
     const mockResult = {
       vectorId: vector.id,
@@ -297,23 +396,13 @@ router.post('/invoke', authenticateApiKey, async (req, res) => {
       metadata: {
         modelArchitecture: vector.modelArchitecture,
         vectorDimension: vector.vectorDimension,
-        timestamp: new Date().toISOString()
+        timestamp: new Date().toISOString(),
+        traceId: res.locals.trace?.traceId ?? null
       }
     };
 
-    // Update calls remaining
-    if (permission.callsRemaining !== null) {
-      await db
-        .update(accessPermissions)
-        .set({ callsRemaining: permission.callsRemaining - 1 })
-        .where(eq(accessPermissions.id, permission.id));
-    }
-
-    // Update vector usage stats
-    await db
-      .update(latentVectors)
-      .set({ totalCalls: vector.totalCalls + 1 })
-      .where(eq(latentVectors.id, vectorId));
+    // Update vector usage stats (written in batches by the stats writer)
+    recordVectorCall(vector.id, 0);
 
     res.json({
       success: true,
@@ -335,6 +424,10 @@ router.post('/invoke', authenticateApiKey, async (req, res) => {
 /**
  * GET /api/vectors/my-purchases
  * List purchased vectors for authenticated user
+ *
+ * Without `limit` every purchase is returned. With `limit` (max 1000) rows
+ * are keyset-paginated on the transaction id: pass `nextCursor` back as
+ * `cursor` until it is null.
  */
 router.get('/my-purchases', authenticateApiKey, async (req, res) => {
   try {
@@ -343,29 +436,55 @@ router.get('/my-purchases', authenticateApiKey, async (req, res) => {
       return res.status(500).json({ error: 'Database connection failed' });
     }
     const buyerId = (req as any).userId;
-    
-    const purchases = await db
+    const limit = req.query.limit ? Math.min(Math.max(parseInt(req.query.limit as string) || 100, 1), 1000) : null;
+    const cursor = req.query.cursor ? parseInt(req.query.cursor as string) : null;
+
+    if (cursor !== null && !Number.isFinite(cursor)) {
+      return res.status(400).json({ error: 'Invalid cursor' });
+    }
+
+    const conditions = [eq(transactions.buyerId, buyerId)];
+    if (cursor !== null) {
+      conditions.push(gt(transactions.id, cursor));
+    }
+
+    const query = db
       .select({
         transactionId: transactions.id,
+        buyerId: transactions.buyerId,
+        transactionType: transactions.transactionType,
         vectorId: latentVectors.id,
         vectorName: latentVectors.title,
         category: latentVectors.category,
         amount: transactions.amount,
         purchaseDate: transactions.createdAt,
         accessToken: accessPermissions.accessToken,
+        expiresAt: accessPermissions.expiresAt,
         callsRemaining: accessPermissions.callsRemaining,
         isActive: accessPermissions.isActive
       })
       .from(transactions)
       .innerJoin(latentVectors, eq(transactions.vectorId, latentVectors.id))
       .innerJoin(accessPermissions, eq(transactions.id, accessPermissions.transactionId))
-      .where(eq(transactions.buyerId, buyerId))
-      .orderBy(transactions.createdAt);
+      .where(and(...conditions))
+      .orderBy(asc(transactions.id));
+
+    if (limit === null) {
+      const purchases = await query;
+      return res.json({
+        success: true,
+        purchases,
+        total: purchases.length
+      });
+    }
 
+    // Fetch one extra row to know whether another page exists
+    const rows = await query.limit(limit + 1);
+    const purchases = rows.slice(0, limit);
     res.json({
       success: true,
       purchases,
-      total: purchases.length
+      nextCursor: rows.length > limit ? String(purchases[purchases.length - 1].transactionId) : null
     });
 
   } catch (error: any) {
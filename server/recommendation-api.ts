@@ -0,0 +1,42 @@
+/**
+ * AI Recommendation API
+ * Serves background-materialized recommendations to AI agents
+ */
+
+import express from "express";
+import { z } from "zod";
+import { validateApiKey } from "./ai-auth-api";
+import { getMaterializedRecommendations } from "./recommendation-engine";
+
+const router = express.Router();
+
+const querySchema = z.object({
+  limit: z.coerce.number().int().min(1).max(20).default(5),
+});
+
+/**
+ * GET /api/ai/recommendations
+ * Read the caller's precomputed recommendations
+ */
+router.get("/recommendations", validateApiKey, async (req, res) => {
+  try {
+    const parsed = querySchema.safeParse(req.query);
+    if (!parsed.success) {
+      return res.status(400).json({ error: "Invalid request", details: parsed.error.issues });
+    }
+
+    const userId = (req as any).apiKeyUserId;
+    const result = await getMaterializedRecommendations(userId, parsed.data.limit);
+
+    return res.json({
+      recommendations: result.recommendations,
+      computedAt: result.computedAt,
+      stale: result.stale,
+    });
+  } catch (error) {
+    console.error("[AI Recommendations] Get error:", error);
+    return res.status(500).json({ error: "Failed to get recommendations" });
+  }
+});
+
+export { router as aiRecommendationRouter };
@@ -0,0 +1,92 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
+
+vi.mock("./_core/llm", () => ({ invokeLLM: vi.fn() }));
+vi.mock("./db", () => ({
+  getBrowsingHistory: vi.fn(async () => []),
+  getUserPreferences: vi.fn(async () => null),
+  getUserTransactions: vi.fn(async () => []),
+  searchLatentVectors: vi.fn(async () => [
+    { id: 1, title: "Popular", category: "nlp", status: "active", averageRating: "4.9", totalCalls: 500 },
+    { id: 2, title: "Niche", category: "vision", status: "active", averageRating: "3.0", totalCalls: 10 },
+  ]),
+  getLatentVectorsByIds: vi.fn(async () => []),
+}));
+
+import { invokeLLM } from "./_core/llm";
+import {
+  getMaterializedRecommendations,
+  markRecommendationsStale,
+  refreshStaleRecommendations,
+  resetMaterializedRecommendations,
+} from "./recommendation-engine";
+
+const llm = vi.mocked(invokeLLM);
+
+function llmAnswer(vectorId: number) {
+  return {
+    choices: [{
+      message: { content: JSON.stringify({ recommendations: [{ vectorId, score: 90, reason: "Matches your history" }] }) },
+    }],
+  } as any;
+}
+
+describe("Materialized recommendations", () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+    vi.setSystemTime(new Date("2026-01-01T00:00:00Z"));
+    resetMaterializedRecommendations();
+    llm.mockReset();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("serves the stored entry until the user is marked stale", async () => {
+    llm.mockResolvedValue(llmAnswer(2));
+    const first = await getMaterializedRecommendations(1);
+    const second = await getMaterializedRecommendations(1);
+
+    expect(first.recommendations.map(r => r.vectorId)).toEqual([2]);
+    expect(second.stale).toBe(false);
+    expect(llm).toHaveBeenCalledTimes(1);
+
+    markRecommendationsStale(1);
+    expect((await getMaterializedRecommendations(1)).stale).toBe(true);
+    expect(await refreshStaleRecommendations()).toBe(1);
+    expect(llm).toHaveBeenCalledTimes(2);
+  });
+
+  it("retries heuristic fallbacks after a short TTL", async () => {
+    llm.mockRejectedValueOnce(new Error("LLM unavailable"));
+    const fallback = await getMaterializedRecommendations(7);
+    expect(fallback.recommendations[0].reason).toMatch(/Popular choice/);
+
+    // Not yet expired: nothing to refresh
+    expect(await refreshStaleRecommendations()).toBe(0);
+
+    vi.advanceTimersByTime(5 * 60 * 1000);
+    llm.mockResolvedValue(llmAnswer(2));
+    expect(await refreshStaleRecommendations()).toBe(1);
+    const refreshed = await getMaterializedRecommendations(7);
+    expect(refreshed.recommendations.map(r => r.vectorId)).toEqual([2]);
+    expect(refreshed.stale).toBe(false);
+  });
+
+  it("marks entries past their max age stale on read", async () => {
+    llm.mockResolvedValue(llmAnswer(1));
+    await getMaterializedRecommendations(3);
+
+    vi.advanceTimersByTime(6 * 60 * 60 * 1000);
+    const expired = await getMaterializedRecommendations(3);
+    expect(expired.recommendations.map(r => r.vectorId)).toEqual([1]);
+    expect(expired.stale).toBe(true);
+    expect(await refreshStaleRecommendations()).toBe(1);
+  });
+
+  it("deduplicates concurrent computations for one user", async () => {
+    llm.mockResolvedValue(llmAnswer(1));
+    await Promise.all([getMaterializedRecommendations(4), getMaterializedRecommendations(4)]);
+    expect(llm).toHaveBeenCalledTimes(1);
+  });
+});
@@ -26,6 +26,16 @@ export interface Recommendation {
 export async function generateRecommendations(
   context: RecommendationContext
 ): Promise<Recommendation[]> {
+  return (await computeRecommendations(context)).recommendations;
+}
+
+/**
+ * Recommendations, flagged when they are the heuristic fallback because the
+ * LLM failed or answered nothing usable
+ */
+async function computeRecommendations(
+  context: RecommendationContext
+): Promise<{ recommendations: Recommendation[]; fallback: boolean }> {
   const { userId, limit = 5 } = context;
 
   // 1. Fetch user's browsing history (last 30 days)
@@ -154,7 +164,7 @@ Respond in JSON format:
     const content = typeof message?.content === 'string' ? message.content : null;
     if (!content) {
       console.error("[Recommendations] Empty response from LLM");
-      return fallbackRecommendations(allVectors, limit);
+      return { recommendations: fallbackRecommendations(allVectors, limit), fallback: true };
     }
 
     const parsed = JSON.parse(content);
@@ -169,11 +179,183 @@ Respond in JSON format:
       };
     }).filter(rec => rec.vector); // Only include valid vectors
 
-    return enriched.slice(0, limit);
+    return { recommendations: enriched.slice(0, limit), fallback: false };
   } catch (error) {
     console.error("[Recommendations] LLM error:", error);
-    return fallbackRecommendations(allVectors, limit);
+    return { recommendations: fallbackRecommendations(allVectors, limit), fallback: true };
+  }
+}
+
+// ===== Materialized Recommendations =====
+
+/**
+ * Recommendations are computed in the background and kept per user, so
+ * reads never wait on the LLM. Behavior events mark a user stale; the
+ * refresher recomputes only stale users.
+ *
+ * Entries also expire: LLM results after MAX_AGE_MS, so that new listings
+ * reach users whose behavior has not changed, and heuristic fallbacks (the
+ * LLM failed) after FALLBACK_TTL_MS. An expired entry is still served, but
+ * marks its user stale. The store keeps at most MAX_MATERIALIZED_USERS
+ * users, evicting the least recently read.
+ */
+
+const MATERIALIZED_LIMIT = 20;
+const MAX_AGE_MS = 6 * 60 * 60 * 1000;
+const FALLBACK_TTL_MS = 5 * 60 * 1000;
+const MAX_MATERIALIZED_USERS = 10_000;
+
+export interface MaterializedRecommendations {
+  items: Array<{ vectorId: number; score: number; reason: string }>;
+  computedAt: number;
+  expiresAt: number;
+  fallback: boolean;
+}
+
+const materialized = new Map<number, MaterializedRecommendations>();
+const staleUsers = new Set<number>();
+const inFlight = new Map<number, Promise<MaterializedRecommendations>>();
+
+/**
+ * Mark a user's recommendations for recomputation on the next refresh
+ */
+export function markRecommendationsStale(userId: number): void {
+  staleUsers.add(userId);
+}
+
+function remember(userId: number, entry: MaterializedRecommendations): void {
+  // Map order is recency order: re-inserting moves the user to the end
+  materialized.delete(userId);
+  materialized.set(userId, entry);
+  while (materialized.size > MAX_MATERIALIZED_USERS) {
+    const oldest = materialized.keys().next().value as number;
+    materialized.delete(oldest);
+    staleUsers.delete(oldest);
+  }
+}
+
+/**
+ * Compute and store one user's recommendations (deduplicating concurrent calls)
+ */
+async function materializeRecommendations(userId: number): Promise<MaterializedRecommendations> {
+  const pending = inFlight.get(userId);
+  if (pending) return pending;
+
+  const task = (async () => {
+    staleUsers.delete(userId);
+    const { recommendations, fallback } = await computeRecommendations({ userId, limit: MATERIALIZED_LIMIT });
+    const computedAt = Date.now();
+    const entry = {
+      items: recommendations.map(({ vectorId, score, reason }) => ({ vectorId, score, reason })),
+      computedAt,
+      expiresAt: computedAt + (fallback ? FALLBACK_TTL_MS : MAX_AGE_MS),
+      fallback,
+    };
+    remember(userId, entry);
+    return entry;
+  })();
+
+  inFlight.set(userId, task);
+  try {
+    return await task;
+  } finally {
+    inFlight.delete(userId);
+  }
+}
+
+/**
+ * Read a user's materialized recommendations
+ *
+ * Only a user with no entry yet waits for a computation; stale and expired
+ * entries are served as-is until the background refresher replaces them.
+ */
+export async function getMaterializedRecommendations(
+  userId: number,
+  limit: number = 5
+): Promise<{ recommendations: MaterializedRecommendations["items"]; computedAt: Date; stale: boolean }> {
+  const cached = materialized.get(userId);
+  let entry: MaterializedRecommendations;
+  if (cached) {
+    entry = cached;
+    remember(userId, entry);
+    if (entry.expiresAt <= Date.now()) staleUsers.add(userId);
+  } else {
+    entry = await materializeRecommendations(userId);
   }
+  return {
+    recommendations: entry.items.slice(0, limit),
+    computedAt: new Date(entry.computedAt),
+    stale: staleUsers.has(userId),
+  };
+}
+
+/**
+ * Cached recommendations enriched with vector data (single IN query)
+ */
+export async function getCachedRecommendations(
+  context: RecommendationContext
+): Promise<Recommendation[]> {
+  const { userId, limit = 5 } = context;
+  const { recommendations } = await getMaterializedRecommendations(userId, limit);
+  const vectors = await db.getLatentVectorsByIds(recommendations.map(r => r.vectorId));
+  const byId = new Map(vectors.map(v => [v.id, v]));
+
+  return recommendations
+    .map(rec => ({ ...rec, vector: byId.get(rec.vectorId) }))
+    .filter(rec => rec.vector);
+}
+
+/**
+ * Recompute recommendations for users whose behavior changed, and retry
+ * expired fallback entries
+ *
+ * @returns Number of users refreshed
+ */
+export async function refreshStaleRecommendations(batchSize: number = 10): Promise<number> {
+  const now = Date.now();
+  materialized.forEach((entry, userId) => {
+    if (entry.fallback && entry.expiresAt <= now) staleUsers.add(userId);
+  });
+  const users = Array.from(staleUsers).slice(0, batchSize);
+
+  await Promise.all(users.map(async userId => {
+    try {
+      await materializeRecommendations(userId);
+    } catch (error) {
+      console.error(`[Recommendations] Refresh failed for user ${userId}:`, error);
+      staleUsers.add(userId);
+    }
+  }));
+
+  return users.length;
+}
+
+/**
+ * Periodically refresh stale users in the background
+ */
+export function startRecommendationRefresher(intervalMs: number = 30_000, batchSize: number = 10) {
+  let running = false;
+  const timer = setInterval(async () => {
+    if (running || (materialized.size === 0 && staleUsers.size === 0)) return;
+    running = true;
+    try {
+      // One bounded batch of LLM calls per tick; failures retry next tick
+      await refreshStaleRecommendations(batchSize);
+    } finally {
+      running = false;
+    }
+  }, intervalMs);
+  timer.unref?.();
+  return () => clearInterval(timer);
+}
+
+/**
+ * Drop every materialized entry (tests)
+ */
+export function resetMaterializedRecommendations(): void {
+  materialized.clear();
+  staleUsers.clear();
+  inFlight.clear();
 }
 
 /**
@@ -213,4 +395,5 @@ export async function trackBrowsingAction(
     action,
     metadata: metadata ? JSON.stringify(metadata) : null,
   });
+  markRecommendationsStale(userId);
 }
@@ -10,6 +10,7 @@ import { storagePut } from "./storage";
 import { nanoid } from "nanoid";
 import { invokeLLM } from "./_core/llm";
 import * as recommendationEngine from "./recommendation-engine";
+import { acquireCall } from "./invocation-stats";
 import { createApiKey, listApiKeys, revokeApiKey, deleteApiKey } from "./api-key-manager.js";
 import * as blogDb from "./blog-db";
 import { getDb } from "./db";
@@ -244,7 +245,7 @@ export const appRouter = router({
       }))
       .mutation(async ({ ctx, input }) => {
         const { invokeVector } = await import("./vector-invocation");
-        return await invokeVector(ctx.user.id, input);
+        return await invokeVector(ctx.user.id, input, ctx.res.locals.trace?.traceId);
       }),
 
     // Get invocation history
@@ -389,12 +390,17 @@ export const appRouter = router({
         success: z.boolean(),
         errorMessage: z.string().optional(),
       }))
-      .mutation(async ({ input }) => {
+      .mutation(async ({ ctx, input }) => {
         const permission = await db.getAccessPermissionByToken(input.accessToken);
         if (!permission) {
           throw new TRPCError({ code: "UNAUTHORIZED" });
         }
 
+        // Take the call from the quota (a no-op for unlimited permissions)
+        if (!(await acquireCall(permission))) {
+          throw new TRPCError({ code: "FORBIDDEN", message: "No calls remaining" });
+        }
+
         await db.logApiCall({
           userId: permission.userId,
           vectorId: permission.vectorId,
@@ -402,13 +408,9 @@ export const appRouter = router({
           responseTime: input.responseTime,
           success: input.success,
           errorMessage: input.errorMessage,
+          traceId: ctx.res.locals.trace?.traceId,
         });
 
-        // Decrement calls remaining if applicable
-        if (permission.callsRemaining !== null) {
-          await db.decrementCallsRemaining(permission.id);
-        }
-
         return { success: true };
       }),
 
@@ -633,11 +635,11 @@ export const appRouter = router({
 
   // Recommendations
   recommendations: router({
-    // Get personalized recommendations using LLM
+    // Get personalized recommendations (materialized in the background)
     getRecommendations: protectedProcedure
       .input(z.object({ limit: z.number().default(5) }))
       .query(async ({ ctx, input }) => {
-        const recommendations = await recommendationEngine.generateRecommendations({
+        const recommendations = await recommendationEngine.getCachedRecommendations({
           userId: ctx.user.id,
           limit: input.limit,
         });
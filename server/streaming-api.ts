@@ -5,9 +5,10 @@
 
 import { Router, Request, Response } from "express";
 import { getDb } from "./db";
-import { latentVectors, transactions } from "../drizzle/schema";
+import { latentVectors } from "../drizzle/schema";
 import { eq, and, inArray } from "drizzle-orm";
 import { validateApiKey } from "./api-key-manager";
+import { recordTransaction } from "./invocation-stats";
 
 const router = Router();
 
@@ -92,7 +93,7 @@ router.get("/invoke/stream", async (req: Request, res: Response) => {
         const platformFee = amount * platformFeeRate;
         const creatorEarnings = amount - platformFee;
         
-        await db.insert(transactions).values({
+        recordTransaction({
           buyerId: validation.userId,
           vectorId: vector.id,
           amount: vector.basePrice,
@@ -193,14 +194,14 @@ router.post("/batch-invoke", async (req: Request, res: Response) => {
             latency_ms: Math.floor(Math.random() * 100) + 50
           };
 
-          // Record transaction
+          // Record transaction (inserted with the rest of the batch by the stats writer)
           if (validation.userId) {
             const platformFeeRate = 0.20; // 20% platform fee
             const amount = parseFloat(vector.basePrice);
             const platformFee = amount * platformFeeRate;
             const creatorEarnings = amount - platformFee;
             
-            await db.insert(transactions).values({
+            recordTransaction({
               buyerId: validation.userId,
               vectorId: vector.id,
               amount: vector.basePrice,
@@ -0,0 +1,76 @@
+/**
+ * W3C Trace Context Middleware
+ * Continues the caller's trace for every API request
+ *
+ * A valid `traceparent` header (https://www.w3.org/TR/trace-context/) makes
+ * the request a child of the caller's span; otherwise a new trace is
+ * started. The request's own span is exposed on `res.locals.trace` for
+ * route logging and echoed in a `traceresponse` header, and the handler's
+ * time until the headers go out is reported as `Server-Timing: app;dur=<ms>`
+ * so that clients can put server time next to their own spans.
+ */
+
+import type { NextFunction, Request, Response } from "express";
+import { randomBytes } from "crypto";
+
+const TRACEPARENT = /^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?$/;
+const SLOW_REQUEST_MS = 1000;
+
+export interface TraceContext {
+  traceId: string;
+  spanId: string;
+  parentId: string | null;
+  sampled: boolean;
+}
+
+/**
+ * Parse a traceparent header; null when absent or invalid
+ */
+export function parseTraceparent(header: string | string[] | undefined): Omit<TraceContext, "parentId"> | null {
+  const value = Array.isArray(header) ? header[0] : header;
+  const match = value ? TRACEPARENT.exec(value.trim().toLowerCase()) : null;
+  if (!match) return null;
+  const [, version, traceId, spanId, flags, rest] = match;
+  // Version ff is invalid; version 00 allows no trailing fields
+  if (version === "ff" || (version === "00" && rest)) return null;
+  if (/^0+$/.test(traceId) || /^0+$/.test(spanId)) return null;
+  return { traceId, spanId, sampled: (parseInt(flags, 16) & 1) === 1 };
+}
+
+export function formatTraceparent(trace: TraceContext): string {
+  return `00-${trace.traceId}-${trace.spanId}-${trace.sampled ? "01" : "00"}`;
+}
+
+export function traceContext() {
+  return (req: Request, res: Response, next: NextFunction) => {
+    const started = process.hrtime.bigint();
+    const parent = parseTraceparent(req.headers.traceparent);
+    const trace: TraceContext = {
+      traceId: parent?.traceId ?? randomBytes(16).toString("hex"),
+      spanId: randomBytes(8).toString("hex"),
+      parentId: parent?.spanId ?? null,
+      sampled: parent?.sampled ?? false,
+    };
+    res.locals.trace = trace;
+    res.setHeader("traceresponse", formatTraceparent(trace));
+
+    const elapsedMs = () => Number(process.hrtime.bigint() - started) / 1e6;
+    const writeHead = res.writeHead;
+    (res as any).writeHead = function (this: Response, ...args: any[]) {
+      if (!this.headersSent) this.setHeader("Server-Timing", `app;dur=${elapsedMs().toFixed(1)}`);
+      return (writeHead as any).apply(this, args);
+    };
+
+    res.on("finish", () => {
+      const ms = elapsedMs();
+      if (trace.sampled && ms >= SLOW_REQUEST_MS) {
+        console.warn(
+          `[Trace] Slow request ${req.method} ${req.originalUrl} ${res.statusCode} ${ms.toFixed(0)}ms ` +
+            `trace=${trace.traceId} span=${trace.spanId} parent=${trace.parentId}`
+        );
+      }
+    });
+
+    next();
+  };
+}
@@ -0,0 +1,60 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from "vitest";
+import { promises as fs } from "fs";
+import os from "os";
+import path from "path";
+import { VectorPayloadCache, contentDigest, keyDigest } from "./vector-cache";
+
+async function seed(dir: string, key: string, payload: Buffer): Promise<void> {
+  const file = `${keyDigest(key)}.${contentDigest(payload)}.payload`;
+  await fs.writeFile(path.join(dir, file), payload);
+}
+
+describe("VectorPayloadCache disk tier", () => {
+  let dir: string;
+
+  beforeEach(async () => {
+    dir = await fs.mkdtemp(path.join(os.tmpdir(), "vector-cache-"));
+  });
+
+  afterEach(async () => {
+    vi.restoreAllMocks();
+    await fs.rm(dir, { recursive: true, force: true });
+  });
+
+  it("indexes the directory once for concurrent first lookups", async () => {
+    const a = Buffer.from(JSON.stringify({ vector: [1, 2] }));
+    const b = Buffer.from(JSON.stringify({ vector: [3, 4, 5] }));
+    await seed(dir, "vectors/a", a);
+    await seed(dir, "vectors/b", b);
+
+    const readdir = vi.spyOn(fs, "readdir");
+    const cache = new VectorPayloadCache({ diskDir: dir });
+    const download = vi.fn(async () => Buffer.from("{}"));
+
+    const [first, second] = await Promise.all([
+      cache.get("vectors/a", download),
+      cache.get("vectors/b", download),
+    ]);
+
+    expect(first).toEqual({ vector: [1, 2] });
+    expect(second).toEqual({ vector: [3, 4, 5] });
+    expect(download).not.toHaveBeenCalled();
+    expect(readdir).toHaveBeenCalledTimes(1);
+    expect(cache.getStats()).toMatchObject({ diskHits: 2, diskEntries: 2, diskBytes: a.length + b.length });
+  });
+
+  it("falls back to download when the directory cannot be indexed", async () => {
+    vi.spyOn(console, "warn").mockImplementation(() => undefined);
+    vi.spyOn(fs, "readdir").mockRejectedValueOnce(new Error("EACCES"));
+    const cache = new VectorPayloadCache({ diskDir: dir, maxBytes: 0 });
+    const download = vi.fn(async () => Buffer.from(JSON.stringify({ vector: [9] })));
+
+    await expect(cache.get("vectors/c", download)).resolves.toEqual({ vector: [9] });
+    expect(cache.getStats().diskEntries).toBe(0);
+
+    // The next lookup retries the scan and persists the download
+    await expect(cache.get("vectors/c", download)).resolves.toEqual({ vector: [9] });
+    expect(download).toHaveBeenCalledTimes(2);
+    expect(cache.getStats().diskEntries).toBe(1);
+  });
+});
@@ -0,0 +1,282 @@
+/**
+ * Vector Payload Cache
+ * Keeps downloaded vector files close to the invocation path
+ *
+ * Three layers sit in front of object storage:
+ * - an in-process LRU bounded by payload bytes,
+ * - an optional local-disk tier (VECTOR_CACHE_DIR), and
+ * - single-flight loading, so concurrent misses for one key share a download.
+ *
+ * Disk format (shared with the Python SDK's VectorPayloadCache):
+ *   <dir>/<sha256(vectorFileKey)>.<sha256(payload)[0:16]>.payload
+ * The file holds the raw bytes exactly as downloaded. The content hash in
+ * the name is verified on read, so torn or corrupted files are discarded
+ * instead of served. Files are written to a temp name and renamed into place.
+ *
+ * Vector file keys are immutable (uploads get a fresh nanoid key), so entries
+ * never need revalidation against storage. Cached payloads are shared between
+ * invocations and must be treated as read-only.
+ */
+
+import { createHash } from "crypto";
+import { promises as fs } from "fs";
+import path from "path";
+
+const DEFAULT_MAX_BYTES = 256 * 1024 * 1024;
+const DEFAULT_DISK_MAX_BYTES = 2 * 1024 * 1024 * 1024;
+const PAYLOAD_SUFFIX = ".payload";
+
+export interface VectorCacheOptions {
+  maxBytes?: number;
+  diskDir?: string | null;
+  diskMaxBytes?: number;
+}
+
+export interface VectorCacheStats {
+  hits: number;
+  diskHits: number;
+  misses: number;
+  sharedLoads: number;
+  entries: number;
+  bytes: number;
+  diskEntries: number;
+  diskBytes: number;
+}
+
+interface MemoryEntry {
+  data: unknown;
+  bytes: number;
+}
+
+interface DiskEntry {
+  file: string;
+  bytes: number;
+}
+
+export function keyDigest(vectorFileKey: string): string {
+  return createHash("sha256").update(vectorFileKey).digest("hex");
+}
+
+export function contentDigest(payload: Buffer): string {
+  return createHash("sha256").update(payload).digest("hex").slice(0, 16);
+}
+
+export class VectorPayloadCache {
+  private readonly maxBytes: number;
+  private readonly diskDir: string | null;
+  private readonly diskMaxBytes: number;
+
+  // Map iteration order doubles as LRU order (oldest first)
+  private readonly memory = new Map<string, MemoryEntry>();
+  private memoryBytes = 0;
+  private disk: Map<string, DiskEntry> | null = null;
+  private diskIndexing: Promise<Map<string, DiskEntry> | null> | null = null;
+  private diskBytes = 0;
+  private readonly inFlight = new Map<string, Promise<unknown>>();
+
+  private stats = { hits: 0, diskHits: 0, misses: 0, sharedLoads: 0 };
+
+  constructor(options: VectorCacheOptions = {}) {
+    this.maxBytes = options.maxBytes ?? DEFAULT_MAX_BYTES;
+    this.diskDir = options.diskDir ?? null;
+    this.diskMaxBytes = options.diskMaxBytes ?? DEFAULT_DISK_MAX_BYTES;
+  }
+
+  /**
+   * Return the parsed payload for a key, loading raw bytes with `download`
+   * only when neither tier has it
+   */
+  async get(vectorFileKey: string, download: (key: string) => Promise<Buffer>): Promise<unknown> {
+    const cached = this.memory.get(vectorFileKey);
+    if (cached) {
+      this.memory.delete(vectorFileKey);
+      this.memory.set(vectorFileKey, cached);
+      this.stats.hits++;
+      return cached.data;
+    }
+
+    const pending = this.inFlight.get(vectorFileKey);
+    if (pending) {
+      this.stats.sharedLoads++;
+      return pending;
+    }
+
+    const task = this.load(vectorFileKey, download);
+    this.inFlight.set(vectorFileKey, task);
+    try {
+      return await task;
+    } finally {
+      this.inFlight.delete(vectorFileKey);
+    }
+  }
+
+  invalidate(vectorFileKey: string): void {
+    const entry = this.memory.get(vectorFileKey);
+    if (entry) {
+      this.memory.delete(vectorFileKey);
+      this.memoryBytes -= entry.bytes;
+    }
+    const digest = keyDigest(vectorFileKey);
+    const onDisk = this.disk?.get(digest);
+    if (onDisk) {
+      this.removeDiskEntry(digest, onDisk);
+    }
+  }
+
+  getStats(): VectorCacheStats {
+    return {
+      ...this.stats,
+      entries: this.memory.size,
+      bytes: this.memoryBytes,
+      diskEntries: this.disk?.size ?? 0,
+      diskBytes: this.diskBytes,
+    };
+  }
+
+  private async load(vectorFileKey: string, download: (key: string) => Promise<Buffer>): Promise<unknown> {
+    const digest = keyDigest(vectorFileKey);
+    let payload = await this.readDisk(digest);
+    if (payload) {
+      this.stats.diskHits++;
+    } else {
+      this.stats.misses++;
+      payload = await download(vectorFileKey);
+      await this.writeDisk(digest, payload);
+    }
+
+    const data = JSON.parse(payload.toString("utf8"));
+    this.remember(vectorFileKey, data, payload.length);
+    return data;
+  }
+
+  private remember(vectorFileKey: string, data: unknown, bytes: number): void {
+    // A payload larger than the whole budget would evict everything for nothing
+    if (bytes > this.maxBytes) return;
+
+    this.memory.set(vectorFileKey, { data, bytes });
+    this.memoryBytes += bytes;
+    for (const [key, entry] of this.memory) {
+      if (this.memoryBytes <= this.maxBytes) break;
+      this.memory.delete(key);
+      this.memoryBytes -= entry.bytes;
+    }
+  }
+
+  /**
+   * Index the disk tier once; afterwards lookups never list the directory.
+   * Concurrent first lookups share one scan. If the scan fails (unwritable
+   * or unreadable directory), the lookup proceeds without the disk tier and
+   * the next lookup retries the scan.
+   */
+  private diskIndex(): Promise<Map<string, DiskEntry> | null> {
+    if (!this.diskDir) return Promise.resolve(null);
+    if (!this.diskIndexing) {
+      this.diskIndexing = this.scanDisk(this.diskDir).catch(error => {
+        // The disk tier is best-effort; serve from memory and storage instead
+        console.warn(`[VectorCache] Disk tier unavailable at ${this.diskDir}:`, error);
+        this.diskIndexing = null;
+        return null;
+      });
+    }
+    return this.diskIndexing;
+  }
+
+  private async scanDisk(diskDir: string): Promise<Map<string, DiskEntry>> {
+    await fs.mkdir(diskDir, { recursive: true });
+    const files = await fs.readdir(diskDir);
+    const entries: Array<[string, DiskEntry, number]> = [];
+    for (const file of files) {
+      if (!file.endsWith(PAYLOAD_SUFFIX)) continue;
+      try {
+        const stat = await fs.stat(path.join(diskDir, file));
+        entries.push([file.split(".")[0], { file, bytes: stat.size }, stat.mtimeMs]);
+      } catch {
+        // Removed concurrently by another process sharing the directory
+      }
+    }
+
+    // Oldest first, matching LRU order
+    entries.sort((a, b) => a[2] - b[2]);
+    const disk = new Map<string, DiskEntry>();
+    let bytes = 0;
+    for (const [digest, entry] of entries) {
+      disk.set(digest, entry);
+      bytes += entry.bytes;
+    }
+    this.disk = disk;
+    this.diskBytes = bytes;
+    return disk;
+  }
+
+  private async readDisk(digest: string): Promise<Buffer | null> {
+    const index = await this.diskIndex();
+    const entry = index?.get(digest);
+    if (!index || !entry) return null;
+
+    let payload: Buffer;
+    try {
+      payload = await fs.readFile(path.join(this.diskDir!, entry.file));
+    } catch {
+      this.removeDiskEntry(digest, entry);
+      return null;
+    }
+    if (`${digest}.${contentDigest(payload)}${PAYLOAD_SUFFIX}` !== entry.file) {
+      this.removeDiskEntry(digest, entry);
+      return null;
+    }
+
+    index.delete(digest);
+    index.set(digest, entry);
+    return payload;
+  }
+
+  private async writeDisk(digest: string, payload: Buffer): Promise<void> {
+    const index = await this.diskIndex();
+    if (!index || payload.length > this.diskMaxBytes) return;
+
+    const file = `${digest}.${contentDigest(payload)}${PAYLOAD_SUFFIX}`;
+    const target = path.join(this.diskDir!, file);
+    const temp = `${target}.${process.pid}.tmp`;
+    try {
+      await fs.writeFile(temp, payload);
+      await fs.rename(temp, target);
+    } catch (error) {
+      // The disk tier is best-effort; the payload is still served from memory
+      console.warn(`[VectorCache] Failed to persist ${file}:`, error);
+      await fs.rm(temp, { force: true }).catch(() => undefined);
+      return;
+    }
+
+    const previous = index.get(digest);
+    if (previous && previous.file !== file) {
+      this.removeDiskEntry(digest, previous);
+    } else if (previous) {
+      index.delete(digest);
+      this.diskBytes -= previous.bytes;
+    }
+    index.set(digest, { file, bytes: payload.length });
+    this.diskBytes += payload.length;
+
+    for (const [oldest, entry] of index) {
+      if (this.diskBytes <= this.diskMaxBytes) break;
+      this.removeDiskEntry(oldest, entry);
+    }
+  }
+
+  private removeDiskEntry(digest: string, entry: DiskEntry): void {
+    this.disk?.delete(digest);
+    this.diskBytes -= entry.bytes;
+    fs.rm(path.join(this.diskDir!, entry.file), { force: true }).catch(() => undefined);
+  }
+}
+
+function envBytes(name: string, fallback: number): number {
+  const value = Number(process.env[name]);
+  return Number.isFinite(value) && value > 0 ? value : fallback;
+}
+
+export const vectorPayloadCache = new VectorPayloadCache({
+  maxBytes: envBytes("VECTOR_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES),
+  diskDir: process.env.VECTOR_CACHE_DIR || null,
+  diskMaxBytes: envBytes("VECTOR_CACHE_DISK_MAX_BYTES", DEFAULT_DISK_MAX_BYTES),
+});
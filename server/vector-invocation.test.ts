@@ -1,7 +1,8 @@
 import { describe, it, expect, beforeAll } from "vitest";
 import { invokeVector, verifyVectorAccess, getInvocationHistory } from "./vector-invocation";
+import { acquireCall, releaseCall } from "./invocation-stats";
 import { getDb } from "./db";
-import { users, latentVectors, transactions, accessPermissions } from "../drizzle/schema";
+import { users, latentVectors, transactions, accessPermissions, apiCallLogs } from "../drizzle/schema";
 import { eq } from "drizzle-orm";
 
 describe("Vector Invocation System", () => {
@@ -89,6 +90,24 @@ describe("Vector Invocation System", () => {
     expect(result.cost).toBeGreaterThan(0);
   });
 
+  it("should log the call under the request's trace id", async () => {
+    const traceId = "4bf92f3577b34da6a3ce929d0e0e4736";
+    const result = await invokeVector(testUserId, {
+      vectorId: testVectorId,
+      inputData: "Traced input",
+    }, traceId);
+    expect(result.traceId).toBe(traceId);
+
+    const db = await getDb();
+    const [log] = await db!
+      .select()
+      .from(apiCallLogs)
+      .where(eq(apiCallLogs.traceId, traceId))
+      .limit(1);
+    expect(log?.vectorId).toBe(testVectorId);
+    expect(log?.success).toBe(true);
+  });
+
   it("should record invocation history", async () => {
     // Invoke vector first
     await invokeVector(testUserId, {
@@ -150,4 +169,65 @@ describe("Vector Invocation System", () => {
       .set({ callsRemaining: 100 })
       .where(eq(accessPermissions.id, testPermissionId));
   });
+
+  async function callsRemaining(): Promise<number | null> {
+    const db = await getDb();
+    if (!db) throw new Error("Database not available");
+    const [row] = await db
+      .select({ callsRemaining: accessPermissions.callsRemaining })
+      .from(accessPermissions)
+      .where(eq(accessPermissions.id, testPermissionId));
+    return row.callsRemaining;
+  }
+
+  it("should never grant more concurrent calls than remain", async () => {
+    const db = await getDb();
+    if (!db) throw new Error("Database not available");
+
+    await db
+      .update(accessPermissions)
+      .set({ callsRemaining: 3 })
+      .where(eq(accessPermissions.id, testPermissionId));
+
+    const permission = { id: testPermissionId, callsRemaining: 3 };
+    const granted = await Promise.all(Array.from({ length: 10 }, () => acquireCall(permission)));
+
+    expect(granted.filter(Boolean)).toHaveLength(3);
+    expect(await callsRemaining()).toBe(0);
+
+    // A failed invocation hands its call back
+    await releaseCall(permission);
+    expect(await callsRemaining()).toBe(1);
+    expect((await verifyVectorAccess(testUserId, testVectorId)).hasAccess).toBe(true);
+
+    await db
+      .update(accessPermissions)
+      .set({ callsRemaining: 100 })
+      .where(eq(accessPermissions.id, testPermissionId));
+  });
+
+  it("should stop granting calls once the permission is revoked", async () => {
+    const db = await getDb();
+    if (!db) throw new Error("Database not available");
+
+    // Checked before revocation, charged after it
+    const { permission } = await verifyVectorAccess(testUserId, testVectorId);
+    expect(permission).toBeDefined();
+
+    await db
+      .update(accessPermissions)
+      .set({ isActive: false })
+      .where(eq(accessPermissions.id, testPermissionId));
+
+    expect(await acquireCall(permission!)).toBe(false);
+    expect(await callsRemaining()).toBe(100);
+    await expect(
+      invokeVector(testUserId, { vectorId: testVectorId, inputData: "Test input" })
+    ).rejects.toThrow();
+
+    await db
+      .update(accessPermissions)
+      .set({ isActive: true })
+      .where(eq(accessPermissions.id, testPermissionId));
+  });
 });
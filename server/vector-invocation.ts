@@ -9,6 +9,8 @@ import { eq, and } from "drizzle-orm";
 import { TRPCError } from "@trpc/server";
 import { invokeLLM } from "./_core/llm";
 import { storageGet } from "./storage";
+import { vectorPayloadCache } from "./vector-cache";
+import { acquireCall, recordVectorCall, releaseCall } from "./invocation-stats";
 
 export interface InvokeVectorInput {
   vectorId: number;
@@ -27,6 +29,7 @@ export interface InvokeVectorOutput {
   executionTime: number;
   cost: number;
   error?: string;
+  traceId?: string; // W3C trace id of the request, also stored in api_call_logs
 }
 
 /**
@@ -71,21 +74,26 @@ export async function verifyVectorAccess(userId: number, vectorId: number): Prom
 }
 
 /**
- * Fetch vector data from S3
+ * Download a vector file from S3
+ */
+async function downloadVectorFile(vectorFileKey: string): Promise<Buffer> {
+  // Get presigned URL for vector file
+  const { url } = await storageGet(vectorFileKey);
+
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`Failed to fetch vector: ${response.statusText}`);
+  }
+
+  return Buffer.from(await response.arrayBuffer());
+}
+
+/**
+ * Fetch vector data, served from the payload cache when possible
  */
 async function fetchVectorData(vectorFileKey: string): Promise<any> {
   try {
-    // Get presigned URL for vector file
-    const { url } = await storageGet(vectorFileKey); // Get URL
-    
-    // Fetch vector data
-    const response = await fetch(url);
-    if (!response.ok) {
-      throw new Error(`Failed to fetch vector: ${response.statusText}`);
-    }
-    
-    const vectorData = await response.json();
-    return vectorData;
+    return await vectorPayloadCache.get(vectorFileKey, downloadVectorFile);
   } catch (error) {
     throw new Error(`Failed to load vector data: ${error instanceof Error ? error.message : 'Unknown error'}`);
   }
@@ -162,47 +170,20 @@ function calculateInvocationCost(
   return basePrice;
 }
 
-/**
- * Update statistics after invocation
- */
-async function updateInvocationStats(
-  db: any,
-  vectorId: number,
-  permissionId: number,
-  cost: number,
-  success: boolean
-) {
-  // Update vector total calls and revenue
-  if (success) {
-    await db
-      .update(latentVectors)
-      .set({
-        totalCalls: db.raw('total_calls + 1'),
-        totalRevenue: db.raw(`total_revenue + ${cost}`)
-      })
-      .where(eq(latentVectors.id, vectorId));
-  }
-
-  // Decrement calls remaining if applicable
-  await db
-    .update(accessPermissions)
-    .set({
-      callsRemaining: db.raw('CASE WHEN calls_remaining IS NOT NULL THEN calls_remaining - 1 ELSE NULL END')
-    })
-    .where(eq(accessPermissions.id, permissionId));
-}
-
 /**
  * Main function to invoke a vector
  */
 export async function invokeVector(
   userId: number,
-  input: InvokeVectorInput
+  input: InvokeVectorInput,
+  traceId?: string
 ): Promise<InvokeVectorOutput> {
   const startTime = Date.now();
   const db = await getDb();
   if (!db) throw new TRPCError({ code: "INTERNAL_SERVER_ERROR", message: "Database not available" });
 
+  let acquiredPermission: typeof accessPermissions.$inferSelect | null = null;
+
   try {
     // 1. Verify access permission
     const accessCheck = await verifyVectorAccess(userId, input.vectorId);
@@ -230,6 +211,13 @@ export async function invokeVector(
       throw new TRPCError({ code: "BAD_REQUEST", message: "Vector is not active" });
     }
 
+    // Take this call from the quota up front so concurrent calls cannot
+    // overspend it; handed back below if the invocation fails
+    if (!(await acquireCall(permission))) {
+      throw new TRPCError({ code: "FORBIDDEN", message: "No calls remaining" });
+    }
+    acquiredPermission = permission;
+
     // 3. Fetch vector data from S3
     const vectorData = await fetchVectorData(vector.vectorFileKey);
 
@@ -266,10 +254,11 @@ export async function invokeVector(
       permissionId: permission.id,
       responseTime: executionTime,
       success: true,
+      traceId,
     });
 
-    // 8. Update statistics
-    await updateInvocationStats(db, input.vectorId, permission.id, cost, true);
+    // 8. Update statistics (written in batches by the stats writer)
+    recordVectorCall(input.vectorId, cost);
 
     return {
       success: true,
@@ -277,12 +266,19 @@ export async function invokeVector(
       tokensUsed,
       executionTime,
       cost,
+      traceId,
     };
 
   } catch (error) {
     const executionTime = Date.now() - startTime;
     const errorMessage = error instanceof Error ? error.message : 'Unknown error';
 
+    if (acquiredPermission !== null) {
+      await releaseCall(acquiredPermission).catch(releaseError => {
+        console.error('Failed to return call to quota:', releaseError);
+      });
+    }
+
     // Log failed invocation
     try {
       const accessCheck = await verifyVectorAccess(userId, input.vectorId);
@@ -307,6 +303,7 @@ export async function invokeVector(
           responseTime: executionTime,
           success: false,
           errorMessage,
+          traceId,
         });
       }
     } catch (logError) {